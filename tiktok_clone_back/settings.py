@@ -13,7 +13,7 @@ import os
 import sys
 from pathlib import Path
 
-from decouple import config
+from decouple import Csv, config
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -49,20 +49,209 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 INSTALLED_APPS = THIRD_PARTY_APPS + LOCAL_APPS + DJANGO_APPS
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
+    # Renders with orjson when it is installed, byte for byte like DRF's JSONRenderer.
+    'DEFAULT_RENDERER_CLASSES': (
+        'utils.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    # Trusted proxies in front of the app. Throttles identify clients by REMOTE_ADDR, or by
+    # the X-Forwarded-For entry the last trusted proxy added; 0 ignores the header, which
+    # clients can set to anything.
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
+}
+
+SIMPLE_JWT = {
+    # Check refresh tokens against the Bloom-filtered blacklist (users.token_blacklist).
+    'TOKEN_REFRESH_SERIALIZER': 'users.token_blacklist.FilteredTokenRefreshSerializer',
+}
+
+# In-process caches. Writes invalidate entries in the process that made them; the TTL bounds
+# how long other worker processes may serve a stale copy.
+# Cached user lookups for JWT authentication (users.authentication)
+AUTH_USER_CACHE_MAX_SIZE = config('AUTH_USER_CACHE_MAX_SIZE', default=10000, cast=int)
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=60, cast=float)
+# Pre-rendered profile responses (users.profile_cache)
+PROFILE_CACHE_MAX_SIZE = config('PROFILE_CACHE_MAX_SIZE', default=10000, cast=int)
+PROFILE_CACHE_TTL = config('PROFILE_CACHE_TTL', default=60, cast=float)
+
+# Token blacklist (users.token_blacklist), checked through an in-process Bloom filter of the
+# blacklisted JTIs. Tokens blacklisted by other workers are added every
+# TOKEN_BLACKLIST_REFRESH_INTERVAL seconds, TOKEN_BLACKLIST_BATCH rows at a time, and expired
+# ones are dropped by the full rebuild every TOKEN_BLACKLIST_REBUILD_INTERVAL seconds. Rows
+# committed after higher primary keys are looked up again for TOKEN_BLACKLIST_GAP_TIMEOUT
+# seconds, which should exceed the longest transaction that blacklists a token.
+TOKEN_BLACKLIST_REFRESH_INTERVAL = config('TOKEN_BLACKLIST_REFRESH_INTERVAL', default=2,
+                                          cast=float)
+TOKEN_BLACKLIST_REBUILD_INTERVAL = config('TOKEN_BLACKLIST_REBUILD_INTERVAL', default=60 * 60,
+                                          cast=float)
+TOKEN_BLACKLIST_FALSE_POSITIVE_RATE = config('TOKEN_BLACKLIST_FALSE_POSITIVE_RATE',
+                                             default=0.001, cast=float)
+TOKEN_BLACKLIST_BATCH = config('TOKEN_BLACKLIST_BATCH', default=10000, cast=int)
+TOKEN_BLACKLIST_GAP_TIMEOUT = config('TOKEN_BLACKLIST_GAP_TIMEOUT', default=60, cast=float)
+
+# Rate limiting (users.throttling)
+# 'ip' limits every request from one client address, 'username' locks a username out after
+# too many failed logins. Values are (limit, window in seconds).
+RATE_LIMIT_BACKEND = config(
+    'RATE_LIMIT_BACKEND', default='utils.rate_limit.InMemoryRateLimitBackend')
+RATE_LIMITS = {
+    'login': {'ip': (30, 60), 'username': (5, 15 * 60)},
+    'token_obtain_pair': {'ip': (30, 60), 'username': (5, 15 * 60)},
+    'register': {'ip': (20, 60 * 60)},
+}
+
+# Profile picture variants (users.profile_pictures): square sizes in pixels, generated by a
+# background pool after every upload.
+PROFILE_PICTURE_VARIANTS = {'small': 48, 'medium': 150, 'large': 480}
+PROFILE_PICTURE_FORMAT = config('PROFILE_PICTURE_FORMAT', default='WEBP')
+PROFILE_PICTURE_QUALITY = config('PROFILE_PICTURE_QUALITY', default=80, cast=int)
+PROFILE_PICTURE_WORKERS = config('PROFILE_PICTURE_WORKERS', default=2, cast=int)
+
+# N+1 detection (utils.query_inspector). Requests running the same query shape
+# QUERY_INSPECTOR_REPEAT_THRESHOLD times or more are logged with their view and call site.
+# Off in tests, where utils.query_budget.QueryBudgetMixin enables it to enforce budgets.
+QUERY_INSPECTOR_ENABLED = config('QUERY_INSPECTOR_ENABLED', default=DEBUG, cast=bool)
+QUERY_INSPECTOR_REPEAT_THRESHOLD = config('QUERY_INSPECTOR_REPEAT_THRESHOLD', default=3,
+                                          cast=int)
+
+# Route the user endpoints to their native async views. Enable when serving through ASGI.
+USERS_ASYNC_VIEWS = config('USERS_ASYNC_VIEWS', default=False, cast=bool)
+
+# Maximum number of ids accepted by the bulk profile endpoint (GET /users/?ids=...)
+USERS_BULK_MAX_IDS = config('USERS_BULK_MAX_IDS', default=50, cast=int)
+
+# Username autocomplete (users.autocomplete), served from a sorted in-process index. Users
+# created since the last refresh are added every USER_AUTOCOMPLETE_REFRESH_INTERVAL seconds,
+# USER_AUTOCOMPLETE_BATCH rows at a time; renames and deletions made by other workers are
+# picked up by the full rebuild every USER_AUTOCOMPLETE_REBUILD_INTERVAL seconds.
+USER_AUTOCOMPLETE_LIMIT = config('USER_AUTOCOMPLETE_LIMIT', default=10, cast=int)
+USER_AUTOCOMPLETE_MAX_LIMIT = config('USER_AUTOCOMPLETE_MAX_LIMIT', default=50, cast=int)
+USER_AUTOCOMPLETE_REFRESH_INTERVAL = config(
+    'USER_AUTOCOMPLETE_REFRESH_INTERVAL', default=5, cast=float)
+USER_AUTOCOMPLETE_REBUILD_INTERVAL = config(
+    'USER_AUTOCOMPLETE_REBUILD_INTERVAL', default=60 * 60, cast=float)
+USER_AUTOCOMPLETE_BATCH = config('USER_AUTOCOMPLETE_BATCH', default=10000, cast=int)
+
+# Chunked video uploads (videos.uploads). Chunks are streamed to a partial file on the local
+# media storage in blocks of VIDEO_UPLOAD_BLOCK_SIZE bytes, which bounds memory per request.
+# Allowed content types map to the extension of the stored file.
+VIDEO_UPLOAD_MAX_SIZE = config('VIDEO_UPLOAD_MAX_SIZE', default=10 * 1024 ** 3, cast=int)
+VIDEO_UPLOAD_MAX_CHUNK_SIZE = config(
+    'VIDEO_UPLOAD_MAX_CHUNK_SIZE', default=64 * 1024 ** 2, cast=int)
+VIDEO_UPLOAD_BLOCK_SIZE = config('VIDEO_UPLOAD_BLOCK_SIZE', default=1024 ** 2, cast=int)
+VIDEO_UPLOAD_CONTENT_TYPES = {
+    'video/mp4': 'mp4',
+    'video/quicktime': 'mov',
+    'video/webm': 'webm',
+}
+
+# Video processing jobs (videos.jobs), run by `manage.py run_video_jobs`. Each job type has
+# its own concurrency cap within the worker pool. Failed jobs are retried with exponential
+# backoff; jobs whose worker stops renewing its lease are requeued by the other workers.
+# FakeTranscoder produces placeholder output for environments without ffmpeg.
+VIDEO_TRANSCODER = config('VIDEO_TRANSCODER', default='videos.transcoders.FFmpegTranscoder')
+VIDEO_RENDITIONS = {'360p': 360, '720p': 720}
+VIDEO_JOB_WORKERS = config('VIDEO_JOB_WORKERS', default=2, cast=int)
+VIDEO_JOB_CONCURRENCY = {'probe': 2, 'thumbnail': 2, 'transcode': 1}
+VIDEO_JOB_MAX_ATTEMPTS = config('VIDEO_JOB_MAX_ATTEMPTS', default=3, cast=int)
+VIDEO_JOB_RETRY_BACKOFF = config('VIDEO_JOB_RETRY_BACKOFF', default=30, cast=float)
+VIDEO_JOB_RETRY_BACKOFF_MAX = config('VIDEO_JOB_RETRY_BACKOFF_MAX', default=3600, cast=float)
+VIDEO_JOB_LEASE = config('VIDEO_JOB_LEASE', default=300, cast=float)
+VIDEO_JOB_POLL_INTERVAL = config('VIDEO_JOB_POLL_INTERVAL', default=1.0, cast=float)
+
+# Video streaming (videos.views.video_stream_view). Single ranges are handed to the WSGI
+# server's sendfile path; multi-range responses are sliced from a memory map in blocks of
+# VIDEO_STREAM_BLOCK_SIZE. Requests with more ranges than VIDEO_STREAM_MAX_RANGES get the
+# whole file. Setting VIDEO_STREAM_ACCEL_REDIRECT to an nginx internal location (e.g.
+# /protected-media/) delegates the transfer, ranges included, to nginx.
+VIDEO_STREAM_BLOCK_SIZE = config('VIDEO_STREAM_BLOCK_SIZE', default=256 * 1024, cast=int)
+VIDEO_STREAM_MAX_RANGES = config('VIDEO_STREAM_MAX_RANGES', default=16, cast=int)
+VIDEO_STREAM_MAX_AGE = config('VIDEO_STREAM_MAX_AGE', default=24 * 60 * 60, cast=int)
+VIDEO_STREAM_ACCEL_REDIRECT = config('VIDEO_STREAM_ACCEL_REDIRECT', default='')
+
+# Write-behind engagement counters (videos.counters). Views, likes and shares are coalesced per
+# video in VIDEO_COUNTER_BACKEND and written with one UPDATE per VIDEO_COUNTER_FLUSH_BATCH videos
+# every VIDEO_COUNTER_FLUSH_INTERVAL seconds (0 disables the flusher thread), or as soon as
+# VIDEO_COUNTER_MAX_PENDING counters are pending. A worker that dies loses at most what it
+# counted since its last flush. utils.counters.CacheCounterBackend shares the deltas of every
+# worker through the default cache instead.
+VIDEO_COUNTER_BACKEND = config(
+    'VIDEO_COUNTER_BACKEND', default='utils.counters.InMemoryCounterBackend')
+VIDEO_COUNTER_FLUSH_INTERVAL = config('VIDEO_COUNTER_FLUSH_INTERVAL', default=5.0, cast=float)
+VIDEO_COUNTER_FLUSH_BATCH = config('VIDEO_COUNTER_FLUSH_BATCH', default=500, cast=int)
+VIDEO_COUNTER_MAX_PENDING = config('VIDEO_COUNTER_MAX_PENDING', default=10000, cast=int)
+
+# Keyset pagination (utils.pagination) of the video listings: default and largest page size.
+PAGINATION_PAGE_SIZE = config('PAGINATION_PAGE_SIZE', default=20, cast=int)
+PAGINATION_MAX_PAGE_SIZE = config('PAGINATION_MAX_PAGE_SIZE', default=100, cast=int)
+
+# Following timeline (videos.timeline). When a video becomes ready, TIMELINE_FANOUT_WORKERS
+# background threads write it into the inbox of every follower of its creator, in batches of
+# TIMELINE_FANOUT_BATCH rows. Videos of creators with more than TIMELINE_FANOUT_MAX_FOLLOWERS
+# followers are not fanned out but pulled when a follower reads the timeline. A new follow
+# copies the creator's last TIMELINE_BACKFILL_SIZE videos into the follower's inbox.
+TIMELINE_FANOUT_MAX_FOLLOWERS = config('TIMELINE_FANOUT_MAX_FOLLOWERS', default=10000, cast=int)
+TIMELINE_FANOUT_BATCH = config('TIMELINE_FANOUT_BATCH', default=1000, cast=int)
+TIMELINE_FANOUT_WORKERS = config('TIMELINE_FANOUT_WORKERS', default=2, cast=int)
+TIMELINE_BACKFILL_SIZE = config('TIMELINE_BACKFILL_SIZE', default=20, cast=int)
+
+# Trending hashtags and sounds (videos.trending). Posts and flushed engagement counters are
+# counted with TRENDING_EVENT_WEIGHTS into count-min sketches per sliding window, given as
+# (window, bucket) lengths in seconds. Sketches are TRENDING_SKETCH_DEPTH rows of
+# TRENDING_SKETCH_WIDTH counters; TRENDING_CANDIDATES keys per window compete for the top.
+# Every TRENDING_SNAPSHOT_INTERVAL seconds each worker merges its counts into the shared
+# snapshot in the database and reloads it.
+TRENDING_WINDOWS = {'1h': (60 * 60, 5 * 60), '24h': (24 * 60 * 60, 60 * 60),
+                    '7d': (7 * 24 * 60 * 60, 6 * 60 * 60)}
+TRENDING_EVENT_WEIGHTS = {'post': 20, 'view_count': 1, 'like_count': 5, 'share_count': 10}
+TRENDING_SKETCH_WIDTH = config('TRENDING_SKETCH_WIDTH', default=2048, cast=int)
+TRENDING_SKETCH_DEPTH = config('TRENDING_SKETCH_DEPTH', default=4, cast=int)
+TRENDING_CANDIDATES = config('TRENDING_CANDIDATES', default=500, cast=int)
+TRENDING_SNAPSHOT_INTERVAL = config('TRENDING_SNAPSHOT_INTERVAL', default=60, cast=float)
+TRENDING_LIMIT = config('TRENDING_LIMIT', default=20, cast=int)
+TRENDING_MAX_LIMIT = config('TRENDING_MAX_LIMIT', default=100, cast=int)
+
+# For-You feed (videos.feed). Candidate sources are 'name': 'dotted.path' entries returning
+# row indices into the feature store; FEED_SOURCE_BOOSTS adds a per-source bonus to the score.
+# Feature arrays cover ready videos of the last FEED_WINDOW_DAYS and are rebuilt every
+# FEED_FEATURES_TTL seconds; ranked lists are cached per user for FEED_CACHE_TTL seconds.
+FEED_CANDIDATE_SOURCES = {
+    'recent': 'videos.feed.recent_candidates',
+    'trending': 'videos.feed.trending_candidates',
+    'following': 'videos.feed.following_candidates',
 }
+FEED_SOURCE_BOOSTS = {'recent': 0.0, 'trending': 0.0, 'following': 0.5}
+FEED_CANDIDATES_PER_SOURCE = config('FEED_CANDIDATES_PER_SOURCE', default=5000, cast=int)
+FEED_WEIGHTS = {'like_rate': 4.0, 'share_rate': 8.0, 'popularity': 0.1, 'freshness': 1.0}
+FEED_FRESHNESS_HALF_LIFE_HOURS = config('FEED_FRESHNESS_HALF_LIFE_HOURS', default=24, cast=float)
+FEED_WINDOW_DAYS = config('FEED_WINDOW_DAYS', default=30, cast=int)
+FEED_FEATURES_TTL = config('FEED_FEATURES_TTL', default=60, cast=float)
+FEED_LENGTH = config('FEED_LENGTH', default=500, cast=int)
+FEED_PAGE_SIZE = config('FEED_PAGE_SIZE', default=10, cast=int)
+FEED_MAX_PAGE_SIZE = config('FEED_MAX_PAGE_SIZE', default=50, cast=int)
+FEED_CACHE_MAX_SIZE = config('FEED_CACHE_MAX_SIZE', default=10000, cast=int)
+FEED_CACHE_TTL = config('FEED_CACHE_TTL', default=300, cast=float)
 
 
 AUTH_USER_MODEL = 'users.CustomUser'
 
 MIDDLEWARE = [
+    # First, so its timings cover every other middleware. See utils/metrics.py for the
+    # overhead budget and `manage.py bench_metrics` to check it.
+    'utils.metrics.MetricsMiddleware',
+    # Flags repeated queries (N+1) in development; see QUERY_INSPECTOR_ENABLED.
+    'utils.query_inspector.QueryInspectorMiddleware',
+    # Marks which requests may read from the replicas (utils.db_router).
+    'utils.db_router.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -107,6 +296,10 @@ if 'test' in sys.argv or os.getenv('GITHUB_ACTIONS'):
             'PORT': config('TEST_DATABASE_PORT', cast=int, default=5432),
         }
     }
+    # Mirrors of the test database standing in for read replicas in the router tests
+    # (users.tests.test_db_router); the other tests leave DATABASE_REPLICAS empty.
+    for test_replica in ('replica1', 'replica2'):
+        DATABASES[test_replica] = dict(DATABASES['default'], TEST={'MIRROR': 'default'})
 else:
     DATABASES = {
         'default': {
@@ -119,6 +312,32 @@ else:
         }
     }
 
+# Read replicas (utils.db_router). Each of DATABASE_REPLICA_HOSTS ('host' or 'host:port')
+# gets the primary's other settings, and the reads of GET requests go to a healthy one.
+# Replicas are checked every DATABASE_REPLICA_CHECK_INTERVAL seconds and ejected while they
+# are unreachable or more than DATABASE_REPLICA_MAX_LAG seconds behind. A client that wrote
+# reads from the primary for the next DATABASE_REPLICA_STICKY_SECONDS.
+DATABASE_REPLICA_HOSTS = config('DATABASE_REPLICA_HOSTS', default='', cast=Csv())
+DATABASE_REPLICA_CHECK_INTERVAL = config('DATABASE_REPLICA_CHECK_INTERVAL', default=5,
+                                         cast=float)
+DATABASE_REPLICA_MAX_LAG = config('DATABASE_REPLICA_MAX_LAG', default=2, cast=float)
+DATABASE_REPLICA_STICKY_SECONDS = config('DATABASE_REPLICA_STICKY_SECONDS', default=5, cast=int)
+DATABASE_REPLICAS = []
+for replica_index, replica_address in enumerate(DATABASE_REPLICA_HOSTS, start=1):
+    replica_host, _, replica_port = replica_address.partition(':')
+    DATABASES[f'replica{replica_index}'] = dict(
+        DATABASES['default'], HOST=replica_host,
+        PORT=int(replica_port) if replica_port else DATABASES['default']['PORT'])
+    DATABASE_REPLICAS.append(f'replica{replica_index}')
+DATABASE_ROUTERS = ['utils.db_router.PrimaryReplicaRouter']
+
+# Persistent connections, reused for DATABASE_CONN_MAX_AGE seconds and checked before reuse
+# once a request has ended, so a restarted database server does not fail the next request.
+# Set it to 0 when serving with ASGI, where connections are not reused across requests.
+DATABASE_CONN_MAX_AGE = config('DATABASE_CONN_MAX_AGE', default=60, cast=int)
+for database in DATABASES.values():
+    database.update(CONN_MAX_AGE=DATABASE_CONN_MAX_AGE, CONN_HEALTH_CHECKS=True)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -139,6 +358,27 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# PASSWORD_HASH_ITERATIONS tunes the PBKDF2 work factor per deployment; stored hashes made
+# with a different count are upgraded on the user's next successful login.
+
+PASSWORD_HASHERS = [
+    'users.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+PASSWORD_HASH_ITERATIONS = config('PASSWORD_HASH_ITERATIONS', default=0, cast=int)
+PASSWORD_HASHING_WORKERS = config(
+    'PASSWORD_HASHING_WORKERS', default=os.cpu_count() or 1, cast=int)
+PASSWORD_HASHING_QUEUE_DEPTH = config(
+    'PASSWORD_HASHING_QUEUE_DEPTH', default=2 * (os.cpu_count() or 1), cast=int)
+PASSWORD_HASHING_RETRY_AFTER = config('PASSWORD_HASHING_RETRY_AFTER', default=1, cast=int)
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
 
@@ -156,12 +396,72 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Media files (profile pictures, videos)
+
+MEDIA_ROOT = config('MEDIA_ROOT', default=os.path.join(BASE_DIR, 'media'))
+MEDIA_URL = 'media/'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# Logging
+# Records are queued in memory and written by a listener thread, so request threads never
+# wait on the stream. Repeated warnings (failed logins, missing users) are throttled per
+# message template; the number dropped is reported on the next line that gets through.
+# Set LOG_FORMAT=text for human-readable output during local development.
+
+LOG_LEVEL = config('LOG_LEVEL', default='INFO')
+LOG_FORMAT = config('LOG_FORMAT', default='json')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {
+            '()': 'utils.logger_config.JSONFormatter',
+        },
+        'text': {
+            'format': '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+        },
+    },
+    'filters': {
+        'rate_limit': {
+            '()': 'utils.logger_config.RateLimitFilter',
+            'rate': config('LOG_RATE_LIMIT', default=1.0, cast=float),
+            'burst': config('LOG_RATE_LIMIT_BURST', default=10, cast=int),
+        },
+    },
+    'handlers': {
+        # Must sort before 'queue': dictConfig builds handlers in name order.
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': LOG_FORMAT,
+        },
+        'queue': {
+            '()': 'utils.logger_config.QueueListenerHandler',
+            'handlers': ['cfg://handlers.console'],
+            'queue_size': config('LOG_QUEUE_SIZE', default=10000, cast=int),
+            'filters': ['rate_limit'],
+        },
+    },
+    'root': {
+        'handlers': ['queue'],
+        'level': LOG_LEVEL,
+    },
+    'loggers': {
+        'django': {
+            'handlers': ['queue'],
+            'level': LOG_LEVEL,
+            'propagate': False,
+        },
+    },
+}
+
+
 # Tests
 if 'test' in sys.argv or 'test_coverage' in sys.argv:
     MEDIA_ROOT = os.path.join(BASE_DIR, 'test_media')
+    QUERY_INSPECTOR_ENABLED = False
@@ -16,12 +16,17 @@ Including another URLconf
 """
 from django.urls import path, include
 from django.contrib import admin
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from utils.metrics import metrics_view
+from users.views.token_obtain_view import RateLimitedTokenObtainPairView
 
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('users.urls')),
-    path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('', include('videos.urls')),
+    path('api/token/', RateLimitedTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('metrics/', metrics_view, name='metrics'),
 ]
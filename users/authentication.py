@@ -0,0 +1,103 @@
+import copy
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from utils.cache import LRUCache
+from utils.db_router import read_from_primary
+from utils.metrics import registry
+from users.token_blacklist import get_token_blacklist
+
+
+user_cache = LRUCache(
+    maxsize=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL,
+)
+registry.register_collector('auth_user_cache', user_cache.stats)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches the user lookup behind a bounded LRU/TTL cache.
+
+    The stock JWTAuthentication runs one SELECT per request to rebuild request.user. This
+    class keeps recently authenticated users in memory, keyed by the user id claim, and
+    re-validates the token claims (active flag and revoke claim) against the cached user on
+    every hit. Entries are dropped by the CustomUser save/delete signals in users.signals.
+    Misses are read from the primary, so a lagging replica cannot cache a user whose
+    password has since changed.
+
+    Access tokens revoked by a logout are rejected through the token blacklist filter
+    (users.token_blacklist), which needs no query for tokens that are not revoked.
+
+    Methods:
+    - get_validated_token(raw_token: bytes) -> Token: Validate a token and check the blacklist.
+    - get_user(validated_token: Token) -> User: Return the user for a validated token.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        """
+        Validate an access token and reject it if it has been blacklisted.
+
+        Args:
+            raw_token (bytes): The encoded token.
+
+        Returns:
+            Token: The validated token.
+        """
+        validated_token = super().get_validated_token(raw_token)
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if jti is not None and get_token_blacklist().is_blacklisted(jti):
+            raise InvalidToken(_('Token is blacklisted'))
+        return validated_token
+
+    def get_user(self, validated_token: Token):
+        """
+        Return the user identified by the token, hitting the database only on a cache miss.
+
+        Args:
+            validated_token (Token): The validated access token.
+
+        Returns:
+            User: A private copy of the cached user instance.
+        """
+        try:
+            user_id = str(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as e:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification')) from e
+
+        user = user_cache.get(user_id)
+
+        if user is None:
+            with read_from_primary():
+                user = super().get_user(validated_token)
+            user_cache.set(user_id, user)
+        else:
+            self._check_claims(user, validated_token)
+
+        # Hand out a copy so attribute changes made while serving one request
+        # never leak into the shared cached instance.
+        return copy.copy(user)
+
+    @staticmethod
+    def _check_claims(user, validated_token: Token) -> None:
+        """
+        Apply the same checks JWTAuthentication runs after loading the user.
+
+        Args:
+            user: The cached user instance.
+            validated_token (Token): The validated access token.
+        """
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code='password_changed')
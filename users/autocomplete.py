@@ -0,0 +1,127 @@
+import threading
+import time
+from itertools import islice
+from typing import List, Tuple
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from utils.lazy import LazySingleton, maintain
+from utils.prefix_index import PrefixIndex
+from users.models.custom_user_models import CustomUser
+
+
+class UsernameIndex:
+    """
+    Process-local prefix index of the active users' usernames.
+
+    Built from the database on first use, then refreshed incrementally: every
+    USER_AUTOCOMPLETE_REFRESH_INTERVAL seconds the users whose primary key is above the
+    highest one indexed are appended, which is one range scan of the primary key. Saves and
+    deletes made by this process update the index at once through signals; renames and
+    deletions made by other processes are picked up by a full rebuild every
+    USER_AUTOCOMPLETE_REBUILD_INTERVAL seconds.
+
+    Methods:
+    - complete(prefix, limit) -> List[Tuple[int, str]]: Usernames starting with the prefix.
+    - refresh(): Index the users created since the last refresh.
+    - rebuild(): Reload every username.
+    """
+
+    def __init__(self) -> None:
+        self.index = PrefixIndex()
+        self.max_id = 0
+        self.built = False
+        self.refreshed_at = self.built_at = -float('inf')
+        self._lock = threading.Lock()
+
+    def complete(self, prefix: str, limit: int) -> List[Tuple[int, str]]:
+        """
+        Return the active users whose username starts with prefix, ignoring case.
+
+        Args:
+            prefix (str): The prefix typed so far.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            List[Tuple[int, str]]: (id, username) pairs in alphabetical order.
+        """
+        now = time.monotonic()
+        if self.built_at + settings.USER_AUTOCOMPLETE_REBUILD_INTERVAL <= now:
+            maintain(self._lock, lambda: self.built, self.rebuild)
+        elif self.refreshed_at + settings.USER_AUTOCOMPLETE_REFRESH_INTERVAL <= now:
+            maintain(self._lock, lambda: self.built, self.refresh)
+        return self.index.complete(prefix, limit)
+
+    def refresh(self) -> None:
+        """
+        Index the active users created since the last refresh or rebuild.
+        """
+        users = (CustomUser.objects.filter(pk__gt=self.max_id, is_active=True)
+                 .order_by('pk').values_list('pk', 'username')
+                 .iterator(chunk_size=settings.USER_AUTOCOMPLETE_BATCH))
+        while True:
+            batch = list(islice(users, settings.USER_AUTOCOMPLETE_BATCH))
+            if not batch:
+                break
+            self.index.update(batch)
+            self.max_id = batch[-1][0]
+        self.refreshed_at = time.monotonic()
+
+    def rebuild(self) -> None:
+        """
+        Reload every active user, dropping renamed and deleted ones.
+        """
+        started = time.monotonic()
+        users = list(CustomUser.objects.filter(is_active=True).values_list('pk', 'username')
+                     .iterator(chunk_size=settings.USER_AUTOCOMPLETE_BATCH))
+        self.index = PrefixIndex(users)
+        self.max_id = max((user_id for user_id, _ in users), default=0)
+        self.built = True
+        self.built_at = self.refreshed_at = started
+
+    def update_user(self, user: CustomUser) -> None:
+        if user.is_active:
+            self.index.add(user.pk, user.username)
+        else:
+            self.index.remove(user.pk)
+
+    def remove_user(self, user_id: int) -> None:
+        self.index.remove(user_id)
+
+
+_username_index = LazySingleton(UsernameIndex, 'USER_AUTOCOMPLETE_')
+
+
+def get_username_index() -> UsernameIndex:
+    """
+    Return the process-wide username index.
+
+    Returns:
+        UsernameIndex: The shared instance.
+    """
+    return _username_index.get()
+
+
+@receiver(post_save, sender=CustomUser, dispatch_uid='index_username')
+def index_username(instance: CustomUser, update_fields=None, **kwargs) -> None:
+    """
+    Reflect a saved user in this process's index, if it has been built.
+    """
+    # Logins save last_login and rehashed passwords only; skip them.
+    if update_fields is not None and not {'username', 'is_active'} & set(update_fields):
+        return
+    index = _username_index.peek()
+    if index is not None:
+        index.update_user(instance)
+
+
+@receiver(post_delete, sender=CustomUser, dispatch_uid='unindex_username')
+def unindex_username(instance: CustomUser, **kwargs) -> None:
+    """
+    Drop a deleted user from this process's index, if it has been built.
+    """
+    index = _username_index.peek()
+    if index is not None:
+        index.remove_user(instance.pk)
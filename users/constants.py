@@ -3,3 +3,11 @@ USER_NOT_FOUND_MESSAGE = "User not found."
 WRONG_CREDENTIALS_ERROR = "Wrong credentials."
 FAILED_LOGIN_ATTEMPT = "Failed login attempt for username: %s"
 MISSING_FIELD_ERROR = "Missing field: "
+LOGIN_BUSY_ERROR = "Too many concurrent logins, please retry later."
+HASHING_POOL_SATURATED = "Password hashing pool saturated, rejecting login for username: %s"
+INVALID_IDS_ERROR = "Query parameter 'ids' must be a comma-separated list of user IDs."
+TOO_MANY_IDS_ERROR = "At most %s user IDs can be requested at once."
+PROFILE_PICTURE_PROCESSING_FAILED = "Could not process profile picture %s of user %s"
+INVALID_BODY_ERROR = "Request body could not be decoded."
+CANNOT_FOLLOW_SELF_ERROR = "Users cannot follow themselves."
+INVALID_REFRESH_TOKEN_ERROR = "A valid refresh token of the requesting user is required."
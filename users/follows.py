@@ -0,0 +1,68 @@
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+
+from users.models.custom_user_models import CustomUser
+from users.models.follow_models import Follow
+from users.signals import invalidate_cached_user, user_followed, user_unfollowed
+
+
+def _adjust_counts(follower_id: int, followee_id: int, delta: int) -> None:
+    # One statement for both rows, so two users following each other at the same time
+    # lock their rows in the same order.
+    CustomUser.objects.filter(pk__in=[follower_id, followee_id]).update(
+        following_count=F('following_count') + Case(
+            When(pk=follower_id, then=Value(delta)), default=Value(0)),
+        follower_count=F('follower_count') + Case(
+            When(pk=followee_id, then=Value(delta)), default=Value(0)),
+    )
+
+
+def _on_commit(signal, follower_id: int, followee_id: int) -> None:
+    def notify():
+        invalidate_cached_user(follower_id)
+        invalidate_cached_user(followee_id)
+        signal.send(sender=Follow, follower_id=follower_id, followee_id=followee_id)
+
+    transaction.on_commit(notify)
+
+
+def follow(follower: CustomUser, followee: CustomUser) -> bool:
+    """
+    Make follower follow followee, keeping both users' counts in the same transaction.
+
+    user_followed is sent once the edge is committed.
+
+    Args:
+        follower (CustomUser): The user who follows.
+        followee (CustomUser): The user being followed; must differ from follower.
+
+    Returns:
+        bool: False if follower already followed followee.
+    """
+    with transaction.atomic():
+        _, created = Follow.objects.get_or_create(follower=follower, followee=followee)
+        if created:
+            _adjust_counts(follower.pk, followee.pk, 1)
+            _on_commit(user_followed, follower.pk, followee.pk)
+    return created
+
+
+def unfollow(follower: CustomUser, followee: CustomUser) -> bool:
+    """
+    Remove the edge from follower to followee and update both users' counts.
+
+    user_unfollowed is sent once the removal is committed.
+
+    Args:
+        follower (CustomUser): The user who follows.
+        followee (CustomUser): The user being followed.
+
+    Returns:
+        bool: False if follower did not follow followee.
+    """
+    with transaction.atomic():
+        deleted, _ = Follow.objects.filter(follower=follower, followee=followee).delete()
+        if deleted:
+            _adjust_counts(follower.pk, followee.pk, -1)
+            _on_commit(user_unfollowed, follower.pk, followee.pk)
+    return bool(deleted)
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 hasher whose iteration count is read from settings.
+
+    The algorithm name is unchanged, so hashes produced by Django's PBKDF2PasswordHasher
+    still verify. Whenever a stored hash was made with a different iteration count,
+    must_update() reports it and the login path re-hashes the password transparently, so
+    changing PASSWORD_HASH_ITERATIONS migrates users as they log in.
+    """
+
+    @property
+    def iterations(self) -> int:
+        return settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
@@ -0,0 +1,179 @@
+import json
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client, override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from utils.benchmarking import find_regressions, peak_rss_mb, summarize_latencies
+from users.models.custom_user_models import CustomUser
+
+PASSWORD = 'bench-api-password'
+PREFIX = 'bench_api_'
+# Endpoints answering anything but 200 when they succeed.
+EXPECTED_STATUS = {'register': 201, 'profile_delete': 204}
+
+
+class _QueryCounter:  # pylint: disable=too-few-public-methods
+    """
+    Database execute wrapper counting the queries of one worker thread.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    """
+    Load benchmark of the user and token endpoints, with a regression check.
+
+    --users users are seeded, then --concurrency worker threads share them and each runs
+    --rounds times, per user, the journey of a client: register a new account, log in,
+    obtain and refresh a token pair, then get and update the profile and delete the new
+    account. Requests go through the whole Django stack in process, like a threaded WSGI
+    server, so the report leaves out the network and the HTTP server.
+
+    The JSON report gives, per endpoint, throughput, p50/p95/p99 latency, queries per
+    request and unexpected statuses, and the peak RSS of the process. Save it with
+    --output, then compare later runs with --baseline: the command fails when a metric
+    regresses beyond --threshold (utils.benchmarking.find_regressions). Baselines only
+    compare runs on the same machine and database. Rate limits are off during the run and
+    every seeded or registered user is deleted when it ends.
+    """
+
+    help = 'Benchmark the user and token endpoints and compare with a baseline.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--rounds', type=int, default=1)
+        parser.add_argument('--output', help='Write the JSON report to this file.')
+        parser.add_argument('--baseline', help='Fail on regressions against this report.')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Tolerated relative change of every metric but errors.')
+
+    def handle(self, *args, **options):
+        users = self._seed(options['users'])
+        concurrency = max(min(options['concurrency'], len(users)), 1)
+        slices = [(worker, users[worker::concurrency], options['rounds'])
+                  for worker in range(concurrency)]
+
+        try:
+            with override_settings(ALLOWED_HOSTS=['*'], RATE_LIMITS={}), \
+                    ThreadPoolExecutor(concurrency) as pool:
+                start = time.perf_counter()
+                results = list(pool.map(self._run_worker, slices))
+                elapsed = time.perf_counter() - start
+        finally:
+            OutstandingToken.objects.filter(user__username__startswith=PREFIX).delete()
+            CustomUser.objects.filter(username__startswith=PREFIX).delete()
+
+        report = {
+            'database': connection.vendor,
+            'users': len(users),
+            'concurrency': concurrency,
+            'rounds': options['rounds'],
+            'elapsed_seconds': elapsed,
+            'peak_rss_mb': peak_rss_mb(),
+            'endpoints': self._summarize(results, elapsed),
+        }
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as baseline:
+                report['regressions'] = find_regressions(report, json.load(baseline),
+                                                         options['threshold'])
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, indent=2)
+
+        self.stdout.write(json.dumps(report, indent=2))
+        if report.get('regressions'):
+            raise CommandError(f"{len(report['regressions'])} regressions against "
+                               f"{options['baseline']}")
+
+    @staticmethod
+    def _seed(count):
+        # Hashed once: seeding is not what is measured.
+        password = make_password(PASSWORD)
+        return CustomUser.objects.bulk_create(
+            CustomUser(username=f'{PREFIX}{i}', email=f'{PREFIX}{i}@example.com',
+                       password=password)
+            for i in range(count)
+        )
+
+    def _run_worker(self, task):
+        worker, users, rounds = task
+        client = Client()
+        counter = _QueryCounter()
+        wrapped = [connections[alias] for alias in connections]
+        for wrapped_connection in wrapped:
+            wrapped_connection.execute_wrappers.append(counter)
+        samples = defaultdict(list)
+
+        def call(endpoint, method, path, body=None, token=None):
+            expected = EXPECTED_STATUS.get(endpoint, 200)
+            headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if token else {}
+            queries = counter.count
+            start = time.perf_counter()
+            response = getattr(client, method)(path, body, content_type='application/json',
+                                               **headers)
+            latency = time.perf_counter() - start
+            samples[endpoint].append((latency, counter.count - queries,
+                                      response.status_code != expected))
+            return response if response.status_code == expected else None
+
+        try:
+            for round_index in range(rounds):
+                for user in users:
+                    self._journey(call, user, f'{PREFIX}new_{worker}_{round_index}_{user.pk}')
+        finally:
+            for wrapped_connection in wrapped:
+                wrapped_connection.execute_wrappers.remove(counter)
+            connections.close_all()
+        return samples
+
+    @staticmethod
+    def _journey(call, user, new_username):
+        registered = call('register', 'post', reverse('register_user'), {
+            'username': new_username, 'email': f'{new_username}@example.com',
+            'password': PASSWORD,
+        })
+        credentials = {'username': user.username, 'password': PASSWORD}
+        call('login', 'post', reverse('login_user'), credentials)
+        tokens = call('token_obtain_pair', 'post', reverse('token_obtain_pair'), credentials)
+        if tokens is None:
+            return
+        tokens = tokens.json()
+        refreshed = call('token_refresh', 'post', reverse('token_refresh'),
+                         {'refresh': tokens['refresh']})
+        access = refreshed.json()['access'] if refreshed else tokens['access']
+
+        profile = reverse('user_profile', kwargs={'userid': user.pk})
+        call('profile_get', 'get', profile, token=access)
+        call('profile_put', 'put', profile, {'bio': new_username}, token=access)
+        if registered is not None:
+            registered = registered.json()
+            call('profile_delete', 'delete',
+                 reverse('user_profile', kwargs={'userid': registered['user']['id']}),
+                 token=registered['access'])
+
+    @staticmethod
+    def _summarize(results, elapsed):
+        endpoints = {}
+        for endpoint in sorted({endpoint for samples in results for endpoint in samples}):
+            samples = [sample for worker in results for sample in worker.get(endpoint, ())]
+            # Each endpoint's throughput is over the whole run, which it shares with the others.
+            summary = summarize_latencies([latency for latency, _, _ in samples], elapsed)
+            summary['queries_per_request'] = sum(queries for _, queries, _ in samples) \
+                / len(samples)
+            summary['errors'] = sum(failed for _, _, failed in samples)
+            endpoints[endpoint] = summary
+        return endpoints
@@ -0,0 +1,65 @@
+import time
+
+from django.db import connection, transaction
+from django.core.management.base import BaseCommand
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from users.models.custom_user_models import CustomUser
+from users.profile_cache import profile_cache
+from users.views.user_profile_view import UserProfileAPIView
+from users.views.user_bulk_profile_view import BulkUserProfileAPIView
+
+
+class Command(BaseCommand):
+    """
+    Benchmark fetching a page of profile cards one id at a time versus in one bulk request.
+
+    Seeds users inside a transaction that is rolled back afterwards. The profile cache is
+    cleared before every round so both paths are measured cold.
+    """
+
+    help = 'Compare per-id profile fetches with the bulk profile endpoint.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch', type=int, default=50)
+        parser.add_argument('--rounds', type=int, default=20)
+
+    def handle(self, *args, **options):
+        factory = APIRequestFactory()
+        single_view = UserProfileAPIView.as_view()
+        bulk_view = BulkUserProfileAPIView.as_view()
+
+        with transaction.atomic():
+            users = CustomUser.objects.bulk_create(
+                CustomUser(username=f'bench_bulk_{i}', email=f'bench_bulk_{i}@example.com')
+                for i in range(options['batch'])
+            )
+            user_ids = [user.pk for user in users]
+            query = ','.join(str(user_id) for user_id in user_ids)
+
+            def per_id():
+                for user_id in user_ids:
+                    single_view(factory.get(f'/users/{user_id}/'), userid=user_id).render()
+
+            def bulk():
+                bulk_view(factory.get('/users/', {'ids': query})).render()
+
+            for label, fetch in (('per-id', per_id), ('bulk', bulk)):
+                self._run(label, fetch, options['rounds'])
+
+            transaction.set_rollback(True)
+
+    def _run(self, label, fetch, rounds):
+        elapsed = 0.0
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(rounds):
+                profile_cache.clear()
+                start = time.perf_counter()
+                fetch()
+                elapsed += time.perf_counter() - start
+
+        self.stdout.write(
+            f'{label:>6}: {len(queries) / rounds:.1f} queries/page, '
+            f'{elapsed / rounds * 1e3:.2f} ms/page'
+        )
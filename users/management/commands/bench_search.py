@@ -0,0 +1,112 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from utils.benchmarking import peak_rss_mb, summarize_latencies
+from utils.search import SearchPagination, ranked_search
+from users.autocomplete import UsernameIndex
+from users.models.custom_user_models import USER_SEARCH_VECTOR, CustomUser
+
+
+SYLLABLES = ['ka', 'ri', 'mo', 'lu', 'ze', 'an', 'to', 'vi', 'sa', 'ne', 'jo', 'el', 'da', 'py']
+WORDS = ['dance', 'music', 'cooking', 'travel', 'comedy', 'fitness', 'gaming', 'art', 'pets',
+         'fashion', 'science', 'football', 'makeup', 'books', 'cars', 'nature', 'coffee']
+
+
+class Command(BaseCommand):
+    """
+    Measure user search and username autocomplete latency against --users seeded users.
+
+    Autocomplete is timed through the in-process index (users.autocomplete), after timing
+    its build, and compared with the `username__istartswith` query it replaces, which no
+    B-tree index serves for mixed case. On PostgreSQL, the ranked full-text and trigram
+    search (utils.search) is compared with `icontains` on username and bio; other databases
+    have no such indexes and skip it. The seeded users are rolled back.
+    """
+
+    help = 'Benchmark user search and username autocomplete.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1_000_000)
+        parser.add_argument('--queries', type=int, default=1000,
+                            help='Autocomplete lookups timed against the index.')
+        parser.add_argument('--db-queries', type=int, default=50,
+                            help='Queries timed against the database per method.')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        report = {'users': options['users']}
+
+        with transaction.atomic():
+            usernames = self._seed(rng, options['users'])
+            prefixes = [name[:rng.randint(1, 4)]
+                        for name in rng.choices(usernames, k=options['queries'])]
+
+            report['autocomplete_index'] = self._time_index(prefixes)
+            report['autocomplete_istartswith'] = self._time(
+                prefixes[:options['db_queries']],
+                lambda prefix: list(CustomUser.objects.filter(username__istartswith=prefix)
+                                    .order_by('username').values_list('pk', 'username')[:10]))
+
+            if connection.vendor == 'postgresql':
+                words = rng.choices(WORDS + [name[:-1] for name in usernames[:100]],
+                                    k=options['db_queries'])
+                report['search_ranked'] = self._time(words, self._ranked_page)
+                report['search_icontains'] = self._time(words, lambda word: list(
+                    CustomUser.objects.filter(Q(username__icontains=word)
+                                              | Q(bio__icontains=word))[:20]))
+            else:
+                report['search_ranked'] = f'skipped: needs PostgreSQL, not {connection.vendor}'
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps(report, indent=2))
+
+    @staticmethod
+    def _seed(rng, count):
+        usernames = []
+        for start in range(0, count, 10_000):
+            batch = []
+            for index in range(start, min(start + 10_000, count)):
+                username = ''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) + str(index)
+                usernames.append(username)
+                batch.append(CustomUser(username=username, email=f'{username}@example.com',
+                                        bio=' '.join(rng.choices(WORDS, k=4))))
+            CustomUser.objects.bulk_create(batch)
+        return usernames
+
+    def _time_index(self, prefixes):
+        rss_before = peak_rss_mb()
+        index = UsernameIndex()
+        start = time.perf_counter()
+        index.rebuild()
+        build_s = time.perf_counter() - start
+
+        report = self._time(prefixes, lambda prefix: index.complete(prefix, 10))
+        report.update({'build_seconds': build_s,
+                       'peak_rss_growth_mb': peak_rss_mb() - rss_before})
+        return report
+
+    @staticmethod
+    def _ranked_page(word):
+        users = ranked_search(CustomUser.objects.only('id', 'username'), USER_SEARCH_VECTOR,
+                              word, similar_field='username')
+        request = Request(APIRequestFactory().get('/', {'limit': 20}))
+        return SearchPagination().paginate_queryset(users, request)
+
+    @staticmethod
+    def _time(queries, run):
+        latencies = []
+        start = time.perf_counter()
+        for query in queries:
+            begin = time.perf_counter()
+            run(query)
+            latencies.append(time.perf_counter() - begin)
+        return summarize_latencies(latencies, time.perf_counter() - start)
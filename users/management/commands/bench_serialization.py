@@ -0,0 +1,87 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from utils.renderers import FastJSONRenderer, orjson
+from users.models.custom_user_models import CustomUser
+from users.serializers import CustomUserSerializer, user_values_serializer
+
+
+class Command(BaseCommand):
+    """
+    Microbenchmark of profile serialization and JSON rendering.
+
+    --users users are seeded, half of them with a profile picture and its variants, then
+    serialized --repeat times with CustomUserSerializer over model instances and with
+    CustomUserValuesSerializer over .values() rows, each rendered with JSONRenderer and
+    FastJSONRenderer. Loading the rows is timed apart from serializing them. The best run
+    of each step is reported, along with whether both paths rendered the same bytes. The
+    seeded users are rolled back.
+    """
+
+    help = 'Compare profile serialization and rendering through DRF and the fast path.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            CustomUser.objects.bulk_create(
+                CustomUser(username=f'bench_serialization_{i}',
+                           email=f'bench_serialization_{i}@example.com', bio=f'Bio {i}',
+                           follower_count=i,
+                           **(self._picture(i) if i % 2 else {}))
+                for i in range(options['users'])
+            )
+            users = CustomUser.objects.filter(username__startswith='bench_serialization_') \
+                .order_by('pk')
+            repeat = options['repeat']
+
+            instances = self._best(repeat, lambda: list(users.all()))
+            rows = self._best(repeat, lambda: list(users.values(*user_values_serializer.columns)))
+            drf = self._best(repeat, lambda: CustomUserSerializer(instances['output'],
+                                                                  many=True).data)
+            fast = self._best(repeat,
+                              lambda: user_values_serializer.serialize_rows(rows['output']))
+            drf_json = self._best(repeat, lambda: JSONRenderer().render(drf['output']))
+            fast_json = self._best(repeat, lambda: FastJSONRenderer().render(fast['output']))
+
+            transaction.set_rollback(True)
+
+        report = {
+            'users': options['users'],
+            'orjson': orjson is not None,
+            'load_instances_ms': instances['ms'],
+            'load_rows_ms': rows['ms'],
+            'serialize_drf_ms': drf['ms'],
+            'serialize_values_ms': fast['ms'],
+            'render_json_renderer_ms': drf_json['ms'],
+            'render_fast_json_renderer_ms': fast_json['ms'],
+            'serialize_speedup': drf['ms'] / fast['ms'],
+            'render_speedup': drf_json['ms'] / fast_json['ms'],
+            'end_to_end_speedup': (instances['ms'] + drf['ms'] + drf_json['ms'])
+            / (rows['ms'] + fast['ms'] + fast_json['ms']),
+            'identical_output': drf_json['output'] == fast_json['output'],
+        }
+        self.stdout.write(json.dumps(report, indent=2))
+
+    @staticmethod
+    def _picture(index):
+        return {
+            'profile_picture': f'profile_pictures/{index}.png',
+            'profile_picture_variants': {variant: f'profile_pictures/{index}_{variant}.webp'
+                                         for variant in ('small', 'medium', 'large')},
+        }
+
+    @staticmethod
+    def _best(repeat, run):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = run()
+            best = min(best, time.perf_counter() - start)
+        return {'ms': best * 1e3, 'output': output}
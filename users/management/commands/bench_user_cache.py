@@ -0,0 +1,60 @@
+import time
+
+from django.db import connection, transaction
+from django.core.management.base import BaseCommand
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.authentication import CachedJWTAuthentication, user_cache
+from users.models.custom_user_models import CustomUser
+
+
+class Command(BaseCommand):
+    """
+    Benchmark JWT user resolution with and without the in-process user cache.
+
+    Seeds users inside a transaction that is rolled back afterwards, then authenticates the
+    same stream of requests with JWTAuthentication and CachedJWTAuthentication and reports
+    queries and microseconds per request.
+    """
+
+    help = 'Compare queries per request for JWTAuthentication and CachedJWTAuthentication.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--requests', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            users = CustomUser.objects.bulk_create(
+                CustomUser(username=f'bench_cache_{i}', email=f'bench_cache_{i}@example.com')
+                for i in range(options['users'])
+            )
+            factory = APIRequestFactory()
+            requests = [
+                factory.get('/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+                for user in users
+            ]
+            stream = [requests[i % len(requests)] for i in range(options['requests'])]
+
+            for label, authentication in (('uncached', JWTAuthentication()),
+                                          ('cached', CachedJWTAuthentication())):
+                user_cache.clear()
+                self._run(label, authentication, stream)
+
+            self.stdout.write(f"cache stats: {user_cache.stats()}")
+            transaction.set_rollback(True)
+
+    def _run(self, label, authentication, stream):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for request in stream:
+                authentication.authenticate(request)
+            elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f'{label:>8}: {len(queries) / len(stream):.3f} queries/request, '
+            f'{elapsed / len(stream) * 1e6:.1f} us/request'
+        )
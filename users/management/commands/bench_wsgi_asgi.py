@@ -0,0 +1,110 @@
+import asyncio
+import contextlib
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from unittest import mock
+
+from django.db import connections
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient, Client, override_settings
+
+from utils.benchmarking import summarize_latencies
+from users.models.custom_user_models import CustomUser
+from users.urls import build_urlpatterns
+
+
+def _urlconf(async_views):
+    urlconf = ModuleType(f'bench_urls_{"async" if async_views else "sync"}')
+    urlconf.urlpatterns = build_urlpatterns(async_views)
+    return urlconf
+
+
+class Command(BaseCommand):
+    """
+    Load benchmark of the profile endpoint through the sync (WSGI) and async (ASGI) stacks.
+
+    The WSGI run drives the DRF views through Django's synchronous handler from a pool of
+    worker threads, like a threaded WSGI server. The ASGI run drives the native async views
+    through the asynchronous handler from concurrent tasks on one event loop. Seeded users
+    are deleted when the run finishes.
+    """
+
+    help = 'Compare WSGI and ASGI throughput and tail latency of the user profile endpoint.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--requests', type=int, default=2000)
+        parser.add_argument('--concurrency', type=int, default=16)
+        parser.add_argument('--cold', action='store_true',
+                            help='Bypass the profile cache so every request queries the database.')
+
+    def handle(self, *args, **options):
+        users = CustomUser.objects.bulk_create(
+            CustomUser(username=f'bench_asgi_{i}', email=f'bench_asgi_{i}@example.com')
+            for i in range(options['users'])
+        )
+        paths = [f'/users/{random.choice(users).pk}/' for _ in range(options['requests'])]
+
+        try:
+            with override_settings(ALLOWED_HOSTS=['*']), self._cache_bypass(options['cold']):
+                results = {
+                    'wsgi': self._run_wsgi(paths, options['concurrency']),
+                    'asgi': asyncio.run(self._run_asgi(paths, options['concurrency'])),
+                }
+        finally:
+            CustomUser.objects.filter(username__startswith='bench_asgi_').delete()
+
+        self.stdout.write(json.dumps(results, indent=2))
+
+    @staticmethod
+    def _cache_bypass(cold):
+        if not cold:
+            return contextlib.nullcontext()
+        return mock.patch('users.profile_cache.profile_cache.get', return_value=None)
+
+    @staticmethod
+    def _run_wsgi(paths, concurrency):
+        urlconf = _urlconf(async_views=False)
+
+        def fetch(chunk):
+            client = Client()
+            latencies = []
+            try:
+                for path in chunk:
+                    start = time.perf_counter()
+                    client.get(path)
+                    latencies.append(time.perf_counter() - start)
+            finally:
+                connections.close_all()
+            return latencies
+
+        chunks = [paths[i::concurrency] for i in range(concurrency)]
+        with override_settings(ROOT_URLCONF=urlconf), ThreadPoolExecutor(concurrency) as pool:
+            start = time.perf_counter()
+            latencies = [latency for chunk in pool.map(fetch, chunks) for latency in chunk]
+            elapsed = time.perf_counter() - start
+
+        return summarize_latencies(latencies, elapsed)
+
+    @staticmethod
+    async def _run_asgi(paths, concurrency):
+        urlconf = _urlconf(async_views=True)
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def fetch(path):
+            async with semaphore:
+                start = time.perf_counter()
+                await client.get(path)
+                latencies.append(time.perf_counter() - start)
+
+        with override_settings(ROOT_URLCONF=urlconf):
+            start = time.perf_counter()
+            await asyncio.gather(*(fetch(path) for path in paths))
+            elapsed = time.perf_counter() - start
+
+        return summarize_latencies(latencies, elapsed)
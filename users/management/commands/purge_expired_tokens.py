@@ -0,0 +1,26 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from users.token_blacklist import purge_expired_tokens
+
+
+class Command(BaseCommand):
+    """
+    Delete the expired outstanding and blacklisted JWTs in short batches.
+
+    Meant to run periodically, for instance from cron, in place of simplejwt's
+    flushexpiredtokens, whose single DELETE locks the token tables for as long as it runs.
+    """
+
+    help = 'Delete expired outstanding and blacklisted tokens in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Tokens deleted per transaction.')
+        parser.add_argument('--sleep', type=float, default=0,
+                            help='Seconds to pause between batches.')
+
+    def handle(self, *args, **options):
+        purged = purge_expired_tokens(options['batch_size'], options['sleep'])
+        self.stdout.write(json.dumps(purged, indent=2))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_customuser_profile_picture_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='follower_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='follower count'),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='following_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='following count'),
+        ),
+        migrations.CreateModel(
+            name='Follow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('followee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='follower_edges', to=settings.AUTH_USER_MODEL, verbose_name='followee')),
+                ('follower', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='following_edges', to=settings.AUTH_USER_MODEL, verbose_name='follower')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['follower', '-created_at', '-id'], include=('followee',), name='follow_following_idx'), models.Index(fields=['followee', '-created_at', '-id'], include=('follower',), name='follow_followers_idx')],
+                'constraints': [models.UniqueConstraint(fields=('follower', 'followee'), name='follow_unique_edge'), models.CheckConstraint(condition=models.Q(('follower', models.F('followee')), _negated=True), name='follow_not_self')],
+            },
+        ),
+    ]
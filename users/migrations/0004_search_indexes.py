@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+import utils.migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0003_follow'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        utils.migrations.PostgresIndexConcurrently(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('username', config='simple', weight='A'), '||', django.contrib.postgres.search.SearchVector('bio', config='simple', weight='B'), django.contrib.postgres.search.SearchConfig('simple')), name='user_search_idx'),
+        ),
+        utils.migrations.PostgresIndexConcurrently(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('username', name='gin_trgm_ops'), name='user_username_trgm_idx'),
+        ),
+    ]
@@ -1 +1,2 @@
 from .custom_user_models import CustomUser  # pylint: disable=unused-import
+from .follow_models import Follow  # pylint: disable=unused-import
@@ -1,10 +1,29 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.utils.translation import gettext_lazy as _
 
+from utils.search import search_vector
+
+
+# Full-text document of a user (users.views.user_search_view): the username outranks the bio.
+USER_SEARCH_VECTOR = search_vector(('username', 'A'), ('bio', 'B'))
+
 
 class CustomUser(AbstractUser):
     email = models.EmailField(_('email address'), unique=True)
     bio = models.TextField(_("bio"), max_length=500, blank=True)
     profile_picture = models.ImageField(
         _("profile picture"), upload_to='profile_pictures/', null=True, blank=True)
+    profile_picture_variants = models.JSONField(
+        _("profile picture variants"), default=dict, blank=True)
+    # Denormalized from Follow (users.follows) so profiles never count edges.
+    follower_count = models.PositiveIntegerField(_("follower count"), default=0)
+    following_count = models.PositiveIntegerField(_("following count"), default=0)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            GinIndex(USER_SEARCH_VECTOR, name='user_search_idx'),
+            # Trigram matches of misspelled or partial usernames.
+            GinIndex(OpClass('username', name='gin_trgm_ops'), name='user_username_trgm_idx'),
+        ]
@@ -0,0 +1,35 @@
+from django.db import models
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+
+
+class Follow(models.Model):
+    """
+    A directed edge of the social graph: follower follows followee.
+
+    Both listings are served by covering indexes in (user, newest first) order, so listing
+    followers or followings is an index-only range scan on PostgreSQL. The counts shown on
+    profiles are kept on the users (CustomUser.follower_count and following_count).
+    """
+
+    follower = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                                 related_name='following_edges', verbose_name=_("follower"))
+    followee = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                                 related_name='follower_edges', verbose_name=_("followee"))
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['follower', 'followee'], name='follow_unique_edge'),
+            models.CheckConstraint(condition=~models.Q(follower=models.F('followee')),
+                                   name='follow_not_self'),
+        ]
+        indexes = [
+            models.Index(fields=['follower', '-created_at', '-id'], include=['followee'],
+                         name='follow_following_idx'),
+            models.Index(fields=['followee', '-created_at', '-id'], include=['follower'],
+                         name='follow_followers_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.follower_id} follows {self.followee_id}'
@@ -0,0 +1,122 @@
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_login_failed
+from django.contrib.auth.hashers import check_password, make_password
+
+from utils.bounded_executor import BoundedExecutor
+from utils.lazy import LazySingleton
+
+
+User = get_user_model()
+
+_executor = LazySingleton(
+    lambda: BoundedExecutor(
+        max_workers=settings.PASSWORD_HASHING_WORKERS,
+        queue_depth=settings.PASSWORD_HASHING_QUEUE_DEPTH,
+        thread_name_prefix='password-hashing',
+    ),
+    ('PASSWORD_HASHING_WORKERS', 'PASSWORD_HASHING_QUEUE_DEPTH'),
+    on_reset=lambda executor: executor.shutdown(wait=False),
+)
+
+
+def get_hashing_executor() -> BoundedExecutor:
+    """
+    Return the process-wide password hashing pool, creating it on first use.
+
+    PBKDF2 in hashlib releases the GIL, so a thread pool gives real parallelism here
+    without the start-up and pickling cost of a process pool.
+
+    Returns:
+        BoundedExecutor: The pool sized by PASSWORD_HASHING_WORKERS and
+        PASSWORD_HASHING_QUEUE_DEPTH.
+    """
+    return _executor.get()
+
+
+def _verify_password(password: str, encoded: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password on a hashing worker, re-hashing it if the stored hash is outdated.
+
+    When the user does not exist (encoded is None) the default hasher still runs once so
+    the response time does not reveal which usernames are registered.
+
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the password matched, and a fresh hash when
+        the stored one must be upgraded.
+    """
+    if encoded is None:
+        make_password(password)
+        return False, None
+
+    outdated = []
+    is_correct = check_password(password, encoded, setter=outdated.append)
+
+    return is_correct, make_password(password) if is_correct and outdated else None
+
+
+def check_credentials(username: str, password: str, request=None):
+    """
+    Authenticate a username/password pair, running the hash on the bounded pool.
+
+    The user lookup and any password upgrade write stay on the calling thread; only the
+    CPU-bound hashing moves to the pool.
+
+    Args:
+        username (str): The username to authenticate.
+        password (str): The raw password.
+        request: The current request, forwarded to the user_login_failed signal.
+
+    Returns:
+        User: The authenticated user, or None if the credentials are invalid.
+
+    Raises:
+        ExecutorSaturated: If the hashing pool cannot accept more work.
+    """
+    user = User.objects.filter(**{User.USERNAME_FIELD: username}).first()
+    encoded = user.password if user is not None else None
+
+    is_correct, new_hash = get_hashing_executor().run(_verify_password, password, encoded)
+    if user is None or not is_correct or not user.is_active:
+        user_login_failed.send(sender=__name__, credentials={'username': username},
+                               request=request)
+        return None
+
+    if new_hash is not None:
+        user.password = new_hash
+        user.save(update_fields=['password'])
+
+    return user
+
+
+async def acheck_credentials(username: str, password: str, request=None):
+    """
+    Async variant of check_credentials that awaits the hashing pool off the event loop.
+
+    Args:
+        username (str): The username to authenticate.
+        password (str): The raw password.
+        request: The current request, forwarded to the user_login_failed signal.
+
+    Returns:
+        User: The authenticated user, or None if the credentials are invalid.
+
+    Raises:
+        ExecutorSaturated: If the hashing pool cannot accept more work.
+    """
+    user = await User.objects.filter(**{User.USERNAME_FIELD: username}).afirst()
+    encoded = user.password if user is not None else None
+
+    is_correct, new_hash = await get_hashing_executor().arun(_verify_password, password, encoded)
+    if user is None or not is_correct or not user.is_active:
+        await user_login_failed.asend(sender=__name__, credentials={'username': username},
+                                      request=request)
+        return None
+
+    if new_hash is not None:
+        user.password = new_hash
+        await user.asave(update_fields=['password'])
+
+    return user
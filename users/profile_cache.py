@@ -0,0 +1,90 @@
+import hashlib
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+from django.conf import settings
+from utils.cache import LRUCache
+from utils.metrics import registry
+from utils.renderers import FastJSONRenderer
+
+
+class CachedProfile(NamedTuple):
+    serialized: Dict[str, Any]
+    content: bytes
+    etag: str
+
+
+profile_cache = LRUCache(
+    maxsize=settings.PROFILE_CACHE_MAX_SIZE,
+    ttl=settings.PROFILE_CACHE_TTL,
+)
+registry.register_collector('profile_cache', profile_cache.stats)
+
+_renderer = FastJSONRenderer()
+_invalidations = 0  # pylint: disable=invalid-name
+_invalidations_lock = threading.Lock()
+
+
+def get_cached_profile(user_id) -> Optional[CachedProfile]:
+    """
+    Return the cached rendering of a user profile.
+
+    Args:
+        user_id: The primary key of the user.
+
+    Returns:
+        Optional[CachedProfile]: The cached entry, or None on a miss.
+    """
+    return profile_cache.get(str(user_id))
+
+
+def invalidation_marker() -> int:
+    """
+    Return a marker to take before reading a profile from the database.
+
+    Passing it back to cache_profile prevents a read that raced with a write from caching
+    the stale representation.
+
+    Returns:
+        int: The number of invalidations seen so far.
+    """
+    return _invalidations
+
+
+def cache_profile(user_id, serialized: Dict[str, Any],
+                  marker: Optional[int] = None) -> CachedProfile:
+    """
+    Render a serialized profile once and cache the bytes with a strong ETag.
+
+    Args:
+        user_id: The primary key of the user.
+        serialized (Dict[str, Any]): The CustomUserSerializer output, of a row read from
+        the primary database.
+        marker (Optional[int]): The value of invalidation_marker() taken before the read.
+
+    Returns:
+        CachedProfile: The rendered entry, cached unless an invalidation happened since
+        marker was taken.
+    """
+    content = _renderer.render(serialized)
+    entry = CachedProfile(serialized, content, f'"{hashlib.sha1(content).hexdigest()}"')
+
+    with _invalidations_lock:
+        if marker is None or marker == _invalidations:
+            profile_cache.set(str(user_id), entry)
+
+    return entry
+
+
+def invalidate_profile(user_id) -> None:
+    """
+    Drop the cached rendering of a user profile.
+
+    Args:
+        user_id: The primary key of the user.
+    """
+    global _invalidations  # pylint: disable=global-statement
+
+    with _invalidations_lock:
+        _invalidations += 1
+        profile_cache.delete(str(user_id))
@@ -0,0 +1,115 @@
+import io
+import logging
+import os
+from typing import Dict
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+from django.conf import settings
+from django.db import transaction
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from users.constants import PROFILE_PICTURE_PROCESSING_FAILED
+from users.models.custom_user_models import CustomUser
+from users.signals import invalidate_cached_user
+from utils.workers import closes_connections, lazy_thread_pool
+
+
+logger = logging.getLogger(__name__)
+
+VARIANTS_DIR = 'profile_pictures/variants'
+
+_executor = lazy_thread_pool('PROFILE_PICTURE_WORKERS', 'profile-pictures')
+
+
+def variant_name(source_name: str, variant: str) -> str:
+    """
+    Return the storage name of one resized variant of a profile picture.
+
+    Args:
+        source_name (str): The storage name of the original upload.
+        variant (str): The variant key from PROFILE_PICTURE_VARIANTS.
+
+    Returns:
+        str: The storage name of the variant.
+    """
+    stem = os.path.splitext(os.path.basename(source_name))[0]
+    extension = settings.PROFILE_PICTURE_FORMAT.lower()
+    return f'{VARIANTS_DIR}/{stem}_{variant}.{extension}'
+
+
+def render_variants(source_name: str) -> Dict[str, str]:
+    """
+    Decode a profile picture once and write every configured square variant to storage.
+
+    Args:
+        source_name (str): The storage name of the original upload.
+
+    Returns:
+        Dict[str, str]: The storage name of each variant, keyed by variant.
+    """
+    sizes = settings.PROFILE_PICTURE_VARIANTS
+    names = {}
+
+    with default_storage.open(source_name, 'rb') as source, Image.open(source) as image:
+        # For JPEG sources, let the decoder downscale while decoding instead of
+        # materialising the full-resolution bitmap.
+        largest = max(sizes.values())
+        image.draft('RGB', (largest, largest))
+        image = ImageOps.exif_transpose(image).convert('RGB')
+
+        for variant, size in sorted(sizes.items(), key=lambda item: -item[1]):
+            resized = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(buffer, format=settings.PROFILE_PICTURE_FORMAT,
+                         quality=settings.PROFILE_PICTURE_QUALITY)
+
+            name = variant_name(source_name, variant)
+            if default_storage.exists(name):
+                default_storage.delete(name)
+            names[variant] = default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    return names
+
+
+def process_profile_picture(user_id: int, source_name: str) -> None:
+    """
+    Produce the variants of a profile picture and record them on the user.
+
+    The row is only updated if the user still has the same picture, so a slow job for an
+    older upload cannot overwrite the variants of a newer one.
+
+    Args:
+        user_id (int): The primary key of the user.
+        source_name (str): The storage name of the uploaded picture.
+    """
+    try:
+        variants = render_variants(source_name)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.exception(PROFILE_PICTURE_PROCESSING_FAILED, source_name, user_id)
+        return
+
+    updated = CustomUser.objects.filter(pk=user_id, profile_picture=source_name).update(
+        profile_picture_variants=variants)
+    if updated:
+        invalidate_cached_user(user_id)
+
+
+@closes_connections
+def _process_in_worker(user_id: int, source_name: str) -> None:
+    process_profile_picture(user_id, source_name)
+
+
+def schedule_profile_picture_processing(user: CustomUser) -> None:
+    """
+    Queue variant generation for the user's current picture once the transaction commits.
+
+    Args:
+        user (CustomUser): The user whose picture was just saved.
+    """
+    if not user.profile_picture:
+        return
+
+    user_id, source_name = user.pk, user.profile_picture.name
+    transaction.on_commit(
+        lambda: _executor.get().submit(_process_in_worker, user_id, source_name))
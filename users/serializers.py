@@ -1,8 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from rest_framework import serializers
-from django.contrib.auth.models import User
 from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+
+from utils.serialization import ValuesSerializer, storage_url
+from users.profile_pictures import schedule_profile_picture_processing
 
 
 User = get_user_model()
@@ -15,29 +18,101 @@ class CustomUserSerializer(serializers.ModelSerializer):
     This serializer is used for creating and updating User instances.
     It includes fields such as id, username, email, password, bio, and profile_picture.
     The password field is write-only, meaning it is not included in the serialized representation
-    when sending data to the client.
+    when sending data to the client. profile_picture_variants is read-only and maps each resized
+    variant of the picture to its URL once the background processing has produced it. The
+    follower and following counts are read-only; they are maintained by users.follows.
 
     Methods:
     - create(validated_data: Dict[str, Any]) -> User:
-    Creates a new User instance based on the validated data.
+    Creates a new User instance based on the validated data, hashing the password once
+    and writing the row with a single INSERT.
+    - update(instance: User, validated_data: Dict[str, Any]) -> User:
+    Updates a User instance, discarding stale picture variants when a new picture is uploaded.
     """
 
+    profile_picture_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = User
         fields = ['id', 'username', 'email',
-                  'password', 'bio', 'profile_picture']
+                  'password', 'bio', 'profile_picture', 'profile_picture_variants',
+                  'follower_count', 'following_count']
+        read_only_fields = ['follower_count', 'following_count']
         extra_kwargs: Dict[str, Dict[str, Any]] = {
             'password': {'write_only': True}
         }
 
     def create(self, validated_data: Dict[str, Any]) -> User:
-        user: User = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password']
+        user: User = User(
+            username=User.normalize_username(validated_data['username']),
+            email=User.objects.normalize_email(validated_data['email']),
+            bio=validated_data.get('bio', ''),
+            profile_picture=validated_data.get('profile_picture', None),
         )
-        user.bio = validated_data.get('bio', '')
-        user.profile_picture = validated_data.get('profile_picture', None)
-        user.save()
+        user.set_password(validated_data['password'])
+        user.save(force_insert=True)
+        schedule_profile_picture_processing(user)
+
+        return user
+
+    def update(self, instance: User, validated_data: Dict[str, Any]) -> User:
+        if 'profile_picture' in validated_data:
+            instance.profile_picture_variants = {}
+
+        user: User = super().update(instance, validated_data)
+        if 'profile_picture' in validated_data:
+            schedule_profile_picture_processing(user)
 
         return user
+
+    def get_profile_picture_variants(self, user: User) -> Dict[str, str]:
+        return {variant: default_storage.url(name)
+                for variant, name in user.profile_picture_variants.items()}
+
+
+def _picture_url(name: str) -> Optional[str]:
+    return storage_url(User._meta.get_field('profile_picture').storage, name) if name else None
+
+
+def _picture_variant_urls(names: Dict[str, str]) -> Dict[str, str]:
+    return {variant: storage_url(default_storage, name) for variant, name in names.items()}
+
+
+class CustomUserValuesSerializer(ValuesSerializer):
+    """
+    Read-only fast path of CustomUserSerializer, for profiles read from .values() rows.
+    """
+
+    serializer_class = CustomUserSerializer
+    converters = {
+        'profile_picture': _picture_url,
+        'profile_picture_variants': _picture_variant_urls,
+    }
+
+
+user_values_serializer = CustomUserValuesSerializer()
+
+
+class UserSummarySerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for the user cards of follower and following lists.
+    """
+
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'follower_count', 'following_count']
+        read_only_fields = fields
+
+
+class AuthorSerializer(CustomUserSerializer):
+    """
+    Read-only serializer for the public profile of the author of content, such as a comment.
+
+    It reuses the fields of CustomUserSerializer, picture variants included, without the
+    private ones; its fields are also the columns to load for it.
+    """
+
+    class Meta(CustomUserSerializer.Meta):
+        fields = ['id', 'username', 'profile_picture', 'profile_picture_variants']
+        read_only_fields = fields
+        extra_kwargs: Dict[str, Dict[str, Any]] = {}
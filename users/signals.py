@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.dispatch import Signal, receiver
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete, pre_delete
+
+from users.authentication import user_cache
+from users.profile_cache import invalidate_profile
+from users.models.custom_user_models import CustomUser
+
+
+# Sent by users.follows once a follow or unfollow is committed, with follower_id and
+# followee_id.
+user_followed = Signal()
+user_unfollowed = Signal()
+
+
+def invalidate_cached_user(user_id) -> None:
+    """
+    Drop every in-process cache entry derived from the given user.
+
+    Call this directly after writes that bypass model signals, such as QuerySet.update().
+
+    Args:
+        user_id: The primary key of the user.
+    """
+    user_cache.delete(str(user_id))
+    invalidate_profile(user_id)
+
+
+@receiver([post_save, post_delete], sender=CustomUser, dispatch_uid='invalidate_cached_user')
+def invalidate_cached_user_on_change(instance: CustomUser, **kwargs) -> None:
+    """
+    Invalidate cached copies of a user whenever it is saved or deleted.
+
+    Args:
+        instance (CustomUser): The user that changed.
+    """
+    invalidate_cached_user(instance.pk)
+
+
+@receiver(pre_delete, sender=CustomUser, dispatch_uid='release_follow_counts')
+def release_follow_counts(instance: CustomUser, **kwargs) -> None:
+    """
+    Take a deleted user's edges out of the counts of the users on their other end, and
+    drop their cached copies once the deletion commits.
+
+    The edges themselves are removed by the cascade; this updates the counts with two bulk
+    UPDATEs instead of one per edge.
+
+    Args:
+        instance (CustomUser): The user being deleted.
+    """
+    followers = CustomUser.objects.filter(following_edges__followee=instance)
+    followees = CustomUser.objects.filter(follower_edges__follower=instance)
+    # Collected first: the UPDATEs bypass the post_save invalidation.
+    affected = [*followers.values_list('pk', flat=True), *followees.values_list('pk', flat=True)]
+    followers.update(following_count=F('following_count') - 1)
+    followees.update(follower_count=F('follower_count') - 1)
+
+    def invalidate():
+        for user_id in affected:
+            invalidate_cached_user(user_id)
+
+    transaction.on_commit(invalidate)
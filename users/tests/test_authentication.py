@@ -0,0 +1,123 @@
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from utils.cache import LRUCache
+from users.authentication import CachedJWTAuthentication, user_cache
+from users.models.custom_user_models import CustomUser
+
+
+class LRUCacheTest(TestCase):
+    """
+    Test module for the LRUCache class.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        self.cache = LRUCache(maxsize=2, ttl=10, timer=lambda: self.now)
+
+    def test_evicts_least_recently_used_entry(self):
+        """
+        Ensure that the least recently used entry is evicted when the cache is full.
+        """
+
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_entries_expire_after_ttl(self):
+        """
+        Ensure that entries are treated as missing once their TTL has elapsed.
+        """
+
+        self.cache.set('a', 1)
+        self.now = 10
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_stats_report_hits_and_misses(self):
+        """
+        Ensure that hits, misses and the hit rate are counted.
+        """
+
+        self.cache.set('a', 1)
+        self.cache.get('a')
+        self.cache.get('missing')
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    """
+    Test module for the CachedJWTAuthentication class.
+    """
+
+    def setUp(self):
+        user_cache.clear()
+        self.user = CustomUser.objects.create_user(
+            username='testuser', email='test@example.com', password='testpassword123')
+        self.token = AccessToken.for_user(self.user)
+        self.authentication = CachedJWTAuthentication()
+
+    def _authenticate(self):
+        request = APIRequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        return self.authentication.authenticate(request)
+
+    def test_repeated_requests_do_not_query_the_database(self):
+        """
+        Ensure that only the first request for a user runs a query.
+        """
+
+        with self.assertNumQueries(1):
+            self._authenticate()
+
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate()
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user_cache.stats()['hits'], 1)
+
+    def test_cached_user_is_not_shared_between_requests(self):
+        """
+        Ensure that each request receives its own copy of the cached user.
+        """
+
+        first, _ = self._authenticate()
+        first.bio = 'changed in memory'
+        second, _ = self._authenticate()
+
+        self.assertEqual(second.bio, '')
+
+    def test_deactivation_invalidates_cache(self):
+        """
+        Ensure that saving an inactive user takes effect on the next request.
+        """
+
+        self._authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_delete_invalidates_cache(self):
+        """
+        Ensure that deleting a user takes effect on the next request.
+        """
+
+        self._authenticate()
+        self.user.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
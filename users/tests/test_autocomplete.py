@@ -0,0 +1,102 @@
+from django.test import TestCase, override_settings
+
+from utils.prefix_index import PrefixIndex
+from users.autocomplete import get_username_index
+from users.models.custom_user_models import CustomUser
+
+
+class PrefixIndexTest(TestCase):
+    """
+    Test module for the PrefixIndex class.
+    """
+
+    def test_complete_ignores_case_and_stops_at_limit(self):
+        """
+        Ensure that completions match the prefix in any case, in order, up to the limit.
+        """
+
+        index = PrefixIndex([(1, 'bob'), (2, 'Bobby'), (3, 'alice'), (4, 'bobcat'), (5, 'bo')])
+
+        self.assertEqual(index.complete('BOB', 10), [(1, 'bob'), (2, 'Bobby'), (4, 'bobcat')])
+        self.assertEqual(index.complete('bo', 2), [(5, 'bo'), (1, 'bob')])
+        self.assertEqual(index.complete('z', 10), [])
+
+    def test_add_replaces_and_remove_drops(self):
+        """
+        Ensure that re-adding an item moves it and removing it drops it.
+        """
+
+        index = PrefixIndex([(1, 'bob'), (2, 'carol')])
+
+        index.add(1, 'dave')
+        index.add(3, 'bea')
+        index.remove(2)
+        index.remove(99)
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.complete('', 10), [(3, 'bea'), (1, 'dave')])
+
+    def test_bulk_update_merges(self):
+        """
+        Ensure that a large update re-sorts everything, replacing the items it contains.
+        """
+
+        index = PrefixIndex([(1, 'bob')])
+
+        index.update([(1, 'zed'), (2, 'amy'), (3, 'bo'), (2, 'ann')])
+
+        self.assertEqual(index.complete('', 10), [(2, 'ann'), (3, 'bo'), (1, 'zed')])
+
+
+class UsernameIndexTest(TestCase):
+    """
+    Test module for the UsernameIndex class.
+    """
+
+    def create(self, username, **fields):
+        return CustomUser.objects.create_user(username=username, email=f'{username}@example.com',
+                                              **fields)
+
+    # Overriding a USER_AUTOCOMPLETE_ setting gives each test a fresh index.
+    @override_settings(USER_AUTOCOMPLETE_REFRESH_INTERVAL=60)
+    def test_builds_then_follows_saves_and_deletes(self):
+        """
+        Ensure that the index is built on first use and updated by saves and deletes.
+        """
+
+        for username in ('anna', 'annie', 'bob'):
+            self.create(username)
+        self.create('annoyed', is_active=False)
+        index = get_username_index()
+
+        self.assertEqual([name for _, name in index.complete('ann', 10)], ['anna', 'annie'])
+        with self.assertNumQueries(0):
+            index.complete('b', 10)
+
+        renamed = CustomUser.objects.get(username='bob')
+        renamed.username = 'annabel'
+        renamed.save()
+        CustomUser.objects.get(username='anna').delete()
+
+        self.assertEqual([name for _, name in index.complete('ann', 10)],
+                         ['annabel', 'annie'])
+
+    @override_settings(USER_AUTOCOMPLETE_REFRESH_INTERVAL=60, USER_AUTOCOMPLETE_BATCH=2)
+    def test_refresh_adds_users_created_elsewhere(self):
+        """
+        Ensure that a refresh indexes the users created without signals, in batches.
+        """
+
+        index = get_username_index()
+        index.complete('a', 10)
+
+        CustomUser.objects.bulk_create([
+            CustomUser(username=username, email=f'{username}@example.com')
+            for username in ('amy', 'adam', 'abe')
+        ])
+        self.assertEqual(index.complete('a', 10), [])
+
+        with self.assertNumQueries(1):
+            index.refresh()
+
+        self.assertEqual([name for _, name in index.complete('a', 10)], ['abe', 'adam', 'amy'])
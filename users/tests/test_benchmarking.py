@@ -0,0 +1,50 @@
+from django.test import SimpleTestCase
+
+from utils.benchmarking import find_regressions
+
+
+def _report(p95_ms=10.0, throughput_rps=100.0, queries_per_request=2.0, errors=0,
+            peak_rss_mb=100.0):
+    return {
+        'peak_rss_mb': peak_rss_mb,
+        'endpoints': {'login': {
+            'p50_ms': 5.0, 'p95_ms': p95_ms, 'p99_ms': 20.0, 'throughput_rps': throughput_rps,
+            'queries_per_request': queries_per_request, 'errors': errors,
+        }},
+    }
+
+
+class FindRegressionsTest(SimpleTestCase):
+    """
+    Test module for find_regressions.
+    """
+
+    def test_changes_within_the_threshold_pass(self):
+        """
+        Ensure that changes smaller than the threshold, and improvements, are not reported.
+        """
+
+        report = _report(p95_ms=11.5, throughput_rps=85.0, queries_per_request=1.0,
+                         peak_rss_mb=110.0)
+
+        self.assertEqual(find_regressions(report, _report(), 0.2), [])
+
+    def test_regressions_are_reported(self):
+        """
+        Ensure that every metric regressing beyond the threshold, any new error and a
+        missing endpoint are reported.
+        """
+
+        report = _report(p95_ms=13.0, throughput_rps=70.0, queries_per_request=4.0, errors=1,
+                         peak_rss_mb=130.0)
+        baseline = _report()
+        baseline['endpoints']['register'] = baseline['endpoints']['login']
+
+        self.assertEqual(find_regressions(report, baseline, 0.2), [
+            'login: p95_ms 10.00 -> 13.00',
+            'login: queries_per_request 2.00 -> 4.00',
+            'login: throughput_rps 100.0 -> 70.0',
+            'login: errors 0 -> 1',
+            'register: not measured',
+            'peak_rss_mb: 100.0 -> 130.0',
+        ])
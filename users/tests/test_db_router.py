@@ -0,0 +1,148 @@
+from contextlib import ExitStack, contextmanager
+from unittest import mock
+
+from django.db import DatabaseError, connections
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from utils import db_router
+from utils.db_router import STICKY_COOKIE, get_replica_pool
+from users.authentication import user_cache
+from users.models.custom_user_models import CustomUser
+from users.profile_cache import invalidate_profile
+
+REPLICAS = ['replica1', 'replica2']
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class PrimaryReplicaRouterTest(TransactionTestCase):
+    """
+    Test module for the PrimaryReplicaRouter and ReplicaRoutingMiddleware classes.
+
+    The replicas are test mirrors of the default database: separate connections to the
+    same data, so the queries each one runs show where reads were routed.
+    """
+
+    databases = {'default', *REPLICAS}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('user_profile', kwargs={'userid': self.user.pk})
+        self.followers_url = reverse('user_followers', kwargs={'userid': self.user.pk})
+        # Keep the health checks out of the counted queries.
+        get_replica_pool().check()
+
+    def request(self, method, url=None, **data):
+        """
+        Return the response and the number of queries run on the primary and the replicas.
+        """
+        invalidate_profile(self.user.pk)
+        with ExitStack() as stack:
+            primary = stack.enter_context(CaptureQueriesContext(connections['default']))
+            replicas = [stack.enter_context(CaptureQueriesContext(connections[alias]))
+                        for alias in REPLICAS]
+            response = getattr(self.client, method)(url or self.followers_url, data)
+        return response, len(primary), sum(map(len, replicas))
+
+    @contextmanager
+    def lagging_replicas(self):
+        """
+        Make the replicas serve the users table as it is now, whatever is written next.
+        """
+        with connections['default'].cursor() as cursor:
+            cursor.execute('CREATE TABLE lagging_users AS SELECT * FROM users_customuser')
+        self.addCleanup(connections['default'].cursor().execute, 'DROP TABLE lagging_users')
+
+        def lagging(execute, sql, params, many, context):
+            return execute(sql.replace('"users_customuser"', '"lagging_users"'), params, many,
+                           context)
+
+        with ExitStack() as stack:
+            for alias in REPLICAS:
+                stack.enter_context(connections[alias].execute_wrapper(lagging))
+            yield
+
+    def test_reads_go_to_replicas_until_a_write(self):
+        """
+        Ensure that GET requests read from a replica, and that the client's reads go to the
+        primary for the sticky window after it writes.
+        """
+
+        read, read_primary, read_replicas = self.request('get')
+        updated, _, updated_replicas = self.request('put', self.url, bio='new bio')
+        sticky, sticky_primary, sticky_replicas = self.request('get')
+
+        self.assertEqual(read.status_code, status.HTTP_200_OK)
+        self.assertEqual(read_primary, 0)
+        self.assertGreater(read_replicas, 0)
+        self.assertEqual(updated.status_code, status.HTTP_200_OK)
+        self.assertEqual(updated_replicas, 0)
+        self.assertIn(STICKY_COOKIE, updated.cookies)
+        self.assertEqual((sticky_primary, sticky_replicas), (read_replicas, 0))
+        self.assertEqual(sticky.status_code, status.HTTP_200_OK)
+
+        self.client.cookies[STICKY_COOKIE] = '0'
+        self.assertEqual(self.request('get')[1:], (0, read_replicas))
+
+    def test_caches_are_filled_from_the_primary(self):
+        """
+        Ensure that profiles and users cached while the replicas lag are read from the
+        primary, so a client that wrote still sees its write once the cache serves it.
+        """
+
+        reader = APIClient()
+        reader.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        user_cache.clear()
+
+        with self.lagging_replicas():
+            self.client.put(self.url, {'bio': 'new bio'})
+            lagging = CustomUser.objects.using('replica1').get(pk=self.user.pk)
+            read = reader.get(self.url)
+            sticky = self.client.get(self.url)
+
+        self.assertEqual(lagging.bio, '')
+        self.assertEqual(read.data['bio'], 'new bio')
+        self.assertEqual(sticky.data['bio'], 'new bio')
+        self.assertEqual(user_cache.get(str(self.user.pk)).bio, 'new bio')
+
+    def test_unhealthy_replicas_are_ejected(self):
+        """
+        Ensure that replicas failing their health check or lagging too much are skipped,
+        and that reads fall back to the primary when none is left.
+        """
+
+        def lag(alias):
+            if alias == 'replica1':
+                raise DatabaseError('connection refused')
+            return lags[alias]
+
+        lags = {'replica2': 0.5}
+        pool = get_replica_pool()
+        with mock.patch.object(db_router, '_replication_lag', side_effect=lag):
+            pool.check()
+            self.assertEqual(pool.healthy, ['replica2'])
+            self.assertEqual({pool.choose() for _ in range(20)}, {'replica2'})
+
+            lags['replica2'] = 60
+            pool.check()
+        self.assertEqual(pool.healthy, [])
+        self.assertEqual(pool.stats()['healthy'], 0)
+        self.assertEqual(self.request('get', self.url)[1:], (1, 0))
+
+    def test_no_replica_outside_requests(self):
+        """
+        Ensure that queries made outside a request, as by commands and workers, use the
+        primary.
+        """
+
+        with CaptureQueriesContext(connections['replica1']) as replica1, \
+                CaptureQueriesContext(connections['replica2']) as replica2:
+            self.assertTrue(CustomUser.objects.filter(pk=self.user.pk).exists())
+
+        self.assertEqual(len(replica1) + len(replica2), 0)
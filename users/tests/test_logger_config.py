@@ -0,0 +1,224 @@
+import json
+import logging
+import sys
+import threading
+from logging.config import dictConfig
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from users.constants import FAILED_LOGIN_ATTEMPT
+from utils.logger_config import JSONFormatter, QueueListenerHandler, RateLimitFilter
+
+
+def make_record(msg, *args, level=logging.WARNING, name='users.views.user_login_view', **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def raised_exc_info():
+    try:
+        raise RuntimeError('boom')
+    except RuntimeError:
+        return sys.exc_info()
+
+
+def make_error_record():
+    return logging.getLogger('test').makeRecord(
+        'test', logging.ERROR, __file__, 1, 'failed', (), exc_info=raised_exc_info())
+
+
+class CollectingHandler(logging.Handler):
+    """
+    Handler that keeps the records it emits and the threads it emitted them on.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.get_ident())
+
+
+class JSONFormatterTest(SimpleTestCase):
+    """
+    Test module for the JSONFormatter class.
+    """
+
+    def test_formats_record_as_json(self):
+        """
+        Ensure that a record is rendered as one JSON object with its message and extras.
+        """
+
+        line = JSONFormatter().format(
+            make_record(FAILED_LOGIN_ATTEMPT, 'alice', client_ip='10.0.0.1'))
+        payload = json.loads(line)
+
+        self.assertNotIn('\n', line)
+        self.assertEqual(payload['message'], FAILED_LOGIN_ATTEMPT % 'alice')
+        self.assertEqual(payload['level'], 'WARNING')
+        self.assertEqual(payload['logger'], 'users.views.user_login_view')
+        self.assertEqual(payload['client_ip'], '10.0.0.1')
+
+    def test_includes_exception(self):
+        """
+        Ensure that the traceback is kept in its own field.
+        """
+
+        payload = json.loads(JSONFormatter().format(make_error_record()))
+
+        self.assertEqual(payload['message'], 'failed')
+        self.assertIn('RuntimeError: boom', payload['exception'])
+
+
+class RateLimitFilterTest(SimpleTestCase):
+    """
+    Test module for the RateLimitFilter class.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        self.filter = RateLimitFilter(rate=1.0, burst=3, timer=lambda: self.now)
+
+    def test_drops_repeated_template_beyond_burst(self):
+        """
+        Ensure that one message template is capped whatever its arguments are.
+        """
+
+        allowed = [self.filter.filter(make_record(FAILED_LOGIN_ATTEMPT, f'user{i}'))
+                   for i in range(10)]
+
+        self.assertEqual(allowed.count(True), 3)
+
+    def test_reports_suppressed_count_after_refill(self):
+        """
+        Ensure that the next emitted record carries the number of records dropped before it.
+        """
+
+        for i in range(5):
+            self.filter.filter(make_record(FAILED_LOGIN_ATTEMPT, f'user{i}'))
+
+        self.now = 1.0
+        record = make_record(FAILED_LOGIN_ATTEMPT, 'bob')
+
+        self.assertTrue(self.filter.filter(record))
+        self.assertEqual(record.suppressed, 2)
+
+    def test_templates_have_separate_buckets(self):
+        """
+        Ensure that a flood of one message does not silence another.
+        """
+
+        for i in range(10):
+            self.filter.filter(make_record(FAILED_LOGIN_ATTEMPT, f'user{i}'))
+
+        self.assertTrue(self.filter.filter(make_record('Another warning')))
+
+    def test_passes_records_above_max_level(self):
+        """
+        Ensure that records more severe than max_level are never dropped.
+        """
+
+        records = [make_record('disk full', level=logging.CRITICAL) for _ in range(10)]
+
+        self.assertTrue(all(self.filter.filter(record) for record in records))
+
+    def test_passes_errors_and_tracebacks(self):
+        """
+        Ensure that errors and records carrying a traceback are never dropped.
+        """
+
+        exc_info = raised_exc_info()
+        errors = [make_record('Internal Server Error', level=logging.ERROR) for _ in range(10)]
+        tracebacks = [make_record('Retrying') for _ in range(10)]
+        for record in tracebacks:
+            record.exc_info = exc_info
+
+        self.assertTrue(all(self.filter.filter(record) for record in errors + tracebacks))
+
+    def test_status_codes_have_separate_buckets(self):
+        """
+        Ensure that a flood of one response status does not silence another.
+        """
+
+        for _ in range(10):
+            self.filter.filter(make_record('%s: %s', 'Not Found', '/missing/', status_code=404))
+        record = make_record('%s: %s', 'Too Many Requests', '/login/', status_code=429)
+
+        self.assertTrue(self.filter.filter(record))
+
+
+class QueueListenerHandlerTest(SimpleTestCase):
+    """
+    Test module for the QueueListenerHandler class.
+    """
+
+    def setUp(self):
+        self.target = CollectingHandler()
+
+    def test_emits_on_listener_thread(self):
+        """
+        Ensure that records reach the target handler from the listener thread.
+        """
+
+        handler = QueueListenerHandler([self.target])
+        handler.handle(make_record(FAILED_LOGIN_ATTEMPT, 'alice'))
+        handler.close()
+
+        self.assertEqual(len(self.target.records), 1)
+        self.assertEqual(self.target.records[0].getMessage(), FAILED_LOGIN_ATTEMPT % 'alice')
+        self.assertNotIn(threading.get_ident(), self.target.threads)
+
+    def test_keeps_exception_out_of_message(self):
+        """
+        Ensure that a queued record carries its traceback separately from the message.
+        """
+
+        handler = QueueListenerHandler([self.target])
+        handler.handle(make_error_record())
+        handler.close()
+
+        queued = self.target.records[0]
+        self.assertEqual(queued.getMessage(), 'failed')
+        self.assertIn('RuntimeError: boom', queued.exc_text)
+
+    def test_drops_records_when_queue_is_full(self):
+        """
+        Ensure that a full queue drops records instead of blocking the caller.
+        """
+
+        handler = QueueListenerHandler([self.target], queue_size=1)
+        handler.stop()
+
+        for i in range(3):
+            handler.handle(make_record('message %s', i))
+
+        self.assertEqual(handler.dropped, 2)
+        handler.close()
+
+    def test_rejects_unconfigured_handler(self):
+        """
+        Ensure that a handler reference that was not resolved to a handler is rejected.
+        """
+
+        with self.assertRaises(ValueError):
+            QueueListenerHandler([{'class': 'logging.StreamHandler'}])
+
+    def test_settings_logging_config(self):
+        """
+        Ensure that the LOGGING setting builds a queue handler in front of the console handler.
+        """
+
+        root = logging.getLogger()
+        try:
+            dictConfig(settings.LOGGING)
+            queue_handler = next(h for h in root.handlers if isinstance(h, QueueListenerHandler))
+
+            self.assertIsInstance(queue_handler.listener.handlers[0], logging.StreamHandler)
+            self.assertIsInstance(queue_handler.filters[0], RateLimitFilter)
+        finally:
+            dictConfig(settings.LOGGING)
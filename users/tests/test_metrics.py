@@ -0,0 +1,117 @@
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from utils.metrics import MetricsRegistry, registry
+from users.models.custom_user_models import CustomUser
+from users.profile_cache import profile_cache
+
+
+class MetricsRegistryTest(SimpleTestCase):
+    """
+    Test module for the MetricsRegistry class.
+    """
+
+    def setUp(self):
+        self.registry = MetricsRegistry(buckets=(0.01, 0.1))
+
+    def test_renders_cumulative_latency_histogram(self):
+        """
+        Ensure that latency buckets are exported cumulatively with a +Inf bucket.
+        """
+
+        for latency in (0.005, 0.05, 0.5):
+            self.registry.observe('user_profile', 'GET', 200, latency)
+
+        output = self.registry.render()
+
+        bucket = 'http_request_duration_seconds_bucket{view="user_profile",le="%s"} %d'
+        self.assertIn(bucket % ('0.01', 1), output)
+        self.assertIn(bucket % ('0.1', 2), output)
+        self.assertIn(bucket % ('+Inf', 3), output)
+        self.assertIn('http_request_duration_seconds_count{view="user_profile"} 3', output)
+
+    def test_renders_counters_by_view(self):
+        """
+        Ensure that request, query and payload counters are summed per view.
+        """
+
+        self.registry.observe('login_user', 'POST', 200, 0.01, queries=2, request_bytes=40,
+                              response_bytes=500)
+        self.registry.observe('login_user', 'POST', 400, 0.01, queries=1, request_bytes=30,
+                              response_bytes=50)
+
+        output = self.registry.render()
+
+        self.assertIn('http_requests_total{view="login_user",method="POST",status="200"} 1', output)
+        self.assertIn('http_requests_total{view="login_user",method="POST",status="400"} 1', output)
+        self.assertIn('db_queries_total{view="login_user"} 3', output)
+        self.assertIn('http_request_size_bytes_total{view="login_user"} 70', output)
+        self.assertIn('http_response_size_bytes_total{view="login_user"} 550', output)
+
+    def test_escapes_label_values(self):
+        """
+        Ensure that quotes and backslashes in label values are escaped.
+        """
+
+        self.registry.observe('a"b\\c', 'GET', 200, 0.01)
+
+        self.assertIn('view="a\\"b\\\\c"', self.registry.render())
+
+    def test_exports_collectors_as_gauges(self):
+        """
+        Ensure that numeric collector values are exported with the source as a label.
+        """
+
+        self.registry.register_collector('test_cache', lambda: {'hits': 3, 'name': 'ignored'})
+
+        output = self.registry.render()
+
+        self.assertIn('cache_hits{source="test_cache"} 3', output)
+        self.assertNotIn('cache_name', output)
+
+
+class MetricsMiddlewareTest(TestCase):
+    """
+    Test module for the MetricsMiddleware class.
+    """
+
+    def setUp(self):
+        registry.reset()
+        profile_cache.clear()
+        self.user = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+
+    def test_records_view_name_and_queries(self):
+        """
+        Ensure that a request is recorded under its route name with its database queries.
+        """
+
+        self.client.get(reverse('user_profile', kwargs={'userid': self.user.id}))
+
+        output = registry.render()
+
+        self.assertIn('http_requests_total{view="user_profile",method="GET",status="200"} 1',
+                      output)
+        self.assertIn('db_queries_total{view="user_profile"} 1', output)
+
+    def test_groups_unresolved_paths(self):
+        """
+        Ensure that paths without a route share one label value.
+        """
+
+        self.client.get('/no/such/path/')
+        self.client.get('/another/missing/path/')
+
+        self.assertIn('http_requests_total{view="<unresolved>",method="GET",status="404"} 2',
+                      registry.render())
+
+    def test_metrics_endpoint(self):
+        """
+        Ensure that the metrics endpoint serves the text format including cache stats.
+        """
+
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(b'cache_size{source="profile_cache"}', response.content)
+        self.assertIn(b'cache_size{source="auth_user_cache"}', response.content)
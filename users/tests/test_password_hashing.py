@@ -0,0 +1,101 @@
+import threading
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+
+from utils.bounded_executor import BoundedExecutor, ExecutorSaturated
+from users.models.custom_user_models import CustomUser
+from users.password_hashing import acheck_credentials, check_credentials, get_hashing_executor
+
+
+class BoundedExecutorTest(TestCase):
+    """
+    Test module for the BoundedExecutor class.
+    """
+
+    def setUp(self):
+        self.executor = BoundedExecutor(max_workers=1, queue_depth=1)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown()
+
+    def test_rejects_work_beyond_workers_and_queue_depth(self):
+        """
+        Ensure that submissions beyond max_workers + queue_depth raise ExecutorSaturated.
+        """
+
+        self.executor.submit(self.release.wait)
+        self.executor.submit(self.release.wait)
+
+        with self.assertRaises(ExecutorSaturated):
+            self.executor.submit(self.release.wait)
+
+    def test_slots_are_released_when_work_finishes(self):
+        """
+        Ensure that finished tasks free their slot for new work.
+        """
+
+        self.release.set()
+        for _ in range(5):
+            self.assertTrue(self.executor.run(self.release.wait))
+
+        self.assertEqual(self.executor.in_flight, 0)
+
+    def test_shared_pool_follows_settings(self):
+        """
+        Ensure that the shared pool is created once and rebuilt when its size changes.
+        """
+
+        executor = get_hashing_executor()
+        with override_settings(PASSWORD_HASHING_WORKERS=3):
+            resized = get_hashing_executor()
+
+        self.assertIs(get_hashing_executor(), get_hashing_executor())
+        self.assertIsNot(resized, executor)
+        self.assertEqual(resized.max_workers, 3)
+
+
+class CheckCredentialsTest(TestCase):
+    """
+    Test module for check_credentials and acheck_credentials.
+    """
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='testuser', email='test@example.com', password='testpassword123')
+
+    def test_valid_credentials_return_user(self):
+        """
+        Ensure that valid credentials return the matching user.
+        """
+
+        self.assertEqual(check_credentials('testuser', 'testpassword123'), self.user)
+
+    def test_invalid_credentials_return_none(self):
+        """
+        Ensure that a wrong password or unknown username returns None.
+        """
+
+        self.assertIsNone(check_credentials('testuser', 'wrongpassword'))
+        self.assertIsNone(check_credentials('nobody', 'testpassword123'))
+
+    def test_inactive_user_is_rejected(self):
+        """
+        Ensure that inactive users cannot authenticate.
+        """
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertIsNone(check_credentials('testuser', 'testpassword123'))
+
+    def test_async_variant_matches_sync_behaviour(self):
+        """
+        Ensure that acheck_credentials authenticates the same way as check_credentials.
+        """
+
+        self.assertEqual(
+            async_to_sync(acheck_credentials)('testuser', 'testpassword123'), self.user)
+        self.assertIsNone(async_to_sync(acheck_credentials)('testuser', 'wrongpassword'))
@@ -0,0 +1,114 @@
+import io
+import shutil
+
+from PIL import Image
+from django.conf import settings
+from django.urls import reverse
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from users.models.custom_user_models import CustomUser
+from users.profile_pictures import process_profile_picture, variant_name
+from users.throttling import get_rate_limit_backend
+from users.views.user_register_view import RegisterUserAPIView
+
+
+def make_image(size=(800, 600), image_format='JPEG'):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color=(200, 30, 30)).save(buffer, format=image_format)
+    return SimpleUploadedFile('avatar.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+
+class ProfilePictureProcessingTest(APITestCase):
+    """
+    Test module for the profile picture processing pipeline.
+    """
+
+    def setUp(self):
+        get_rate_limit_backend().clear()
+        self.payload = {
+            'username': 'newuser',
+            'email': 'newuser@example.com',
+            'password': 'testpassword123',
+            'profile_picture': make_image(),
+        }
+
+    def tearDown(self):
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+    def test_upload_schedules_processing_after_commit(self):
+        """
+        Ensure that registering with a picture queues variant generation on commit.
+        """
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(reverse('register_user'), self.payload, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_processing_writes_variants_and_exposes_urls(self):
+        """
+        Ensure that processing writes every square variant and the profile lists its URL.
+        """
+
+        self.client.post(reverse('register_user'), self.payload, format='multipart')
+        user = CustomUser.objects.get()
+
+        process_profile_picture(user.pk, user.profile_picture.name)
+
+        user.refresh_from_db()
+        self.assertEqual(set(user.profile_picture_variants), set(settings.PROFILE_PICTURE_VARIANTS))
+        for variant, size in settings.PROFILE_PICTURE_VARIANTS.items():
+            with default_storage.open(user.profile_picture_variants[variant]) as variant_file:
+                self.assertEqual(Image.open(variant_file).size, (size, size))
+
+        response = self.client.get(reverse('user_profile', kwargs={'userid': user.pk}))
+        self.assertTrue(response.data['profile_picture_variants']['small'].endswith('.webp'))
+
+    def test_processing_ignores_replaced_pictures(self):
+        """
+        Ensure that a job for a picture the user has since replaced does not record variants.
+        """
+
+        older = default_storage.save('profile_pictures/older.jpg', make_image())
+        self.client.post(reverse('register_user'), self.payload, format='multipart')
+        user = CustomUser.objects.get()
+
+        with self.assertNoLogs('users.profile_pictures', 'ERROR'):
+            process_profile_picture(user.pk, older)
+
+        user.refresh_from_db()
+        self.assertNotEqual(user.profile_picture.name, older)
+        self.assertTrue(default_storage.exists(variant_name(older, 'small')))
+        self.assertEqual(user.profile_picture_variants, {})
+
+    def test_invalid_images_are_skipped(self):
+        """
+        Ensure that an upload Pillow cannot decode leaves the user without variants.
+        """
+
+        user = CustomUser.objects.create_user(
+            username='testuser', email='test@example.com', password='testpassword123',
+            profile_picture=SimpleUploadedFile('broken.jpg', b'not an image'))
+
+        with self.assertLogs(level='ERROR'):
+            process_profile_picture(user.pk, user.profile_picture.name)
+
+        user.refresh_from_db()
+        self.assertEqual(user.profile_picture_variants, {})
+
+    def test_uploads_stream_to_disk(self):
+        """
+        Ensure that the upload views only use the temporary file upload handler.
+        """
+
+        view = RegisterUserAPIView()
+        request = APIRequestFactory().post('/users/register/')
+        view.initialize_request(request)
+
+        self.assertEqual(len(request.upload_handlers), 1)
+        self.assertIsInstance(request.upload_handlers[0], TemporaryFileUploadHandler)
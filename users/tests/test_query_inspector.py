@@ -0,0 +1,150 @@
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from utils.query_inspector import QueryInspector, fingerprint, request_queries_inspected
+from users.models.custom_user_models import CustomUser
+from users.profile_cache import profile_cache
+
+
+class FingerprintTest(SimpleTestCase):
+    """
+    Test module for fingerprint.
+    """
+
+    def test_values_do_not_change_the_shape(self):
+        """
+        Ensure that queries differing only in their values, or in how many values they
+        list, share a fingerprint, and that other queries do not.
+        """
+
+        shape = fingerprint('SELECT "id" FROM "users"  WHERE "id" IN (%s, %s) AND "bio" = %s')
+
+        self.assertEqual(shape, 'SELECT "id" FROM "users" WHERE "id" IN (...) AND "bio" = ?')
+        self.assertEqual(fingerprint("SELECT \"id\" FROM \"users\" WHERE \"id\" IN (7) "
+                                     "AND \"bio\" = 'it''s me'"), shape)
+        self.assertEqual(fingerprint('INSERT INTO "t" ("a") VALUES (%s), (%s), (%s)'),
+                         'INSERT INTO "t" ("a") VALUES (...)')
+        self.assertNotEqual(fingerprint('SELECT "id" FROM "users" WHERE "bio" = %s'), shape)
+
+
+class QueryInspectorTest(TestCase):
+    """
+    Test module for the QueryInspector and QueryInspectorMiddleware classes.
+    """
+
+    def setUp(self):
+        profile_cache.clear()
+        self.users = [
+            CustomUser.objects.create_user(username=f'testuser{i}', email=f'test{i}@example.com')
+            for i in range(3)
+        ]
+
+    def test_repeated_shapes_are_found_with_their_call_site(self):
+        """
+        Ensure that a query run once per row is reported with its runs, identical runs and
+        the line running it.
+        """
+
+        inspector = QueryInspector()
+        inspector.install()
+        try:
+            CustomUser.objects.count()
+            for user in self.users + self.users[:1]:
+                CustomUser.objects.get(pk=user.pk)
+        finally:
+            inspector.uninstall()
+
+        repeated = inspector.repeated(3)
+
+        self.assertEqual(inspector.total, 5)
+        self.assertEqual([(query.count, query.duplicates) for query in repeated], [(4, 1)])
+        self.assertRegex(repeated[0].call_site,
+                         r'^users/tests/test_query_inspector\.py:\d+ in '
+                         r'test_repeated_shapes_are_found_with_their_call_site$')
+        self.assertIn('4x (1 identical)', inspector.describe())
+
+    def test_savepoints_are_not_counted(self):
+        """
+        Ensure that the savepoints of an atomic block, which TestCase adds, are not counted.
+        """
+
+        inspector = QueryInspector()
+        inspector.install()
+        try:
+            with transaction.atomic():
+                CustomUser.objects.filter(pk=self.users[0].pk).update(bio='Updated bio')
+        finally:
+            inspector.uninstall()
+
+        self.assertEqual(inspector.total, 1)
+        self.assertEqual(len(inspector.shapes), 1)
+
+    @override_settings(QUERY_INSPECTOR_ENABLED=True, QUERY_INSPECTOR_REPEAT_THRESHOLD=1)
+    def test_middleware_reports_repeated_queries(self):
+        """
+        Ensure that the middleware logs repeated shapes with the view name and sends the
+        request's inspector.
+        """
+
+        inspected = []
+
+        def receive(view, method, inspector, **kwargs):
+            inspected.append((view, method, inspector.total))
+
+        request_queries_inspected.connect(receive)
+        self.addCleanup(request_queries_inspected.disconnect, receive)
+        ids = ','.join(str(user.pk) for user in self.users)
+
+        with self.assertLogs('utils.query_inspector', 'WARNING') as logs:
+            self.client.get(reverse('bulk_user_profiles'), {'ids': ids})
+
+        self.assertEqual(inspected, [('bulk_user_profiles', 'GET', 1)])
+        self.assertIn('Repeated query in bulk_user_profiles: 1 runs', logs.output[0])
+
+    def test_disabled_middleware_does_nothing(self):
+        """
+        Ensure that nothing is inspected while QUERY_INSPECTOR_ENABLED is off.
+        """
+
+        inspected = []
+
+        def receive(**kwargs):
+            inspected.append(kwargs)
+
+        request_queries_inspected.connect(receive)
+        self.addCleanup(request_queries_inspected.disconnect, receive)
+
+        self.client.get(reverse('bulk_user_profiles'), {'ids': self.users[0].pk})
+
+        self.assertEqual(inspected, [])
+
+
+class QueryBudgetMixinTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the QueryBudgetMixin class.
+    """
+
+    query_budgets = {'GET user_profile': 0, 'user_profile': 2}
+
+    def setUp(self):
+        profile_cache.clear()
+        self.user = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.url = reverse('user_profile', kwargs={'userid': self.user.pk})
+
+    def test_requests_over_budget_fail(self):
+        """
+        Ensure that a request over its method's budget fails the test, and that the view's
+        budget applies to the other methods.
+        """
+
+        with self.assertRaisesRegex(AssertionError,
+                                    'GET user_profile ran over its budget of 0 queries'):
+            self.client.get(self.url)
+
+        self.client.force_authenticate(self.user)
+        response = self.client.put(self.url, {'bio': 'new bio'})
+
+        self.assertEqual(response.status_code, 200)
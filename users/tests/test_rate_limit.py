@@ -0,0 +1,92 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from utils.rate_limit import CacheRateLimitBackend, InMemoryRateLimitBackend
+
+
+class InMemoryRateLimitBackendTest(TestCase):
+    """
+    Test module for the InMemoryRateLimitBackend class.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        self.backend = InMemoryRateLimitBackend(timer=lambda: self.now)
+
+    def test_counts_events_inside_sliding_window(self):
+        """
+        Ensure that only events within the last window seconds are counted.
+        """
+
+        self.backend.hit('key', 60)
+        self.now = 30
+        self.backend.hit('key', 60)
+        self.now = 61
+
+        self.assertEqual(self.backend.count('key', 60), 1)
+        self.assertEqual(self.backend.hit('key', 60), 2)
+
+    def test_reset_forgets_events(self):
+        """
+        Ensure that reset drops every event recorded for a key.
+        """
+
+        self.backend.hit('key', 60)
+        self.backend.reset('key', 60)
+
+        self.assertEqual(self.backend.count('key', 60), 0)
+
+
+class CacheRateLimitBackendTest(TestCase):
+    """
+    Test module for the CacheRateLimitBackend class, backed by the local-memory cache.
+    """
+
+    def setUp(self):
+        self.now = 1000.0
+        self.backend = CacheRateLimitBackend(timer=lambda: self.now)
+        self.backend.clear()
+
+    def test_counts_hits_in_current_bucket(self):
+        """
+        Ensure that hits within one bucket are counted exactly.
+        """
+
+        for _ in range(3):
+            self.backend.hit('key', 60)
+
+        self.assertEqual(self.backend.count('key', 60), 3)
+
+    def test_previous_bucket_is_weighted_by_overlap(self):
+        """
+        Ensure that the previous bucket only counts for the part still inside the window.
+        """
+
+        self.now = 1200.0
+        for _ in range(10):
+            self.backend.hit('key', 100)
+        self.now = 1370.0
+
+        self.assertEqual(self.backend.count('key', 100), 3)
+
+    def test_clear_keeps_other_cache_entries(self):
+        """
+        Ensure that clearing forgets every key's events but not the rest of the cache.
+        """
+
+        cache.set('unrelated', 1)
+        self.backend.hit('key', 60)
+        self.backend.clear()
+
+        self.assertEqual(self.backend.count('key', 60), 0)
+        self.assertEqual(cache.get('unrelated'), 1)
+
+    def test_reset_forgets_events(self):
+        """
+        Ensure that reset drops the counters of a key.
+        """
+
+        self.backend.hit('key', 60)
+        self.backend.reset('key', 60)
+
+        self.assertEqual(self.backend.count('key', 60), 0)
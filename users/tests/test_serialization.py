@@ -0,0 +1,102 @@
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+
+from utils.renderers import FastJSONRenderer
+from utils.serialization import ValuesSerializer, storage_url
+from users.models.custom_user_models import CustomUser
+from users.serializers import CustomUserSerializer, user_values_serializer
+
+
+class CustomUserValuesSerializerTest(TestCase):
+    """
+    Test module for the CustomUserValuesSerializer class.
+    """
+
+    def test_output_matches_custom_user_serializer(self):
+        """
+        Ensure that profiles serialized from rows render to the same bytes as through
+        CustomUserSerializer, with and without pictures.
+        """
+
+        CustomUser.objects.create_user(username='plain', email='plain@example.com')
+        CustomUser.objects.create_user(
+            username='pictured', email='pictured@example.com', bio='Héllo there',
+            profile_picture='profile_pictures/me.png', follower_count=3,
+            profile_picture_variants={'small': 'profile_pictures/me_small.webp'})
+        users = CustomUser.objects.order_by('pk')
+
+        expected = CustomUserSerializer(users, many=True).data
+        serialized = user_values_serializer.serialize(users)
+
+        self.assertEqual(serialized, expected)
+        self.assertEqual([list(row) for row in serialized], [list(row) for row in expected])
+        self.assertEqual(FastJSONRenderer().render(serialized), JSONRenderer().render(expected))
+
+    def test_storage_url_matches_storage(self):
+        """
+        Ensure that storage_url returns the storage's URL for plain and unusual names.
+        """
+
+        for name in ('profile_pictures/me.png', 'a/b_c-1.webp', 'a/../b.png', './a.png',
+                     'a b.png', 'é.png', 'a//b.png', 'a/.hidden', 'q?x#y.png'):
+            self.assertEqual(storage_url(default_storage, name), default_storage.url(name))
+
+    def test_fields_without_converter_are_rejected(self):
+        """
+        Ensure that a readable field that is not passed through as is needs a converter.
+        """
+
+        class IncompleteSerializer(ValuesSerializer):
+            serializer_class = CustomUserSerializer
+
+        with self.assertRaisesMessage(ImproperlyConfigured, 'profile_picture field'):
+            IncompleteSerializer().serialize(CustomUser.objects.all())
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    """
+    Test module for the FastJSONRenderer class.
+    """
+
+    payload = {
+        'text': 'café \u2028 "quoted" \x1f',
+        'when': datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        'day': date(2024, 5, 1),
+        'price': Decimal('1.50'),
+        'lazy': _('email address'),
+        'id': uuid.UUID(int=1),
+        'nested': [{1: None, 'ok': True}, (0.5, -3)],
+    }
+
+    def test_renders_like_json_renderer(self):
+        """
+        Ensure that the output is byte for byte that of JSONRenderer.
+        """
+
+        self.assertEqual(FastJSONRenderer().render(self.payload),
+                         JSONRenderer().render(self.payload))
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_falls_back_to_json_renderer(self):
+        """
+        Ensure that indented output, integers over 64 bits and a missing orjson are rendered
+        by JSONRenderer.
+        """
+
+        indented = 'application/json; indent=2'
+        big = {'big': 2 ** 70}
+
+        self.assertEqual(FastJSONRenderer().render(self.payload, indented),
+                         JSONRenderer().render(self.payload, indented))
+        self.assertEqual(FastJSONRenderer().render(big), b'{"big":1180591620717411303424}')
+        with mock.patch('utils.renderers.orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.payload),
+                             JSONRenderer().render(self.payload))
@@ -0,0 +1,117 @@
+import uuid
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from utils.bloom import BloomFilter
+from users.models.custom_user_models import CustomUser
+from users.token_blacklist import get_token_blacklist, purge_expired_tokens
+
+
+class BloomFilterTest(TestCase):
+    """
+    Test module for the BloomFilter class.
+    """
+
+    def test_no_false_negatives_and_few_false_positives(self):
+        """
+        Ensure that added keys are always found and others rarely are.
+        """
+
+        added = [uuid.uuid4().hex for _ in range(2000)]
+        bloom = BloomFilter(2000, 0.01)
+        bloom.update(added[:1000])
+        for key in added[1000:]:
+            bloom.add(key)
+
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+
+        self.assertTrue(all(key in bloom for key in added))
+        self.assertEqual(bloom.count, 2000)
+        self.assertLess(false_positives, 300)
+
+
+class TokenBlacklistTest(TestCase):
+    """
+    Test module for the TokenBlacklist class and purge_expired_tokens.
+    """
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+
+    def outstanding(self, expires_in, blacklisted=False):
+        """
+        Create an outstanding token expiring in expires_in seconds, blacklisted if asked.
+        """
+        token = OutstandingToken.objects.create(
+            user=self.user, jti=uuid.uuid4().hex, token='token',
+            expires_at=timezone.now() + timedelta(seconds=expires_in))
+        if blacklisted:
+            BlacklistedToken.objects.create(token=token)
+        return token
+
+    # Overriding a TOKEN_BLACKLIST_ setting gives each test a fresh filter.
+    @override_settings(TOKEN_BLACKLIST_REFRESH_INTERVAL=60)
+    def test_unrevoked_tokens_need_no_query(self):
+        """
+        Ensure that only the first check queries, and revocations are seen at once in this
+        process and after a refresh from others.
+        """
+
+        revoked_before = self.outstanding(3600, blacklisted=True)
+        blacklist = get_token_blacklist()
+
+        self.assertTrue(blacklist.is_blacklisted(revoked_before.jti))
+        with self.assertNumQueries(0):
+            for _ in range(100):
+                self.assertFalse(blacklist.is_blacklisted(uuid.uuid4().hex))
+
+        refresh = RefreshToken.for_user(self.user)
+        blacklist.revoke(refresh)
+        revoked_elsewhere = self.outstanding(3600, blacklisted=True)
+
+        self.assertTrue(blacklist.is_blacklisted(refresh['jti']))
+        self.assertFalse(blacklist.is_blacklisted(revoked_elsewhere.jti))
+        with self.assertNumQueries(1):
+            blacklist.refresh()
+        self.assertTrue(blacklist.is_blacklisted(revoked_elsewhere.jti))
+
+    def test_purge_deletes_expired_tokens_in_batches(self):
+        """
+        Ensure that expired tokens and their blacklist entries are deleted, others kept.
+        """
+
+        kept = [self.outstanding(3600), self.outstanding(3600, blacklisted=True)]
+        for index in range(5):
+            self.outstanding(-60, blacklisted=index % 2 == 0)
+
+        purged = purge_expired_tokens(batch_size=2)
+
+        self.assertEqual(purged, {'batches': 3, 'outstanding': 5, 'blacklisted': 3})
+        self.assertEqual(set(OutstandingToken.objects.all()), set(kept))
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+    def test_rows_committed_out_of_order_are_found(self):
+        """
+        Ensure that a blacklisting committed after one with a higher primary key is added
+        by a later refresh.
+        """
+
+        seen = self.outstanding(3600, blacklisted=True).blacklistedtoken.pk
+        blacklist = get_token_blacklist()
+        blacklist.rebuild()
+        late, early = self.outstanding(3600), self.outstanding(3600)
+
+        BlacklistedToken.objects.create(pk=seen + 2, token=early)
+        blacklist.refresh()
+        BlacklistedToken.objects.create(pk=seen + 1, token=late)
+        with self.assertNumQueries(1):
+            blacklist.refresh()
+
+        self.assertTrue(blacklist.is_blacklisted(early.jti))
+        self.assertTrue(blacklist.is_blacklisted(late.jti))
+        self.assertNotIn(seen + 1, blacklist.gaps)
+        self.assertEqual(blacklist.filter.count, 3)
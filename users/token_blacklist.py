@@ -0,0 +1,226 @@
+import threading
+import time
+from itertools import islice
+from typing import Dict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from utils.bloom import BloomFilter
+from utils.lazy import LazySingleton, maintain
+
+# The most skipped primary keys a TokenBlacklist looks up again; the highest are kept.
+MAX_GAPS = 1000
+
+
+class TokenBlacklist:
+    """
+    Process-local Bloom filter in front of simplejwt's BlacklistedToken table.
+
+    A JTI absent from the filter is not blacklisted, which answers the common case without
+    a query; a JTI present in it is confirmed against the table, which also rules out the
+    filter's false positives. The filter is built on first use from the blacklisted tokens
+    that have not expired, then refreshed incrementally: every
+    TOKEN_BLACKLIST_REFRESH_INTERVAL seconds the rows whose primary key is above the
+    highest one seen are added, which is one range scan of the primary key. Keys are
+    allocated before commit, so a row can appear after higher ones: the keys skipped below
+    the highest one seen are looked up again by each refresh until their row appears, or
+    for TOKEN_BLACKLIST_GAP_TIMEOUT seconds, after which they are taken as rolled back.
+    Tokens revoked by this process are added at once; those revoked by other processes are
+    seen after at most one refresh interval. The filter is rebuilt, dropping expired
+    tokens, every TOKEN_BLACKLIST_REBUILD_INTERVAL seconds, or sooner once it holds more
+    JTIs than it was sized for.
+
+    Methods:
+    - is_blacklisted(jti) -> bool: Whether a token is blacklisted.
+    - revoke(token): Blacklist a token.
+    - refresh(): Add the tokens blacklisted since the last refresh.
+    - rebuild(): Reload the blacklisted tokens that have not expired.
+    """
+
+    def __init__(self) -> None:
+        self.filter = BloomFilter(0, settings.TOKEN_BLACKLIST_FALSE_POSITIVE_RATE)
+        self.max_id = 0
+        # Skipped primary key -> when it was first skipped.
+        self.gaps: Dict[int, float] = {}
+        self.built = False
+        self.refreshed_at = self.built_at = -float('inf')
+        self._lock = threading.Lock()
+
+    def is_blacklisted(self, jti: str) -> bool:
+        """
+        Return whether the token with the given JTI is blacklisted.
+
+        Args:
+            jti (str): The token's JTI claim.
+
+        Returns:
+            bool: True if the token is in the BlacklistedToken table.
+        """
+        now = time.monotonic()
+        if (self.built_at + settings.TOKEN_BLACKLIST_REBUILD_INTERVAL <= now
+                or self.filter.count > self.filter.capacity):
+            maintain(self._lock, lambda: self.built, self.rebuild)
+        elif self.refreshed_at + settings.TOKEN_BLACKLIST_REFRESH_INTERVAL <= now:
+            maintain(self._lock, lambda: self.built, self.refresh)
+
+        if jti not in self.filter:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def revoke(self, token: Token) -> None:
+        """
+        Blacklist a token, recording it as outstanding first if it is not, as access
+        tokens are not.
+
+        Args:
+            token (Token): The validated token.
+        """
+        jti = token[api_settings.JTI_CLAIM]
+        outstanding, _created = OutstandingToken.objects.get_or_create(jti=jti, defaults={
+            'user_id': token.get(api_settings.USER_ID_CLAIM),
+            'created_at': token.current_time,
+            'token': str(token),
+            'expires_at': datetime_from_epoch(token['exp']),
+        })
+        BlacklistedToken.objects.get_or_create(token=outstanding)
+        self.filter.add(jti)
+
+    def refresh(self) -> None:
+        """
+        Add the tokens blacklisted since the last refresh or rebuild, and those of the
+        skipped primary keys.
+        """
+        started = time.monotonic()
+        timeout = settings.TOKEN_BLACKLIST_GAP_TIMEOUT
+        self.gaps = {pk: skipped_at for pk, skipped_at in self.gaps.items()
+                     if skipped_at + timeout > started}
+        query = Q(pk__gt=self.max_id)
+        if self.gaps:
+            query |= Q(pk__in=list(self.gaps))
+        rows = (BlacklistedToken.objects.filter(query).order_by('pk')
+                .values_list('pk', 'token__jti')
+                .iterator(chunk_size=settings.TOKEN_BLACKLIST_BATCH))
+        while True:
+            batch = list(islice(rows, settings.TOKEN_BLACKLIST_BATCH))
+            if not batch:
+                break
+            self.filter.update(jti for _, jti in batch)
+            for pk, _ in batch:
+                if pk > self.max_id:
+                    self._skip(range(self.max_id + 1, pk), started)
+                    self.max_id = pk
+                else:
+                    self.gaps.pop(pk, None)
+        self.refreshed_at = started
+
+    def _skip(self, pks: range, skipped_at: float) -> None:
+        # Keys of transactions that had not committed yet, or rolled back.
+        self.gaps.update(dict.fromkeys(pks[-MAX_GAPS:], skipped_at))
+        if len(self.gaps) > MAX_GAPS:
+            self.gaps = dict(sorted(self.gaps.items())[-MAX_GAPS:])
+
+    def rebuild(self) -> None:
+        """
+        Reload the blacklisted tokens that have not expired, sizing the filter for twice
+        their number.
+        """
+        started = time.monotonic()
+        # Tokens that expired are skipped, but the refreshes continue after them.
+        max_id = BlacklistedToken.objects.aggregate(max_id=Max('pk'))['max_id'] or 0
+        recent = set(BlacklistedToken.objects.filter(pk__gt=max_id - MAX_GAPS, pk__lte=max_id)
+                     .values_list('pk', flat=True))
+        jtis = list(BlacklistedToken.objects.filter(pk__lte=max_id,
+                                                    token__expires_at__gt=timezone.now())
+                    .values_list('token__jti', flat=True)
+                    .iterator(chunk_size=settings.TOKEN_BLACKLIST_BATCH))
+        blacklist = BloomFilter(max(2 * len(jtis), settings.TOKEN_BLACKLIST_BATCH),
+                                settings.TOKEN_BLACKLIST_FALSE_POSITIVE_RATE)
+        blacklist.update(jtis)
+        self.max_id = max_id
+        self.gaps = dict.fromkeys((pk for pk in range(max(max_id - MAX_GAPS, 0) + 1, max_id)
+                                   if pk not in recent), started)
+        self.filter = blacklist
+        self.built = True
+        self.built_at = self.refreshed_at = started
+
+
+_token_blacklist = LazySingleton(TokenBlacklist, 'TOKEN_BLACKLIST_')
+
+
+def get_token_blacklist() -> TokenBlacklist:
+    """
+    Return the process-wide token blacklist filter.
+
+    Returns:
+        TokenBlacklist: The shared instance.
+    """
+    return _token_blacklist.get()
+
+
+def purge_expired_tokens(batch_size: int, pause: float = 0) -> Dict[str, int]:
+    """
+    Delete the expired outstanding tokens and their blacklist entries, batch by batch.
+
+    simplejwt's flushexpiredtokens deletes every expired row in one statement, which holds
+    its locks, and a transaction, for as long as the whole table takes. Here each batch of
+    at most batch_size tokens is found by walking the primary key from the previous one and
+    deleted in its own short transaction. Tokens expire roughly in primary key order, so
+    each walk stops soon after its start.
+
+    Args:
+        batch_size (int): The number of tokens deleted per transaction.
+        pause (float): Seconds to sleep between batches, to leave room to other writes.
+
+    Returns:
+        Dict[str, int]: The number of batches, outstanding and blacklisted tokens deleted.
+    """
+    now = timezone.now()
+    purged = {'batches': 0, 'outstanding': 0, 'blacklisted': 0}
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            ids = list(OutstandingToken.objects.filter(pk__gt=last_id, expires_at__lte=now)
+                       .order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return purged
+            _, deleted = OutstandingToken.objects.filter(pk__in=ids).delete()
+        last_id = ids[-1]
+        purged['batches'] += 1
+        purged['outstanding'] += deleted.get(OutstandingToken._meta.label, 0)
+        purged['blacklisted'] += deleted.get(BlacklistedToken._meta.label, 0)
+        if pause:
+            time.sleep(pause)
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    simplejwt's RefreshToken checking and updating the blacklist through TokenBlacklist.
+    """
+
+    def check_blacklist(self) -> None:
+        if get_token_blacklist().is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self) -> BlacklistedToken:
+        blacklisted = super().blacklist()
+        get_token_blacklist().filter.add(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted
+
+
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):  # pylint: disable=abstract-method
+    """
+    simplejwt's TokenRefreshSerializer for FilteredRefreshToken, the SIMPLE_JWT
+    TOKEN_REFRESH_SERIALIZER.
+    """
+
+    token_class = FilteredRefreshToken
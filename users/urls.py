@@ -1,10 +1,46 @@
+from django.conf import settings
 from django.urls import path
 from users.views.user_login_view import LoginUserAPIView
+from users.views.user_logout_view import LogoutUserAPIView
 from users.views.user_profile_view import UserProfileAPIView
 from users.views.user_register_view import RegisterUserAPIView
+from users.views.user_bulk_profile_view import BulkUserProfileAPIView
+from users.views.user_search_view import UserAutocompleteAPIView, UserSearchAPIView
+from users.views.user_follow_view import (UserFollowAPIView, UserFollowersAPIView,
+                                          UserFollowingAPIView)
+from users.views.async_user_login_view import AsyncLoginUserView
+from users.views.async_user_profile_view import AsyncUserProfileView
+from users.views.async_user_register_view import AsyncRegisterUserView
 
-urlpatterns = [
-    path('users/register/', RegisterUserAPIView.as_view(), name='register_user'),
-    path('users/login/', LoginUserAPIView.as_view(), name='login_user'),
-    path('users/<int:userid>/', UserProfileAPIView.as_view(), name='user_profile'),
-]
+
+def build_urlpatterns(async_views: bool) -> list:
+    """
+    Build the users routes with either the DRF views or their native async counterparts.
+
+    Args:
+        async_views (bool): Whether to route to the async views meant for ASGI.
+
+    Returns:
+        list: The URL patterns.
+    """
+    register_view = AsyncRegisterUserView if async_views else RegisterUserAPIView
+    login_view = AsyncLoginUserView if async_views else LoginUserAPIView
+    profile_view = AsyncUserProfileView if async_views else UserProfileAPIView
+
+    return [
+        path('users/', BulkUserProfileAPIView.as_view(), name='bulk_user_profiles'),
+        path('users/register/', register_view.as_view(), name='register_user'),
+        path('users/login/', login_view.as_view(), name='login_user'),
+        path('users/logout/', LogoutUserAPIView.as_view(), name='logout_user'),
+        path('users/search/', UserSearchAPIView.as_view(), name='user_search'),
+        path('users/autocomplete/', UserAutocompleteAPIView.as_view(), name='user_autocomplete'),
+        path('users/<int:userid>/', profile_view.as_view(), name='user_profile'),
+        path('users/<int:userid>/follow/', UserFollowAPIView.as_view(), name='user_follow'),
+        path('users/<int:userid>/followers/', UserFollowersAPIView.as_view(),
+             name='user_followers'),
+        path('users/<int:userid>/following/', UserFollowingAPIView.as_view(),
+             name='user_following'),
+    ]
+
+
+urlpatterns = build_urlpatterns(settings.USERS_ASYNC_VIEWS)
@@ -0,0 +1,83 @@
+import logging
+
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from utils.async_views import AsyncJSONView
+from utils.bounded_executor import ExecutorSaturated
+from users.password_hashing import acheck_credentials
+from users.throttling import EndpointRateThrottle, record_failed_login, reset_failed_logins
+from users.constants import (WRONG_CREDENTIALS_ERROR, FAILED_LOGIN_ATTEMPT, MISSING_FIELD_ERROR,
+                             LOGIN_BUSY_ERROR, HASHING_POOL_SATURATED, INVALID_BODY_ERROR)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoginUserView(AsyncJSONView):
+    """
+    Native async counterpart of LoginUserAPIView for ASGI deployments.
+
+    The user lookup uses the async ORM and the password hash is awaited on the bounded
+    hashing pool, so the event loop keeps serving other requests while PBKDF2 runs.
+
+    Methods:
+    - post(request: HttpRequest) -> HttpResponse: Handles the POST request for user login.
+    """
+
+    throttle_classes = [EndpointRateThrottle]
+    rate_limit_scope = 'login'
+
+    async def post(self, request: HttpRequest) -> HttpResponse:
+        """
+        Handle the HTTP POST request to authenticate a user.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponse: The authentication tokens if successful, an error message if the
+            credentials are invalid, 429 if rate limited, or 503 if the hashing pool is
+            saturated.
+        """
+        try:
+            body = self.parse_body(request)
+        except ValueError:
+            return self.render({'error': INVALID_BODY_ERROR}, status.HTTP_400_BAD_REQUEST)
+
+        throttled = self.check_throttles(request, body)
+        if throttled is not None:
+            return throttled
+
+        for field in ('username', 'password'):
+            if field not in body:
+                return self.render({'error': f'{MISSING_FIELD_ERROR} {field}'},
+                                   status.HTTP_400_BAD_REQUEST)
+        username, password = body['username'], body['password']
+
+        try:
+            user = await acheck_credentials(username, password, request=request)
+        except ExecutorSaturated:
+            logger.warning(HASHING_POOL_SATURATED, username)
+            return self.render(
+                {'error': LOGIN_BUSY_ERROR},
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                {'Retry-After': str(settings.PASSWORD_HASHING_RETRY_AFTER)},
+            )
+
+        if not user:
+            logger.warning(FAILED_LOGIN_ATTEMPT, username)
+            record_failed_login(self.rate_limit_scope, username)
+            return self.render({'error': WRONG_CREDENTIALS_ERROR}, status.HTTP_400_BAD_REQUEST)
+
+        reset_failed_logins(self.rate_limit_scope, username)
+
+        # simplejwt records the outstanding token with the synchronous ORM.
+        refresh = await sync_to_async(RefreshToken.for_user)(user)
+        return self.render({
+            'refresh': str(refresh),
+            'access': str(refresh.access_token),
+        })
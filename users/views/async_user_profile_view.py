@@ -0,0 +1,127 @@
+import logging
+
+from asgiref.sync import sync_to_async
+from rest_framework import status
+
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest, HttpResponse
+
+from utils.async_views import AsyncJSONView
+from utils.responses import etag_matches
+from users.serializers import CustomUserSerializer, user_values_serializer
+from users.signals import invalidate_cached_user
+from users.models.custom_user_models import CustomUser
+from users.profile_cache import cache_profile, get_cached_profile, invalidation_marker
+from users.constants import USER_WITH_ID_NOT_FOUND, USER_NOT_FOUND_MESSAGE, INVALID_BODY_ERROR
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUserProfileView(AsyncJSONView):
+    """
+    Native async counterpart of UserProfileAPIView for ASGI deployments.
+
+    Reads and deletes use the async ORM and share the pre-rendered profile cache with the
+    synchronous view. Updates validate through CustomUserSerializer, whose unique checks
+    use the synchronous ORM, in a single thread hop.
+
+    Methods:
+    - get: Retrieve a user profile by user ID.
+    - put: Update a user profile by user ID.
+    - delete: Delete a user profile by user ID.
+    """
+
+    async def get(self, request: HttpRequest, userid: int) -> HttpResponse:
+        """
+        Retrieve a user by their ID.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            userid (int): The ID of the user to retrieve.
+
+        Returns:
+            HttpResponse: The serialized user data if found, a 304 response if the client's
+            copy is current, or a 404 response if the user does not exist.
+        """
+        profile = get_cached_profile(userid)
+
+        if profile is None:
+            marker = invalidation_marker()
+            # From the primary: a lagging replica's row would outlive the writer's sticky
+            # window in the cache.
+            try:
+                row = await (CustomUser.objects.using(DEFAULT_DB_ALIAS)
+                             .values(*user_values_serializer.columns).aget(pk=userid))
+            except CustomUser.DoesNotExist:
+                logger.error(USER_WITH_ID_NOT_FOUND, userid)
+                return self.render({'error': USER_NOT_FOUND_MESSAGE}, status.HTTP_404_NOT_FOUND)
+
+            profile = cache_profile(userid, user_values_serializer.to_representation(row),
+                                    marker)
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match and etag_matches(if_none_match, [profile.etag]):
+            return self.render(None, status.HTTP_304_NOT_MODIFIED, {'ETag': profile.etag})
+
+        return HttpResponse(profile.content, content_type=self.renderer.media_type,
+                            headers={'ETag': profile.etag})
+
+    async def put(self, request: HttpRequest, userid: int) -> HttpResponse:
+        """
+        Update a user's information.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            userid (int): The ID of the user to be updated.
+
+        Returns:
+            HttpResponse: The updated user data or an error message.
+        """
+        try:
+            body = self.parse_body(request)
+        except ValueError:
+            return self.render({'error': INVALID_BODY_ERROR}, status.HTTP_400_BAD_REQUEST)
+
+        try:
+            user = await CustomUser.objects.aget(pk=userid)
+        except CustomUser.DoesNotExist:
+            logger.error(USER_WITH_ID_NOT_FOUND, userid)
+            return self.render({'error': USER_NOT_FOUND_MESSAGE}, status.HTTP_404_NOT_FOUND)
+
+        serializer = CustomUserSerializer(user, data=body, partial=True)
+        if not await sync_to_async(self._save)(serializer):
+            return self.render(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        invalidate_cached_user(userid)
+        return self.render({'message': 'User has been updated successfully.',
+                            'data': serializer.data})
+
+    async def delete(self, request: HttpRequest, userid: int) -> HttpResponse:
+        """
+        Deletes a user with the given userid.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            userid (int): The id of the user to be deleted.
+
+        Returns:
+            HttpResponse: The HTTP response indicating the success or failure of the deletion.
+        """
+        try:
+            user = await CustomUser.objects.aget(pk=userid)
+        except CustomUser.DoesNotExist:
+            logger.error(USER_WITH_ID_NOT_FOUND, userid)
+            return self.render({'error': USER_NOT_FOUND_MESSAGE}, status.HTTP_404_NOT_FOUND)
+
+        await user.adelete()
+        invalidate_cached_user(userid)
+        return self.render({'message': 'User has been deleted successfully.'},
+                           status.HTTP_204_NO_CONTENT)
+
+    @staticmethod
+    def _save(serializer: CustomUserSerializer) -> bool:
+        if not serializer.is_valid():
+            return False
+        serializer.save()
+        return True
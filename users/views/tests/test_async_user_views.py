@@ -0,0 +1,130 @@
+import json
+
+from django.test import TestCase
+from django.test.client import AsyncRequestFactory
+from rest_framework import status
+
+from users.models.custom_user_models import CustomUser
+from users.profile_cache import profile_cache
+from users.throttling import get_rate_limit_backend
+from users.views.async_user_login_view import AsyncLoginUserView
+from users.views.async_user_profile_view import AsyncUserProfileView
+from users.views.async_user_register_view import AsyncRegisterUserView
+
+
+class AsyncUserViewsTest(TestCase):
+    """
+    Test module for the native async user views.
+    """
+
+    def setUp(self):
+        profile_cache.clear()
+        get_rate_limit_backend().clear()
+        self.factory = AsyncRequestFactory()
+        self.user = CustomUser.objects.create_user(
+            username='testuser', email='test@example.com', password='testpassword123')
+
+    def _post(self, view, body):
+        request = self.factory.post('/', data=body, content_type='application/json')
+        return view.as_view()(request)
+
+    async def test_login_with_valid_credentials(self):
+        """
+        Ensure that a user can login with valid credentials.
+        """
+
+        response = await self._post(
+            AsyncLoginUserView, {'username': 'testuser', 'password': 'testpassword123'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', json.loads(response.content))
+
+    async def test_login_with_invalid_credentials(self):
+        """
+        Ensure that a user cannot login with invalid credentials.
+        """
+
+        response = await self._post(
+            AsyncLoginUserView, {'username': 'testuser', 'password': 'wrongpassword'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_login_with_missing_field(self):
+        """
+        Ensure that a request without a password is rejected with 400.
+        """
+
+        response = await self._post(AsyncLoginUserView, {'username': 'testuser'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_register_with_valid_data(self):
+        """
+        Ensure that a user can be registered and receives tokens.
+        """
+
+        response = await self._post(AsyncRegisterUserView, {
+            'username': 'newuser', 'email': 'newuser@example.com', 'password': 'testpassword123'})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('refresh', json.loads(response.content))
+        self.assertTrue(await CustomUser.objects.filter(username='newuser').aexists())
+
+    async def test_register_with_duplicate_username(self):
+        """
+        Ensure that registering an existing username returns the validation errors.
+        """
+
+        response = await self._post(AsyncRegisterUserView, {
+            'username': 'testuser', 'email': 'other@example.com', 'password': 'testpassword123'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('username', json.loads(response.content))
+
+    async def test_retrieve_profile_and_revalidate(self):
+        """
+        Ensure that profiles are returned with an ETag and revalidate with 304.
+        """
+
+        view = AsyncUserProfileView.as_view()
+        response = await view(self.factory.get('/'), userid=self.user.pk)
+        revalidated = await view(
+            self.factory.get('/', headers={'If-None-Match': response['ETag']}),
+            userid=self.user.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)['email'], 'test@example.com')
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_retrieve_missing_profile(self):
+        """
+        Ensure that an unknown user ID returns 404.
+        """
+
+        response = await AsyncUserProfileView.as_view()(self.factory.get('/'), userid=9999)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_update_profile(self):
+        """
+        Ensure that a user profile can be updated by user ID.
+        """
+
+        request = self.factory.put('/', data={'bio': 'Updated bio'},
+                                   content_type='application/json')
+        response = await AsyncUserProfileView.as_view()(request, userid=self.user.pk)
+
+        await self.user.arefresh_from_db()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user.bio, 'Updated bio')
+
+    async def test_delete_profile(self):
+        """
+        Ensure that a user profile can be deleted by user ID.
+        """
+
+        response = await AsyncUserProfileView.as_view()(self.factory.delete('/'),
+                                                        userid=self.user.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(await CustomUser.objects.filter(pk=self.user.pk).aexists())
@@ -0,0 +1,63 @@
+from unittest import mock
+
+from django.urls import reverse
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from users.throttling import get_rate_limit_backend
+
+
+class RateLimitedTokenObtainPairViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the RateLimitedTokenObtainPairView class.
+    """
+
+    query_budgets = {'token_obtain_pair': 2}
+
+    url = reverse('token_obtain_pair')
+
+    def setUp(self):
+        get_rate_limit_backend().clear()
+        CustomUser.objects.create_user(
+            username='testuser', email='test@example.com', password='testpassword123')
+
+        self.valid_credentials = {'username': 'testuser', 'password': 'testpassword123'}
+        self.invalid_credentials = {'username': 'testuser', 'password': 'wrongpassword'}
+
+    def test_obtain_token_with_valid_credentials(self):
+        """
+        Ensure that valid credentials return a token pair.
+        """
+
+        response = self.client.post(self.url, self.valid_credentials)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+
+    @override_settings(RATE_LIMITS={'token_obtain_pair': {'username': (2, 60)}})
+    def test_username_is_locked_out_before_hashing(self):
+        """
+        Ensure that repeated failures lock the username out without authenticating.
+        """
+
+        for _ in range(2):
+            response = self.client.post(self.url, self.invalid_credentials)
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        with mock.patch('rest_framework_simplejwt.serializers.authenticate') as mocked:
+            response = self.client.post(self.url, self.valid_credentials)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        mocked.assert_not_called()
+
+    def test_body_that_is_not_an_object(self):
+        """
+        Ensure that a JSON body other than an object is rejected with a 400 response.
+        """
+
+        response = self.client.post(self.url, [1, 2], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,79 @@
+from django.urls import reverse
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from users.profile_cache import profile_cache
+
+
+class BulkUserProfileAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the BulkUserProfileAPIView class.
+    """
+
+    query_budgets = {'bulk_user_profiles': 1}
+
+    url = reverse('bulk_user_profiles')
+
+    def setUp(self):
+        profile_cache.clear()
+        self.users = [
+            CustomUser.objects.create_user(
+                username=f'testuser{i}', email=f'test{i}@example.com', password='testpassword123')
+            for i in range(3)
+        ]
+
+    def _ids(self, *user_ids):
+        return {'ids': ','.join(str(user_id) for user_id in user_ids)}
+
+    def test_retrieve_profiles_in_requested_order(self):
+        """
+        Ensure that profiles are returned in the order the ids were requested.
+        """
+
+        requested = [self.users[2].pk, self.users[0].pk, self.users[1].pk]
+        response = self.client.get(self.url, self._ids(*requested))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['id'] for user in response.data['results']], requested)
+        self.assertEqual(response.data['missing'], [])
+
+    def test_retrieve_profiles_with_a_single_query(self):
+        """
+        Ensure that all uncached profiles are resolved with one query.
+        """
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url, self._ids(*[user.pk for user in self.users]))
+
+    def test_missing_ids_are_reported(self):
+        """
+        Ensure that unknown ids are listed under 'missing' without failing the request.
+        """
+
+        response = self.client.get(self.url, self._ids(self.users[0].pk, 9999))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['missing'], [9999])
+
+    def test_invalid_ids_are_rejected(self):
+        """
+        Ensure that a missing or malformed 'ids' parameter returns 400.
+        """
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'ids': '1,abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(USERS_BULK_MAX_IDS=2)
+    def test_batch_size_is_capped(self):
+        """
+        Ensure that requesting more than USERS_BULK_MAX_IDS ids returns 400.
+        """
+
+        response = self.client.get(self.url, self._ids(*[user.pk for user in self.users]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,127 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from users.models.follow_models import Follow
+from users.profile_cache import profile_cache
+
+
+class UserFollowAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the UserFollowAPIView, UserFollowersAPIView and UserFollowingAPIView
+    classes.
+    """
+
+    # Following: the followee, the existing edge, the insert, both counts in one UPDATE and
+    # the follower count returned; unfollowing deletes instead of the first two.
+    query_budgets = {'POST user_follow': 5, 'user_follow': 4, 'user_followers': 2,
+                     'user_following': 2}
+
+    def setUp(self):
+        profile_cache.clear()
+        self.users = [
+            CustomUser.objects.create_user(username=f'testuser{i}', email=f'test{i}@example.com')
+            for i in range(4)
+        ]
+        self.client.force_authenticate(self.users[0])
+
+    def url(self, name, user):
+        return reverse(name, kwargs={'userid': user.pk})
+
+    def counts(self, user):
+        user.refresh_from_db()
+        return user.follower_count, user.following_count
+
+    def test_follow_and_unfollow(self):
+        """
+        Ensure that following is idempotent and keeps both users' counts.
+        """
+
+        target = self.users[1]
+        self.client.get(self.url('user_profile', target))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created = self.client.post(self.url('user_follow', target))
+        repeated = self.client.post(self.url('user_follow', target))
+
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(repeated.status_code, status.HTTP_200_OK)
+        self.assertEqual(repeated.data, {'following': True, 'follower_count': 1})
+        self.assertEqual(self.counts(target), (1, 0))
+        self.assertEqual(self.counts(self.users[0]), (0, 1))
+        profile = self.client.get(self.url('user_profile', target))
+        self.assertEqual(profile.data['follower_count'], 1)
+
+        removed = self.client.delete(self.url('user_follow', target))
+        self.client.delete(self.url('user_follow', target))
+
+        self.assertEqual(removed.data, {'following': False, 'follower_count': 0})
+        self.assertEqual(self.counts(target), (0, 0))
+        self.assertEqual(self.counts(self.users[0]), (0, 0))
+
+    def test_cannot_follow_self_or_unknown_user(self):
+        """
+        Ensure that following oneself returns 400 and an unknown user 404.
+        """
+
+        own = self.client.post(self.url('user_follow', self.users[0]))
+        unknown = self.client.post(reverse('user_follow', kwargs={'userid': 999}))
+
+        self.assertEqual(own.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(unknown.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_follow_requires_authentication(self):
+        """
+        Ensure that anonymous users cannot follow.
+        """
+
+        self.client.force_authenticate(None)
+
+        response = self.client.post(self.url('user_follow', self.users[1]))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_list_followers_and_following(self):
+        """
+        Ensure that followers and followings are listed newest first, page by page.
+        """
+
+        creator = self.users[3]
+        for follower in self.users[:3]:
+            self.client.force_authenticate(follower)
+            self.client.post(self.url('user_follow', creator))
+
+        first = self.client.get(self.url('user_followers', creator), {'limit': 2})
+        second = self.client.get(self.url('user_followers', creator),
+                                 {'limit': 2, 'cursor': first.data['next_cursor']})
+        following = self.client.get(self.url('user_following', self.users[0]))
+
+        followers = first.data['results'] + second.data['results']
+        self.assertEqual([user['username'] for user in followers],
+                         ['testuser2', 'testuser1', 'testuser0'])
+        self.assertIsNone(second.data['next_cursor'])
+        self.assertEqual([user['id'] for user in following.data['results']], [creator.pk])
+
+    def test_deleting_user_releases_counts(self):
+        """
+        Ensure that deleting a user removes their edges from the other users' counts.
+        """
+
+        self.client.post(self.url('user_follow', self.users[1]))
+        self.client.force_authenticate(self.users[2])
+        self.client.post(self.url('user_follow', self.users[0]))
+        for user in self.users[1:3]:
+            self.client.get(self.url('user_profile', user))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users[0].delete()
+
+        self.assertEqual(self.counts(self.users[1]), (0, 0))
+        self.assertEqual(self.counts(self.users[2]), (0, 0))
+        self.assertFalse(Follow.objects.exists())
+        followee = self.client.get(self.url('user_profile', self.users[1]))
+        follower = self.client.get(self.url('user_profile', self.users[2]))
+        self.assertEqual(followee.data['follower_count'], 0)
+        self.assertEqual(follower.data['following_count'], 0)
@@ -1,18 +1,28 @@
+from unittest import mock
+
+from django.conf import settings
 from django.urls import reverse
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from utils.query_budget import QueryBudgetMixin
+from utils.bounded_executor import ExecutorSaturated
 from users.models.custom_user_models import CustomUser
+from users.throttling import get_rate_limit_backend
 
 
-class LoginUserAPIViewTest(APITestCase):
+class LoginUserAPIViewTest(QueryBudgetMixin, APITestCase):
     """
     Test module for the LoginUserAPIView class.
     """
 
+    query_budgets = {'login_user': 3}
+
     url = reverse('login_user')
 
     def setUp(self):
+        get_rate_limit_backend().clear()
         self.user = CustomUser.objects.create_user(
             username='testuser', email='test@example.com')
         self.user.set_password('testpassword123')
@@ -48,3 +58,93 @@ class LoginUserAPIViewTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
+
+    def test_login_fails_fast_when_hashing_pool_is_saturated(self):
+        """
+        Ensure that a saturated hashing pool answers 503 with a Retry-After header.
+        """
+
+        with mock.patch('users.views.user_login_view.check_credentials',
+                        side_effect=ExecutorSaturated):
+            response = self.client.post(self.url, self.valid_credentials)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertIn('Retry-After', response)
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=1000)
+    def test_login_rehashes_password_with_tuned_iterations(self):
+        """
+        Ensure that a successful login upgrades a hash made with another iteration count.
+        """
+
+        response = self.client.post(self.url, self.valid_credentials)
+
+        self.user.refresh_from_db()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+        self.assertTrue(self.user.check_password('testpassword123'))
+
+    @override_settings(RATE_LIMITS={'login': {'username': (2, 60)}})
+    def test_username_is_locked_out_before_hashing(self):
+        """
+        Ensure that repeated failures lock the username out without running a password hash.
+        """
+
+        for _ in range(2):
+            self.client.post(self.url, self.invalid_credentials)
+
+        with mock.patch('users.views.user_login_view.check_credentials') as mocked_check:
+            response = self.client.post(self.url, self.valid_credentials)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        mocked_check.assert_not_called()
+
+    @override_settings(RATE_LIMITS={'login': {'username': (2, 60)}})
+    def test_successful_login_clears_failures(self):
+        """
+        Ensure that a successful login resets the failed attempt count of the username.
+        """
+
+        self.client.post(self.url, self.invalid_credentials)
+        self.client.post(self.url, self.valid_credentials)
+        response = self.client.post(self.url, self.invalid_credentials)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(RATE_LIMITS={'login': {'ip': (1, 60)}})
+    def test_client_address_is_rate_limited(self):
+        """
+        Ensure that requests beyond the per-address limit are rejected.
+        """
+
+        self.client.post(self.url, self.valid_credentials)
+        response = self.client.post(self.url, self.valid_credentials)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @override_settings(RATE_LIMITS={'login': {'ip': (1, 60)}})
+    def test_forwarded_for_header_is_ignored_without_proxies(self):
+        """
+        Ensure that a client cannot dodge the per-address limit by changing X-Forwarded-For.
+        """
+
+        self.client.post(self.url, self.valid_credentials, HTTP_X_FORWARDED_FOR='10.0.0.1')
+        response = self.client.post(self.url, self.valid_credentials,
+                                    HTTP_X_FORWARDED_FOR='10.0.0.2')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @override_settings(RATE_LIMITS={'login': {'ip': (1, 60)}},
+                       REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1})
+    def test_forwarded_for_address_of_trusted_proxy(self):
+        """
+        Ensure that behind a trusted proxy clients are told apart by the address it added.
+        """
+
+        self.client.post(self.url, self.valid_credentials,
+                         HTTP_X_FORWARDED_FOR='1.1.1.1, 10.0.0.1')
+        response = self.client.post(self.url, self.valid_credentials,
+                                    HTTP_X_FORWARDED_FOR='1.1.1.1, 10.0.0.2')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,63 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+
+
+# Overriding a TOKEN_BLACKLIST_ setting gives each test a fresh filter.
+@override_settings(TOKEN_BLACKLIST_REFRESH_INTERVAL=60)
+class LogoutUserAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the LogoutUserAPIView class.
+    """
+
+    # The user, then per revoked token its outstanding and blacklisted rows and the
+    # blacklisting; an access token has no outstanding row yet, so one is inserted first.
+    query_budgets = {'logout_user': 8}
+
+    url = reverse('logout_user')
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.refresh.access_token}')
+
+    def test_logout_revokes_both_tokens(self):
+        """
+        Ensure that after logging out neither the access nor the refresh token works.
+        """
+
+        response = self.client.post(self.url, {'refresh': str(self.refresh)})
+        reused = self.client.post(self.url, {'refresh': str(self.refresh)})
+        self.client.credentials()
+        refreshed = self.client.post(reverse('token_refresh'), {'refresh': str(self.refresh)})
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(reused.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(refreshed.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_still_works_before_logout(self):
+        """
+        Ensure that an unrevoked refresh token is accepted.
+        """
+
+        response = self.client.post(reverse('token_refresh'), {'refresh': str(self.refresh)})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_logout_rejects_foreign_or_invalid_tokens(self):
+        """
+        Ensure that a refresh token of another user or a malformed one is rejected.
+        """
+
+        other = CustomUser.objects.create_user(username='other', email='other@example.com')
+
+        foreign = self.client.post(self.url, {'refresh': str(RefreshToken.for_user(other))})
+        invalid = self.client.post(self.url, {'refresh': 'not-a-token'})
+
+        self.assertEqual(foreign.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
@@ -2,15 +2,22 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from utils.query_budget import QueryBudgetMixin
 from users.models.custom_user_models import CustomUser
+from users.profile_cache import profile_cache
 
 
-class UserProfileAPIViewTest(APITestCase):
+class UserProfileAPIViewTest(QueryBudgetMixin, APITestCase):
     """
     Test module for the UserProfileAPIView class.
     """
 
+    # Deleting is one query per table the user cascades to, plus the follow counts released:
+    # two SELECTs collecting the users to invalidate and two UPDATEs.
+    query_budgets = {'GET user_profile': 1, 'PUT user_profile': 2, 'DELETE user_profile': 15}
+
     def setUp(self):
+        profile_cache.clear()
         self.user_password = 'testpassword123'
 
         self.user = CustomUser.objects.create_user(
@@ -54,3 +61,54 @@ class UserProfileAPIViewTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(CustomUser.objects.filter(pk=self.user.pk).exists())
+
+    def test_retrieve_user_profile_is_served_from_cache(self):
+        """
+        Ensure that a repeated profile fetch is served without database queries.
+        """
+
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.json()['email'], 'test@example.com')
+        self.assertEqual(profile_cache.stats()['hits'], 1)
+
+    def test_retrieve_user_profile_with_matching_etag(self):
+        """
+        Ensure that a matching If-None-Match header returns 304 without database queries.
+        """
+
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_update_user_profile_invalidates_cache(self):
+        """
+        Ensure that an update changes the ETag and the cached representation.
+        """
+
+        etag = self.client.get(self.url)['ETag']
+        self.client.put(self.url, self.update_data, format='json')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['bio'], 'Updated bio')
+
+    def test_delete_user_profile_invalidates_cache(self):
+        """
+        Ensure that a deleted profile is no longer served from the cache.
+        """
+
+        self.client.get(self.url)
+        self.client.delete(self.url)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
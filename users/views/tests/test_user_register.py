@@ -1,18 +1,30 @@
+from unittest import mock
+
+from django.db import connection
 from django.urls import reverse
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from utils.query_budget import QueryBudgetMixin
 from users.models.custom_user_models import CustomUser
+from users.throttling import get_rate_limit_backend
 
 
-class RegisterUserAPIViewTest(APITestCase):
+class RegisterUserAPIViewTest(QueryBudgetMixin, APITestCase):
     """
     Test module for the RegisterUserAPIView class.
     """
 
+    # The username and email uniqueness checks, the insert and the refresh token issued.
+    query_budgets = {'register_user': 4}
+
     url = reverse('register_user')
 
     def setUp(self):
+        get_rate_limit_backend().clear()
         self.valid_data = {
             'username': 'newuser',
             'email': 'newuser@example.com',
@@ -64,3 +76,37 @@ class RegisterUserAPIViewTest(APITestCase):
         self.client.post(self.url, self.valid_data)
         response = self.client.post(self.url, self.valid_data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_user_registration_hashes_once_and_inserts_once(self):
+        """
+        Ensure that registration runs a single password hash and a single user INSERT.
+        """
+
+        encode = PBKDF2PasswordHasher.encode
+        with mock.patch.object(PBKDF2PasswordHasher, 'encode', autospec=True,
+                               side_effect=encode) as mocked_encode, \
+                CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, self.valid_data)
+
+        user_table = CustomUser._meta.db_table
+        user_writes = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith(('INSERT', 'UPDATE')) and user_table in query['sql']
+        ]
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(mocked_encode.call_count, 1)
+        self.assertEqual(len(user_writes), 1)
+        self.assertTrue(user_writes[0].startswith('INSERT'))
+        self.assertTrue(CustomUser.objects.get().check_password('testpassword123'))
+
+    @override_settings(RATE_LIMITS={'register': {'ip': (1, 60)}})
+    def test_user_registration_is_rate_limited(self):
+        """
+        Ensure that registrations beyond the per-address limit are rejected.
+        """
+
+        self.client.post(self.url, self.valid_data)
+        response = self.client.post(self.url, self.invalid_data)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
@@ -0,0 +1,66 @@
+import unittest
+
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models.custom_user_models import CustomUser
+
+
+@override_settings(USER_AUTOCOMPLETE_REFRESH_INTERVAL=0)
+class UserSearchAPIViewTest(APITestCase):
+    """
+    Test module for the UserSearchAPIView and UserAutocompleteAPIView classes.
+    """
+
+    def setUp(self):
+        for username, bio in (('dancer_kim', 'Street dance every day'),
+                              ('kimchi_chef', 'Cooking videos'),
+                              ('Kimberly', ''),
+                              ('painter', 'I paint and dance')):
+            CustomUser.objects.create_user(username=username, email=f'{username}@example.com',
+                                           bio=bio)
+
+    def test_autocomplete(self):
+        """
+        Ensure that usernames starting with the prefix are completed, in any case.
+        """
+
+        response = self.client.get(reverse('user_autocomplete'), {'q': 'KIM', 'limit': 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data['results']],
+                         ['Kimberly', 'kimchi_chef'])
+
+    def test_invalid_query(self):
+        """
+        Ensure that a missing or too long query returns 400.
+        """
+
+        missing = self.client.get(reverse('user_search'), {'q': '  '})
+        too_long = self.client.get(reverse('user_autocomplete'), {'q': 'k' * 101})
+        limit = self.client.get(reverse('user_autocomplete'), {'q': 'k', 'limit': 51})
+
+        self.assertEqual(missing.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(too_long.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(limit.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'Full-text search needs PostgreSQL.')
+    def test_search_ranks_usernames_over_bios(self):
+        """
+        Ensure that users are matched by username and bio, username matches first, page by
+        page.
+        """
+
+        first = self.client.get(reverse('user_search'), {'q': 'dance', 'limit': 1})
+        second = self.client.get(reverse('user_search'),
+                                 {'q': 'dance', 'limit': 1, 'cursor': first.data['next_cursor']})
+        typo = self.client.get(reverse('user_search'), {'q': 'kimberley'})
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in first.data['results']
+                          + second.data['results']], ['dancer_kim', 'painter'])
+        self.assertIsNone(second.data['next_cursor'])
+        self.assertEqual(typo.data['results'][0]['username'], 'Kimberly')
@@ -0,0 +1,43 @@
+from rest_framework.response import Response
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from django.http import HttpRequest
+
+from users.throttling import (EndpointRateThrottle, record_failed_login, reset_failed_logins,
+                              submitted_username)
+
+
+class RateLimitedTokenObtainPairView(TokenObtainPairView):
+    """
+    simplejwt's TokenObtainPairView behind the 'token_obtain_pair' rate limits.
+
+    Failed authentications count towards the username lockout, successful ones clear it.
+
+    Methods:
+    - post: Issue a refresh/access token pair for valid credentials.
+    """
+
+    throttle_classes = [EndpointRateThrottle]
+    rate_limit_scope = 'token_obtain_pair'
+
+    def post(self, request: HttpRequest, *args, **kwargs) -> Response:
+        """
+        Handle the HTTP POST request to obtain a token pair.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: The token pair, or the authentication error raised by simplejwt.
+        """
+        username = submitted_username(request)
+
+        try:
+            response = super().post(request, *args, **kwargs)
+        except AuthenticationFailed:
+            record_failed_login(self.rate_limit_scope, username)
+            raise
+
+        reset_failed_logins(self.rate_limit_scope, username)
+        return response
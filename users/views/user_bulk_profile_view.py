@@ -0,0 +1,91 @@
+from typing import List
+
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest
+
+from users.serializers import user_values_serializer
+from users.models.custom_user_models import CustomUser
+from users.constants import INVALID_IDS_ERROR, TOO_MANY_IDS_ERROR
+from users.profile_cache import cache_profile, get_cached_profile, invalidation_marker
+
+
+class BulkUserProfileAPIView(APIView):
+    """
+    API view for retrieving many user profiles in one request.
+
+    Feeds need profile cards for dozens of authors at once. This view resolves every id
+    that is not already in the profile cache with a single query, serialized from its rows
+    without building model instances, and returns the profiles in the requested order.
+    Ids that do not exist are reported under 'missing' instead of failing the whole
+    request.
+
+    Methods:
+    - get: Retrieve the profiles listed in the 'ids' query parameter.
+    """
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Retrieve several users by their IDs.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with a comma-separated 'ids'
+            query parameter.
+
+        Returns:
+            Response: The serialized users under 'results' in request order and the ids
+            that were not found under 'missing', or a 400 response if 'ids' is invalid
+            or longer than USERS_BULK_MAX_IDS.
+        """
+        try:
+            user_ids = self._parse_ids(request.query_params.get('ids', ''))
+        except ValueError:
+            return Response({'error': INVALID_IDS_ERROR}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(user_ids) > settings.USERS_BULK_MAX_IDS:
+            return Response({'error': TOO_MANY_IDS_ERROR % settings.USERS_BULK_MAX_IDS},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        profiles = {}
+        for user_id in user_ids:
+            cached = get_cached_profile(user_id)
+            if cached is not None:
+                profiles[user_id] = cached.serialized
+
+        uncached = [user_id for user_id in user_ids if user_id not in profiles]
+        if uncached:
+            marker = invalidation_marker()
+            # From the primary: a lagging replica's rows would outlive the writer's sticky
+            # window in the cache.
+            users = CustomUser.objects.using(DEFAULT_DB_ALIAS).filter(pk__in=uncached)
+            for profile in user_values_serializer.serialize(users):
+                profiles[profile['id']] = cache_profile(profile['id'], profile, marker).serialized
+
+        return Response({
+            'results': [profiles[user_id] for user_id in user_ids if user_id in profiles],
+            'missing': [user_id for user_id in user_ids if user_id not in profiles],
+        }, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _parse_ids(raw_ids: str) -> List[int]:
+        """
+        Parse the 'ids' query parameter, dropping duplicates but keeping the first position.
+
+        Args:
+            raw_ids (str): The comma-separated ids.
+
+        Returns:
+            List[int]: The unique ids in request order.
+
+        Raises:
+            ValueError: If the parameter is empty or contains a non-positive integer.
+        """
+        user_ids = [int(part) for part in raw_ids.split(',') if part.strip()]
+        if not user_ids or any(user_id <= 0 for user_id in user_ids):
+            raise ValueError(raw_ids)
+
+        return list(dict.fromkeys(user_ids))
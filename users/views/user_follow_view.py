@@ -0,0 +1,137 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny, IsAuthenticated
+
+from django.http import HttpRequest
+
+from utils.pagination import KeysetPagination
+from users.follows import follow, unfollow
+from users.serializers import UserSummarySerializer
+from users.models.custom_user_models import CustomUser
+from users.models.follow_models import Follow
+from users.constants import CANNOT_FOLLOW_SELF_ERROR, USER_NOT_FOUND_MESSAGE
+
+
+def _user_not_found() -> Response:
+    return Response({'error': USER_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+
+class UserFollowAPIView(APIView):
+    """
+    API view for following and unfollowing a user.
+
+    Methods:
+    - post: Follow the user.
+    - delete: Unfollow the user.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: HttpRequest, userid: int) -> Response:
+        """
+        Follow a user.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            userid (int): The ID of the user to follow.
+
+        Returns:
+            Response: The followee's follower count, with status 201 if the follow is new and
+            200 if it already existed, a 400 response for the requesting user's own ID, or a
+            404 response if the user does not exist.
+        """
+        followee = CustomUser.objects.filter(pk=userid).first()
+        if followee is None:
+            return _user_not_found()
+        if followee.pk == request.user.pk:
+            return Response({'error': CANNOT_FOLLOW_SELF_ERROR},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        created = follow(request.user, followee)
+        return self._state(followee, True,
+                           status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+    def delete(self, request: HttpRequest, userid: int) -> Response:
+        """
+        Unfollow a user.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            userid (int): The ID of the user to unfollow.
+
+        Returns:
+            Response: The followee's follower count, or a 404 response if the user does
+            not exist.
+        """
+        followee = CustomUser.objects.filter(pk=userid).first()
+        if followee is None:
+            return _user_not_found()
+
+        unfollow(request.user, followee)
+        return self._state(followee, False, status.HTTP_200_OK)
+
+    @staticmethod
+    def _state(followee: CustomUser, following: bool, status_code: int) -> Response:
+        follower_count = CustomUser.objects.values_list('follower_count', flat=True).get(
+            pk=followee.pk)
+        return Response({'following': following, 'follower_count': follower_count},
+                        status=status_code)
+
+
+class UserFollowListAPIView(APIView):
+    """
+    Base API view listing one side of a user's follow edges, most recent first.
+
+    Pages are fetched by keyset on the edges' (created_at, id), which the Follow indexes
+    serve per user.
+
+    Methods:
+    - get: Retrieve a page of users.
+    """
+
+    permission_classes = [AllowAny]
+    # The edge field holding the listed user, and the one holding the user whose list it is.
+    listed = ''
+    owner = ''
+
+    def get(self, request: HttpRequest, userid: int) -> Response:
+        """
+        Retrieve a page of the users on the other end of a user's edges.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'cursor' and
+            'limit' query parameters.
+            userid (int): The ID of the user.
+
+        Returns:
+            Response: The users under 'results' and the cursor of the next page under
+            'next_cursor', a 400 response for an invalid cursor or limit, or a 404 response
+            if the user does not exist.
+        """
+        if not CustomUser.objects.filter(pk=userid).exists():
+            return _user_not_found()
+
+        edges = Follow.objects.filter(**{f'{self.owner}_id': userid}).select_related(self.listed)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(edges, request, view=self)
+        users = [getattr(edge, self.listed) for edge in page]
+        return paginator.get_paginated_response(UserSummarySerializer(users, many=True).data)
+
+
+class UserFollowersAPIView(UserFollowListAPIView):
+    """
+    API view listing the followers of a user.
+    """
+
+    listed = 'follower'
+    owner = 'followee'
+
+
+class UserFollowingAPIView(UserFollowListAPIView):
+    """
+    API view listing the users a user follows.
+    """
+
+    listed = 'followee'
+    owner = 'follower'
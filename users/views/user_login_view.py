@@ -1,16 +1,21 @@
+import logging
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from django.conf import settings
 from django.http import HttpRequest
 from django.forms import ValidationError
-from django.contrib.auth import authenticate
 
-from utils import logger_config
-from users.constants import WRONG_CREDENTIALS_ERROR, FAILED_LOGIN_ATTEMPT, MISSING_FIELD_ERROR
+from utils.bounded_executor import ExecutorSaturated
+from users.password_hashing import check_credentials
+from users.throttling import EndpointRateThrottle, record_failed_login, reset_failed_logins
+from users.constants import (WRONG_CREDENTIALS_ERROR, FAILED_LOGIN_ATTEMPT, MISSING_FIELD_ERROR,
+                             LOGIN_BUSY_ERROR, HASHING_POOL_SATURATED)
 
-logger = logger_config.configure_logger()
+logger = logging.getLogger(__name__)
 
 
 class LoginUserAPIView(APIView):
@@ -18,7 +23,10 @@ class LoginUserAPIView(APIView):
     API view for user login.
 
     This view handles the POST request for user login. It expects the 'username' and 'password'
-    fields in the request data.
+    fields in the request data. Password hashing runs on a bounded pool; when the pool is
+    saturated the request fails fast with 503 and a Retry-After header. Requests over the
+    'login' rate limits, or for a username locked out after repeated failures, are rejected
+    with 429 before any hashing happens.
 
     Methods:
     - post(request: HttpRequest) -> Response: Handles the POST request for user login.
@@ -28,6 +36,9 @@ class LoginUserAPIView(APIView):
       the login is successful, or an error message if the provided credentials are invalid.
     """
 
+    throttle_classes = [EndpointRateThrottle]
+    rate_limit_scope = 'login'
+
     def post(self, request: HttpRequest) -> Response:
         """
         Handle the HTTP POST request to authenticate a user.
@@ -37,7 +48,8 @@ class LoginUserAPIView(APIView):
 
         Returns:
             Response: The HTTP response object containing the authentication tokens if successful,
-            or an error message if the credentials are invalid.
+            an error message if the credentials are invalid, or a 503 response if the
+            password hashing pool is saturated.
         """
         try:
             username = request.data['username']
@@ -45,12 +57,23 @@ class LoginUserAPIView(APIView):
         except KeyError as e:
             raise ValidationError(f'{MISSING_FIELD_ERROR} {e.args[0]}') from e
 
-        user = authenticate(username=username, password=password)
+        try:
+            user = check_credentials(username, password, request=request)
+        except ExecutorSaturated:
+            logger.warning(HASHING_POOL_SATURATED, username)
+            return Response(
+                {"error": LOGIN_BUSY_ERROR},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(settings.PASSWORD_HASHING_RETRY_AFTER)},
+            )
 
         if not user:
             logger.warning(FAILED_LOGIN_ATTEMPT, username)
+            record_failed_login(self.rate_limit_scope, username)
             return Response({"error": WRONG_CREDENTIALS_ERROR}, status=status.HTTP_400_BAD_REQUEST)
 
+        reset_failed_logins(self.rate_limit_scope, username)
+
         refresh = RefreshToken.for_user(user)
         return Response({
             'refresh': str(refresh),
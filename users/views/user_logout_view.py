@@ -0,0 +1,52 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from django.http import HttpRequest
+
+from users.constants import INVALID_REFRESH_TOKEN_ERROR
+from users.token_blacklist import FilteredRefreshToken, get_token_blacklist
+
+
+class LogoutUserAPIView(APIView):
+    """
+    API view for logging out.
+
+    The refresh token given in the body and the access token of the request are both
+    blacklisted (users.token_blacklist), so neither can be used again, in this worker at
+    once and in the others after at most TOKEN_BLACKLIST_REFRESH_INTERVAL seconds.
+
+    Methods:
+    - post: Revoke the user's tokens.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: HttpRequest) -> Response:
+        """
+        Revoke a refresh token and the access token of the request.
+
+        Args:
+            request (HttpRequest): The HTTP request object with the 'refresh' token.
+
+        Returns:
+            Response: An empty 204 response, or a 400 response if the refresh token is
+            missing, invalid, already revoked or issued to another user.
+        """
+        try:
+            refresh = FilteredRefreshToken(request.data.get('refresh', ''))
+        except TokenError:
+            return Response({'error': INVALID_REFRESH_TOKEN_ERROR},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if str(refresh.get(api_settings.USER_ID_CLAIM)) != str(request.user.pk):
+            return Response({'error': INVALID_REFRESH_TOKEN_ERROR},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        blacklist = get_token_blacklist()
+        blacklist.revoke(refresh)
+        if request.auth is not None:
+            blacklist.revoke(request.auth)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,22 +1,34 @@
+import logging
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
+from django.db import DEFAULT_DB_ALIAS
 from django.http import HttpRequest
 
-from utils import logger_config
-from users.serializers import CustomUserSerializer
+from utils.uploads import DiskUploadMixin
+from utils.responses import PrerenderedJSONResponse, etag_matches
+from users.serializers import CustomUserSerializer, user_values_serializer
+from users.signals import invalidate_cached_user
+from users.profile_cache import cache_profile, get_cached_profile, invalidation_marker
 from users.models.custom_user_models import CustomUser
 from users.constants import USER_WITH_ID_NOT_FOUND, USER_NOT_FOUND_MESSAGE
 
 
-logger = logger_config.configure_logger()
+logger = logging.getLogger(__name__)
 
 
-class UserProfileAPIView(APIView):
+class UserProfileAPIView(DiskUploadMixin, APIView):
     """
     API view for retrieving, updating, and deleting user profiles.
 
+    Profiles are served from an in-process cache of pre-rendered JSON with a strong ETag, so
+    a client revalidating with If-None-Match gets a 304 without touching the database.
+    Cache misses are read from the primary and serialized straight from the row, without
+    building a model instance.
+    Uploaded profile pictures are streamed to disk rather than held in memory.
+
     Methods:
     - get: Retrieve a user profile by user ID.
     - put: Update a user profile by user ID.
@@ -32,17 +44,32 @@ class UserProfileAPIView(APIView):
             userid (int): The ID of the user to retrieve.
 
         Returns:
-            Response: The serialized user data if found,
-            or a 404 response if the user does not exist.
+            Response: The serialized user data if found, a 304 response if the client's
+            copy is current, or a 404 response if the user does not exist.
         """
-        try:
-            user = CustomUser.objects.get(pk=userid)
-            serializer = CustomUserSerializer(user)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-
-        except CustomUser.DoesNotExist:
-            logger.error(USER_WITH_ID_NOT_FOUND, userid)
-            return Response({'error': USER_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+        profile = get_cached_profile(userid)
+
+        if profile is None:
+            marker = invalidation_marker()
+            # From the primary: a lagging replica's row would outlive the writer's sticky
+            # window in the cache.
+            try:
+                row = (CustomUser.objects.using(DEFAULT_DB_ALIAS)
+                       .values(*user_values_serializer.columns).get(pk=userid))
+            except CustomUser.DoesNotExist:
+                logger.error(USER_WITH_ID_NOT_FOUND, userid)
+                return Response({'error': USER_NOT_FOUND_MESSAGE},
+                                status=status.HTTP_404_NOT_FOUND)
+
+            profile = cache_profile(userid, user_values_serializer.to_representation(row),
+                                    marker)
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match and etag_matches(if_none_match, [profile.etag]):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': profile.etag})
+
+        return PrerenderedJSONResponse(profile.serialized, profile.content,
+                                       status=status.HTTP_200_OK, headers={'ETag': profile.etag})
 
     def put(self, request: HttpRequest, userid: int) -> Response:
         """
@@ -62,6 +89,7 @@ class UserProfileAPIView(APIView):
 
             if serializer.is_valid():
                 serializer.save()
+                invalidate_cached_user(userid)
                 return Response(
                     {'message': 'User has been updated successfully.',
                         'data': serializer.data, },
@@ -88,6 +116,7 @@ class UserProfileAPIView(APIView):
         try:
             user = CustomUser.objects.get(pk=userid)
             user.delete()
+            invalidate_cached_user(userid)
             return Response(
                 {'message': 'User has been deleted successfully.'},
                 status=status.HTTP_204_NO_CONTENT
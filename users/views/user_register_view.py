@@ -3,15 +3,21 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from django.db import transaction
 from django.http import HttpRequest
 
+from utils.uploads import DiskUploadMixin
 from users.serializers import CustomUserSerializer
+from users.throttling import EndpointRateThrottle
 
 
-class RegisterUserAPIView(APIView):
+class RegisterUserAPIView(DiskUploadMixin, APIView):
     """
     API view for registering a new user.
 
+    Requests over the 'register' rate limits are rejected with 429 before validation. Uploaded
+    profile pictures are streamed to disk rather than held in memory.
+
     Methods:
     - post: Register a new user with the provided data.
 
@@ -20,6 +26,9 @@ class RegisterUserAPIView(APIView):
       is successful, or the validation errors if the provided data is invalid.
     """
 
+    throttle_classes = [EndpointRateThrottle]
+    rate_limit_scope = 'register'
+
     def post(self, request: HttpRequest) -> Response:
         """
         Handle HTTP POST request to create a new user.
@@ -33,8 +42,10 @@ class RegisterUserAPIView(APIView):
         serializer = CustomUserSerializer(data=request.data)
 
         if serializer.is_valid():
-            user = self._create_user(serializer)
-            refresh = RefreshToken.for_user(user)
+            with transaction.atomic():
+                user = serializer.save()
+                refresh = RefreshToken.for_user(user)
+
             res_data = {
                 'user': serializer.data,
                 'refresh': str(refresh),
@@ -43,19 +54,3 @@ class RegisterUserAPIView(APIView):
             return Response(res_data, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-    @staticmethod
-    def _create_user(serializer):
-        """
-        Creates a new user based on the provided serializer.
-
-        Args:
-            serializer: The serializer containing the user data.
-
-        Returns:
-            The created user object.
-        """
-        user = serializer.save()
-        user.set_password(serializer.validated_data['password'])
-        user.save()
-        return user
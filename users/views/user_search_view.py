@@ -0,0 +1,86 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from utils.pagination import parse_page_size
+from utils.search import SearchPagination, parse_search_query, ranked_search
+from users.autocomplete import get_username_index
+from users.serializers import UserSummarySerializer
+from users.models.custom_user_models import USER_SEARCH_VECTOR, CustomUser
+
+
+class UserSearchAPIView(APIView):
+    """
+    API view for searching users by username and bio.
+
+    Words are matched against the users' full-text document and misspelled or partial
+    usernames by trigram similarity, both answered by GIN indexes. Results are ordered by
+    relevance and paginated by keyset on (rank, id).
+
+    Methods:
+    - get: Retrieve a page of matching users.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Search users.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with the search text in 'q' and
+            optional 'cursor' and 'limit' query parameters.
+
+        Returns:
+            Response: The users under 'results', most relevant first, and the cursor of the
+            next page under 'next_cursor', or a 400 response for an invalid query, cursor
+            or limit.
+        """
+        text = parse_search_query(request)
+        users = ranked_search(
+            CustomUser.objects.filter(is_active=True)
+            .only('id', 'username', 'follower_count', 'following_count'),
+            USER_SEARCH_VECTOR, text, similar_field='username')
+
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        return paginator.get_paginated_response(UserSummarySerializer(page, many=True).data)
+
+
+class UserAutocompleteAPIView(APIView):
+    """
+    API view completing a username prefix as it is typed.
+
+    Served from the in-process sorted index of usernames (users.autocomplete), so a
+    keystroke costs a binary search and no database query.
+
+    Methods:
+    - get: Retrieve the users whose username starts with a prefix.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Complete a username prefix.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with the prefix in 'q' and an
+            optional 'limit' query parameter.
+
+        Returns:
+            Response: Up to 'limit' users under 'results' in alphabetical order, or a 400
+            response for an invalid prefix or limit.
+        """
+        prefix = parse_search_query(request)
+        limit = parse_page_size(request, settings.USER_AUTOCOMPLETE_LIMIT,
+                                settings.USER_AUTOCOMPLETE_MAX_LIMIT)
+
+        matches = get_username_index().complete(prefix, limit)
+        return Response({'results': [{'id': user_id, 'username': username}
+                                     for user_id, username in matches]},
+                        status=status.HTTP_200_OK)
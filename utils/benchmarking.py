@@ -0,0 +1,107 @@
+import math
+import resource
+import sys
+from typing import Any, Dict, List, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Return the pct-th percentile of values using the nearest-rank method.
+
+    Args:
+        values (Sequence[float]): The samples.
+        pct (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The sample at that rank, or 0.0 when there are no samples.
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_latencies(latencies: Sequence[float], elapsed: float) -> Dict[str, float]:
+    """
+    Summarize per-request latencies measured over a run.
+
+    Args:
+        latencies (Sequence[float]): Seconds spent on each request.
+        elapsed (float): Wall-clock seconds for the whole run.
+
+    Returns:
+        Dict[str, float]: Request count, throughput and p50/p95/p99/max latency in ms.
+    """
+    return {
+        'requests': len(latencies),
+        'throughput_rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1e3,
+        'p95_ms': percentile(latencies, 95) * 1e3,
+        'p99_ms': percentile(latencies, 99) * 1e3,
+        'max_ms': max(latencies, default=0.0) * 1e3,
+    }
+
+
+def peak_rss_mb() -> float:
+    """
+    Return the peak resident set size of the current process in megabytes.
+
+    Returns:
+        float: The peak RSS reported by getrusage.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+# Report metrics that regress when they grow, and those that regress when they shrink
+# (find_regressions).
+GROWTH_METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'queries_per_request')
+SHRINK_METRICS = ('throughput_rps',)
+
+
+def find_regressions(report: Dict[str, Any], baseline: Dict[str, Any],
+                     threshold: float) -> List[str]:
+    """
+    Compare a benchmark report with a baseline report of the same shape.
+
+    Each endpoint of the baseline regresses when a latency percentile or its queries per
+    request grow, or its throughput shrinks, by more than threshold, and when it fails more
+    requests at all. Queries per request get the same tolerance because periodic work,
+    such as cache refreshes, lands on whichever requests come due. The peak RSS regresses
+    like a latency.
+
+    Args:
+        report (Dict[str, Any]): The current report, with 'endpoints' mapping names to the
+            metrics of summarize_latencies plus 'queries_per_request' and 'errors', and
+            'peak_rss_mb'.
+        baseline (Dict[str, Any]): The stored report to compare with.
+        threshold (float): The tolerated relative change, e.g. 0.2 for 20%.
+
+    Returns:
+        List[str]: One description per regression, empty when there is none.
+    """
+    regressions = []
+    for endpoint, expected in baseline['endpoints'].items():
+        measured = report['endpoints'].get(endpoint)
+        if measured is None:
+            regressions.append(f'{endpoint}: not measured')
+            continue
+        for metric in GROWTH_METRICS:
+            if measured[metric] > expected[metric] * (1 + threshold):
+                regressions.append(f'{endpoint}: {metric} {expected[metric]:.2f} -> '
+                                   f'{measured[metric]:.2f}')
+        for metric in SHRINK_METRICS:
+            if measured[metric] < expected[metric] * (1 - threshold):
+                regressions.append(f'{endpoint}: {metric} {expected[metric]:.1f} -> '
+                                   f'{measured[metric]:.1f}')
+        if measured['errors'] > expected['errors']:
+            regressions.append(f"{endpoint}: errors {expected['errors']} -> "
+                               f"{measured['errors']}")
+
+    if report['peak_rss_mb'] > baseline['peak_rss_mb'] * (1 + threshold):
+        regressions.append(f"peak_rss_mb: {baseline['peak_rss_mb']:.1f} -> "
+                           f"{report['peak_rss_mb']:.1f}")
+    return regressions
@@ -0,0 +1,66 @@
+import math
+from typing import Iterable
+
+import numpy as np
+
+from utils.sketches import hash_pair
+
+
+# Positions are computed modulo 2**64 in Python as numpy does for the vectorized path.
+_UINT64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Fixed-size set membership test with no false negatives.
+
+    A key sets k bits of an m-bit array, chosen by double hashing (h1 + i * h2), and is
+    reported present when all of its bits are set. Keys that were added are always found;
+    other keys are wrongly found with probability about error_rate while at most capacity
+    keys have been added, and more often beyond. Keys cannot be removed: to drop keys,
+    build a new filter.
+
+    Methods:
+    - add(key): Add one key.
+    - update(keys): Add many keys at once.
+    - __contains__(key) -> bool: Whether the key may have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.size = max(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        first, step = hash_pair(key)
+        return (((first + index * step) & _UINT64) % self.size for index in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, keys: Iterable[str]) -> None:
+        """
+        Add keys, hashing each once and setting all their bits in one vectorized pass.
+
+        Args:
+            keys (Iterable[str]): The keys.
+        """
+        pairs = np.array([hash_pair(key) for key in keys], dtype=np.uint64).reshape(-1, 2)
+        if not pairs.size:
+            return
+        rounds = np.arange(self.hashes, dtype=np.uint64)[:, None]
+        # uint64 arithmetic wraps around, which is what the hash needs.
+        positions = ((pairs[:, 0] + rounds * pairs[:, 1]) % np.uint64(self.size)).ravel()
+        masks = np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+        np.bitwise_or.at(self.bits, (positions >> np.uint64(3)).astype(np.intp), masks)
+        self.count += len(pairs)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
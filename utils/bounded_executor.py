@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class ExecutorSaturated(Exception):
+    """
+    Raised when a BoundedExecutor already holds as much work as it is allowed to queue.
+    """
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a hard cap on running plus queued work.
+
+    A plain ThreadPoolExecutor accepts an unbounded backlog, so a burst of slow tasks turns
+    into unbounded latency for everyone queued behind it. This executor admits at most
+    max_workers + queue_depth tasks at a time and raises ExecutorSaturated immediately
+    instead of queueing more, so callers can shed load.
+
+    Methods:
+    - submit(fn, *args, **kwargs) -> Future: Schedule fn or raise ExecutorSaturated.
+    - run(fn, *args, **kwargs): Schedule fn and block until it returns.
+    - arun(fn, *args, **kwargs): Schedule fn and await its result.
+    - shutdown(wait=True): Stop the worker threads.
+    """
+
+    def __init__(self, max_workers: int, queue_depth: int, thread_name_prefix: str = '') -> None:
+        if max_workers <= 0 or queue_depth < 0:
+            raise ValueError('max_workers must be positive and queue_depth non-negative.')
+
+        self.max_workers = max_workers
+        self.queue_depth = queue_depth
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(max_workers + queue_depth)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Schedule fn(*args, **kwargs) on the pool.
+
+        Args:
+            fn (Callable): The callable to run on a worker thread.
+
+        Returns:
+            Future: The future for the scheduled call.
+
+        Raises:
+            ExecutorSaturated: If every worker is busy and the queue is full.
+        """
+        # The slot is held until the task finishes, so it is released by the done callback.
+        if not self._slots.acquire(blocking=False):  # pylint: disable=consider-using-with
+            raise ExecutorSaturated(
+                f'{self.max_workers} workers busy and {self.queue_depth} tasks queued.')
+
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run fn on the pool and block the calling thread until it finishes.
+
+        Returns:
+            Any: The return value of fn.
+        """
+        return self.submit(fn, *args, **kwargs).result(timeout)
+
+    async def arun(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn on the pool without blocking the event loop.
+
+        Returns:
+            Any: The return value of fn.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting work and shut the worker threads down.
+        """
+        self._executor.shutdown(wait=wait)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of tasks currently running or queued.
+        """
+        return self._in_flight
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
@@ -0,0 +1,123 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class LRUCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe, bounded in-process cache with least-recently-used eviction.
+
+    Entries can optionally expire after a fixed time-to-live. The cache keeps hit, miss
+    and eviction counters so callers can size it from real traffic.
+
+    Methods:
+    - get(key, default=None): Return the cached value for key, or default.
+    - set(key, value): Store a value, evicting the least recently used entry when full.
+    - delete(key): Remove a single entry if present.
+    - clear(): Remove every entry and reset the counters.
+    - stats() -> Dict[str, Any]: Return the current counters.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        if maxsize <= 0:
+            raise ValueError('maxsize must be a positive integer.')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): The value returned when the key is missing or expired.
+
+        Returns:
+            Any: The cached value, or default.
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value under key, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+        """
+        expires_at = self._timer() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = (value, expires_at)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove key from the cache if present.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, evictions, current size, capacity and hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
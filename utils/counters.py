@@ -0,0 +1,187 @@
+import math
+import time
+import threading
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from django.core.cache import caches
+
+
+class CounterBackend:
+    """
+    Storage interface for write-behind counters.
+
+    Increments are coalesced per key into a pending delta until a flusher drains them and
+    writes them to the database. Keys are opaque strings chosen by the caller.
+
+    Methods:
+    - add(key, amount): Add amount to the pending delta of key.
+    - pending(keys) -> Dict[str, int]: Return the pending deltas of keys that have one.
+    - drain() -> Dict[str, int]: Remove and return the deltas that are ready to be flushed.
+    - restore(deltas): Put back deltas that could not be written.
+    - size() -> int: Return roughly how many keys are pending.
+    - clear(): Forget every pending delta.
+    """
+
+    def add(self, key: str, amount: int = 1) -> None:
+        raise NotImplementedError('.add() must be overridden')
+
+    def pending(self, keys: Iterable[str]) -> Dict[str, int]:
+        raise NotImplementedError('.pending() must be overridden')
+
+    def drain(self) -> Dict[str, int]:
+        raise NotImplementedError('.drain() must be overridden')
+
+    def restore(self, deltas: Dict[str, int]) -> None:
+        for key, amount in deltas.items():
+            self.add(key, amount)
+
+    def size(self) -> int:
+        raise NotImplementedError('.size() must be overridden')
+
+    def clear(self) -> None:
+        raise NotImplementedError('.clear() must be overridden')
+
+
+class InMemoryCounterBackend(CounterBackend):
+    """
+    Pending deltas kept in a dict in process memory.
+
+    An increment is one dict update under a lock and draining swaps the dict out, so
+    writers never wait on the database. Each worker process flushes its own deltas; what
+    is pending when a process is killed is lost, which the flush interval bounds.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._deltas[key] = self._deltas.get(key, 0) + amount
+
+    def pending(self, keys: Iterable[str]) -> Dict[str, int]:
+        with self._lock:
+            return {key: self._deltas[key] for key in keys if key in self._deltas}
+
+    def drain(self) -> Dict[str, int]:
+        with self._lock:
+            deltas, self._deltas = self._deltas, {}
+        return {key: amount for key, amount in deltas.items() if amount}
+
+    def restore(self, deltas: Dict[str, int]) -> None:
+        with self._lock:
+            for key, amount in deltas.items():
+                self._deltas[key] = self._deltas.get(key, 0) + amount
+
+    def size(self) -> int:
+        return len(self._deltas)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._deltas.clear()
+
+
+class CacheCounterBackend(CounterBackend):
+    """
+    Pending deltas kept in a Django cache, shared by every worker using it.
+
+    Time is cut into epochs of period seconds. An increment adds to the key's delta of the
+    current epoch, and the first increment of a key in an epoch also appends the key to
+    the epoch's index. Any worker may drain an epoch once it is over; claiming it with
+    add() makes sure only one does. This needs only atomic add/incr, which Redis and
+    Memcached provide. The local-memory cache stands in for the shared store in tests.
+
+    Entries expire after retention epochs, so deltas that no worker drained by then are
+    lost rather than kept forever.
+    """
+
+    def __init__(self, alias: str = 'default', prefix: str = 'counters', period: float = 5.0,
+                 retention: int = 60, timer: Callable[[], float] = time.time) -> None:
+        self._cache = caches[alias]
+        self._prefix = prefix
+        self._period = period
+        self._retention = retention
+        self._timeout = math.ceil(period * retention)
+        self._timer = timer
+
+    def add(self, key: str, amount: int = 1) -> None:
+        epoch = self._epoch()
+        delta_key = self._key(epoch, 'delta', key)
+
+        if self._cache.add(delta_key, amount, timeout=self._timeout):
+            count_key = self._key(epoch, 'count')
+            self._cache.add(count_key, 0, timeout=self._timeout)
+            slot = self._cache.incr(count_key)
+            self._cache.set(self._key(epoch, 'slot', slot), key, timeout=self._timeout)
+            return
+
+        try:
+            self._cache.incr(delta_key, amount)
+        except ValueError:
+            # The delta expired between add() and incr().
+            self.add(key, amount)
+
+    def pending(self, keys: Iterable[str]) -> Dict[str, int]:
+        keys = list(keys)
+        totals: Dict[str, int] = {}
+
+        for epoch in self._undrained_epochs(self._epoch()):
+            found = self._cache.get_many([self._key(epoch, 'delta', key) for key in keys])
+            for key in keys:
+                amount = found.get(self._key(epoch, 'delta', key))
+                if amount:
+                    totals[key] = totals.get(key, 0) + amount
+        return totals
+
+    def drain(self) -> Dict[str, int]:
+        # The previous epoch may still receive increments that computed their epoch just
+        # before it ended, so only epochs that ended a full period ago are drained.
+        current = self._epoch()
+        deltas: Dict[str, int] = {}
+
+        for epoch in self._undrained_epochs(current - 2):
+            if not self._cache.add(self._key(epoch, 'claim'), 1, timeout=self._timeout):
+                continue
+
+            slot_keys, keys, delta_keys = self._epoch_keys(epoch)
+            found = self._cache.get_many(delta_keys)
+
+            for key, delta_key in zip(keys, delta_keys):
+                if found.get(delta_key):
+                    deltas[key] = deltas.get(key, 0) + found[delta_key]
+
+            self._cache.delete_many(slot_keys + delta_keys + [self._key(epoch, 'count')])
+            if epoch > self._cache.get(self._key('drained'), -1):
+                self._cache.set(self._key('drained'), epoch, timeout=self._timeout)
+
+        return deltas
+
+    def size(self) -> int:
+        return self._cache.get(self._key(self._epoch(), 'count'), 0)
+
+    def clear(self) -> None:
+        # The alias may hold other data, so only this backend's keys are deleted.
+        current = self._epoch()
+        stale = [self._key('drained')]
+        for epoch in range(current - self._retention + 1, current + 1):
+            slot_keys, _, delta_keys = self._epoch_keys(epoch)
+            stale += slot_keys + delta_keys + [self._key(epoch, 'count'),
+                                               self._key(epoch, 'claim')]
+        self._cache.delete_many(stale)
+
+    def _epoch(self) -> int:
+        return int(self._timer() // self._period)
+
+    def _epoch_keys(self, epoch: int) -> Tuple[List[str], List[str], List[str]]:
+        # The slot keys of the epoch's index, the keys they list and their delta keys.
+        count = self._cache.get(self._key(epoch, 'count'), 0)
+        slot_keys = [self._key(epoch, 'slot', slot) for slot in range(1, count + 1)]
+        keys = list(self._cache.get_many(slot_keys).values())
+        return slot_keys, keys, [self._key(epoch, 'delta', key) for key in keys]
+
+    def _undrained_epochs(self, last: int) -> List[int]:
+        first = max(self._cache.get(self._key('drained'), -1) + 1, last - self._retention + 1)
+        return list(range(first, last + 1))
+
+    def _key(self, *parts) -> str:
+        return ':'.join(str(part) for part in (self._prefix,) + parts)
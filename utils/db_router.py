@@ -0,0 +1,280 @@
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import HttpRequest, HttpResponse
+
+from utils.lazy import LazySingleton, maintain
+from utils.metrics import registry
+
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+# The cookie holding the Unix time until which a client reads from the primary.
+STICKY_COOKIE = 'db_primary_until'
+
+
+class RequestRouting:  # pylint: disable=too-few-public-methods
+    """
+    The routing state of one request: whether its reads may go to a replica, and whether
+    it has written.
+    """
+
+    __slots__ = ('replica', 'wrote')
+
+    def __init__(self, replica: bool) -> None:
+        self.replica = replica
+        self.wrote = False
+
+
+# The routing state of the current request. Code outside a request, such as management
+# commands, workers and background threads, has none and always uses the primary.
+_routing: ContextVar[Optional[RequestRouting]] = ContextVar('db_routing', default=None)
+
+# Seconds of replay a replica is behind the primary; 0 when it has replayed everything it
+# received, since pg_last_xact_replay_timestamp() does not advance while the primary is idle.
+POSTGRES_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+        THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+class ReplicaPool:
+    """
+    Health and replication lag of the DATABASE_REPLICAS.
+
+    Every DATABASE_REPLICA_CHECK_INTERVAL seconds, the first thread asking for a replica
+    measures each one's replication lag with one query; the others keep using the last
+    result meanwhile. Replicas that fail the check, or lag more than
+    DATABASE_REPLICA_MAX_LAG seconds, are ejected until a later check finds them fit again.
+
+    Methods:
+    - choose() -> Optional[str]: A healthy replica alias, or None to use the primary.
+    - check(): Measure every replica now.
+    - stats() -> Dict[str, Any]: The health and lag of each replica, for the metrics.
+    """
+
+    def __init__(self, aliases: List[str]) -> None:
+        self.aliases = aliases
+        self.healthy: List[str] = []
+        self.lags: Dict[str, Optional[float]] = dict.fromkeys(aliases)
+        self.checked_at = -float('inf')
+        self._lock = threading.Lock()
+
+    def choose(self) -> Optional[str]:
+        """
+        Return a random healthy replica.
+
+        Returns:
+            Optional[str]: The alias of the replica, or None if none is healthy.
+        """
+        if not self.aliases:
+            return None
+        if self.checked_at + settings.DATABASE_REPLICA_CHECK_INTERVAL <= time.monotonic():
+            maintain(self._lock, lambda: True, self.check)
+        healthy = self.healthy
+        return random.choice(healthy) if healthy else None
+
+    def check(self) -> None:
+        """
+        Measure the lag of every replica and eject the unreachable and lagging ones.
+        """
+        healthy = []
+        for alias in self.aliases:
+            try:
+                lag = _replication_lag(alias)
+            except DatabaseError:
+                logger.warning('Replica %s failed its health check; ejecting it.', alias,
+                               exc_info=True)
+                connections[alias].close()
+                lag = None
+            self.lags[alias] = lag
+            if lag is not None and lag <= settings.DATABASE_REPLICA_MAX_LAG:
+                healthy.append(alias)
+            elif lag is not None:
+                logger.warning('Replica %s lags %.1f s behind the primary; ejecting it.',
+                               alias, lag)
+        self.healthy = healthy
+        self.checked_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the health and lag of each replica, for the metrics.
+
+        Returns:
+            Dict[str, Any]: The healthy and configured counts, and per alias whether it is
+            healthy and its last measured lag in seconds.
+        """
+        values: Dict[str, Any] = {'healthy': len(self.healthy), 'configured': len(self.aliases)}
+        for alias, lag in self.lags.items():
+            values[f'{alias}_healthy'] = int(alias in self.healthy)
+            if lag is not None:
+                values[f'{alias}_lag_seconds'] = lag
+        return values
+
+
+def _replication_lag(alias: str) -> float:
+    connection = connections[alias]
+    with connection.cursor() as cursor:
+        cursor.execute(POSTGRES_LAG_SQL if connection.vendor == 'postgresql' else 'SELECT 0')
+        return float(cursor.fetchone()[0])
+
+
+_replica_pool = LazySingleton(lambda: ReplicaPool(list(settings.DATABASE_REPLICAS)),
+                              'DATABASE_REPLICA')
+
+
+def get_replica_pool() -> ReplicaPool:
+    """
+    Return the process-wide pool of the DATABASE_REPLICAS.
+
+    Returns:
+        ReplicaPool: The shared instance.
+    """
+    return _replica_pool.get()
+
+
+registry.register_collector('db_replicas', lambda: get_replica_pool().stats(),
+                            prefix='db_replicas')
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """
+    Send the reads of the current request to the primary within the block.
+    """
+    routing = _routing.get()
+    if routing is None or not routing.replica:
+        yield
+        return
+    routing.replica = False
+    try:
+        yield
+    finally:
+        routing.replica = not routing.wrote
+
+
+class PrimaryReplicaRouter:
+    """
+    Database router sending the reads of safe requests to the replicas.
+
+    Reads go to a healthy replica (ReplicaPool) only while ReplicaRoutingMiddleware has
+    marked the request as replica-safe, and outside transactions on the primary. Everything
+    else, including all writes and every query made outside a request, goes to the
+    primary. Once a request writes, its remaining reads go to the primary as well, so it
+    reads its own writes. Reads filling a cache shared with other requests must use the
+    primary (read_from_primary(), or QuerySet.using(DEFAULT_DB_ALIAS)): a lagging
+    replica's row would be served from the cache after the writer's sticky window.
+
+    Methods:
+    - db_for_read(model, **hints) -> str: A replica alias, or the primary's.
+    - db_for_write(model, **hints) -> None: The primary, as Django's default.
+    - allow_relation(obj1, obj2, **hints) -> bool: Relate rows of any alias.
+    - allow_migrate(db, app_label, **hints) -> Optional[bool]: Never migrate replicas.
+    """
+
+    def db_for_read(self, _model, **_hints) -> str:
+        """
+        Return the alias to read from: a healthy replica when the request allows it.
+
+        Returns:
+            str: A replica alias, or the primary's.
+        """
+        routing = _routing.get()
+        if (routing is None or not routing.replica
+                or connections[DEFAULT_DB_ALIAS].in_atomic_block):
+            # Explicitly, so rows related to ones read from a replica come from the primary.
+            return DEFAULT_DB_ALIAS
+        return get_replica_pool().choose() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, _model, **_hints) -> None:
+        """
+        Record that the current request writes, so its remaining reads use the primary.
+        Returning None leaves the write to the primary, Django's default.
+        """
+        routing = _routing.get()
+        if routing is not None:
+            routing.replica = False
+            routing.wrote = True
+
+    def allow_relation(self, _obj1, _obj2, **_hints) -> bool:
+        """
+        Allow relations between rows of any alias, as replicas hold the primary's rows.
+        """
+        return True
+
+    def allow_migrate(self, db: str, _app_label: str, **_hints) -> Optional[bool]:
+        """
+        Never migrate the replicas, which replay the primary's schema; no opinion otherwise.
+        """
+        return False if db in settings.DATABASE_REPLICAS else None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Marks which requests may read from the replicas, with read-your-writes stickiness.
+
+    GET, HEAD and OPTIONS requests read from the replicas. A request that writes, such as
+    a profile update or a registration, sets a cookie making the client's reads go to the
+    primary for the next DATABASE_REPLICA_STICKY_SECONDS, which should exceed
+    DATABASE_REPLICA_MAX_LAG: the client sees its own change even though the replicas
+    have not replayed it yet.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        routing = RequestRouting(self._replica_safe(request))
+        token = _routing.set(routing)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self._stick(response, routing)
+
+    async def __acall__(self, request: HttpRequest):
+        routing = RequestRouting(self._replica_safe(request))
+        token = _routing.set(routing)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self._stick(response, routing)
+
+    @staticmethod
+    def _replica_safe(request: HttpRequest) -> bool:
+        if not settings.DATABASE_REPLICAS or request.method not in SAFE_METHODS:
+            return False
+        try:
+            sticky_until = float(request.COOKIES.get(STICKY_COOKIE, 0))
+        except ValueError:
+            sticky_until = 0
+        return sticky_until <= time.time()
+
+    @staticmethod
+    def _stick(response: HttpResponse, routing: RequestRouting) -> HttpResponse:
+        if settings.DATABASE_REPLICAS and routing.wrote and response.status_code < 400:
+            window = settings.DATABASE_REPLICA_STICKY_SECONDS
+            response.set_cookie(STICKY_COOKIE, f'{time.time() + window:.3f}', max_age=window,
+                                httponly=True, samesite='Lax')
+        return response
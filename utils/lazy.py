@@ -0,0 +1,102 @@
+import threading
+from typing import Callable, Generic, Optional, Tuple, TypeVar, Union
+
+from django.core.signals import setting_changed
+
+
+T = TypeVar('T')
+
+
+class LazySingleton(Generic[T]):
+    """
+    Process-wide instance created on first use and discarded when its settings change.
+
+    The instance is built once under a lock, so concurrent first callers wait for it rather
+    than building their own. When a setting starting with setting_prefix is changed (by
+    override_settings in tests) the instance is dropped, after on_reset has been called on
+    it, and the next call builds a new one from the new settings. When is_stale says the
+    instance has expired, one caller builds its replacement while the others keep using it.
+
+    Methods:
+    - get() -> T: Return the instance, creating it if needed.
+    - peek() -> Optional[T]: Return the instance if it has been created.
+    - reset(): Discard the instance.
+    """
+
+    def __init__(self, factory: Callable[[], T], setting_prefix: Union[str, Tuple[str, ...]],
+                 on_reset: Optional[Callable[[T], None]] = None,
+                 is_stale: Optional[Callable[[T], bool]] = None) -> None:
+        self.factory = factory
+        self.setting_prefix = setting_prefix
+        self.on_reset = on_reset
+        self.is_stale = is_stale
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+        setting_changed.connect(self._setting_changed)
+
+    def get(self) -> T:
+        """
+        Return the instance, creating it with the factory on first use or once stale.
+
+        Returns:
+            T: The shared instance.
+        """
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self.factory()
+                instance = self._instance
+        elif self.is_stale is not None and self.is_stale(instance):
+            if self._lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+                try:
+                    instance = self._instance = self.factory()
+                finally:
+                    self._lock.release()
+        return instance
+
+    def peek(self) -> Optional[T]:
+        """
+        Return the instance if it has been created, without creating it.
+
+        Returns:
+            Optional[T]: The shared instance, or None.
+        """
+        return self._instance
+
+    def reset(self) -> None:
+        """
+        Discard the instance, so the next get() creates a new one.
+        """
+        with self._lock:
+            instance, self._instance = self._instance, None
+        if instance is not None and self.on_reset is not None:
+            self.on_reset(instance)
+
+    def _setting_changed(self, setting: str, **kwargs) -> None:
+        if setting.startswith(self.setting_prefix):
+            self.reset()
+
+
+def maintain(lock: threading.Lock, is_built: Callable[[], bool],
+             task: Callable[[], None]) -> None:
+    """
+    Run a task building or refreshing state shared by every thread of the process.
+
+    The first build blocks every caller until it is done. Later runs happen in the thread
+    that got the lock, while the others keep reading the current state instead of waiting.
+
+    Args:
+        lock (threading.Lock): The lock serializing the task.
+        is_built (Callable[[], bool]): Whether the state has been built once.
+        task (Callable[[], None]): The build or refresh.
+    """
+    if not is_built():
+        with lock:
+            if not is_built():
+                task()
+    elif lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+        try:
+            task()
+        finally:
+            lock.release()
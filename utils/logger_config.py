@@ -1,26 +1,171 @@
+import atexit
+import json
 import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Sequence, Tuple
 
-LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+# Attributes every LogRecord has; anything else was passed through `extra=`.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {
+    'message', 'asctime', 'suppressed',
+}
 
 
-def configure_logger():
+class JSONFormatter(logging.Formatter):
     """
-    Configures a logger with a specific level and stream handler.
+    Formats log records as single-line JSON objects.
 
-    Returns:
-        logging.Logger: The configured logger object.
+    Every line carries the timestamp, level, logger name, rendered message and call site.
+    Values passed through `extra=` are added as top-level keys, and tracebacks are kept in
+    their own field so log shippers do not split them into separate events.
+
+    Methods:
+    - format(record: LogRecord) -> str: Render the record as JSON.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno,
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+
+        if getattr(record, 'suppressed', 0):
+            payload['suppressed'] = record.suppressed
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload['exception'] = record.exc_text
+        if record.stack_info:
+            payload['stack'] = self.formatStack(record.stack_info)
+
+        return json.dumps(payload, default=str)
 
-    Example:
-        To use this logger in your application, you can call this function as follows:
 
-            from utils import logger_config
+class RateLimitFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """
+    Caps how often the same message template is emitted.
+
+    Records are grouped by logger name, unformatted message and `status_code` (set by
+    django.request, which logs every response status with the same template), so every
+    `FAILED_LOGIN_ATTEMPT` line shares a single token bucket whatever the username is,
+    while a flood of 404s does not use up the bucket of 500s. Each bucket allows `burst`
+    records at once and refills at `rate` records per second. Records dropped in the
+    meantime are counted, and the count is attached to the next record that gets through
+    as `suppressed`. Records above `max_level` and records carrying a traceback are never
+    dropped.
 
-            # Configure logger with custom level
-            logger = logger_config.configure_logger()
-            logger.error("An example error message.")
+    Methods:
+    - filter(record: LogRecord) -> bool: Whether the record should be emitted.
     """
 
-    logging.basicConfig(level=logging.DEBUG, format=LOG_FORMAT)
-    logger = logging.getLogger(__name__)
+    def __init__(self, rate: float = 1.0, burst: int = 10, max_level: str = 'WARNING',
+                 timer: Callable[[], float] = time.monotonic):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.max_level = (logging.getLevelName(max_level) if isinstance(max_level, str)
+                          else max_level)
+        self._timer = timer
+        self._lock = threading.Lock()
+        # key -> [tokens, last refill, suppressed since last emit]
+        self._buckets: Dict[Tuple[str, Any, Any], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or record.exc_info:
+            return True
+
+        key = (record.name, record.msg, getattr(record, 'status_code', None))
+        now = self._timer()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+
+            bucket[0] = tokens - 1
+            record.suppressed, bucket[2] = bucket[2], 0
+            return True
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    Hands records to a background thread that writes them to the real handlers.
+
+    Logging calls on request threads only put the record on a bounded in-memory queue.
+    When the queue is full the record is dropped and counted rather than blocking the
+    caller. The listener is flushed and stopped when the interpreter exits.
+
+    Intended to be built by `logging.config.dictConfig`, referencing the target handlers
+    with `cfg://handlers.<name>`. dictConfig creates handlers in name order, so the
+    targets must sort before this handler's own name.
+
+    Methods:
+    - enqueue(record: LogRecord) -> None: Queue a record without blocking.
+    - prepare(record: LogRecord) -> LogRecord: Make a record safe to pass to another thread.
+    - stop() -> None: Flush the queue and stop the listener thread.
+    """
+
+    def __init__(self, handlers: Sequence[logging.Handler], queue_size: int = 10000,
+                 respect_handler_level: bool = True):
+        # dictConfig resolves cfg:// references on item access, not on iteration.
+        handlers = [handlers[i] for i in range(len(handlers))]
+        for handler in handlers:
+            if not isinstance(handler, logging.Handler):
+                raise ValueError(f'Expected a configured handler, got {handler!r}.')
+
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.dropped = 0
+        self.listener = QueueListener(self.queue, *handlers,
+                                      respect_handler_level=respect_handler_level)
+        self.listener.start()
+        self._listening = True
+        atexit.register(self.stop)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the stock QueueHandler, keep the traceback out of the message so the
+        # target handler's formatter can render it on its own.
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def stop(self) -> None:
+        # QueueListener.stop is not idempotent.
+        if self._listening:
+            self._listening = False
+            self.listener.stop()
 
-    return logger
+    def close(self) -> None:
+        self.stop()
+        super().close()
@@ -0,0 +1,320 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+
+# Upper bounds in seconds, like Prometheus client defaults.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNRESOLVED_VIEW = '<unresolved>'
+
+
+class _EndpointStats:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    Aggregated measurements of one view.
+    """
+
+    __slots__ = ('buckets', 'latency_sum', 'count', 'statuses', 'queries', 'query_time',
+                 'request_bytes', 'response_bytes')
+
+    def __init__(self, bucket_count: int) -> None:
+        # One slot per bucket plus the +Inf overflow; counts are not cumulative.
+        self.buckets = [0] * (bucket_count + 1)
+        self.latency_sum = 0.0
+        self.count = 0
+        self.statuses: Dict[Tuple[str, int], int] = {}
+        self.queries = 0
+        self.query_time = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class MetricsRegistry:
+    """
+    Thread-safe, in-process aggregation of per-view request metrics.
+
+    Each request costs a bisect into the latency buckets and a handful of integer
+    additions under one lock. Nothing is exported until the registry is scraped.
+
+    Methods:
+    - observe(view, method, status, latency, queries, query_time, request_bytes,
+      response_bytes): Record one request.
+    - register_collector(name, collect, prefix): Add a callable whose stats are exported as gauges.
+    - render() -> str: Export everything in the Prometheus text format.
+    - reset(): Forget every observation.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._collectors: Dict[str, Tuple[str, Callable[[], Dict[str, Any]]]] = {}
+
+    def observe(self, view: str, method: str, status: int, latency: float, queries: int = 0,
+                query_time: float = 0.0, request_bytes: int = 0, response_bytes: int = 0) -> None:
+        """
+        Record one request.
+
+        Args:
+            view (str): The resolved view name.
+            method (str): The HTTP method.
+            status (int): The response status code.
+            latency (float): Seconds spent handling the request.
+            queries (int): Number of database queries executed.
+            query_time (float): Seconds spent in those queries.
+            request_bytes (int): Size of the request body.
+            response_bytes (int): Size of the response body.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        bucket = bisect_left(self.buckets, latency)
+
+        with self._lock:
+            stats = self._endpoints.get(view)
+            if stats is None:
+                stats = self._endpoints[view] = _EndpointStats(len(self.buckets))
+
+            stats.buckets[bucket] += 1
+            stats.latency_sum += latency
+            stats.count += 1
+            key = (method, status)
+            stats.statuses[key] = stats.statuses.get(key, 0) + 1
+            stats.queries += queries
+            stats.query_time += query_time
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def register_collector(self, name: str, collect: Callable[[], Dict[str, Any]],
+                           prefix: str = 'cache') -> None:
+        """
+        Export the numeric values returned by collect as gauges labelled with name.
+
+        Args:
+            name (str): The label identifying the source, e.g. a cache name.
+            collect (Callable[[], Dict[str, Any]]): Returns the current stats when scraped.
+            prefix (str): Prepended to each stat key to form the metric name.
+        """
+        with self._lock:
+            self._collectors[name] = (prefix, collect)
+
+    def reset(self) -> None:
+        """
+        Forget every recorded request. Registered collectors are kept.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def render(self) -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition document.
+        """
+        with self._lock:
+            snapshot = [(view, self._copy(stats))
+                        for view, stats in sorted(self._endpoints.items())]
+            collectors = sorted(self._collectors.items())
+
+        lines: List[str] = []
+        self._render_latency(lines, snapshot)
+
+        counters = (
+            ('http_requests_total', 'Requests handled, by view, method and status.', None),
+            ('db_queries_total', 'Database queries executed, by view.', 'queries'),
+            ('db_query_duration_seconds_total', 'Seconds spent in database queries, by view.',
+             'query_time'),
+            ('http_request_size_bytes_total', 'Request body bytes received, by view.',
+             'request_bytes'),
+            ('http_response_size_bytes_total', 'Response body bytes sent, by view.',
+             'response_bytes'),
+        )
+        for name, help_text, attr in counters:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for view, stats in snapshot:
+                if attr is None:
+                    for (method, status), count in sorted(stats.statuses.items()):
+                        labels = _labels(view=view, method=method, status=status)
+                        lines.append(f'{name}{labels} {count}')
+                else:
+                    lines.append(f'{name}{_labels(view=view)} {getattr(stats, attr)}')
+
+        self._render_collectors(lines, collectors)
+        return '\n'.join(lines) + '\n'
+
+    def _render_latency(self, lines: List[str], snapshot) -> None:
+        name = 'http_request_duration_seconds'
+        lines.append(f'# HELP {name} Request latency, by view.')
+        lines.append(f'# TYPE {name} histogram')
+
+        for view, stats in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), stats.buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{name}_bucket{_labels(view=view, le=le)} {cumulative}')
+            lines.append(f'{name}_sum{_labels(view=view)} {stats.latency_sum}')
+            lines.append(f'{name}_count{_labels(view=view)} {stats.count}')
+
+    @staticmethod
+    def _render_collectors(lines: List[str], collectors) -> None:
+        gauges: Dict[str, List[str]] = {}
+
+        for source, (prefix, collect) in collectors:
+            for key, value in collect().items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    gauges.setdefault(f'{prefix}_{key}', []).append(
+                        f'{_labels(source=source)} {value}')
+
+        for key, samples in sorted(gauges.items()):
+            lines.append(f'# TYPE {key} gauge')
+            lines.extend(f'{key}{sample}' for sample in samples)
+
+    @staticmethod
+    def _copy(stats: _EndpointStats) -> _EndpointStats:
+        copy = _EndpointStats(len(stats.buckets) - 1)
+        for attr in _EndpointStats.__slots__:
+            value = getattr(stats, attr)
+            setattr(copy, attr, value.copy() if isinstance(value, (list, dict)) else value)
+        return copy
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+registry = MetricsRegistry()
+
+
+class _QueryTimer:  # pylint: disable=too-few-public-methods
+    """
+    Database execute wrapper counting queries and the time spent in them.
+    """
+
+    __slots__ = ('count', 'duration')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+class MetricsMiddleware:
+    """
+    Records latency, database usage and payload sizes of every request by view name.
+
+    Should be the first entry in MIDDLEWARE so the latency covers the whole stack.
+    Requests that do not resolve to a view are grouped under `<unresolved>`, which keeps
+    the number of label values bounded by the number of routes.
+
+    Overhead budget: under 50µs per request, measured by the bench_metrics command.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        timer = _QueryTimer()
+        wrapped = self._install(timer)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            latency = time.perf_counter() - start
+            self._uninstall(wrapped, timer)
+        self._record(request, response, latency, timer)
+        return response
+
+    async def __acall__(self, request: HttpRequest):
+        timer = _QueryTimer()
+        wrapped = self._install(timer)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            latency = time.perf_counter() - start
+            self._uninstall(wrapped, timer)
+        self._record(request, response, latency, timer)
+        return response
+
+    @staticmethod
+    def _install(timer: _QueryTimer) -> list:
+        # Same effect as nesting connection.execute_wrapper() for every alias, without the
+        # generator-based context managers on the hot path.
+        wrapped = [connections[alias] for alias in connections]
+        for connection in wrapped:
+            connection.execute_wrappers.append(timer)
+        return wrapped
+
+    @staticmethod
+    def _uninstall(wrapped: list, timer: _QueryTimer) -> None:
+        for connection in wrapped:
+            connection.execute_wrappers.remove(timer)
+
+    @staticmethod
+    def _record(request: HttpRequest, response: HttpResponse, latency: float,
+                timer: _QueryTimer) -> None:
+        match = request.resolver_match
+        view = (match.view_name or match.route) if match is not None else UNRESOLVED_VIEW
+
+        if response.has_header('Content-Length'):
+            response_bytes = int(response['Content-Length'])
+        elif not response.streaming:
+            response_bytes = len(response.content)
+        else:
+            response_bytes = 0
+
+        registry.observe(
+            view=view,
+            method=request.method,
+            status=response.status_code,
+            latency=latency,
+            queries=timer.count,
+            query_time=timer.duration,
+            request_bytes=_content_length(request.META.get('CONTENT_LENGTH')),
+            response_bytes=response_bytes,
+        )
+
+
+def _content_length(value: Any) -> int:
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Serve the collected metrics for scraping.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        HttpResponse: The metrics in the Prometheus text format.
+    """
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
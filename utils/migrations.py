@@ -0,0 +1,23 @@
+from django.contrib.postgres import operations
+
+
+class PostgresIndexConcurrently(operations.AddIndexConcurrently):
+    """
+    Build a PostgreSQL-specific index (GIN, opclasses) without locking out writes.
+
+    CREATE INDEX CONCURRENTLY lets inserts and updates continue while a large table is
+    indexed. Like CreateExtension, the operation does nothing on other databases, where
+    the index type does not exist; the migration state records the index either way.
+    Migrations using it must set atomic = False.
+    """
+
+    def describe(self) -> str:
+        return f'Concurrently create index {self.index.name} on model {self.model_name}'
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state) -> None:
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state) -> None:
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
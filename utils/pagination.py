@@ -0,0 +1,189 @@
+import base64
+import json
+import math
+from typing import Any, List, Optional, Sequence
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+INVALID_CURSOR_ERROR = "Invalid cursor."
+INVALID_LIMIT_ERROR = "Limit must be an integer between 1 and %s."
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the position of a page boundary as an opaque, URL-safe cursor.
+
+    Args:
+        values (Sequence[Any]): JSON-serializable key values of the last item served.
+
+    Returns:
+        str: The cursor.
+    """
+    raw = json.dumps(list(values), separators=(',', ':'), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def _finite_float(value: str) -> float:
+    # json accepts NaN, Infinity and numbers like 1e999 that overflow to infinity, which
+    # would raise OverflowError once converted to an integer key.
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(value)
+    return number
+
+
+def _reject_constant(value: str) -> None:
+    raise ValueError(value)
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor. Non-finite numbers are rejected.
+
+    Args:
+        cursor (str): The cursor from the request.
+        length (int): The expected number of key values.
+
+    Returns:
+        List[Any]: The key values.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)),
+                            parse_float=_finite_float, parse_constant=_reject_constant)
+    except ValueError as exc:
+        # Includes binascii.Error, UnicodeDecodeError and json.JSONDecodeError.
+        raise ValueError(cursor) from exc
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError(cursor)
+    return values
+
+
+def parse_page_size(request: Request, default: int, maximum: int) -> int:
+    """
+    Read the 'limit' query parameter.
+
+    Args:
+        request (Request): The request.
+        default (int): The page size when no limit is given.
+        maximum (int): The largest page size allowed.
+
+    Returns:
+        int: The page size.
+
+    Raises:
+        ValidationError: If the limit is not an integer between 1 and maximum.
+    """
+    limit = request.query_params.get('limit', str(default))
+    if not limit.isdigit() or not 0 < int(limit) <= maximum:
+        raise ValidationError({'error': INVALID_LIMIT_ERROR % maximum})
+    return int(limit)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks to the next page instead of counting rows to skip.
+
+    The queryset is ordered by `ordering`, whose last field must be unique (the primary
+    key); the others may be model fields or annotations. The cursor carries the ordering
+    values of the last item of the page, and the next page is the rows strictly after them:
+
+        created_at < c OR (created_at = c AND id < i)
+
+    plus a redundant `created_at <= c`, so the database can start an index range scan at
+    the cursor. With a composite index matching `ordering`, every page costs the same
+    however deep the client has scrolled, whereas OFFSET reads and discards every row
+    before the page. Rows inserted while a client scrolls never shift or repeat items.
+
+    Methods:
+    - paginate_queryset(queryset, request, view) -> List: Return the rows of the page.
+    - get_paginated_response(data) -> Response: Wrap the page with the next cursor.
+    """
+
+    ordering = ('-created_at', '-id')
+    # Default to PAGINATION_PAGE_SIZE and PAGINATION_MAX_PAGE_SIZE.
+    page_size: Optional[int] = None
+    max_page_size: Optional[int] = None
+
+    def __init__(self) -> None:
+        self.next_cursor: Optional[str] = None
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> List[Any]:
+        """
+        Return the rows of the page following the request's cursor.
+
+        Args:
+            queryset (QuerySet): The unordered rows to paginate.
+            request (Request): The request, with optional 'cursor' and 'limit' parameters.
+            view: The calling view.
+
+        Returns:
+            List[Any]: Up to 'limit' rows.
+
+        Raises:
+            ValidationError: If the cursor or the limit is invalid.
+        """
+        page_size = parse_page_size(request, self.page_size or settings.PAGINATION_PAGE_SIZE,
+                                    self.max_page_size or settings.PAGINATION_MAX_PAGE_SIZE)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get('cursor')
+        if cursor is not None:
+            queryset = queryset.filter(self._after(queryset, cursor))
+
+        rows = list(queryset[:page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_cursor = encode_cursor(self._key(rows[-1]))
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({'results': data, 'next_cursor': self.next_cursor})
+
+    def to_html(self) -> str:
+        # The browsable API only asks for page controls when display_page_controls is set.
+        return ''
+
+    def _fields(self) -> List[tuple]:
+        return [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+
+    def _key(self, row: Any) -> List[Any]:
+        return [getattr(row, name) for name, _ in self._fields()]
+
+    @staticmethod
+    def _field(queryset: QuerySet, name: str):
+        # Orderings may use annotations, such as the rank of search results.
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return queryset.model._meta.get_field(name)
+
+    def _after(self, queryset: QuerySet, cursor: str) -> Q:
+        fields = self._fields()
+        try:
+            raw = decode_cursor(cursor, len(fields))
+            values = [self._field(queryset, name).to_python(value)
+                      for (name, _), value in zip(fields, raw)]
+        except (ValueError, TypeError, DjangoValidationError) as exc:
+            raise ValidationError({'error': INVALID_CURSOR_ERROR}) from exc
+        if None in values:
+            raise ValidationError({'error': INVALID_CURSOR_ERROR})
+
+        condition = Q()
+        for position, (name, descending) in enumerate(fields):
+            lookup = 'lt' if descending else 'gt'
+            ties = {field: value for (field, _), value in zip(fields[:position], values)}
+            condition |= Q(**ties, **{f'{name}__{lookup}': values[position]})
+
+        first, descending = fields[0]
+        return condition & Q(**{f'{first}__{"lte" if descending else "gte"}': values[0]})
@@ -0,0 +1,121 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+
+class PrefixIndex:
+    """
+    In-memory sorted index of (text, id) pairs answering prefix queries.
+
+    Entries are kept sorted by their casefolded text, so the matches of a prefix form one
+    contiguous run: a binary search finds its start and the results are read from there,
+    which costs O(log n + limit) whatever the number of entries. Adding an entry is a
+    binary search and a list insertion (a memmove, fast even at millions of entries).
+
+    Methods:
+    - add(item_id, text): Insert an entry, replacing the item's previous text.
+    - update(items): Insert many entries, re-sorting once when there are many.
+    - remove(item_id): Remove an item's entry.
+    - complete(prefix, limit) -> List[Tuple[int, str]]: The first entries starting with
+      the prefix, in order.
+    """
+
+    def __init__(self, items: Iterable[Tuple[int, str]] = ()) -> None:
+        self._lock = threading.Lock()
+        # Parallel lists: (casefolded text, id) sort keys and the original texts.
+        self._keys: List[Tuple[str, int]] = []
+        self._texts: List[str] = []
+        self._key_of: Dict[int, str] = {}
+        self.update(items)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, item_id: int, text: str) -> None:
+        """
+        Insert an entry, replacing the item's previous text.
+
+        Args:
+            item_id (int): The ID of the item.
+            text (str): The text to match prefixes against.
+        """
+        with self._lock:
+            self._discard(item_id)
+            self._insert(item_id, text)
+
+    def update(self, items: Iterable[Tuple[int, str]]) -> None:
+        """
+        Insert many entries, replacing the items' previous texts.
+
+        Args:
+            items (Iterable[Tuple[int, str]]): The (id, text) pairs.
+        """
+        items = list(dict(items).items())
+        with self._lock:
+            for item_id, _ in items:
+                self._discard(item_id)
+            if len(items) < len(self._keys) // 8:
+                for item_id, text in items:
+                    self._insert(item_id, text)
+                return
+
+            # Sorting everything once beats shifting the lists for every insertion.
+            entries = [(key, item_id, text) for (key, item_id), text
+                       in zip(self._keys, self._texts)]
+            entries += [(_fold(text), item_id, text) for item_id, text in items]
+            entries.sort()
+            self._keys = [(key, item_id) for key, item_id, _ in entries]
+            self._texts = [text for _, _, text in entries]
+            self._key_of = {item_id: key for key, item_id in self._keys}
+
+    def remove(self, item_id: int) -> None:
+        """
+        Remove an item's entry, if it has one.
+
+        Args:
+            item_id (int): The ID of the item.
+        """
+        with self._lock:
+            self._discard(item_id)
+
+    def complete(self, prefix: str, limit: int) -> List[Tuple[int, str]]:
+        """
+        Return the first entries whose text starts with prefix, ignoring case.
+
+        Args:
+            prefix (str): The prefix typed so far.
+            limit (int): The maximum number of entries to return.
+
+        Returns:
+            List[Tuple[int, str]]: The (id, text) pairs, ordered by text.
+        """
+        prefix = _fold(prefix)
+        results = []
+        with self._lock:
+            position = bisect_left(self._keys, (prefix,))
+            while (len(results) < limit and position < len(self._keys)
+                   and self._keys[position][0].startswith(prefix)):
+                results.append((self._keys[position][1], self._texts[position]))
+                position += 1
+        return results
+
+    def _insert(self, item_id: int, text: str) -> None:
+        key = (_fold(text), item_id)
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._texts.insert(position, text)
+        self._key_of[item_id] = key[0]
+
+    def _discard(self, item_id: int) -> None:
+        folded = self._key_of.pop(item_id, None)
+        if folded is None:
+            return
+        position = bisect_left(self._keys, (folded, item_id))
+        del self._keys[position]
+        del self._texts[position]
+
+
+def _fold(text: str) -> str:
+    folded = text.casefold()
+    # Share the string when folding changes nothing, which is the common case.
+    return text if folded == text else folded
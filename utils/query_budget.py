@@ -0,0 +1,44 @@
+from typing import Dict
+
+from django.test import override_settings
+
+from utils.query_inspector import QueryInspector, request_queries_inspected
+
+
+class QueryBudgetMixin:  # pylint: disable=too-few-public-methods
+    """
+    Test case mixin failing any request that runs more queries than its budget.
+
+    query_budgets maps view names, as given to path(), to the most queries one request to
+    the view may run. A key of the form 'METHOD view_name' sets the budget of one method
+    and takes precedence. Requests to views without a budget are not checked. Queries are
+    counted by QueryInspectorMiddleware, which the mixin enables for the test case, and a
+    failure lists the shapes the request repeated with their call sites, which usually
+    points at the N+1.
+
+    Example:
+        class UserProfileAPIViewTest(QueryBudgetMixin, APITestCase):
+            query_budgets = {'GET user_profile': 1, 'user_profile': 2}
+    """
+
+    query_budgets: Dict[str, int] = {}
+
+    @classmethod
+    def setUpClass(cls):  # pylint: disable=invalid-name
+        """
+        Enable the query inspector and start checking the requests of the test case.
+        """
+        super().setUpClass()
+        enabled = override_settings(QUERY_INSPECTOR_ENABLED=True)
+        enabled.enable()
+        cls.addClassCleanup(enabled.disable)
+        request_queries_inspected.connect(cls._check_query_budget)
+        cls.addClassCleanup(request_queries_inspected.disconnect, cls._check_query_budget)
+
+    @classmethod
+    def _check_query_budget(cls, view: str, method: str, inspector: QueryInspector,
+                            **kwargs) -> None:
+        budget = cls.query_budgets.get(f'{method} {view}', cls.query_budgets.get(view))
+        if budget is not None and inspector.total > budget:
+            raise cls.failureException(f'{method} {view} ran over its budget of {budget} '
+                                       f'queries: {inspector.describe()}')
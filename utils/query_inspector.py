@@ -0,0 +1,219 @@
+import logging
+import os
+import re
+import traceback
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.dispatch import Signal
+from django.http import HttpRequest
+
+from utils.metrics import UNRESOLVED_VIEW
+
+
+logger = logging.getLogger(__name__)
+
+# Sent by QueryInspectorMiddleware after each request it inspected, with view, method and
+# inspector (the request's QueryInspector).
+request_queries_inspected = Signal()
+
+# Literals and placeholders become '?', then lists of them collapse, so queries differing
+# only in their values, or in how many values they list, share a fingerprint.
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|%\(\w+\)s')
+_VALUE_LIST = re.compile(r'\(\?(?:\s*,\s*\?)*\)')
+_VALUE_ROWS = re.compile(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+')
+_SPACE = re.compile(r'\s+')
+# Savepoints only bracket the statements of an atomic block, and under TestCase every
+# outermost block, which runs none in production, becomes one. They are not counted, so
+# the counts and budgets seen in tests are those of production.
+_SAVEPOINT = re.compile(r'(?:RELEASE |ROLLBACK TO )?SAVEPOINT\b', re.IGNORECASE)
+
+_THIS_FILE = os.path.abspath(__file__)
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Return the shape of a query: its SQL with every value replaced.
+
+    Args:
+        sql (str): The SQL, with or without parameter placeholders.
+
+    Returns:
+        str: The normalized SQL.
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _VALUE_LIST.sub('(...)', sql)
+    sql = _VALUE_ROWS.sub('(...)', sql)
+    return _SPACE.sub(' ', sql).strip()
+
+
+def _call_site() -> Optional[str]:
+    # The innermost frame of the project's own code, skipping Django and other packages.
+    base_dir = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if (filename.startswith(base_dir) and filename != _THIS_FILE
+                and 'site-packages' not in filename):
+            return f'{os.path.relpath(filename, base_dir)}:{frame.lineno} in {frame.name}'
+    return None
+
+
+class RepeatedQuery(NamedTuple):
+    fingerprint: str
+    count: int
+    # Runs with the very same SQL and parameters as an earlier one.
+    duplicates: int
+    call_site: Optional[str]
+
+
+class _Shape:  # pylint: disable=too-few-public-methods
+    __slots__ = ('count', 'statements', 'call_site')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.statements: Counter = Counter()
+        self.call_site: Optional[str] = None
+
+
+class QueryInspector:
+    """
+    Database execute wrapper grouping the queries it sees by fingerprint.
+
+    The call site of a shape is captured when it runs a second time, so walking the stack
+    is only paid for queries that repeat. Savepoints are run but not counted.
+
+    Methods:
+    - install() / uninstall(): Wrap or unwrap every connection of the current thread.
+    - repeated(threshold) -> List[RepeatedQuery]: The shapes run at least threshold times.
+    - describe(threshold) -> str: A readable summary of the queries and repeated shapes.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.shapes: Dict[str, _Shape] = {}
+        self._wrapped: list = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if _SAVEPOINT.match(sql):
+            return execute(sql, params, many, context)
+        self.total += 1
+        key = fingerprint(sql)
+        shape = self.shapes.get(key)
+        if shape is None:
+            shape = self.shapes[key] = _Shape()
+        shape.count += 1
+        shape.statements[(sql, repr(params))] += 1
+        if shape.count == 2:
+            shape.call_site = _call_site()
+        return execute(sql, params, many, context)
+
+    def install(self) -> None:
+        self._wrapped = [connections[alias] for alias in connections]
+        for connection in self._wrapped:
+            connection.execute_wrappers.append(self)
+
+    def uninstall(self) -> None:
+        for connection in self._wrapped:
+            connection.execute_wrappers.remove(self)
+        self._wrapped = []
+
+    def repeated(self, threshold: int) -> List[RepeatedQuery]:
+        """
+        Return the shapes run at least threshold times, most frequent first.
+
+        Args:
+            threshold (int): The number of runs from which a shape counts as repeated.
+
+        Returns:
+            List[RepeatedQuery]: The repeated shapes.
+        """
+        repeated = [
+            RepeatedQuery(key, shape.count, shape.count - len(shape.statements),
+                          shape.call_site)
+            for key, shape in self.shapes.items() if shape.count >= threshold
+        ]
+        return sorted(repeated, key=lambda query: -query.count)
+
+    def describe(self, threshold: int = 2) -> str:
+        """
+        Summarize the inspected queries, for logs and test failures.
+
+        Args:
+            threshold (int): The number of runs from which a shape is listed.
+
+        Returns:
+            str: One line with the totals, then one per repeated shape.
+        """
+        lines = [f'{self.total} queries, {len(self.shapes)} distinct shapes']
+        for query in self.repeated(threshold):
+            lines.append(f'  {query.count}x ({query.duplicates} identical) at '
+                         f'{query.call_site}: {query.fingerprint}')
+        return '\n'.join(lines)
+
+
+class QueryInspectorMiddleware:
+    """
+    Flags the query shapes a request runs repeatedly, the mark of an N+1 pattern.
+
+    Enabled by QUERY_INSPECTOR_ENABLED, which defaults to DEBUG; otherwise it passes
+    requests through untouched. Each query is fingerprinted (fingerprint()), and every
+    shape run QUERY_INSPECTOR_REPEAT_THRESHOLD times or more in one request is logged as a
+    warning with the view name and the call site in the project's code. Tests get each
+    request's inspector through the request_queries_inspected signal, which
+    utils.query_budget.QueryBudgetMixin uses to enforce query budgets.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.QUERY_INSPECTOR_ENABLED:
+            return self.get_response(request)
+
+        inspector = QueryInspector()
+        inspector.install()
+        try:
+            response = self.get_response(request)
+        finally:
+            inspector.uninstall()
+        self._report(request, inspector)
+        return response
+
+    async def __acall__(self, request: HttpRequest):
+        if not settings.QUERY_INSPECTOR_ENABLED:
+            return await self.get_response(request)
+
+        inspector = QueryInspector()
+        inspector.install()
+        try:
+            response = await self.get_response(request)
+        finally:
+            inspector.uninstall()
+        self._report(request, inspector)
+        return response
+
+    @staticmethod
+    def _report(request: HttpRequest, inspector: QueryInspector) -> None:
+        match = request.resolver_match
+        view = (match.view_name or match.route) if match is not None else UNRESOLVED_VIEW
+
+        for query in inspector.repeated(settings.QUERY_INSPECTOR_REPEAT_THRESHOLD):
+            logger.warning('Repeated query in %s: %d runs (%d identical) of %s at %s', view,
+                           query.count, query.duplicates, query.fingerprint, query.call_site,
+                           extra={'view': view, 'method': request.method})
+        request_queries_inspected.send(sender=QueryInspectorMiddleware, view=view,
+                                       method=request.method, inspector=inspector)
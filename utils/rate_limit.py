@@ -0,0 +1,160 @@
+import math
+import hashlib
+import time
+import threading
+from collections import deque
+from typing import Callable, Dict, Deque, Tuple
+
+from django.core.cache import caches
+
+
+class RateLimitBackend:
+    """
+    Storage interface for sliding-window rate limits.
+
+    Methods:
+    - hit(key, window) -> int: Record an event and return the count in the window.
+    - count(key, window) -> int: Return the count in the window without recording.
+    - reset(key, window): Forget every event recorded for key.
+    - clear(): Forget every event for every key.
+    """
+
+    def hit(self, key: str, window: float) -> int:
+        raise NotImplementedError('.hit() must be overridden')
+
+    def count(self, key: str, window: float) -> int:
+        raise NotImplementedError('.count() must be overridden')
+
+    def reset(self, key: str, window: float) -> None:
+        raise NotImplementedError('.reset() must be overridden')
+
+    def clear(self) -> None:
+        raise NotImplementedError('.clear() must be overridden')
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Exact sliding-window log kept in process memory.
+
+    Each key keeps the timestamps of its events inside the window. Limits are per process,
+    which is fine for a single worker and for tests; use CacheRateLimitBackend when several
+    workers must share counts.
+    """
+
+    sweep_every = 1000
+
+    def __init__(self, timer: Callable[[], float] = time.monotonic) -> None:
+        self._timer = timer
+        self._events: Dict[str, Deque[float]] = {}
+        self._windows: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._hits_since_sweep = 0
+
+    def hit(self, key: str, window: float) -> int:
+        now = self._timer()
+        with self._lock:
+            events = self._events.setdefault(key, deque())
+            self._windows[key] = window
+            self._prune(events, now, window)
+            events.append(now)
+
+            self._hits_since_sweep += 1
+            if self._hits_since_sweep >= self.sweep_every:
+                self._sweep(now)
+
+            return len(events)
+
+    def count(self, key: str, window: float) -> int:
+        with self._lock:
+            events = self._events.get(key)
+            if not events:
+                return 0
+            self._prune(events, self._timer(), window)
+            return len(events)
+
+    def reset(self, key: str, window: float) -> None:
+        with self._lock:
+            self._events.pop(key, None)
+            self._windows.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._windows.clear()
+
+    @staticmethod
+    def _prune(events: Deque[float], now: float, window: float) -> None:
+        while events and events[0] <= now - window:
+            events.popleft()
+
+    def _sweep(self, now: float) -> None:
+        # Drop keys that have gone quiet so one-off IPs and usernames do not pile up.
+        self._hits_since_sweep = 0
+        for key in [k for k, events in self._events.items()
+                    if not events or events[-1] <= now - self._windows[k]]:
+            del self._events[key]
+            del self._windows[key]
+
+
+class CacheRateLimitBackend(RateLimitBackend):
+    """
+    Sliding-window counter stored in a Django cache, shared by every worker using it.
+
+    Each key keeps one counter per fixed bucket of window seconds. The sliding count is
+    the current bucket plus the previous bucket weighted by how much of it still overlaps
+    the window. This needs only atomic add/incr, which Redis and Memcached provide. The
+    local-memory cache stands in for the shared store in tests.
+    """
+
+    def __init__(self, alias: str = 'default', prefix: str = 'ratelimit',
+                 timer: Callable[[], float] = time.time) -> None:
+        self._cache = caches[alias]
+        self._prefix = prefix
+        self._timer = timer
+
+    def hit(self, key: str, window: float) -> int:
+        now = self._timer()
+        bucket_key, previous_key = self._bucket_keys(key, window, now)
+
+        self._cache.add(bucket_key, 0, timeout=math.ceil(2 * window))
+        try:
+            current = self._cache.incr(bucket_key)
+        except ValueError:
+            # The bucket expired between add() and incr().
+            self._cache.set(bucket_key, 1, timeout=math.ceil(2 * window))
+            current = 1
+
+        return self._weighted(window, now, current, self._cache.get(previous_key, 0))
+
+    def count(self, key: str, window: float) -> int:
+        now = self._timer()
+        bucket_key, previous_key = self._bucket_keys(key, window, now)
+        found = self._cache.get_many([bucket_key, previous_key])
+        return self._weighted(window, now, found.get(bucket_key, 0), found.get(previous_key, 0))
+
+    def reset(self, key: str, window: float) -> None:
+        self._cache.delete_many(self._bucket_keys(key, window, self._timer()))
+
+    def clear(self) -> None:
+        # The alias may hold other data and bucket keys cannot be listed, so move every
+        # key to a new generation instead; the old buckets expire on their own.
+        generation_key = f'{self._prefix}:generation'
+        if not self._cache.add(generation_key, 1, timeout=None):
+            try:
+                self._cache.incr(generation_key)
+            except ValueError:
+                # The generation was evicted between add() and incr().
+                self._cache.add(generation_key, 1, timeout=None)
+
+    def _bucket_keys(self, key: str, window: float, now: float) -> Tuple[str, str]:
+        # Keys embed user input, so hash them to stay within Memcached's key rules.
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        generation = self._cache.get(f'{self._prefix}:generation', 0)
+        bucket = int(now // window)
+        return (f'{self._prefix}:{generation}:{digest}:{bucket}',
+                f'{self._prefix}:{generation}:{digest}:{bucket - 1}')
+
+    @staticmethod
+    def _weighted(window: float, now: float, current: int, previous: int) -> int:
+        overlap = 1 - (now % window) / window
+        return current + math.floor(previous * overlap)
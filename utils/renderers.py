@@ -0,0 +1,42 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    DRF's JSONRenderer, rendering with orjson when it is installed.
+
+    The output is byte for byte that of JSONRenderer with DRF's default settings (compact,
+    UTF-8, \\u2028 and \\u2029 escaped): dates, times, lazy strings and the other types
+    orjson does not handle the same way are passed to DRF's encoder. Two differences
+    remain: floats needing an exponent are spelled 1e16 rather than 1e+16, and NaN and
+    infinities render as null instead of failing. Indented output, non-default
+    UNICODE_JSON or COMPACT_JSON settings, integers over 64 bits and a missing orjson all
+    fall back to JSONRenderer.
+    """
+
+    if orjson is not None:
+        options = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                   | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (orjson is None or self.ensure_ascii or not self.compact
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        try:
+            content = orjson.dumps(data, default=self.encoder_class().default,
+                                   option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # A strict JavaScript subset, like JSONRenderer.
+        if b'\xe2\x80' in content:
+            content = (content.replace('\u2028'.encode(), b'\\u2028')
+                       .replace('\u2029'.encode(), b'\\u2029'))
+        return content
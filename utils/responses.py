@@ -0,0 +1,45 @@
+from typing import Any, Iterable
+
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+
+class PrerenderedJSONResponse(Response):
+    """
+    DRF response that ships JSON bytes rendered ahead of time.
+
+    The original data is kept on the response so tests and other renderers (such as the
+    browsable API) still work; only the JSON renderer short-circuits to the cached bytes.
+    """
+
+    def __init__(self, data: Any, content: bytes, **kwargs) -> None:
+        super().__init__(data, **kwargs)
+        self.prerendered_content = content
+
+    @property
+    def rendered_content(self):
+        renderer = getattr(self, 'accepted_renderer', None)
+        accepted_media_type = getattr(self, 'accepted_media_type', '') or ''
+
+        if renderer is None or renderer.format != 'json' or 'indent' in accepted_media_type:
+            return super().rendered_content
+
+        self['Content-Type'] = self.content_type or renderer.media_type
+        return self.prerendered_content
+
+
+def etag_matches(if_none_match: str, etags: Iterable[str]) -> bool:
+    """
+    Evaluate an If-None-Match header against the current entity tags.
+
+    If-None-Match uses the weak comparison function, so W/ prefixes are ignored.
+
+    Args:
+        if_none_match (str): The raw If-None-Match header value.
+        etags (Iterable[str]): The entity tags of the current representation.
+
+    Returns:
+        bool: True if the client's copy is current.
+    """
+    requested = {tag.removeprefix('W/') for tag in parse_etags(if_none_match)}
+    return '*' in requested or any(tag.removeprefix('W/') in requested for tag in etags)
@@ -0,0 +1,100 @@
+from typing import Optional, Tuple
+
+from django.contrib.postgres.search import (SearchQuery, SearchRank, SearchVector,
+                                            TrigramSimilarity)
+from django.db.models import FloatField, Q, QuerySet
+from django.db.models.functions import Cast
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from utils.pagination import KeysetPagination
+
+
+# No stemming or stop words: usernames and captions mix languages and made-up words.
+SEARCH_CONFIG = 'simple'
+SEARCH_QUERY_MAX_LENGTH = 100
+
+INVALID_SEARCH_QUERY_ERROR = "The 'q' parameter must be between 1 and %s characters."
+
+
+def search_vector(*weighted_fields: Tuple[str, str]) -> SearchVector:
+    """
+    Build the full-text document of a model from its text fields.
+
+    Models index this expression with a GIN index, and queries must filter on the same
+    expression for PostgreSQL to use it.
+
+    Args:
+        *weighted_fields (Tuple[str, str]): (field name, weight 'A' to 'D') pairs.
+
+    Returns:
+        SearchVector: The concatenation of the weighted field vectors.
+    """
+    vectors = [SearchVector(name, weight=weight, config=SEARCH_CONFIG)
+               for name, weight in weighted_fields]
+    document = vectors[0]
+    for vector in vectors[1:]:
+        document = document + vector
+    return document
+
+
+def parse_search_query(request: Request) -> str:
+    """
+    Read the 'q' query parameter.
+
+    Args:
+        request (Request): The request.
+
+    Returns:
+        str: The stripped search text.
+
+    Raises:
+        ValidationError: If the text is empty or longer than SEARCH_QUERY_MAX_LENGTH.
+    """
+    text = request.query_params.get('q', '').strip()
+    if not 0 < len(text) <= SEARCH_QUERY_MAX_LENGTH:
+        raise ValidationError({'error': INVALID_SEARCH_QUERY_ERROR % SEARCH_QUERY_MAX_LENGTH})
+    return text
+
+
+def ranked_search(queryset: QuerySet, document: SearchVector, text: str,
+                  similar_field: Optional[str] = None) -> QuerySet:
+    """
+    Filter a queryset to the rows matching a search and annotate their relevance as 'rank'.
+
+    Rows match when their document matches the words of text (web search syntax: quoted
+    phrases, 'or', '-word'), which the GIN index on document answers. With similar_field,
+    rows whose field is trigram-similar to text match too, through a gin_trgm_ops index on
+    that field, so misspelled and partial names are found; the similarity adds to the rank.
+
+    Args:
+        queryset (QuerySet): The rows to search.
+        document (SearchVector): The indexed expression built by search_vector.
+        text (str): The search text.
+        similar_field (Optional[str]): A field compared by trigram similarity.
+
+    Returns:
+        QuerySet: The matching rows, with a 'rank' annotation.
+    """
+    query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+    rank = SearchRank(document, query)
+    matches = Q(document=query)
+    if similar_field is not None:
+        rank = rank + TrigramSimilarity(similar_field, text)
+        matches |= Q(**{f'{similar_field}__trigram_similar': text})
+
+    # Cast to double precision: a float4 rank does not survive the round trip through a
+    # cursor exactly, and the keyset comparison would then skip or repeat rows.
+    return (queryset.alias(document=document)
+            .annotate(rank=Cast(rank, FloatField())).filter(matches))
+
+
+class SearchPagination(KeysetPagination):
+    """
+    Keyset pagination of search results, most relevant first.
+
+    The rank is computed per query, so no index serves the ordering; the GIN indexes bound
+    the work to the matching rows, and the cursor keeps deep pages from repeating rows.
+    """
+
+    ordering = ('-rank', '-id')
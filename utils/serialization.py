@@ -0,0 +1,122 @@
+import re
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage, Storage
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+
+# Relative file names that FileSystemStorage.url() would neither quote nor normalize.
+_PLAIN_NAME = re.compile(r'[\w-]+(?:\.[\w-]+)*(?:/[\w-]+(?:\.[\w-]+)*)*', re.ASCII)
+
+# Fields whose representation of a database value is the value itself.
+PASSTHROUGH_FIELDS = (serializers.CharField, serializers.IntegerField,
+                      serializers.BooleanField, serializers.JSONField)
+
+
+class ValuesSerializer:
+    """
+    Read-only fast path of a ModelSerializer, building its output from .values() rows.
+
+    Reads through DRF instantiate a model per row, then walk the serializer's fields per
+    row, resolving each attribute and calling its to_representation. Here the readable
+    fields of serializer_class are compiled once into (name, column, converter) triples,
+    and each row is turned into a dict with one lookup per field, plus a call for the
+    fields listed in converters. Fields of the types in PASSTHROUGH_FIELDS need no
+    converter; any other readable field must have one, which gets the column value, and
+    None stays None as in DRF. The output equals serializer_class(instance).data, keys in
+    the same order.
+
+    Methods:
+    - columns -> Tuple[str, ...]: The columns to load with QuerySet.values().
+    - to_representation(row) -> Dict[str, Any]: The output for one row.
+    - serialize(queryset) -> List[Dict[str, Any]]: The output for every row of a queryset.
+    - serialize_rows(rows) -> List[Dict[str, Any]]: The output for rows loaded elsewhere.
+    """
+
+    # Set by subclasses.
+    serializer_class: Type[serializers.Serializer]
+    converters: Dict[str, Callable[[Any], Any]] = {}
+
+    @cached_property
+    def fields(self) -> List[Tuple[str, str, Optional[Callable[[Any], Any]]]]:
+        """
+        The readable fields of serializer_class, compiled on first use.
+
+        Returns:
+            List[Tuple[str, str, Optional[Callable]]]: (name, column, converter) triples, in
+            the serializer's field order; the converter is None for passthrough fields.
+        """
+        compiled = []
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            converter = self.converters.get(name)
+            if converter is None and not isinstance(field, PASSTHROUGH_FIELDS):
+                raise ImproperlyConfigured(
+                    f'{type(self).__name__} needs a converter for the {name} field '
+                    f'({type(field).__name__}).')
+            # Method fields read the whole instance; their converter gets a column of the
+            # same name instead.
+            source = name if field.source == '*' else field.source
+            compiled.append((name, source.replace('.', '__'), converter))
+        return compiled
+
+    @cached_property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(column for _, column, _ in self.fields))
+
+    def to_representation(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the output for one row.
+
+        Args:
+            row (Dict[str, Any]): A row of QuerySet.values(*columns).
+
+        Returns:
+            Dict[str, Any]: The serialized row.
+        """
+        output = {}
+        for name, column, converter in self.fields:
+            value = row[column]
+            output[name] = value if converter is None or value is None else converter(value)
+        return output
+
+    def serialize(self, queryset: QuerySet) -> List[Dict[str, Any]]:
+        """
+        Load the columns of every row of a queryset and serialize them.
+
+        Args:
+            queryset (QuerySet): The rows to serialize.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized rows, in the queryset's order.
+        """
+        return self.serialize_rows(queryset.values(*self.columns))
+
+    def serialize_rows(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        to_representation = self.to_representation
+        return [to_representation(row) for row in rows]
+
+
+def storage_url(storage: Storage, name: str) -> str:
+    """
+    Return storage.url(name), skipping its quoting and URL joining for plain names.
+
+    FileSystemStorage.url() quotes the name and joins it to the base URL with urljoin,
+    which dominates serializing rows with files. A name made of ASCII word characters,
+    hyphens and dots, in segments that are not '.' or '..', is left unchanged by both, so
+    its URL is the base URL followed by the name.
+
+    Args:
+        storage (Storage): The storage of the file field.
+        name (str): The name of the file in the storage.
+
+    Returns:
+        str: The URL of the file, as storage.url() returns it.
+    """
+    if isinstance(storage, FileSystemStorage) and _PLAIN_NAME.fullmatch(name):
+        return storage.base_url + name
+    return storage.url(name)
@@ -0,0 +1,263 @@
+import hashlib
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def hash_pair(key: str) -> Tuple[int, int]:
+    """
+    Return the two 64-bit hashes of a key used for double hashing, h1 + i * h2.
+
+    Args:
+        key (str): The key.
+
+    Returns:
+        Tuple[int, int]: h1 and h2; h2 is odd, so it visits every column of a
+        power-of-two width.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+# Sketches see the same hashtags and sounds over and over.
+_cached_hash_pair = lru_cache(maxsize=65536)(hash_pair)
+
+
+def sketch_columns(keys: Sequence[str], width: int, depth: int) -> np.ndarray:
+    """
+    Return the column of every key in every row of a count-min sketch.
+
+    Rows use double hashing, h1 + row * h2, so each key is hashed once whatever the depth.
+    Hashes are stable across processes, which lets sketches built by different workers be
+    merged.
+
+    Args:
+        keys (Sequence[str]): The keys.
+        width (int): The number of columns of the sketch.
+        depth (int): The number of rows of the sketch.
+
+    Returns:
+        np.ndarray: A depth x len(keys) array of column indices.
+    """
+    pairs = np.array([_cached_hash_pair(key) for key in keys], dtype=np.uint64).reshape(-1, 2)
+    rows = np.arange(depth, dtype=np.uint64)[:, None]
+    # uint64 arithmetic wraps around, which is what the hash needs.
+    return ((pairs[:, 0] + rows * pairs[:, 1]) % np.uint64(width)).astype(np.intp)
+
+
+class CountMinSketch:
+    """
+    Fixed-size frequency table that never under-counts.
+
+    Each key is counted in one column of every row; its estimate is the smallest of those
+    cells. With width w and depth d, an estimate exceeds the true count by more than
+    e/w of the total with probability at most e^-d, however many distinct keys there are.
+    Sketches of the same shape add up, cell by cell, to the sketch of both streams.
+
+    Methods:
+    - add(columns, counts): Count keys given their columns from sketch_columns.
+    - estimate(columns) -> np.ndarray: The estimated counts of keys.
+    """
+
+    def __init__(self, width: int, depth: int, table: Optional[np.ndarray] = None) -> None:
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64) if table is None else table
+
+    def add(self, columns: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Count keys. Counts must not be negative.
+
+        Args:
+            columns (np.ndarray): The keys' columns, from sketch_columns.
+            counts (np.ndarray): One count per key.
+        """
+        rows = np.arange(self.depth)[:, None]
+        np.add.at(self.table, (rows, columns), counts)
+
+    def estimate(self, columns: np.ndarray) -> np.ndarray:
+        """
+        Return the estimated counts of keys.
+
+        Args:
+            columns (np.ndarray): The keys' columns, from sketch_columns.
+
+        Returns:
+            np.ndarray: One estimate per key, never below its true count.
+        """
+        if columns.shape[1] == 0:
+            return np.zeros(0, dtype=np.int64)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+
+class WindowedTopK:  # pylint: disable=too-many-instance-attributes
+    """
+    The heaviest keys of a stream over a sliding time window, in bounded memory.
+
+    The window is cut into time buckets aligned on multiples of bucket_seconds since the
+    epoch, so every process buckets events the same way. Each bucket has its own
+    count-min sketch and `total` is the sum of the live ones: when a bucket leaves the
+    window its table is subtracted. Each bucket also keeps candidates for the top, at most
+    2 * capacity keys: a key whose estimate in the bucket is above the bucket's weakest
+    candidate enters, and when the bucket is full it is cut back to the capacity strongest.
+    The top is the union of the live buckets' candidates ranked by `total`, so a key that
+    was heavy in any live bucket is found even after heavier buckets expire. Keys are
+    assumed to be heavy-tailed, as hashtags and sounds are.
+
+    Methods:
+    - add(keys, counts, now): Count keys at time now.
+    - top(limit, now) -> List[Tuple[str, int]]: The heaviest keys and their estimates.
+    - merge(other): Add another instance's counts, as when combining workers' deltas.
+    - empty() -> bool: Whether nothing has been counted.
+    - to_arrays() -> Dict[str, np.ndarray]: The state, for numpy.savez.
+    - load_arrays(arrays): Replace the state with one saved by to_arrays.
+    """
+
+    def __init__(self, window_seconds: float, bucket_seconds: float, width: int, depth: int,
+                 capacity: int) -> None:
+        self.bucket_seconds = bucket_seconds
+        self.slots = math.ceil(window_seconds / bucket_seconds)
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.buckets: Dict[int, CountMinSketch] = {}
+        self.candidates: Dict[int, Dict[str, int]] = {}
+        self.total = CountMinSketch(width, depth)
+        self._floors: Dict[int, int] = {}
+        self._ranking: Optional[List[Tuple[str, int]]] = None
+
+    def add(self, keys: Sequence[str], counts: np.ndarray, now: float,
+            columns: Optional[np.ndarray] = None) -> None:
+        """
+        Count keys at time now.
+
+        Args:
+            keys (Sequence[str]): Distinct keys.
+            counts (np.ndarray): One non-negative count per key.
+            now (float): The Unix time of the events.
+            columns (Optional[np.ndarray]): The keys' columns, when already computed.
+        """
+        if columns is None:
+            columns = sketch_columns(keys, self.width, self.depth)
+        index = self._expire(now)
+        bucket = self.buckets.get(index)
+        if bucket is None:
+            bucket = self.buckets[index] = CountMinSketch(self.width, self.depth)
+            self.candidates[index] = {}
+        bucket.add(columns, counts)
+        self.total.add(columns, counts)
+        self._ranking = None
+
+        candidates, floor = self.candidates[index], self._floors.get(index, 0)
+        for key, estimate in zip(keys, bucket.estimate(columns).tolist()):
+            if key in candidates or estimate > floor:
+                candidates[key] = estimate
+        if len(candidates) > 2 * self.capacity:
+            self._prune(index)
+
+    def top(self, limit: int, now: float) -> List[Tuple[str, int]]:
+        """
+        Return the heaviest keys of the window ending at now.
+
+        Args:
+            limit (int): The number of keys.
+            now (float): The Unix time the window ends at.
+
+        Returns:
+            List[Tuple[str, int]]: (key, estimated count) pairs, heaviest first.
+        """
+        self._expire(now)
+        if self._ranking is None:
+            keys = list(dict.fromkeys(key for candidates in self.candidates.values()
+                                      for key in candidates))
+            self._ranking = _ranked(keys, self.total)
+        return self._ranking[:limit]
+
+    def merge(self, other: 'WindowedTopK') -> None:
+        """
+        Add the counts of an instance with the same shape.
+
+        Args:
+            other (WindowedTopK): The counts to add.
+        """
+        for index, bucket in other.buckets.items():
+            if index in self.buckets:
+                self.buckets[index].table += bucket.table
+            else:
+                self.buckets[index] = CountMinSketch(self.width, self.depth, bucket.table.copy())
+                self.candidates[index] = {}
+            self.total.table += bucket.table
+            for key in other.candidates.get(index, ()):
+                self.candidates[index].setdefault(key, 0)
+            self._prune(index)
+        self._ranking = None
+
+    def empty(self) -> bool:
+        return not self.buckets
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Return the state as arrays, for numpy.savez.
+
+        Candidate estimates are not saved: load_arrays recomputes them from the tables.
+
+        Returns:
+            Dict[str, np.ndarray]: The live buckets' tables and candidates.
+        """
+        indices = sorted(self.buckets)
+        tables = [self.buckets[index].table for index in indices]
+        return {
+            'buckets': np.array(indices, dtype=np.int64),
+            'tables': (np.stack(tables) if tables
+                       else np.zeros((0, self.depth, self.width), dtype=np.int64)),
+            'candidates': np.array([key for index in indices for key in self.candidates[index]],
+                                   dtype=str),
+            'candidate_buckets': np.array([index for index in indices
+                                           for _ in self.candidates[index]], dtype=np.int64),
+        }
+
+    def load_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Replace the state with one saved by to_arrays.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): The arrays returned by to_arrays, of an
+                instance with the same shape.
+        """
+        self.buckets = {int(index): CountMinSketch(self.width, self.depth, table.copy())
+                        for index, table in zip(arrays['buckets'], arrays['tables'])}
+        self.total = CountMinSketch(self.width, self.depth)
+        for bucket in self.buckets.values():
+            self.total.table += bucket.table
+        self.candidates = {index: {} for index in self.buckets}
+        for key, index in zip(arrays['candidates'].tolist(),
+                              arrays['candidate_buckets'].tolist()):
+            if index in self.candidates:
+                self.candidates[index][key] = 0
+        self._floors = {}
+        for index in self.buckets:
+            self._prune(index)
+        self._ranking = None
+
+    def _expire(self, now: float) -> int:
+        index = int(now // self.bucket_seconds)
+        for old in [old for old in self.buckets if old <= index - self.slots]:
+            self.total.table -= self.buckets.pop(old).table
+            del self.candidates[old]
+            self._floors.pop(old, None)
+            self._ranking = None
+        return index
+
+    def _prune(self, index: int) -> None:
+        kept = _ranked(list(self.candidates[index]), self.buckets[index])[:self.capacity]
+        self.candidates[index] = dict(kept)
+        self._floors[index] = kept[-1][1] if len(kept) == self.capacity else 0
+
+
+def _ranked(keys: List[str], sketch: CountMinSketch) -> List[Tuple[str, int]]:
+    estimates = sketch.estimate(sketch_columns(keys, sketch.width, sketch.depth))
+    order = np.argsort(-estimates, kind='stable')
+    return [(keys[position], int(estimates[position])) for position in order
+            if estimates[position] > 0]
@@ -0,0 +1,16 @@
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+
+
+class DiskUploadMixin:  # pylint: disable=too-few-public-methods
+    """
+    APIView mixin that streams multipart uploads straight to a temporary file on disk.
+
+    Django's default handlers keep uploads under FILE_UPLOAD_MAX_MEMORY_SIZE in memory.
+    Views that accept images or videos use this mixin so request memory stays flat
+    whatever the client sends, and FileSystemStorage can move the temporary file into
+    place instead of copying it.
+    """
+
+    def initialize_request(self, request, *args, **kwargs):
+        request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
@@ -0,0 +1,54 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from utils.lazy import LazySingleton
+
+
+T = TypeVar('T')
+
+
+def lazy_thread_pool(workers_setting: str, thread_name_prefix: str
+                     ) -> LazySingleton[ThreadPoolExecutor]:
+    """
+    Return a process-wide thread pool sized by a setting, created on first use.
+
+    Args:
+        workers_setting (str): The name of the setting holding the number of workers.
+        thread_name_prefix (str): The prefix of the worker thread names.
+
+    Returns:
+        LazySingleton[ThreadPoolExecutor]: The pool, rebuilt when the setting changes.
+    """
+    return LazySingleton(
+        lambda: ThreadPoolExecutor(getattr(settings, workers_setting),
+                                   thread_name_prefix=thread_name_prefix),
+        workers_setting,
+        on_reset=lambda executor: executor.shutdown(wait=False),
+    )
+
+
+def closes_connections(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorate a task run on a worker thread to close its database connections afterwards.
+
+    Worker threads are not covered by the request/response connection cleanup, so
+    without this every worker would keep a connection open, and reuse it after the
+    database dropped it.
+
+    Args:
+        func (Callable): The task.
+
+    Returns:
+        Callable: The task, closing stale connections when it returns or raises.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return wrapper
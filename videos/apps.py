@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class VideosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'videos'
+
+    def ready(self):
+        # pylint: disable=import-outside-toplevel
+        from utils.metrics import registry
+        from videos.jobs import queue_gauges
+        from videos import timeline, trending  # pylint: disable=unused-import
+
+        registry.register_collector('video_jobs', queue_gauges, prefix='video_jobs')
@@ -0,0 +1,68 @@
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import F, Prefetch, QuerySet
+
+from users.models.custom_user_models import CustomUser
+from users.serializers import AuthorSerializer
+from videos.models.comment_models import Comment
+from videos.models.video_models import Video
+
+
+def with_authors(comments: QuerySet) -> QuerySet:
+    """
+    Fetch the authors of a page of comments with one query, whatever the page size.
+
+    The authors are loaded by a single prefetch of the distinct author IDs, restricted to
+    the columns AuthorSerializer renders, so a page costs the same two queries however many
+    comments or distinct authors it contains.
+
+    Args:
+        comments (QuerySet): The comments.
+
+    Returns:
+        QuerySet: The comments, prefetching their authors.
+    """
+    authors = CustomUser.objects.only(*AuthorSerializer.Meta.fields)
+    return comments.prefetch_related(Prefetch('author', queryset=authors))
+
+
+def add_comment(video: Video, author: CustomUser, text: str,
+                parent: Optional[Comment] = None) -> Comment:
+    """
+    Comment on a video, or reply to one of its comments.
+
+    A reply to a reply is attached to the top-level comment, keeping threads one level
+    deep; the parent's reply_count is incremented in the same transaction.
+
+    Args:
+        video (Video): The video.
+        author (CustomUser): The user commenting.
+        text (str): The text of the comment.
+        parent (Optional[Comment]): The comment replied to, on the same video.
+
+    Returns:
+        Comment: The new comment.
+    """
+    if parent is not None and parent.parent_id is not None:
+        parent = parent.parent
+
+    with transaction.atomic():
+        comment = Comment.objects.create(video=video, author=author, text=text, parent=parent)
+        if parent is not None:
+            Comment.objects.filter(pk=parent.pk).update(reply_count=F('reply_count') + 1)
+    return comment
+
+
+def delete_comment(comment: Comment) -> None:
+    """
+    Delete a comment with its replies, updating its parent's reply_count.
+
+    Args:
+        comment (Comment): The comment.
+    """
+    with transaction.atomic():
+        comment.delete()
+        if comment.parent_id is not None:
+            Comment.objects.filter(pk=comment.parent_id, reply_count__gt=0).update(
+                reply_count=F('reply_count') - 1)
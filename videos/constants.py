@@ -0,0 +1,21 @@
+VIDEO_NOT_FOUND_MESSAGE = "Video not found."
+INVALID_CONTENT_RANGE_ERROR = (
+    "Content-Range must be 'bytes <start>-<end>/<size>' matching the upload size.")
+MISSING_CHECKSUM_ERROR = "Missing X-Chunk-Checksum header with the SHA-256 of the chunk."
+CHECKSUM_MISMATCH_ERROR = "Chunk checksum does not match."
+CHUNK_TOO_LARGE_ERROR = "Chunks may be at most %s bytes."
+CONTENT_LENGTH_MISMATCH_ERROR = "Content-Length must equal the length of the Content-Range."
+INCOMPLETE_CHUNK_ERROR = "Request body ended before the end of the Content-Range."
+UPLOAD_OFFSET_MISMATCH_ERROR = "Chunk must start at the current upload offset."
+UPLOAD_IN_PROGRESS_ERROR = "Another chunk of this upload is being written."
+UPLOAD_NOT_IN_PROGRESS_ERROR = "Upload is already complete."
+UPLOAD_SIZE_ERROR = "Size must be between 1 and %s bytes."
+UNSUPPORTED_CONTENT_TYPE_ERROR = "Unsupported content type. Allowed types: %s."
+JOB_FAILED = "Video job %s for video %s failed permanently: %s"
+JOB_LEASE_EXPIRED = "Lease expired before the worker reported a result."
+RENDITION_NOT_FOUND_MESSAGE = "Rendition not found. Available renditions: %s."
+RANGE_NOT_SATISFIABLE_ERROR = "None of the requested ranges overlap the file."
+INVALID_TRENDING_KIND_ERROR = "Unknown trending kind. Available kinds: %s."
+INVALID_TRENDING_WINDOW_ERROR = "Unknown trending window. Available windows: %s."
+COMMENT_NOT_FOUND_MESSAGE = "Comment not found."
+COMMENT_NOT_AUTHOR_ERROR = "Only the author can delete a comment."
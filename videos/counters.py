@@ -0,0 +1,223 @@
+import atexit
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import BigIntegerField, Case, F, Value, When
+from django.db.models.functions import Greatest
+from django.dispatch import Signal
+from django.utils.module_loading import import_string
+
+from utils.counters import CounterBackend
+from utils.lazy import LazySingleton
+from videos.models.video_models import Video
+
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = ('view_count', 'like_count', 'share_count')
+
+# Sent after each batch written by flush_counters, with deltas={video_id: {field: amount}}.
+counters_flushed = Signal()
+
+
+class CounterFlusher:
+    """
+    Background thread writing the pending counter deltas to the database.
+
+    It flushes every interval seconds, and sooner when woken because too many counters
+    are pending. It is stopped, with a last flush, when the interpreter exits.
+
+    Methods:
+    - start(): Start the thread.
+    - wake(): Ask for a flush without waiting for the interval.
+    - stop(flush=True): Stop the thread, flushing what is pending first.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='video-counters', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the thread and wait for it; later calls do nothing.
+
+        Args:
+            flush (bool): Whether to flush the pending deltas once the thread is stopped.
+        """
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join()
+        if flush:
+            self._flush()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                return
+            self._flush()
+
+    @staticmethod
+    def _flush() -> None:
+        close_old_connections()
+        try:
+            flush_counters()
+        except Exception:  # pylint: disable=broad-except
+            # The deltas were put back; the next flush retries them.
+            logger.exception('Flushing video counters failed.')
+
+
+def _create_backend() -> CounterBackend:
+    return import_string(settings.VIDEO_COUNTER_BACKEND)()
+
+
+def _start_flusher() -> CounterFlusher:
+    flusher = CounterFlusher(settings.VIDEO_COUNTER_FLUSH_INTERVAL)
+    flusher.start()
+    return flusher
+
+
+# Settings receivers run in the order they were connected, so the flusher is stopped, with
+# its last flush, before the backend holding the deltas is dropped.
+_flusher = LazySingleton(_start_flusher, 'VIDEO_COUNTER_', on_reset=CounterFlusher.stop)
+_backend = LazySingleton(_create_backend, 'VIDEO_COUNTER_')
+
+
+def get_counter_backend() -> CounterBackend:
+    """
+    Return the process-wide store of pending counter deltas configured by
+    VIDEO_COUNTER_BACKEND.
+
+    Returns:
+        CounterBackend: The shared backend instance.
+    """
+    return _backend.get()
+
+
+def increment(video_id: int, field: str, amount: int = 1) -> None:
+    """
+    Count amount towards one counter of a video without writing to the database.
+
+    The delta is written by the next flush. With VIDEO_COUNTER_FLUSH_INTERVAL set to 0
+    no flusher thread runs and flush_counters() must be called explicitly.
+
+    Args:
+        video_id (int): The ID of the video.
+        field (str): One of COUNTER_FIELDS.
+        amount (int): The increment, negative to decrement.
+    """
+    if field not in COUNTER_FIELDS:
+        raise ValueError(f'Unknown counter {field!r}.')
+
+    backend = get_counter_backend()
+    backend.add(f'{video_id}:{field}', amount)
+
+    if settings.VIDEO_COUNTER_FLUSH_INTERVAL > 0:
+        flusher = _flusher.get()
+        if backend.size() >= settings.VIDEO_COUNTER_MAX_PENDING:
+            flusher.wake()
+
+
+def pending_counts(video_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """
+    Return the deltas counted but not yet flushed for each video.
+
+    Args:
+        video_ids (Iterable[int]): The IDs of the videos.
+
+    Returns:
+        Dict[int, Dict[str, int]]: The non-zero deltas by counter, for the videos with any.
+    """
+    keys = [f'{video_id}:{field}' for video_id in video_ids for field in COUNTER_FIELDS]
+    counts: Dict[int, Dict[str, int]] = defaultdict(dict)
+
+    for key, amount in get_counter_backend().pending(keys).items():
+        video_id, field = key.split(':')
+        counts[int(video_id)][field] = amount
+    return counts
+
+
+def with_pending_counts(videos: List[Video]) -> List[Video]:
+    """
+    Add the pending deltas to the counters of loaded videos, so readers see their own
+    increments before they are flushed.
+
+    Args:
+        videos (List[Video]): The videos, with their persisted counters loaded.
+
+    Returns:
+        List[Video]: The same videos, updated in place.
+    """
+    counts = pending_counts(video.pk for video in videos)
+    for video in videos:
+        for field, amount in counts.get(video.pk, {}).items():
+            setattr(video, field, max(getattr(video, field) + amount, 0))
+    return videos
+
+
+def flush_counters() -> int:
+    """
+    Write every drained delta to the database.
+
+    Deltas are grouped per video and applied with one UPDATE per VIDEO_COUNTER_FLUSH_BATCH
+    videos, in primary key order so concurrent flushes lock rows in the same order. Each
+    batch commits on its own to keep row locks short and is then announced through
+    counters_flushed; if one fails, the deltas of that batch and the following ones are put
+    back into the backend and the error is raised.
+
+    Returns:
+        int: The number of videos updated.
+    """
+    backend = get_counter_backend()
+    deltas = backend.drain()
+    if not deltas:
+        return 0
+
+    by_video: Dict[int, Dict[str, int]] = defaultdict(dict)
+    for key, amount in deltas.items():
+        video_id, field = key.split(':')
+        by_video[int(video_id)][field] = amount
+
+    video_ids = sorted(by_video)
+    batch_size = settings.VIDEO_COUNTER_FLUSH_BATCH
+    for start in range(0, len(video_ids), batch_size):
+        batch = video_ids[start:start + batch_size]
+        try:
+            Video.objects.filter(pk__in=batch).update(**_bulk_increments(batch, by_video))
+        except Exception:
+            backend.restore({f'{video_id}:{field}': amount
+                             for video_id in video_ids[start:]
+                             for field, amount in by_video[video_id].items()})
+            raise
+        counters_flushed.send_robust(
+            sender=Video, deltas={video_id: by_video[video_id] for video_id in batch})
+
+    return len(video_ids)
+
+
+def _bulk_increments(video_ids: List[int], by_video: Dict[int, Dict[str, int]]) -> dict:
+    updates = {}
+    for field in COUNTER_FIELDS:
+        whens = [When(pk=video_id, then=Value(by_video[video_id][field]))
+                 for video_id in video_ids if by_video[video_id].get(field)]
+        if whens:
+            # A lost increment must not let a later decrement push the count below zero.
+            delta = Case(*whens, default=Value(0), output_field=BigIntegerField())
+            updates[field] = Greatest(F(field) + delta, Value(0))
+    return updates
@@ -0,0 +1,315 @@
+import bisect
+import time
+from datetime import timedelta
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from utils.cache import LRUCache
+from utils.lazy import LazySingleton
+from utils.metrics import registry
+from videos.models.video_models import Video
+from videos.timeline import following_video_ids
+
+
+# Smoothing priors for engagement rates, so a video with 1 view and 1 like does not
+# outrank one with 10k views and 2k likes.
+LIKE_PRIOR = (1.0, 20.0)
+SHARE_PRIOR = (0.5, 20.0)
+# Trending velocity: weighted engagement divided by (age in hours + 2) ** gravity.
+TRENDING_WEIGHTS = (1.0, 5.0, 10.0)
+TRENDING_GRAVITY = 1.5
+
+
+class FeatureStore:  # pylint: disable=too-many-instance-attributes
+    """
+    Column arrays of the ranking features of every video eligible for the feed.
+
+    Built from one query over the ready videos of the last FEED_WINDOW_DAYS and kept for
+    FEED_FEATURES_TTL seconds, so scoring a request only indexes into arrays. Rows are
+    sorted by video id.
+
+    Methods:
+    - load() -> FeatureStore: Build the arrays from the database (classmethod).
+    - rows_for(video_ids) -> np.ndarray: Map video ids to row indices, dropping unknown ids.
+    - memoize(key, compute) -> np.ndarray: Compute rows once for the lifetime of the store.
+    """
+
+    def __init__(self, ids: np.ndarray, owner_ids: np.ndarray, created: np.ndarray,
+                 views: np.ndarray, likes: np.ndarray, shares: np.ndarray) -> None:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.ids = ids
+        self.owner_ids = owner_ids
+        self.created = created
+        self.views = views
+        self.likes = likes
+        self.shares = shares
+        self.built_at = time.monotonic()
+        self.loaded_at = time.time()
+        self._memo = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls) -> 'FeatureStore':
+        """
+        Build the arrays from the ready videos of the last FEED_WINDOW_DAYS.
+
+        Returns:
+            FeatureStore: The new store.
+        """
+        since = timezone.now() - timedelta(days=settings.FEED_WINDOW_DAYS)
+        rows = list(Video.objects
+                    .filter(status=Video.Status.READY, created_at__gte=since)
+                    .order_by('id')
+                    .values_list('id', 'owner_id', 'created_at', 'view_count', 'like_count',
+                                 'share_count'))
+        ids, owner_ids, created, views, likes, shares = zip(*rows) if rows else ((),) * 6
+        return cls(
+            ids=np.array(ids, dtype=np.int64),
+            owner_ids=np.array(owner_ids, dtype=np.int64),
+            created=np.array([value.timestamp() for value in created], dtype=np.float64),
+            views=np.array(views, dtype=np.float64),
+            likes=np.array(likes, dtype=np.float64),
+            shares=np.array(shares, dtype=np.float64),
+        )
+
+    def rows_for(self, video_ids) -> np.ndarray:
+        video_ids = np.asarray(video_ids, dtype=np.int64)
+        rows = np.searchsorted(self.ids, video_ids)
+        found = rows < len(self.ids)
+        found[found] = self.ids[rows[found]] == video_ids[found]
+        return rows[found]
+
+    def memoize(self, key, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Compute rows once for the lifetime of the store.
+
+        Candidate sources that do not depend on the viewer share their rows this way.
+        Racing threads may both compute; the result is the same.
+
+        Args:
+            key: Identifies the rows, such as the source name and limit.
+            compute (Callable[[], np.ndarray]): Computes the rows on the first call.
+
+        Returns:
+            np.ndarray: The rows.
+        """
+        rows = self._memo.get(key)
+        if rows is None:
+            rows = self._memo[key] = compute()
+        return rows
+
+
+_store = LazySingleton(
+    FeatureStore.load, 'FEED_',
+    is_stale=lambda store: store.built_at + settings.FEED_FEATURES_TTL <= time.monotonic())
+
+
+def get_feature_store() -> FeatureStore:
+    """
+    Return the process-wide feature store, rebuilding it once it is FEED_FEATURES_TTL old.
+
+    Only one thread rebuilds; the others keep scoring against the previous arrays.
+
+    Returns:
+        FeatureStore: The current feature arrays.
+    """
+    return _store.get()
+
+
+def _top(values: np.ndarray, count: int) -> np.ndarray:
+    if len(values) <= count:
+        return np.arange(len(values))
+    return np.argpartition(values, -count)[-count:]
+
+
+def trending_scores(store: FeatureStore, now: float) -> np.ndarray:
+    """
+    Return the engagement velocity of every video in the store.
+
+    Args:
+        store (FeatureStore): The feature arrays.
+        now (float): The current time as a Unix timestamp.
+
+    Returns:
+        np.ndarray: One score per row.
+    """
+    views, likes, shares = TRENDING_WEIGHTS
+    engagement = views * store.views + likes * store.likes + shares * store.shares
+    age_hours = np.maximum(now - store.created, 0) / 3600
+    return engagement / (age_hours + 2) ** TRENDING_GRAVITY
+
+
+def recent_candidates(_user, store: FeatureStore, limit: int) -> np.ndarray:
+    """
+    Candidate source: the newest videos, the same for every viewer.
+    """
+    return store.memoize(('recent', limit), lambda: _top(store.created, limit))
+
+
+def trending_candidates(_user, store: FeatureStore, limit: int) -> np.ndarray:
+    """
+    Candidate source: the videos gaining engagement fastest when the store was built, the
+    same for every viewer.
+    """
+    return store.memoize(('trending', limit),
+                         lambda: _top(trending_scores(store, store.loaded_at), limit))
+
+
+def following_candidates(user, store: FeatureStore, limit: int) -> np.ndarray:
+    """
+    Candidate source: the newest videos of the creators the viewer follows.
+    """
+    if not user.is_authenticated:
+        return np.empty(0, dtype=np.int64)
+    return store.rows_for(following_video_ids(user, limit))
+
+
+def generate_candidates(user, store: FeatureStore) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge the rows returned by every FEED_CANDIDATE_SOURCES entry.
+
+    A video returned by several sources is kept once, with the highest source boost.
+    The viewer's own videos are left out.
+
+    Args:
+        user: The requesting user, possibly anonymous.
+        store (FeatureStore): The feature arrays.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The unique candidate rows and their source boosts.
+    """
+    all_rows, all_boosts = [], []
+    for name, path in settings.FEED_CANDIDATE_SOURCES.items():
+        rows = np.asarray(import_string(path)(user, store, settings.FEED_CANDIDATES_PER_SOURCE),
+                          dtype=np.int64)
+        all_rows.append(rows)
+        all_boosts.append(np.full(len(rows), settings.FEED_SOURCE_BOOSTS.get(name, 0.0)))
+
+    if not all_rows:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    rows, boosts = np.concatenate(all_rows), np.concatenate(all_boosts)
+    order = np.argsort(-boosts, kind='stable')
+    rows, first = np.unique(rows[order], return_index=True)
+    boosts = boosts[order][first]
+
+    if user.is_authenticated:
+        keep = store.owner_ids[rows] != user.pk
+        rows, boosts = rows[keep], boosts[keep]
+    return rows, boosts
+
+
+def score_candidates(store: FeatureStore, rows: np.ndarray, boosts: np.ndarray,
+                     now: float) -> np.ndarray:
+    """
+    Score a batch of candidates in one vectorized pass.
+
+    The score is a weighted sum (FEED_WEIGHTS) of the smoothed like and share rates, the
+    log of the view count and an exponential freshness decay, plus the source boost.
+
+    Args:
+        store (FeatureStore): The feature arrays.
+        rows (np.ndarray): The candidate rows.
+        boosts (np.ndarray): The source boost of each candidate.
+        now (float): The current time as a Unix timestamp.
+
+    Returns:
+        np.ndarray: One score per candidate.
+    """
+    weights = settings.FEED_WEIGHTS
+    views = store.views[rows]
+    age_hours = np.maximum(now - store.created[rows], 0) / 3600
+
+    like_rate = (store.likes[rows] + LIKE_PRIOR[0]) / (views + LIKE_PRIOR[1])
+    share_rate = (store.shares[rows] + SHARE_PRIOR[0]) / (views + SHARE_PRIOR[1])
+    freshness = np.exp2(-age_hours / settings.FEED_FRESHNESS_HALF_LIFE_HOURS)
+
+    return (weights['like_rate'] * like_rate
+            + weights['share_rate'] * share_rate
+            + weights['popularity'] * np.log1p(views)
+            + weights['freshness'] * freshness
+            + boosts)
+
+
+def rank_feed(user, store: Optional[FeatureStore] = None,
+              now: Optional[float] = None) -> List[Tuple[int, float]]:
+    """
+    Generate, score and rank the feed of a user.
+
+    Args:
+        user: The requesting user, possibly anonymous.
+        store (Optional[FeatureStore]): The feature arrays; defaults to the shared store.
+        now (Optional[float]): The Unix timestamp to score at; defaults to when the store
+        was loaded, so scores stay the same while it is cached and a cursor's (score, id)
+        is found again after the ranking is recomputed.
+
+    Returns:
+        List[Tuple[int, float]]: Up to FEED_LENGTH (video id, score) pairs ordered by
+        descending score, then ascending id, so (score, id) is a keyset for paging.
+    """
+    store = get_feature_store() if store is None else store
+    rows, boosts = generate_candidates(user, store)
+    scores = score_candidates(store, rows, boosts, store.loaded_at if now is None else now)
+
+    best = _top(scores, settings.FEED_LENGTH)
+    ids, scores = store.ids[rows[best]], scores[best]
+    order = np.lexsort((ids, -scores))
+    return list(zip(ids[order].tolist(), scores[order].tolist()))
+
+
+def position_after(ranked: List[Tuple[int, float]], score: float, video_id: int) -> int:
+    """
+    Return the index of the first entry of a ranked feed that comes after (score, video_id).
+
+    Works whether or not that entry is still in the list, so a client keeps its place
+    when its cached ranking expired and the feed was ranked again.
+
+    Args:
+        ranked (List[Tuple[int, float]]): The output of rank_feed.
+        score (float): The score of the last entry served.
+        video_id (int): The id of the last entry served.
+
+    Returns:
+        int: The index of the next entry to serve.
+    """
+    return bisect.bisect_right(ranked, (-score, video_id), key=lambda entry: (-entry[1], entry[0]))
+
+
+feed_cache = LRUCache(maxsize=settings.FEED_CACHE_MAX_SIZE, ttl=settings.FEED_CACHE_TTL)
+registry.register_collector('feed_cache', feed_cache.stats)
+
+
+@receiver(setting_changed)
+def _clear_feed_cache(setting: str, **kwargs) -> None:
+    if setting.startswith('FEED_'):
+        feed_cache.clear()
+
+
+def get_feed(user, refresh: bool = False) -> List[Tuple[int, float]]:
+    """
+    Return the ranked feed of a user from the cache, ranking it on a miss.
+
+    Scrolling reads pages of the cached list; opening the feed again (refresh) ranks it
+    anew so new videos show up.
+
+    Args:
+        user: The requesting user, possibly anonymous.
+        refresh (bool): Whether to ignore the cached list.
+
+    Returns:
+        List[Tuple[int, float]]: The ranked (video id, score) pairs.
+    """
+    key = user.pk if user.is_authenticated else 'anonymous'
+    ranked = None if refresh else feed_cache.get(key)
+    if ranked is None:
+        ranked = rank_feed(user)
+        feed_cache.set(key, ranked)
+    return ranked
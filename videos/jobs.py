@@ -0,0 +1,480 @@
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from utils.benchmarking import percentile
+from videos.models.video_models import Video
+from videos.models.video_job_models import VideoJob
+from videos.timeline import schedule_fan_out
+from videos.trending import schedule_post
+from videos.transcoders import run_job
+from videos.constants import JOB_FAILED, JOB_LEASE_EXPIRED
+
+
+logger = logging.getLogger(__name__)
+
+JobType = VideoJob.JobType
+JobStatus = VideoJob.Status
+
+
+def enqueue_processing(video: Video, priority: Optional[int] = None) -> List[VideoJob]:
+    """
+    Queue the processing jobs of a freshly uploaded video.
+
+    Probing and thumbnailing are quick and unblock the video page, so they go in the high
+    priority lane; transcoding goes in the normal lane unless a priority is given.
+
+    Args:
+        video (Video): The uploaded video.
+        priority (Optional[int]): Overrides the lane of every job, e.g. LOW for backfills.
+
+    Returns:
+        List[VideoJob]: The created jobs.
+    """
+    lanes = {
+        JobType.PROBE: VideoJob.Priority.HIGH,
+        JobType.THUMBNAIL: VideoJob.Priority.HIGH,
+        JobType.TRANSCODE: VideoJob.Priority.NORMAL,
+    }
+    return VideoJob.objects.bulk_create(
+        VideoJob(video=video, job_type=job_type,
+                 priority=lane if priority is None else priority,
+                 max_attempts=settings.VIDEO_JOB_MAX_ATTEMPTS)
+        for job_type, lane in lanes.items()
+    )
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Return the exponential backoff before retrying a job that failed attempts times.
+
+    Args:
+        attempts (int): The number of attempts made so far.
+
+    Returns:
+        float: Seconds to wait, capped at VIDEO_JOB_RETRY_BACKOFF_MAX.
+    """
+    delay = settings.VIDEO_JOB_RETRY_BACKOFF * 2 ** max(attempts - 1, 0)
+    return min(delay, settings.VIDEO_JOB_RETRY_BACKOFF_MAX)
+
+
+def claim_job(worker: str, job_types: List[str]) -> Optional[VideoJob]:
+    """
+    Claim the most urgent runnable job of one of job_types.
+
+    Rows locked by other workers are skipped, and the claim itself is a conditional
+    UPDATE, so two workers never run the same job.
+
+    Args:
+        worker (str): Identifies the claiming worker.
+        job_types (List[str]): The types the worker has capacity for.
+
+    Returns:
+        Optional[VideoJob]: The claimed job, or None if nothing is runnable.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        job = (VideoJob.objects.select_for_update(skip_locked=True)
+               .filter(status=JobStatus.QUEUED, run_after__lte=now, job_type__in=job_types)
+               .order_by('priority', 'run_after', 'id')
+               .first())
+        if job is None:
+            return None
+
+        claimed = VideoJob.objects.filter(pk=job.pk, status=JobStatus.QUEUED).update(
+            status=JobStatus.RUNNING, attempts=F('attempts') + 1, worker=worker,
+            leased_until=now + timedelta(seconds=settings.VIDEO_JOB_LEASE), started_at=now)
+        if not claimed:
+            return None
+
+    job.refresh_from_db()
+    Video.objects.filter(pk=job.video_id, status=Video.Status.UPLOADED).update(
+        status=Video.Status.PROCESSING)
+    return job
+
+
+def _running(job: VideoJob):
+    # Matches the job only while it is still held by the claim that produced `job`; a late
+    # result from a worker whose lease expired is ignored.
+    return VideoJob.objects.filter(pk=job.pk, status=JobStatus.RUNNING, worker=job.worker,
+                                   attempts=job.attempts)
+
+
+def complete_job(job: VideoJob, output: Dict[str, Any]) -> bool:
+    """
+    Record a successful run and store its output on the video.
+
+    Args:
+        job (VideoJob): The claimed job.
+        output (Dict[str, Any]): What the job produced, as returned by run_job.
+
+    Returns:
+        bool: False if the job was no longer held by this claim.
+    """
+    with transaction.atomic():
+        if not _running(job).update(status=JobStatus.SUCCEEDED, finished_at=timezone.now(),
+                                    leased_until=None, last_error=''):
+            return False
+
+        if job.job_type == JobType.PROBE:
+            Video.objects.filter(pk=job.video_id).update(metadata=output)
+        elif job.job_type == JobType.TRANSCODE:
+            Video.objects.filter(pk=job.video_id).update(renditions=output)
+        elif job.job_type == JobType.THUMBNAIL:
+            Video.objects.filter(pk=job.video_id).update(thumbnail=output['thumbnail'])
+
+        _update_video_status(job.video_id)
+    return True
+
+
+def fail_job(job: VideoJob, error: str) -> bool:
+    """
+    Record a failed run, scheduling a retry with backoff while attempts remain.
+
+    Args:
+        job (VideoJob): The claimed job.
+        error (str): Description of the failure.
+
+    Returns:
+        bool: False if the job was no longer held by this claim.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        if job.attempts < job.max_attempts:
+            return bool(_running(job).update(
+                status=JobStatus.QUEUED, leased_until=None, worker='', last_error=error,
+                run_after=now + timedelta(seconds=retry_delay(job.attempts))))
+
+        if not _running(job).update(status=JobStatus.FAILED, leased_until=None,
+                                    finished_at=now, last_error=error):
+            return False
+        logger.error(JOB_FAILED, job.job_type, job.video_id, error)
+        _update_video_status(job.video_id)
+    return True
+
+
+def renew_leases(worker: str, job_ids: List[int]) -> int:
+    """
+    Extend the leases of the jobs a worker is still running.
+
+    Args:
+        worker (str): The worker holding the jobs.
+        job_ids (List[int]): The running jobs.
+
+    Returns:
+        int: The number of leases renewed.
+    """
+    leased_until = timezone.now() + timedelta(seconds=settings.VIDEO_JOB_LEASE)
+    return VideoJob.objects.filter(pk__in=job_ids, status=JobStatus.RUNNING, worker=worker).update(
+        leased_until=leased_until)
+
+
+def recover_expired_leases() -> int:
+    """
+    Requeue jobs whose worker stopped renewing their lease, e.g. because it crashed.
+
+    Jobs without attempts left are failed instead.
+
+    Returns:
+        int: The number of jobs recovered or failed.
+    """
+    now = timezone.now()
+    expired = VideoJob.objects.filter(status=JobStatus.RUNNING, leased_until__lt=now)
+
+    with transaction.atomic():
+        requeued = expired.filter(attempts__lt=F('max_attempts')).update(
+            status=JobStatus.QUEUED, leased_until=None, worker='', run_after=now,
+            last_error=JOB_LEASE_EXPIRED)
+
+        video_ids = set(expired.values_list('video_id', flat=True))
+        failed = expired.update(status=JobStatus.FAILED, leased_until=None, finished_at=now,
+                                last_error=JOB_LEASE_EXPIRED)
+        for video_id in video_ids:
+            _update_video_status(video_id)
+
+    return requeued + failed
+
+
+def _update_video_status(video_id: int) -> None:
+    statuses = set(VideoJob.objects.filter(video_id=video_id).values_list('status', flat=True))
+    videos = Video.objects.filter(pk=video_id)
+
+    if JobStatus.FAILED in statuses:
+        videos.update(status=Video.Status.FAILED)
+    elif statuses == {JobStatus.SUCCEEDED}:
+        if videos.filter(status__in=[Video.Status.UPLOADED, Video.Status.PROCESSING]).update(
+                status=Video.Status.READY):
+            schedule_fan_out(video_id)
+            schedule_post(video_id)
+
+
+def plan_job(job: VideoJob) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """
+    Resolve the local paths a job reads and writes.
+
+    Args:
+        job (VideoJob): The claimed job.
+
+    Returns:
+        Tuple: The source path, the output paths passed to the worker process, and the
+        storage names recorded on success, both keyed by output name.
+    """
+    video = job.video
+    source = default_storage.path(video.file.name)
+    names: Dict[str, Any] = {}
+
+    if job.job_type == JobType.TRANSCODE:
+        names = {name: f'videos/{video.pk}/{name}.mp4' for name in settings.VIDEO_RENDITIONS}
+    elif job.job_type == JobType.THUMBNAIL:
+        names = {'thumbnail': f'videos/{video.pk}/thumbnail.jpg'}
+
+    outputs = {name: default_storage.path(storage_name) for name, storage_name in names.items()}
+    return source, outputs, names
+
+
+def queue_stats() -> Dict[str, Any]:
+    """
+    Summarize the job table: queue depth by type and lane, and recent job latencies.
+
+    Latencies cover jobs finished in the last hour. Wait time runs from creation to the
+    start of the last attempt, so it includes retry delays.
+
+    Returns:
+        Dict[str, Any]: Counts and p50/p95 wait and run times in seconds.
+    """
+    now = timezone.now()
+    stats: Dict[str, Any] = {'queued': {}, 'queued_by_priority': {}, 'running': {}}
+
+    runnable = VideoJob.objects.filter(status=JobStatus.QUEUED, run_after__lte=now)
+    for row in runnable.values('job_type', 'priority').annotate(count=Count('id')):
+        stats['queued'][row['job_type']] = stats['queued'].get(row['job_type'], 0) + row['count']
+        lane = VideoJob.Priority(row['priority']).name.lower()
+        stats['queued_by_priority'][lane] = stats['queued_by_priority'].get(lane, 0) + row['count']
+
+    running = VideoJob.objects.filter(status=JobStatus.RUNNING)
+    for row in running.values('job_type').annotate(count=Count('id')):
+        stats['running'][row['job_type']] = row['count']
+
+    stats['delayed'] = VideoJob.objects.filter(status=JobStatus.QUEUED, run_after__gt=now).count()
+
+    finished = (VideoJob.objects
+                .filter(status=JobStatus.SUCCEEDED, finished_at__gte=now - timedelta(hours=1))
+                .values_list('created_at', 'started_at', 'finished_at')
+                .order_by('-finished_at')[:1000])
+    waits = [(started - created).total_seconds() for created, started, _ in finished]
+    runs = [(done - started).total_seconds() for _, started, done in finished]
+    stats.update({
+        'finished_last_hour': len(waits),
+        'wait_p50_s': percentile(waits, 50),
+        'wait_p95_s': percentile(waits, 95),
+        'run_p50_s': percentile(runs, 50),
+        'run_p95_s': percentile(runs, 95),
+    })
+    return stats
+
+
+def queue_gauges() -> Dict[str, float]:
+    """
+    Flatten queue_stats into numeric gauges for the metrics endpoint.
+
+    Returns:
+        Dict[str, float]: Gauge values keyed by name.
+    """
+    stats = queue_stats()
+    gauges = {
+        'queued': sum(stats['queued'].values()),
+        'running': sum(stats['running'].values()),
+        'delayed': stats['delayed'],
+    }
+    for job_type in JobType.values:
+        gauges[f'queued_{job_type}'] = stats['queued'].get(job_type, 0)
+    for key in ('wait_p50_s', 'wait_p95_s', 'run_p50_s', 'run_p95_s'):
+        gauges[key] = stats[key]
+    return gauges
+
+
+class JobScheduler:  # pylint: disable=too-many-instance-attributes
+    """
+    Claims video jobs and runs them on a local pool of worker processes.
+
+    The scheduler process does all the database work: claiming, lease renewal, recording
+    results and recovering jobs abandoned by crashed workers. The pool processes only run
+    the transcoder on local files. Each job type has its own concurrency cap on top of the
+    pool size, so a backlog of slow transcodes cannot starve probes and thumbnails.
+
+    Methods:
+    - tick() -> int: Collect finished jobs and claim new ones; returns the number claimed.
+    - run(stop, drain): Loop until stop is set, or until the queue is empty if drain.
+    - stats() -> Dict[str, Any]: Counters of this scheduler.
+    - shutdown(): Wait for running jobs and stop the pool.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, workers: Optional[int] = None,
+                 concurrency: Optional[Dict[str, int]] = None,
+                 worker_id: Optional[str] = None) -> None:
+        self.workers = workers or settings.VIDEO_JOB_WORKERS
+        self.concurrency = dict(settings.VIDEO_JOB_CONCURRENCY if concurrency is None
+                                else concurrency)
+        self.worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}'
+        self._owns_executor = executor is None
+        self.executor = executor or self._create_executor()
+        self.in_flight: Dict[Future, VideoJob] = {}
+        self._output_names: Dict[Future, Dict[str, str]] = {}
+        self.counters = {'claimed': 0, 'succeeded': 0, 'retried': 0, 'failed': 0}
+        self._last_renewal = time.monotonic()
+
+    def _create_executor(self) -> Executor:
+        # Spawned rather than forked: forked children would share the parent's database
+        # connections and close them on exit.
+        return ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def available_types(self) -> List[str]:
+        """
+        Return the job types that have spare capacity.
+
+        Returns:
+            List[str]: Types below both their own cap and the pool size.
+        """
+        if len(self.in_flight) >= self.workers:
+            return []
+
+        running: Dict[str, int] = {}
+        for job in self.in_flight.values():
+            running[job.job_type] = running.get(job.job_type, 0) + 1
+
+        return [job_type for job_type in JobType.values
+                if running.get(job_type, 0) < self.concurrency.get(job_type, self.workers)]
+
+    def tick(self) -> int:
+        """
+        Run one scheduling round.
+
+        Returns:
+            int: The number of jobs claimed in this round.
+        """
+        self._collect(done=[future for future in self.in_flight if future.done()])
+        self._renew_leases()
+        recover_expired_leases()
+
+        claimed = 0
+        while True:
+            job_types = self.available_types()
+            if not job_types:
+                break
+            job = claim_job(self.worker_id, job_types)
+            if job is None:
+                break
+            self._submit(job)
+            claimed += 1
+        return claimed
+
+    def run(self, stop: Optional[threading.Event] = None, drain: bool = False) -> None:
+        """
+        Schedule jobs until stop is set.
+
+        Args:
+            stop (Optional[threading.Event]): Set to stop claiming and return once running
+            jobs are finished.
+            drain (bool): Return as soon as nothing is running and nothing is runnable.
+        """
+        stop = stop or threading.Event()
+        poll_interval = settings.VIDEO_JOB_POLL_INTERVAL
+
+        while not stop.is_set():
+            claimed = self.tick()
+            if drain and not claimed and not self.in_flight:
+                break
+            if claimed:
+                continue
+            if self.in_flight:
+                wait(list(self.in_flight), timeout=poll_interval, return_when=FIRST_COMPLETED)
+            else:
+                stop.wait(poll_interval)
+
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Wait for the running jobs, record their results and stop the pool.
+        """
+        self._collect(done=list(self.in_flight), block=True)
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the counters of this scheduler and its running jobs by type.
+
+        Returns:
+            Dict[str, Any]: Claimed, succeeded, retried and failed counts and jobs in flight.
+        """
+        running: Dict[str, int] = {}
+        for job in self.in_flight.values():
+            running[job.job_type] = running.get(job.job_type, 0) + 1
+        return {**self.counters, 'in_flight': running}
+
+    def _submit(self, job: VideoJob) -> None:
+        self.counters['claimed'] += 1
+        try:
+            source, outputs, names = plan_job(job)
+            future = self.executor.submit(run_job, settings.VIDEO_TRANSCODER, job.job_type,
+                                          source, outputs, dict(settings.VIDEO_RENDITIONS))
+        except Exception as exc:  # pylint: disable=broad-except
+            self._record_failure(job, exc)
+            return
+
+        self.in_flight[future] = job
+        self._output_names[future] = names
+
+    def _collect(self, done: List[Future], block: bool = False) -> None:
+        broken = False
+
+        for future in done:
+            job = self.in_flight.pop(future)
+            names = self._output_names.pop(future)
+            try:
+                output = future.result(timeout=None if block else 0)
+            except Exception as exc:  # pylint: disable=broad-except
+                broken = broken or isinstance(exc, BrokenProcessPool)
+                self._record_failure(job, exc)
+                continue
+
+            if job.job_type != JobType.PROBE:
+                output = names
+            if complete_job(job, output):
+                self.counters['succeeded'] += 1
+
+        if broken and self._owns_executor:
+            # A worker process died; the pool cannot be used anymore.
+            self.executor.shutdown(wait=False)
+            self.executor = self._create_executor()
+
+    def _record_failure(self, job: VideoJob, exc: BaseException) -> None:
+        error = f'{type(exc).__name__}: {exc}'
+        if not fail_job(job, error):
+            return
+        if job.attempts < job.max_attempts:
+            self.counters['retried'] += 1
+        else:
+            self.counters['failed'] += 1
+
+    def _renew_leases(self) -> None:
+        now = time.monotonic()
+        if self.in_flight and now - self._last_renewal >= settings.VIDEO_JOB_LEASE / 3:
+            renew_leases(self.worker_id, [job.pk for job in self.in_flight.values()])
+            self._last_renewal = now
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import F
+from django.test import override_settings
+
+from utils.benchmarking import summarize_latencies
+from users.models.custom_user_models import CustomUser
+from videos.counters import increment
+from videos.models.video_models import Video
+
+
+class Command(BaseCommand):
+    """
+    Compare naive row increments with the write-behind counters on one hot video.
+
+    Each client thread counts --events views of the same video. In naive mode every event is
+    an `UPDATE ... SET view_count = view_count + 1` on that row, so writers queue on its
+    lock. In write-behind mode every event is videos.counters.increment() and a flusher
+    writes the coalesced delta every --flush-interval seconds. The final count is checked
+    against the number of events sent. The video is deleted afterwards.
+    """
+
+    help = 'Benchmark view counting on a hot video, naive increments against write-behind.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=16)
+        parser.add_argument('--events', type=int, default=500, help='Events per client.')
+        parser.add_argument('--flush-interval', type=float, default=1.0)
+        parser.add_argument('--mode', choices=['naive', 'write-behind', 'both'], default='both')
+
+    def handle(self, *args, **options):
+        owner, _ = CustomUser.objects.get_or_create(
+            username='bench_counters', defaults={'email': 'bench_counters@example.com'})
+        modes = ['naive', 'write-behind'] if options['mode'] == 'both' else [options['mode']]
+
+        reports = []
+        try:
+            for mode in modes:
+                video = Video.objects.create(owner=owner, title='bench', content_type='video/mp4',
+                                             size=1, status=Video.Status.READY)
+                reports.append(self._run(mode, video, options))
+        finally:
+            owner.delete()
+
+        self.stdout.write(json.dumps(reports, indent=2))
+
+    def _run(self, mode, video, options):
+        def count_naive():
+            Video.objects.filter(pk=video.pk).update(view_count=F('view_count') + 1)
+
+        def count_write_behind():
+            increment(video.pk, 'view_count')
+
+        count = count_naive if mode == 'naive' else count_write_behind
+        latencies = []
+
+        def client():
+            try:
+                for _ in range(options['events']):
+                    start = time.perf_counter()
+                    count()
+                    latencies.append(time.perf_counter() - start)
+            finally:
+                connection.close()
+
+        # Leaving the override stops the flusher, which writes what is still pending.
+        with override_settings(VIDEO_COUNTER_FLUSH_INTERVAL=options['flush_interval']):
+            threads = [threading.Thread(target=client) for _ in range(options['clients'])]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+        report = summarize_latencies(latencies, elapsed)
+        expected = options['clients'] * options['events']
+        report.update({
+            'mode': mode,
+            'clients': options['clients'],
+            'persisted': Video.objects.get(pk=video.pk).view_count,
+            'expected': expected,
+        })
+        return report
@@ -0,0 +1,79 @@
+import json
+import time
+
+import numpy as np
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from utils.benchmarking import summarize_latencies
+from videos.feed import FeatureStore, generate_candidates, rank_feed, score_candidates
+
+
+class Command(BaseCommand):
+    """
+    Measure feed ranking latency with a fixed number of candidates per request.
+
+    Runs rank_feed against a synthetic feature store, so the database is not involved and
+    the figures cover candidate generation, vectorized scoring and ordering only. Every
+    source returns --candidates rows, so each request scores at least that many. Scoring
+    alone is also timed on exactly --candidates rows. The command exits with status 1 when
+    the p95 of a full ranking exceeds --budget-ms.
+    """
+
+    help = 'Benchmark For-You feed ranking for 10k candidates per request.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--videos', type=int, default=200_000)
+        parser.add_argument('--candidates', type=int, default=10_000)
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--budget-ms', type=float, default=20.0)
+
+    def handle(self, *args, **options):
+        store = self._synthetic_store(options['videos'])
+        user = AnonymousUser()
+        now = time.time()
+
+        with override_settings(FEED_CANDIDATES_PER_SOURCE=options['candidates']):
+            rows, boosts = generate_candidates(user, store)
+            rank_feed(user, store, now)
+
+            ranking = []
+            for _ in range(options['requests']):
+                start = time.perf_counter()
+                rank_feed(user, store, now)
+                ranking.append(time.perf_counter() - start)
+            candidates = len(generate_candidates(user, store)[0])
+
+        rows, boosts = rows[:options['candidates']], boosts[:options['candidates']]
+        scoring = []
+        for _ in range(options['requests']):
+            start = time.perf_counter()
+            score_candidates(store, rows, boosts, now)
+            scoring.append(time.perf_counter() - start)
+
+        report = {
+            'videos': options['videos'],
+            'candidates_per_request': candidates,
+            'rank_feed': summarize_latencies(ranking, sum(ranking)),
+            'score_only': summarize_latencies(scoring, sum(scoring)),
+        }
+        self.stdout.write(json.dumps(report, indent=2))
+
+        p95 = report['rank_feed']['p95_ms']
+        if p95 > options['budget_ms']:
+            self.stderr.write(f'p95 {p95:.2f}ms exceeds the {options["budget_ms"]}ms budget.')
+            raise SystemExit(1)
+
+    @staticmethod
+    def _synthetic_store(count):
+        rng = np.random.default_rng(0)
+        views = rng.lognormal(6, 2, count).round()
+        return FeatureStore(
+            ids=np.arange(1, count + 1, dtype=np.int64),
+            owner_ids=rng.integers(1, count // 10 + 2, count),
+            created=time.time() - rng.uniform(0, 30 * 24 * 3600, count),
+            views=views,
+            likes=(views * rng.beta(2, 20, count)).round(),
+            shares=(views * rng.beta(1, 100, count)).round(),
+        )
@@ -0,0 +1,87 @@
+import json
+import time
+from datetime import timedelta
+from statistics import median
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from utils.pagination import KeysetPagination, encode_cursor
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+
+
+class Command(BaseCommand):
+    """
+    Compare page fetch latency by keyset cursor and by OFFSET as clients scroll deeper.
+
+    Seeds enough ready videos for --depth pages, then fetches the page at several depths
+    both ways over the same ordered queryset: KeysetPagination with the cursor of the
+    previous page, and a plain [offset:offset + limit] slice. Keyset fetches should stay
+    flat while OFFSET grows with the depth. The seeded rows are rolled back.
+    """
+
+    help = 'Benchmark keyset pagination against OFFSET at increasing page depths.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--depth', type=int, default=10_000, help='Deepest page fetched.')
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        limit, deepest = options['limit'], options['depth']
+        depths = sorted({0, 1, deepest} | {depth for depth in (10, 100, 1000) if depth < deepest})
+
+        with transaction.atomic():
+            owner = CustomUser.objects.create(username='bench_pagination',
+                                              email='bench_pagination@example.com')
+            self._seed(owner, (deepest + 1) * limit)
+            queryset = Video.objects.filter(status=Video.Status.READY)
+            report = [self._bench_page(queryset, depth, limit, options['repeat'])
+                      for depth in depths]
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps(report, indent=2))
+
+    @classmethod
+    def _bench_page(cls, queryset, depth, limit, repeat):
+        ordered = queryset.order_by(*KeysetPagination.ordering)
+        offset = depth * limit
+        params = {'limit': limit}
+        if offset:
+            previous = ordered[offset - 1]
+            params['cursor'] = encode_cursor([previous.created_at, previous.id])
+        request = Request(APIRequestFactory().get('/videos/', params))
+
+        keyset = cls._time(lambda: KeysetPagination().paginate_queryset(queryset, request),
+                           repeat)
+        offset_ms = cls._time(lambda: list(ordered[offset:offset + limit]), repeat)
+        return {'page': depth, 'keyset_ms': keyset, 'offset_ms': offset_ms}
+
+    @staticmethod
+    def _seed(owner, count):
+        # auto_now_add would stamp every row with the same time; spread them one second apart.
+        field = Video._meta.get_field('created_at')
+        now = timezone.now()
+        field.auto_now_add = False
+        try:
+            Video.objects.bulk_create(
+                [Video(owner=owner, title=f'bench {index}', content_type='video/mp4', size=1,
+                       status=Video.Status.READY, created_at=now - timedelta(seconds=index))
+                 for index in range(count)],
+                batch_size=5000)
+        finally:
+            field.auto_now_add = True
+
+    @staticmethod
+    def _time(fetch, repeat):
+        fetch()
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fetch()
+            samples.append(time.perf_counter() - start)
+        return median(samples) * 1e3
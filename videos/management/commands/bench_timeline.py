@@ -0,0 +1,122 @@
+import json
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from utils.benchmarking import summarize_latencies
+from users.models.custom_user_models import CustomUser
+from users.models.follow_models import Follow
+from videos.models.inbox_models import InboxEntry
+from videos.models.video_models import Video
+from videos.timeline import fan_out, timeline_page
+
+
+class Command(BaseCommand):
+    """
+    Measure the cost of fanning a video out and the latency of reading a timeline.
+
+    Seeds a creator with --followers followers and times fan_out of one of their videos.
+    Then seeds a reader whose inbox holds --inbox entries and who also follows --mega
+    creators over the fan-out threshold, and times reading the first page and a page deep
+    in the timeline. The seeded rows are rolled back.
+    """
+
+    help = 'Benchmark timeline fan-out cost and inbox read latency.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--followers', type=int, default=20_000)
+        parser.add_argument('--inbox', type=int, default=20_000)
+        parser.add_argument('--mega', type=int, default=5)
+        parser.add_argument('--mega-videos', type=int, default=200, help='Videos per mega creator.')
+        parser.add_argument('--requests', type=int, default=200)
+
+    def handle(self, *args, **options):
+        with transaction.atomic(), override_settings(
+                TIMELINE_FANOUT_MAX_FOLLOWERS=options['followers']):
+            users = self._seed_users(options['followers'] + options['mega'] + 2)
+            creator, reader, followers = users[0], users[1], users[2:2 + options['followers']]
+            mega = users[2 + options['followers']:]
+
+            Follow.objects.bulk_create([Follow(follower=user, followee=creator)
+                                        for user in followers], batch_size=5000)
+            CustomUser.objects.filter(pk=creator.pk).update(follower_count=len(followers))
+            video = self._seed_videos(creator, 1)[0]
+
+            start = time.perf_counter()
+            written = fan_out(video.pk)
+            fan_out_s = time.perf_counter() - start
+
+            self._seed_timeline(reader, creator, mega, options)
+            first = self._time_reads(reader, None, options['requests'])
+            deep_cursor = self._cursor_at(reader, options['inbox'] // 2)
+            deep = self._time_reads(reader, deep_cursor, options['requests'])
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps({
+            'fan_out': {'followers': written, 'seconds': fan_out_s,
+                        'ms_per_1k_followers': fan_out_s * 1e3 / max(written, 1) * 1000},
+            'read_first_page': first,
+            'read_deep_page': deep,
+        }, indent=2))
+
+    @staticmethod
+    def _seed_users(count):
+        return CustomUser.objects.bulk_create(
+            [CustomUser(username=f'bench_timeline_{index}',
+                        email=f'bench_timeline_{index}@example.com') for index in range(count)],
+            batch_size=5000)
+
+    @staticmethod
+    def _seed_videos(owner, count):
+        # auto_now_add would stamp every row with the same time; spread them one second apart.
+        field = Video._meta.get_field('created_at')
+        now = timezone.now()
+        field.auto_now_add = False
+        try:
+            return Video.objects.bulk_create(
+                [Video(owner=owner, title=f'bench {index}', content_type='video/mp4', size=1,
+                       status=Video.Status.READY, created_at=now - timedelta(seconds=index))
+                 for index in range(count)],
+                batch_size=5000)
+        finally:
+            field.auto_now_add = True
+
+    def _seed_timeline(self, reader, creator, mega, options):
+        videos = self._seed_videos(creator, options['inbox'])
+        InboxEntry.objects.bulk_create(
+            [InboxEntry(user=reader, video=video, creator=creator, created_at=video.created_at)
+             for video in videos], batch_size=5000)
+        for user in mega:
+            self._seed_videos(user, options['mega_videos'])
+            Follow.objects.create(follower=reader, followee=user)
+        CustomUser.objects.filter(pk__in=[user.pk for user in mega]).update(
+            follower_count=options['followers'] + 1)
+
+    @staticmethod
+    def _cursor_at(reader, depth):
+        cursor, served = None, 0
+        factory = APIRequestFactory()
+        while served < depth:
+            params = {'limit': 100, **({'cursor': cursor} if cursor else {})}
+            videos, cursor = timeline_page(reader, Request(factory.get('/', params)))
+            served += len(videos)
+        return cursor
+
+    @staticmethod
+    def _time_reads(reader, cursor, repeat):
+        request = Request(APIRequestFactory().get('/', {'cursor': cursor} if cursor else {}))
+        timeline_page(reader, request)
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            timeline_page(reader, request)
+            latencies.append(time.perf_counter() - begin)
+        return summarize_latencies(latencies, time.perf_counter() - start)
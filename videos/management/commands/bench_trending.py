@@ -0,0 +1,122 @@
+import json
+import random
+import sys
+import time
+from collections import Counter
+from typing import List, NamedTuple
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from utils.benchmarking import peak_rss_mb, summarize_latencies
+from videos.trending import TrendingAggregator
+
+
+class _Stream(NamedTuple):
+    # Event i is a use of the hashtag names[ranks[i]] at times[i].
+    names: List[str]
+    ranks: np.ndarray
+    times: np.ndarray
+
+    def topics_since(self, start: float) -> Counter:
+        """
+        Count exactly the hashtags used from start on.
+        """
+        return Counter(self.names[rank] for rank in self.ranks[self.times >= start].tolist())
+
+
+class Command(BaseCommand):
+    """
+    Measure the trending aggregator against exact counting on a synthetic hashtag stream.
+
+    --events hashtag events drawn from a Zipf distribution over --topics hashtags are spread
+    evenly over --hours of simulated time and recorded in batches of --batch, as counter
+    flushes deliver them. Every trending window is then read and compared with an exact
+    Counter of the same events: precision of the top --limit, and the relative error of the
+    estimated weights. Nothing is written to the database.
+    """
+
+    help = 'Benchmark trending hashtag aggregation against exact counting.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=1_000_000)
+        parser.add_argument('--topics', type=int, default=100_000)
+        parser.add_argument('--hours', type=float, default=24)
+        parser.add_argument('--batch', type=int, default=500)
+        parser.add_argument('--zipf', type=float, default=1.2)
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        stream = self._stream(options)
+
+        with override_settings(TRENDING_SNAPSHOT_INTERVAL=10 ** 9):
+            aggregator = TrendingAggregator()
+            # Never sync: the bench measures counting, not the database.
+            aggregator.synced_at = time.monotonic()
+            record = self._record(aggregator, stream, options['batch'])
+
+            now = float(stream.times[-1])
+            windows = {name: self._accuracy(aggregator, name, stream, now, options['limit'])
+                       for name in settings.TRENDING_WINDOWS}
+
+        self.stdout.write(json.dumps({
+            'events': len(stream.ranks),
+            'distinct_topics': len(np.unique(stream.ranks)),
+            'record': record,
+            'windows': windows,
+        }, indent=2))
+
+    @staticmethod
+    def _stream(options):
+        rng = np.random.default_rng(options['seed'])
+        ranks = rng.zipf(options['zipf'], options['events'])
+        ranks = ranks[ranks <= options['topics']]
+        # Shuffle the names so the popular topics do not share a prefix.
+        names = [f'tag{index}' for index in range(options['topics'] + 1)]
+        random.Random(options['seed']).shuffle(names)
+        start_time = time.time() - options['hours'] * 3600
+        times = start_time + np.linspace(0, options['hours'] * 3600, len(ranks))
+        return _Stream(names, ranks, times)
+
+    @staticmethod
+    def _record(aggregator, stream, batch_size):
+        rss_before = peak_rss_mb()
+        latencies = []
+        begin = time.perf_counter()
+        for batch_start in range(0, len(stream.ranks), batch_size):
+            batch = stream.ranks[batch_start:batch_start + batch_size]
+            weights = Counter(stream.names[rank] for rank in batch.tolist())
+            started = time.perf_counter()
+            aggregator.record('hashtags', weights, now=float(stream.times[batch_start]))
+            latencies.append(time.perf_counter() - started)
+        record = summarize_latencies(latencies, time.perf_counter() - begin)
+        record.update({'events_per_second': len(stream.ranks) / (time.perf_counter() - begin),
+                       'peak_rss_growth_mb': peak_rss_mb() - rss_before})
+        return record
+
+    @staticmethod
+    def _accuracy(aggregator, name, stream, now, limit):
+        started = time.perf_counter()
+        top = aggregator.top('hashtags', name, limit, now=now)
+        top_ms = (time.perf_counter() - started) * 1e3
+
+        sketch = aggregator.shared['hashtags'][name]
+        # Events count towards the buckets that are still live, like the sketch's window.
+        first_live = (int(now // sketch.bucket_seconds) - sketch.slots + 1) * sketch.bucket_seconds
+        exact = stream.topics_since(first_live)
+        exact_top = {topic for topic, _ in exact.most_common(limit)}
+        errors = [(weight - exact[topic]) / exact[topic] for topic, weight in top]
+        candidates = sum(len(bucket) for bucket in sketch.candidates.values())
+
+        return {
+            'top_ms': top_ms,
+            'precision': len(exact_top & {topic for topic, _ in top}) / limit,
+            'max_relative_error': max(errors, default=0.0),
+            'sketch_mb': sum(bucket.table.nbytes for bucket in sketch.buckets.values()) / 2 ** 20,
+            'candidates': candidates,
+            'exact_counter_mb': (sys.getsizeof(exact)
+                                 + sum(sys.getsizeof(topic) for topic in exact)) / 2 ** 20,
+        }
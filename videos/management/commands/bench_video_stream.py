@@ -0,0 +1,133 @@
+import json
+import os
+import random
+import threading
+import time
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+
+from utils.benchmarking import peak_rss_mb, summarize_latencies
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+from videos.views.video_stream_view import VideoStreamAPIView
+
+
+class Command(BaseCommand):
+    """
+    Measure range-request throughput and memory with concurrent seeking clients.
+
+    Each client thread plays the same video with random seeks: mostly single ranges, and a
+    share of multi-range requests. With --transfer sendfile the responses are written the
+    way gunicorn's wsgi.file_wrapper does it, with os.sendfile from the file descriptor at
+    tell() for Content-Length bytes (into /dev/null). With --transfer iterate the body is
+    consumed through Python, as under servers without a sendfile path. The peak RSS shows
+    that memory does not grow with the file or range sizes. The video and its file are
+    deleted afterwards.
+    """
+
+    help = 'Benchmark the video streaming view with concurrent range requests.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size-mb', type=int, default=512)
+        parser.add_argument('--range-kb', type=int, default=1024)
+        parser.add_argument('--clients', type=int, default=8)
+        parser.add_argument('--requests', type=int, default=200, help='Requests per client.')
+        parser.add_argument('--multi-range-share', type=float, default=0.1)
+        parser.add_argument('--transfer', choices=['sendfile', 'iterate'], default='sendfile')
+
+    def handle(self, *args, **options):
+        size = options['size_mb'] * 1024 ** 2
+        owner, _ = CustomUser.objects.get_or_create(
+            username='bench_stream', defaults={'email': 'bench_stream@example.com'})
+        video = Video.objects.create(owner=owner, title='bench', content_type='video/mp4',
+                                     size=size, upload_offset=size, status=Video.Status.READY)
+        video.file.name = f'videos/{video.pk}/original.mp4'
+        video.save(update_fields=['file'])
+        self._write_file(default_storage.path(video.file.name), size)
+
+        view = VideoStreamAPIView.as_view()
+        latencies = []
+        transferred = []
+        rss_before = peak_rss_mb()
+
+        def client(seed):
+            rng = random.Random(seed)
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            try:
+                for _ in range(options['requests']):
+                    header = self._range_header(rng, size, options['range_kb'] * 1024,
+                                                options['multi_range_share'])
+                    start = time.perf_counter()
+                    nbytes = self._fetch(view, video.pk, header, options['transfer'], devnull)
+                    latencies.append(time.perf_counter() - start)
+                    transferred.append(nbytes)
+            finally:
+                os.close(devnull)
+                connection.close()
+
+        try:
+            elapsed = self._run_clients(client, options['clients'])
+        finally:
+            default_storage.delete(video.file.name)
+            video.delete()
+            owner.delete()
+
+        report = summarize_latencies(latencies, elapsed)
+        report.update({
+            'transfer': options['transfer'],
+            'clients': options['clients'],
+            'file_mb': options['size_mb'],
+            'range_kb': options['range_kb'],
+            'throughput_mb_s': sum(transferred) / 1024 ** 2 / elapsed,
+            'peak_rss_before_mb': rss_before,
+            'peak_rss_after_mb': peak_rss_mb(),
+        })
+        self.stdout.write(json.dumps(report, indent=2))
+
+    @staticmethod
+    def _run_clients(client, count):
+        threads = [threading.Thread(target=client, args=(seed,)) for seed in range(count)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+    @staticmethod
+    def _write_file(path, size):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        block = os.urandom(1024 ** 2)
+        with open(path, 'wb') as file:
+            for _ in range(size // len(block)):
+                file.write(block)
+            file.write(block[:size % len(block)])
+
+    @staticmethod
+    def _range_header(rng, size, length, multi_range_share):
+        parts = 3 if rng.random() < multi_range_share else 1
+        ranges = []
+        for _ in range(parts):
+            start = rng.randrange(0, max(size - length, 1))
+            ranges.append(f'{start}-{start + length - 1}')
+        return 'bytes=' + ','.join(ranges)
+
+    @staticmethod
+    def _fetch(view, video_id, header, transfer, devnull):
+        request = APIRequestFactory().get(f'/videos/{video_id}/stream/', HTTP_RANGE=header)
+        response = view(request, video_id=video_id)
+        try:
+            file = getattr(response, 'file_to_stream', None)
+            if transfer == 'sendfile' and file is not None:
+                offset, remaining = file.tell(), int(response['Content-Length'])
+                while remaining:
+                    sent = os.sendfile(devnull, file.fileno(), offset, remaining)
+                    offset += sent
+                    remaining -= sent
+                return int(response['Content-Length'])
+            return sum(len(chunk) for chunk in response.streaming_content)
+        finally:
+            response.close()
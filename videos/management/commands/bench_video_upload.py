@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import time
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.management.base import BaseCommand
+from rest_framework.test import force_authenticate
+
+from utils.benchmarking import peak_rss_mb
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+from videos.uploads import create_partial, discard_upload
+from videos.views.video_upload_view import VideoUploadAPIView
+
+
+class _PatternStream:
+    """
+    File-like body producing length bytes of a repeated random block, starting at position,
+    without holding the chunk in memory.
+    """
+
+    def __init__(self, block: bytes, length: int, position: int = 0) -> None:
+        self.block = block
+        self.remaining = length
+        self.position = position
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Return the next size bytes of the pattern, or all that remain when size is negative.
+        """
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        out = bytearray()
+        while len(out) < size:
+            offset = self.position % len(self.block)
+            piece = self.block[offset:offset + size - len(out)]
+            out += piece
+            self.position += len(piece)
+        self.remaining -= size
+        return bytes(out)
+
+    def readline(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+
+class Command(BaseCommand):
+    """
+    Upload a multi-gigabyte video through the chunk endpoint and report throughput and RSS.
+
+    Request bodies are generated on the fly and fed to the view as a WSGI input stream, so
+    the benchmark itself holds no chunk in memory and the peak RSS reflects the server side
+    only. The video, its row and its file are deleted afterwards.
+    """
+
+    help = 'Measure chunked upload throughput and peak RSS for a large video.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size-mb', type=int, default=2048)
+        parser.add_argument('--chunk-mb', type=int, default=32)
+
+    def handle(self, *args, **options):
+        size = options['size_mb'] * 1024 ** 2
+        chunk_size = options['chunk_mb'] * 1024 ** 2
+        block = os.urandom(1024 ** 2 + 7)
+
+        owner, _ = CustomUser.objects.get_or_create(
+            username='bench_upload', defaults={'email': 'bench_upload@example.com'})
+        video = Video.objects.create(owner=owner, title='bench', content_type='video/mp4',
+                                     size=size)
+        create_partial(video)
+
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+        try:
+            rss_samples = self._upload(video, block, chunk_size)
+            elapsed = time.perf_counter() - start
+        finally:
+            video.refresh_from_db()
+            if video.file:
+                video.file.delete(save=False)
+            discard_upload(video)
+            video.delete()
+            owner.delete()
+
+        self.stdout.write(json.dumps({
+            'size_mb': options['size_mb'],
+            'chunk_mb': options['chunk_mb'],
+            'chunks': len(rss_samples),
+            'throughput_mb_s': options['size_mb'] / elapsed,
+            'peak_rss_before_mb': rss_before,
+            'peak_rss_after_first_chunk_mb': rss_samples[0],
+            'peak_rss_after_last_chunk_mb': rss_samples[-1],
+        }, indent=2))
+
+    @classmethod
+    def _upload(cls, video, block, chunk_size):
+        view = VideoUploadAPIView.as_view()
+        rss_samples = []
+        for offset in range(0, video.size, chunk_size):
+            request = cls._request(video, block, offset, min(chunk_size, video.size - offset))
+            force_authenticate(request, video.owner)
+
+            response = view(request, video_id=video.pk)
+            if response.status_code != 200:
+                raise RuntimeError(f'Chunk at {offset} failed: {response.data}')
+            rss_samples.append(peak_rss_mb())
+        return rss_samples
+
+    @staticmethod
+    def _checksum(block, offset, length):
+        stream = _PatternStream(block, length, offset)
+        digest = hashlib.sha256()
+        while True:
+            piece = stream.read(1024 ** 2)
+            if not piece:
+                return digest.hexdigest()
+            digest.update(piece)
+
+    @classmethod
+    def _request(cls, video, block, offset, length):
+        stream = _PatternStream(block, length, offset)
+        return WSGIRequest({
+            'REQUEST_METHOD': 'PUT',
+            'PATH_INFO': f'/videos/uploads/{video.pk}/',
+            'SERVER_NAME': 'testserver',
+            'SERVER_PORT': '80',
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': stream,
+            'CONTENT_TYPE': 'application/octet-stream',
+            'CONTENT_LENGTH': str(length),
+            'HTTP_CONTENT_RANGE': f'bytes {offset}-{offset + length - 1}/{video.size}',
+            'HTTP_X_CHUNK_CHECKSUM': cls._checksum(block, offset, length),
+        })
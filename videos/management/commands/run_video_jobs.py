@@ -0,0 +1,41 @@
+import json
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from videos.jobs import JobScheduler, queue_stats
+
+
+class Command(BaseCommand):
+    """
+    Run the video processing worker.
+
+    Claims jobs from the VideoJob table and runs them on a pool of worker processes until
+    interrupted. SIGINT and SIGTERM stop claiming new jobs and wait for the running ones.
+    Several instances can run side by side, on one host or many.
+    """
+
+    help = 'Process queued video jobs (probe, transcode, thumbnail).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Pool size. Defaults to VIDEO_JOB_WORKERS.')
+        parser.add_argument('--drain', action='store_true',
+                            help='Exit once no job is running or runnable.')
+        parser.add_argument('--stats', action='store_true',
+                            help='Print queue depth and job latency, then exit.')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.stdout.write(json.dumps(queue_stats(), indent=2))
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop.set())
+
+        scheduler = JobScheduler(workers=options['workers'])
+        self.stdout.write(f'Processing video jobs as {scheduler.worker_id}')
+        scheduler.run(stop, drain=options['drain'])
+        self.stdout.write(json.dumps(scheduler.stats(), indent=2))
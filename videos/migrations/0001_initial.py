@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Video',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=150, verbose_name='title')),
+                ('description', models.TextField(blank=True, max_length=2200, verbose_name='description')),
+                ('file', models.FileField(blank=True, upload_to='videos/', verbose_name='file')),
+                ('content_type', models.CharField(max_length=50, verbose_name='content type')),
+                ('size', models.BigIntegerField(verbose_name='size')),
+                ('upload_offset', models.BigIntegerField(default=0, verbose_name='upload offset')),
+                ('status', models.CharField(choices=[('uploading', 'uploading'), ('uploaded', 'uploaded')], default='uploading', max_length=20, verbose_name='status')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='videos', to=settings.AUTH_USER_MODEL, verbose_name='owner')),
+            ],
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:26
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='metadata',
+            field=models.JSONField(blank=True, default=dict, verbose_name='metadata'),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, verbose_name='renditions'),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='thumbnail',
+            field=models.FileField(blank=True, upload_to='videos/', verbose_name='thumbnail'),
+        ),
+        migrations.AlterField(
+            model_name='video',
+            name='status',
+            field=models.CharField(choices=[('uploading', 'uploading'), ('uploaded', 'uploaded'), ('processing', 'processing'), ('ready', 'ready'), ('failed', 'failed')], default='uploading', max_length=20, verbose_name='status'),
+        ),
+        migrations.CreateModel(
+            name='VideoJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_type', models.CharField(choices=[('probe', 'probe'), ('transcode', 'transcode'), ('thumbnail', 'thumbnail')], max_length=20, verbose_name='job type')),
+                ('priority', models.SmallIntegerField(choices=[(0, 'high'), (50, 'normal'), (100, 'low')], default=50, verbose_name='priority')),
+                ('status', models.CharField(choices=[('queued', 'queued'), ('running', 'running'), ('succeeded', 'succeeded'), ('failed', 'failed')], default='queued', max_length=20, verbose_name='status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='attempts')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='max attempts')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='run after')),
+                ('leased_until', models.DateTimeField(blank=True, null=True, verbose_name='leased until')),
+                ('worker', models.CharField(blank=True, max_length=100, verbose_name='worker')),
+                ('last_error', models.TextField(blank=True, verbose_name='last error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='started at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='finished at')),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='videos.video', verbose_name='video')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'priority', 'run_after'], name='videojob_claim_idx'), models.Index(fields=['status', 'leased_until'], name='videojob_lease_idx')],
+            },
+        ),
+    ]
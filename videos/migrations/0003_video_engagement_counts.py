@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0002_video_processing'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='like_count',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='like count'),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='share_count',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='share count'),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='view_count',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='view count'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['status', 'created_at'], name='video_status_created_idx'),
+        ),
+    ]
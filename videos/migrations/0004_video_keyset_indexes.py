@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0003_video_engagement_counts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='video',
+            name='video_status_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='video_status_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['owner', '-created_at', '-id'], name='video_owner_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0005_video_like'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InboxEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(verbose_name='created at')),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='creator')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inbox_entries', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inbox_entries', to='videos.video', verbose_name='video')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-created_at', '-video'], name='inbox_user_recent_idx'), models.Index(fields=['user', 'creator'], name='inbox_user_creator_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'video'), name='inbox_unique_user_video')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+import utils.migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('videos', '0006_inbox_entry'),
+    ]
+
+    operations = [
+        utils.migrations.PostgresIndexConcurrently(
+            model_name='video',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='simple', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='simple', weight='B'), django.contrib.postgres.search.SearchConfig('simple')), name='video_search_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0007_video_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendingSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20, unique=True, verbose_name='kind')),
+                ('state', models.BinaryField(verbose_name='state')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='sound',
+            field=models.CharField(blank=True, max_length=150, verbose_name='sound'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0008_trending'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Comment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField(max_length=500, verbose_name='text')),
+                ('reply_count', models.PositiveIntegerField(default=0, verbose_name='reply count')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to=settings.AUTH_USER_MODEL, verbose_name='author')),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='replies', to='videos.comment', verbose_name='parent')),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='videos.video', verbose_name='video')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('parent__isnull', True)), fields=['video', '-created_at', '-id'], name='comment_top_level_idx'), models.Index(fields=['parent', 'created_at', 'id'], name='comment_replies_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,6 @@
+from .video_models import Video  # pylint: disable=unused-import
+from .video_job_models import VideoJob  # pylint: disable=unused-import
+from .video_like_models import VideoLike  # pylint: disable=unused-import
+from .inbox_models import InboxEntry  # pylint: disable=unused-import
+from .trending_models import TrendingSnapshot  # pylint: disable=unused-import
+from .comment_models import Comment  # pylint: disable=unused-import
@@ -0,0 +1,38 @@
+from django.db import models
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+
+from videos.models.video_models import Video
+
+
+class Comment(models.Model):
+    """
+    A comment on a video, or a reply to one.
+
+    Threads are one level deep: a reply's parent is always a top-level comment, and replies
+    to replies are attached to the same top-level comment (videos.comments). The number of
+    replies is kept on the parent in reply_count, so a page of comments shows its reply
+    counts without counting rows.
+    """
+
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='comments',
+                              verbose_name=_("video"))
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                               related_name='comments', verbose_name=_("author"))
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True,
+                               related_name='replies', verbose_name=_("parent"))
+    text = models.TextField(_("text"), max_length=500)
+    reply_count = models.PositiveIntegerField(_("reply count"), default=0)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of a video's top-level comments, newest first, and of a
+            # comment's replies, oldest first (utils.pagination).
+            models.Index(fields=['video', '-created_at', '-id'],
+                         condition=models.Q(parent__isnull=True), name='comment_top_level_idx'),
+            models.Index(fields=['parent', 'created_at', 'id'], name='comment_replies_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.author_id} on #{self.video_id}: {self.text[:50]}'
@@ -0,0 +1,36 @@
+from django.db import models
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+
+from videos.models.video_models import Video
+
+
+class InboxEntry(models.Model):
+    """
+    A video in a user's materialized following timeline.
+
+    Written by fan-out when a followed creator's video becomes ready (videos.timeline), so
+    reading the timeline is one index range scan per page instead of a join over the follow
+    graph. created_at copies the video's, so entries sort like the videos; the creator is
+    kept to drop their entries when the user unfollows them.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                             related_name='inbox_entries', verbose_name=_("user"))
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='inbox_entries',
+                              verbose_name=_("video"))
+    creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                                related_name='+', verbose_name=_("creator"))
+    created_at = models.DateTimeField(_("created at"))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'video'], name='inbox_unique_user_video'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-video'], name='inbox_user_recent_idx'),
+            models.Index(fields=['user', 'creator'], name='inbox_user_creator_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'#{self.video_id} for {self.user_id}'
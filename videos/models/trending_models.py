@@ -0,0 +1,19 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class TrendingSnapshot(models.Model):
+    """
+    The shared state of the trending aggregator (videos.trending) for one kind of topic.
+
+    Workers merge the sketches of the events they counted into this row and load the
+    merged result back, so every worker serves the same trends and a restart resumes from
+    the last snapshot instead of replaying events.
+    """
+
+    kind = models.CharField(_("kind"), max_length=20, unique=True)
+    state = models.BinaryField(_("state"))
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    def __str__(self) -> str:
+        return self.kind
@@ -0,0 +1,57 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from videos.models.video_models import Video
+
+
+class VideoJob(models.Model):
+    """
+    A unit of background processing for a video, claimed by run_video_jobs workers.
+
+    Jobs are picked by priority lane, then by when they became runnable. A claimed job
+    holds a lease that its worker renews while it runs; a job whose lease expired belonged
+    to a worker that died and is put back in the queue.
+    """
+
+    class JobType(models.TextChoices):  # pylint: disable=too-many-ancestors
+        PROBE = 'probe', _('probe')
+        TRANSCODE = 'transcode', _('transcode')
+        THUMBNAIL = 'thumbnail', _('thumbnail')
+
+    class Priority(models.IntegerChoices):  # pylint: disable=too-many-ancestors
+        HIGH = 0, _('high')
+        NORMAL = 50, _('normal')
+        LOW = 100, _('low')
+
+    class Status(models.TextChoices):  # pylint: disable=too-many-ancestors
+        QUEUED = 'queued', _('queued')
+        RUNNING = 'running', _('running')
+        SUCCEEDED = 'succeeded', _('succeeded')
+        FAILED = 'failed', _('failed')
+
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='jobs',
+                              verbose_name=_("video"))
+    job_type = models.CharField(_("job type"), max_length=20, choices=JobType.choices)
+    priority = models.SmallIntegerField(_("priority"), choices=Priority.choices,
+                                        default=Priority.NORMAL)
+    status = models.CharField(_("status"), max_length=20, choices=Status.choices,
+                              default=Status.QUEUED)
+    attempts = models.PositiveSmallIntegerField(_("attempts"), default=0)
+    max_attempts = models.PositiveSmallIntegerField(_("max attempts"), default=3)
+    run_after = models.DateTimeField(_("run after"), default=timezone.now)
+    leased_until = models.DateTimeField(_("leased until"), null=True, blank=True)
+    worker = models.CharField(_("worker"), max_length=100, blank=True)
+    last_error = models.TextField(_("last error"), blank=True)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    started_at = models.DateTimeField(_("started at"), null=True, blank=True)
+    finished_at = models.DateTimeField(_("finished at"), null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'priority', 'run_after'], name='videojob_claim_idx'),
+            models.Index(fields=['status', 'leased_until'], name='videojob_lease_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.job_type} #{self.video_id}'
@@ -0,0 +1,28 @@
+from django.db import models
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+
+from videos.models.video_models import Video
+
+
+class VideoLike(models.Model):
+    """
+    A user's like of a video.
+
+    The row makes likes idempotent per user; the like count shown on the video is kept
+    in Video.like_count by the write-behind counters (videos.counters).
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                             related_name='video_likes', verbose_name=_("user"))
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='likes',
+                              verbose_name=_("video"))
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'video'], name='videolike_unique_user_video'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.user_id} likes #{self.video_id}'
@@ -0,0 +1,62 @@
+from django.db import models
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.utils.translation import gettext_lazy as _
+
+from utils.search import search_vector
+
+
+# Full-text document of a video caption (videos.views.video_search_view).
+VIDEO_SEARCH_VECTOR = search_vector(('title', 'A'), ('description', 'B'))
+
+
+class Video(models.Model):
+    """
+    A video uploaded by a user.
+
+    Uploads are chunked: the row is created first with the declared size, then chunks are
+    written into a partial file and upload_offset records how many bytes are durably on
+    disk. Once the offset reaches the size the partial file is moved into place as `file`
+    and background jobs (videos.jobs) probe, transcode and thumbnail it.
+    """
+
+    class Status(models.TextChoices):  # pylint: disable=too-many-ancestors
+        UPLOADING = 'uploading', _('uploading')
+        UPLOADED = 'uploaded', _('uploaded')
+        PROCESSING = 'processing', _('processing')
+        READY = 'ready', _('ready')
+        FAILED = 'failed', _('failed')
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='videos',
+        verbose_name=_("owner"))
+    title = models.CharField(_("title"), max_length=150)
+    description = models.TextField(_("description"), max_length=2200, blank=True)
+    # The name of the soundtrack the video uses, counted by the trending sounds.
+    sound = models.CharField(_("sound"), max_length=150, blank=True)
+    file = models.FileField(_("file"), upload_to='videos/', blank=True)
+    content_type = models.CharField(_("content type"), max_length=50)
+    size = models.BigIntegerField(_("size"))
+    upload_offset = models.BigIntegerField(_("upload offset"), default=0)
+    status = models.CharField(
+        _("status"), max_length=20, choices=Status.choices, default=Status.UPLOADING)
+    metadata = models.JSONField(_("metadata"), default=dict, blank=True)
+    renditions = models.JSONField(_("renditions"), default=dict, blank=True)
+    thumbnail = models.FileField(_("thumbnail"), upload_to='videos/', blank=True)
+    view_count = models.PositiveBigIntegerField(_("view count"), default=0)
+    like_count = models.PositiveBigIntegerField(_("like count"), default=0)
+    share_count = models.PositiveBigIntegerField(_("share count"), default=0)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination on (created_at, id) of the video listings (utils.pagination),
+            # and the feed features of the recent window (videos.feed).
+            models.Index(fields=['status', '-created_at', '-id'], name='video_status_recent_idx'),
+            models.Index(fields=['owner', '-created_at', '-id'], name='video_owner_recent_idx'),
+            GinIndex(VIDEO_SEARCH_VECTOR, name='video_search_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return self.title
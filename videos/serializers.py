@@ -0,0 +1,67 @@
+from rest_framework import serializers
+from django.conf import settings
+
+from users.serializers import AuthorSerializer
+from videos.models.comment_models import Comment
+from videos.models.video_models import Video
+from videos.constants import UPLOAD_SIZE_ERROR, UNSUPPORTED_CONTENT_TYPE_ERROR
+
+
+class VideoSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the Video model.
+
+    Only the descriptive fields and the declared size and content type are writable, and
+    only when the upload is created; the owner comes from the request and the upload state
+    is maintained by the chunk endpoint.
+
+    Methods:
+    - validate_size(value: int) -> int: Reject sizes above VIDEO_UPLOAD_MAX_SIZE.
+    - validate_content_type(value: str) -> str: Reject types not in VIDEO_UPLOAD_CONTENT_TYPES.
+    """
+
+    class Meta:
+        model = Video
+        fields = ['id', 'owner', 'title', 'description', 'sound', 'content_type', 'size',
+                  'upload_offset', 'status', 'file', 'created_at']
+        read_only_fields = ['id', 'owner', 'upload_offset', 'status', 'file', 'created_at']
+
+    def validate_size(self, value: int) -> int:
+        if not 0 < value <= settings.VIDEO_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(UPLOAD_SIZE_ERROR % settings.VIDEO_UPLOAD_MAX_SIZE)
+        return value
+
+    def validate_content_type(self, value: str) -> str:
+        if value not in settings.VIDEO_UPLOAD_CONTENT_TYPES:
+            allowed = ', '.join(sorted(settings.VIDEO_UPLOAD_CONTENT_TYPES))
+            raise serializers.ValidationError(UNSUPPORTED_CONTENT_TYPE_ERROR % allowed)
+        return value
+
+
+class VideoListSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for the videos of the feed and the video listings.
+    """
+
+    class Meta:
+        model = Video
+        fields = ['id', 'owner', 'title', 'description', 'sound', 'status', 'thumbnail',
+                  'renditions', 'view_count', 'like_count', 'share_count', 'created_at']
+        read_only_fields = fields
+
+
+class CommentSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the Comment model.
+
+    Only the text is writable; the video, the author and the parent come from the request.
+    The author is rendered by AuthorSerializer from the prefetched user
+    (videos.comments.with_authors).
+    """
+
+    author = AuthorSerializer(read_only=True)
+
+    class Meta:
+        model = Comment
+        fields = ['id', 'video', 'parent', 'author', 'text', 'reply_count', 'created_at']
+        read_only_fields = ['id', 'video', 'parent', 'author', 'reply_count', 'created_at']
@@ -0,0 +1,177 @@
+import mmap
+import os
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from django.utils.http import http_date, parse_http_date_safe
+
+
+ByteRange = Tuple[int, int]
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[List[ByteRange]]:
+    """
+    Parse a `Range: bytes=...` header against a representation of the given size.
+
+    Ranges are resolved to inclusive (first, last) offsets, sorted, and overlapping or
+    adjacent ranges are coalesced. Unsatisfiable ranges are dropped.
+
+    Args:
+        header (Optional[str]): The raw Range header.
+        size (int): The size of the file in bytes.
+
+    Returns:
+        Optional[List[ByteRange]]: The ranges to serve, an empty list if none of them can
+        be satisfied (416), or None if the header is missing or malformed and must be
+        ignored (200).
+    """
+    if not header:
+        return None
+
+    unit, _, specs = header.partition('=')
+    if unit.strip().lower() != 'bytes' or not specs.strip():
+        return None
+
+    ranges = []
+    for spec in specs.split(','):
+        first, dash, last = spec.strip().partition('-')
+        if not dash or not (first + last).isdigit():
+            return None
+
+        if not first:
+            # Suffix range: the last N bytes.
+            length = int(last)
+            if length and size:
+                ranges.append((max(size - length, 0), size - 1))
+            continue
+
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start < size:
+            ranges.append((start, min(int(last), size - 1) if last else size - 1))
+
+    ranges.sort()
+    merged: List[ByteRange] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def file_validators(stat: os.stat_result) -> Tuple[str, str]:
+    """
+    Build the strong ETag and the Last-Modified date of a file.
+
+    Args:
+        stat (os.stat_result): The result of os.stat for the file.
+
+    Returns:
+        Tuple[str, str]: The quoted ETag and the HTTP date of the last modification.
+    """
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"', http_date(stat.st_mtime)
+
+
+def if_range_matches(header: Optional[str], etag: str, last_modified: str) -> bool:
+    """
+    Evaluate an If-Range precondition.
+
+    Only a strong ETag or the exact Last-Modified date match; anything else means the
+    client's cached copy is stale and the full file must be sent.
+
+    Args:
+        header (Optional[str]): The raw If-Range header.
+        etag (str): The current ETag.
+        last_modified (str): The current Last-Modified date.
+
+    Returns:
+        bool: Whether the Range header should be honoured.
+    """
+    if header is None:
+        return True
+
+    header = header.strip()
+    if header.startswith(('"', 'W/')):
+        return header == etag
+
+    date = parse_http_date_safe(header)
+    return date is not None and date == parse_http_date_safe(last_modified)
+
+
+class FileRange:
+    """
+    Read-only view of one byte range of an open file.
+
+    Handed to FileResponse so that WSGI servers with a sendfile-capable wsgi.file_wrapper
+    (gunicorn) send the range straight from the page cache: they take the offset from
+    tell() and the length from Content-Length. Other servers fall back to read(), which
+    never returns bytes past the end of the range.
+
+    Methods:
+    - read(size) -> bytes: Read up to size bytes without leaving the range.
+    - tell() -> int: Return the absolute position in the underlying file.
+    - fileno() -> int: Return the underlying file descriptor.
+    - close() -> None: Close the underlying file.
+    """
+
+    def __init__(self, file: BinaryIO, start: int, end: int) -> None:
+        self.file = file
+        self.remaining = end - start + 1
+        file.seek(start)
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        chunk = self.file.read(size)
+        self.remaining -= len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class MultipartRanges:
+    """
+    multipart/byteranges body for several ranges of a file, served from a memory map.
+
+    Parts are sliced from the map block by block, so memory use stays at one block however
+    large the ranges are, and the pages come straight from the page cache. The exact body
+    length is known upfront for the Content-Length header. StreamingHttpResponse closes the
+    file through close() once the response is done, even if the body was never iterated.
+
+    Methods:
+    - __iter__() -> Iterator[bytes]: Yield the body.
+    - close() -> None: Close the underlying file.
+    """
+
+    def __init__(self, file: BinaryIO, ranges: List[ByteRange], size: int, content_type: str,
+                 boundary: str, block_size: int) -> None:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.file = file
+        self.ranges = ranges
+        self.block_size = block_size
+        self.headers = [(f'--{boundary}\r\nContent-Type: {content_type}\r\n'
+                         f'Content-Range: bytes {start}-{end}/{size}\r\n\r\n').encode('ascii')
+                        for start, end in ranges]
+        self.closing = f'\r\n--{boundary}--\r\n'.encode('ascii')
+        self.length = (sum(len(header) + end - start + 1
+                           for header, (start, end) in zip(self.headers, ranges))
+                       + 2 * (len(ranges) - 1) + len(self.closing))
+
+    def __iter__(self) -> Iterator[bytes]:
+        with mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for index, ((start, end), header) in enumerate(zip(self.ranges, self.headers)):
+                yield (b'\r\n' + header) if index else header
+                for offset in range(start, end + 1, self.block_size):
+                    yield mapped[offset:min(offset + self.block_size, end + 1)]
+        yield self.closing
+
+    def close(self) -> None:
+        self.file.close()
@@ -0,0 +1,224 @@
+import threading
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+
+from utils.counters import CacheCounterBackend, InMemoryCounterBackend
+from users.models.custom_user_models import CustomUser
+from videos.counters import (CounterFlusher, _bulk_increments, flush_counters,
+                             get_counter_backend, increment, pending_counts, with_pending_counts)
+from videos.models.video_models import Video
+
+
+class InMemoryCounterBackendTest(TestCase):
+    """
+    Test module for the InMemoryCounterBackend class.
+    """
+
+    def test_coalesces_and_drains(self):
+        """
+        Ensure that increments are summed per key and drained once.
+        """
+
+        backend = InMemoryCounterBackend()
+        for amount in (1, 1, 3):
+            backend.add('a', amount)
+        backend.add('b', 2)
+        backend.add('b', -2)
+
+        self.assertEqual(backend.pending(['a', 'c']), {'a': 5})
+        self.assertEqual(backend.drain(), {'a': 5})
+        self.assertEqual(backend.drain(), {})
+
+    def test_restore_merges_with_new_increments(self):
+        """
+        Ensure that restored deltas add up with increments made since the drain.
+        """
+
+        backend = InMemoryCounterBackend()
+        backend.add('a', 2)
+        deltas = backend.drain()
+        backend.add('a', 1)
+
+        backend.restore(deltas)
+
+        self.assertEqual(backend.pending(['a']), {'a': 3})
+
+
+class CacheCounterBackendTest(TestCase):
+    """
+    Test module for the CacheCounterBackend class, backed by the local-memory cache.
+    """
+
+    def setUp(self):
+        self.now = 1000.0
+        self.backend = CacheCounterBackend(period=10, timer=lambda: self.now)
+        self.backend.clear()
+
+    def test_drains_ended_epochs_once(self):
+        """
+        Ensure that an epoch is drained a full period after it ended, and only once.
+        """
+
+        self.backend.add('a')
+        self.backend.add('a', 4)
+        self.backend.add('b')
+        self.now = 1010.0
+        self.backend.add('a')
+
+        self.assertEqual(self.backend.drain(), {})
+        self.assertEqual(self.backend.pending(['a', 'b']), {'a': 6, 'b': 1})
+
+        self.now = 1025.0
+        self.assertEqual(self.backend.drain(), {'a': 5, 'b': 1})
+        self.assertEqual(self.backend.drain(), {})
+        self.assertEqual(self.backend.pending(['a', 'b']), {'a': 1})
+
+    def test_workers_share_deltas(self):
+        """
+        Ensure that deltas counted by one worker are drained by another, exactly once.
+        """
+
+        other = CacheCounterBackend(period=10, timer=lambda: self.now)
+        self.backend.add('a', 2)
+        other.add('a', 3)
+        self.now = 1030.0
+
+        self.assertEqual(other.drain(), {'a': 5})
+        self.assertEqual(self.backend.drain(), {})
+
+    def test_clear_keeps_other_cache_entries(self):
+        """
+        Ensure that clearing forgets the pending deltas but not the rest of the cache.
+        """
+
+        cache.set('unrelated', 1)
+        self.backend.add('a')
+        self.backend.clear()
+        self.now = 1030.0
+
+        self.assertEqual(self.backend.pending(['a']), {})
+        self.assertEqual(self.backend.drain(), {})
+        self.assertEqual(cache.get('unrelated'), 1)
+
+
+@override_settings(VIDEO_COUNTER_FLUSH_INTERVAL=0, VIDEO_COUNTER_FLUSH_BATCH=2)
+class VideoCountersTest(TestCase):
+    """
+    Test module for the write-behind video counters.
+    """
+
+    def setUp(self):
+        owner = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.videos = [
+            Video.objects.create(owner=owner, title=f'Video {index}', content_type='video/mp4',
+                                 size=1, status=Video.Status.READY, view_count=10, like_count=1)
+            for index in range(3)
+        ]
+        get_counter_backend().clear()
+
+    def test_flush_applies_coalesced_deltas(self):
+        """
+        Ensure that pending deltas are written in bulk and cleared.
+        """
+
+        first, second, third = self.videos
+        for _ in range(5):
+            increment(first.pk, 'view_count')
+        increment(second.pk, 'share_count', 2)
+        increment(third.pk, 'like_count')
+        increment(third.pk, 'view_count')
+
+        with self.assertNumQueries(2):
+            self.assertEqual(flush_counters(), 3)
+
+        counts = Video.objects.order_by('pk').values_list('view_count', 'like_count',
+                                                          'share_count')
+        self.assertEqual(list(counts), [(15, 1, 0), (10, 1, 2), (11, 2, 0)])
+        self.assertEqual(pending_counts(video.pk for video in self.videos), {})
+        self.assertEqual(flush_counters(), 0)
+
+    def test_decrements_do_not_go_below_zero(self):
+        """
+        Ensure that a decrement whose increment was lost leaves the counter at zero.
+        """
+
+        increment(self.videos[0].pk, 'like_count', -3)
+
+        flush_counters()
+
+        self.assertEqual(Video.objects.get(pk=self.videos[0].pk).like_count, 0)
+
+    def test_failed_flush_restores_deltas(self):
+        """
+        Ensure that the deltas of the batches not written are kept for the next flush.
+        """
+
+        for video in self.videos:
+            increment(video.pk, 'view_count', 4)
+        batches = [_bulk_increments, mock.Mock(side_effect=DatabaseError)]
+
+        def next_batch(*args):
+            return batches.pop(0)(*args)
+
+        with mock.patch('videos.counters._bulk_increments', side_effect=next_batch):
+            with self.assertRaises(DatabaseError):
+                flush_counters()
+
+        self.assertEqual(Video.objects.get(pk=self.videos[1].pk).view_count, 14)
+        self.assertEqual(pending_counts(video.pk for video in self.videos),
+                         {self.videos[2].pk: {'view_count': 4}})
+
+    def test_reads_merge_pending_deltas(self):
+        """
+        Ensure that loaded videos show their persisted counts plus the unflushed deltas.
+        """
+
+        increment(self.videos[1].pk, 'view_count', 3)
+
+        videos = with_pending_counts(list(Video.objects.order_by('pk')))
+
+        self.assertEqual([video.view_count for video in videos], [10, 13, 10])
+
+    def test_settings_change_flushes_the_old_backend(self):
+        """
+        Ensure that the flusher is stopped, with a last flush, before its backend is dropped.
+        """
+
+        with override_settings(VIDEO_COUNTER_FLUSH_INTERVAL=60):
+            increment(self.videos[0].pk, 'view_count', 2)
+
+        self.assertEqual(Video.objects.get(pk=self.videos[0].pk).view_count, 12)
+
+    def test_unknown_counter(self):
+        """
+        Ensure that only the counter fields can be incremented.
+        """
+
+        with self.assertRaises(ValueError):
+            increment(self.videos[0].pk, 'size')
+
+
+class CounterFlusherTest(TestCase):
+    """
+    Test module for the CounterFlusher class.
+    """
+
+    def test_wake_flushes_before_interval(self):
+        """
+        Ensure that waking the flusher flushes without waiting for the interval, and that
+        stopping it flushes what is left.
+        """
+
+        flushed = threading.Event()
+        with mock.patch('videos.counters.flush_counters', side_effect=flushed.set) as flush:
+            flusher = CounterFlusher(interval=60)
+            flusher.start()
+            flusher.wake()
+
+            self.assertTrue(flushed.wait(5))
+            flusher.stop()
+
+        self.assertEqual(flush.call_count, 2)
@@ -0,0 +1,132 @@
+import time
+from datetime import timedelta
+
+import numpy as np
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from users.models.custom_user_models import CustomUser
+from videos.feed import (FeatureStore, generate_candidates, get_feature_store, position_after,
+                         rank_feed, score_candidates)
+from videos.models.video_models import Video
+
+
+def make_store(views, likes, shares, age_hours, owner_ids=None):
+    count = len(views)
+    return FeatureStore(
+        ids=np.arange(1, count + 1, dtype=np.int64),
+        owner_ids=np.asarray(owner_ids if owner_ids is not None else [1] * count, dtype=np.int64),
+        created=time.time() - np.asarray(age_hours, dtype=np.float64) * 3600,
+        views=np.asarray(views, dtype=np.float64),
+        likes=np.asarray(likes, dtype=np.float64),
+        shares=np.asarray(shares, dtype=np.float64),
+    )
+
+
+@override_settings(FEED_WEIGHTS={'like_rate': 4.0, 'share_rate': 8.0, 'popularity': 0.1,
+                                 'freshness': 1.0},
+                   FEED_SOURCE_BOOSTS={'recent': 0.0, 'trending': 0.0})
+class FeedRankingTest(TestCase):
+    """
+    Test module for the feed candidate generation and scoring functions.
+    """
+
+    def test_scores_engagement_and_freshness(self):
+        """
+        Ensure that engaging and fresh videos outscore stale or unengaging ones.
+        """
+
+        store = make_store(views=[1000, 1000, 1000, 0], likes=[300, 10, 300, 0],
+                           shares=[50, 0, 50, 0], age_hours=[1, 1, 24 * 7, 1])
+        rows = np.arange(4)
+
+        scores = score_candidates(store, rows, np.zeros(4), time.time())
+
+        self.assertGreater(scores[0], scores[1])
+        self.assertGreater(scores[0], scores[2])
+        self.assertGreater(scores[1], scores[3])
+
+    def test_source_boost_is_added(self):
+        """
+        Ensure that the boost of a candidate's source is added to its score.
+        """
+
+        store = make_store(views=[10, 10], likes=[1, 1], shares=[0, 0], age_hours=[1, 1])
+
+        scores = score_candidates(store, np.arange(2), np.array([0.0, 2.5]), time.time())
+
+        self.assertAlmostEqual(scores[1] - scores[0], 2.5)
+
+    @override_settings(FEED_SOURCE_BOOSTS={'recent': 0.0, 'trending': 1.0},
+                       FEED_CANDIDATES_PER_SOURCE=2)
+    def test_merges_sources(self):
+        """
+        Ensure that candidates from all sources are merged once with their best boost and
+        the viewer's own videos are left out.
+        """
+
+        store = make_store(views=[0, 0, 5000, 9000], likes=[0, 0, 500, 900],
+                           shares=[0, 0, 0, 0], age_hours=[0.1, 0.2, 48, 0.3],
+                           owner_ids=[1, 2, 2, 2])
+        viewer = CustomUser(pk=1)
+
+        rows, boosts = generate_candidates(viewer, store)
+
+        self.assertEqual(store.ids[rows].tolist(), [2, 3, 4])
+        self.assertEqual(boosts.tolist(), [0.0, 1.0, 1.0])
+
+    @override_settings(FEED_LENGTH=3)
+    def test_rank_feed_orders_by_score(self):
+        """
+        Ensure that the feed lists the best scored videos first, up to FEED_LENGTH.
+        """
+
+        store = make_store(views=[100, 100, 100, 100, 100], likes=[5, 50, 1, 30, 10],
+                           shares=[0, 0, 0, 0, 0], age_hours=[2, 2, 2, 2, 2])
+
+        ranked = rank_feed(AnonymousUser(), store)
+
+        self.assertEqual([video_id for video_id, _ in ranked], [2, 4, 5])
+        self.assertGreater(ranked[0][1], ranked[1][1])
+
+    def test_position_after(self):
+        """
+        Ensure that the position after a (score, id) keyset is found with or without it.
+        """
+
+        ranked = [(4, 3.0), (2, 2.0), (7, 2.0), (1, 1.0)]
+
+        self.assertEqual(position_after(ranked, 2.0, 2), 2)
+        self.assertEqual(position_after(ranked, 2.0, 5), 2)
+        self.assertEqual(position_after(ranked, 2.5, 9), 1)
+        self.assertEqual(position_after(ranked, 0.5, 1), 4)
+
+    def test_rows_for(self):
+        """
+        Ensure that video ids are mapped to rows and unknown ids dropped.
+        """
+
+        store = make_store(views=[0] * 3, likes=[0] * 3, shares=[0] * 3, age_hours=[0] * 3)
+
+        self.assertEqual(store.rows_for([3, 9, 1]).tolist(), [2, 0])
+
+    @override_settings(FEED_WINDOW_DAYS=7, FEED_FEATURES_TTL=0)
+    def test_feature_store_loads_ready_videos_of_window(self):
+        """
+        Ensure that the feature store holds the ready videos of the recent window only.
+        """
+
+        owner = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        ready = Video.objects.create(owner=owner, title='ready', content_type='video/mp4',
+                                     size=1, status=Video.Status.READY, view_count=7)
+        Video.objects.create(owner=owner, title='processing', content_type='video/mp4', size=1,
+                             status=Video.Status.PROCESSING)
+        old = Video.objects.create(owner=owner, title='old', content_type='video/mp4', size=1,
+                                   status=Video.Status.READY)
+        Video.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=8))
+
+        store = get_feature_store()
+
+        self.assertEqual(store.ids.tolist(), [ready.pk])
+        self.assertEqual(store.views.tolist(), [7.0])
@@ -0,0 +1,221 @@
+import io
+import json
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from users.models.custom_user_models import CustomUser
+from videos.jobs import (JobScheduler, claim_job, complete_job, queue_stats, recover_expired_leases,
+                         retry_delay)
+from videos.models.video_models import Video
+from videos.models.video_job_models import VideoJob
+from videos.transcoders import FakeTranscoder
+from videos.uploads import create_partial, finalize_upload, partial_path
+
+
+class BrokenTranscoder(FakeTranscoder):
+
+    def transcode(self, source, destination, height):
+        raise RuntimeError('codec not supported')
+
+
+class PendingExecutor:  # pylint: disable=too-few-public-methods
+    """
+    Executor whose futures never complete, to observe jobs while they are running.
+    """
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, _fn, *args):
+        self.submitted.append(args)
+        return Future()
+
+
+@override_settings(VIDEO_TRANSCODER='videos.transcoders.FakeTranscoder',
+                   VIDEO_JOB_POLL_INTERVAL=0.01, VIDEO_JOB_RETRY_BACKOFF=30)
+class VideoJobSchedulerTest(TestCase):
+    """
+    Test module for the video job scheduler.
+    """
+
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.executor = ThreadPoolExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+    def upload_video(self):
+        """
+        Upload a small video and return it, with its jobs queued.
+        """
+        video = Video.objects.create(owner=self.owner, title='Video', content_type='video/mp4',
+                                     size=5, upload_offset=5)
+        create_partial(video)
+        with open(partial_path(video), 'wb') as partial:
+            partial.write(b'video')
+        finalize_upload(video)
+        return video
+
+    def test_finished_upload_queues_jobs_once(self):
+        """
+        Ensure that finishing an upload queues one job of each type, even if retried.
+        """
+
+        video = self.upload_video()
+        finalize_upload(video)
+
+        self.assertEqual(sorted(video.jobs.values_list('job_type', flat=True)),
+                         ['probe', 'thumbnail', 'transcode'])
+
+    def test_processes_video_until_ready(self):
+        """
+        Ensure that draining the queue runs every job and marks the video ready.
+        """
+
+        video = self.upload_video()
+
+        scheduler = JobScheduler(executor=self.executor, workers=2)
+        scheduler.run(drain=True)
+
+        video.refresh_from_db()
+        self.assertEqual(video.status, Video.Status.READY)
+        self.assertEqual(video.metadata['codec'], 'fake')
+        self.assertEqual(set(video.renditions), set(settings.VIDEO_RENDITIONS))
+        for name in video.renditions.values():
+            self.assertTrue(default_storage.exists(name))
+        self.assertTrue(default_storage.exists(video.thumbnail.name))
+        self.assertEqual(scheduler.stats()['succeeded'], 3)
+
+    def test_claims_high_priority_lane_first(self):
+        """
+        Ensure that jobs are claimed by priority before age.
+        """
+
+        self.upload_video()
+        VideoJob.objects.filter(job_type='transcode').update(
+            run_after=timezone.now() - timedelta(hours=1))
+
+        claimed = [claim_job('worker', VideoJob.JobType.values).job_type for _ in range(3)]
+
+        self.assertEqual(claimed[2], 'transcode')
+        self.assertIsNone(claim_job('worker', VideoJob.JobType.values))
+
+    def test_respects_per_type_concurrency(self):
+        """
+        Ensure that a job type never runs more jobs at once than its cap.
+        """
+
+        self.upload_video()
+        self.upload_video()
+        executor = PendingExecutor()
+
+        scheduler = JobScheduler(executor=executor, workers=10,
+                                 concurrency={'probe': 2, 'thumbnail': 2, 'transcode': 1})
+        scheduler.tick()
+
+        running = scheduler.stats()['in_flight']
+        self.assertEqual(running, {'probe': 2, 'thumbnail': 2, 'transcode': 1})
+        self.assertEqual(VideoJob.objects.filter(status='queued').count(), 1)
+
+    @override_settings(VIDEO_TRANSCODER='videos.tests.test_jobs.BrokenTranscoder')
+    def test_failed_job_is_retried_with_backoff(self):
+        """
+        Ensure that a failed job goes back to the queue with exponential backoff.
+        """
+
+        self.upload_video()
+
+        JobScheduler(executor=self.executor, workers=3).run(drain=True)
+
+        job = VideoJob.objects.get(job_type='transcode')
+        self.assertEqual(job.status, VideoJob.Status.QUEUED)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn('codec not supported', job.last_error)
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=25))
+        self.assertEqual(retry_delay(3), 120)
+
+    @override_settings(VIDEO_TRANSCODER='videos.tests.test_jobs.BrokenTranscoder',
+                       VIDEO_JOB_MAX_ATTEMPTS=1)
+    def test_job_fails_after_last_attempt(self):
+        """
+        Ensure that a job without attempts left fails and marks the video as failed.
+        """
+
+        video = self.upload_video()
+
+        scheduler = JobScheduler(executor=self.executor, workers=3)
+        scheduler.run(drain=True)
+
+        video.refresh_from_db()
+        self.assertEqual(VideoJob.objects.get(job_type='transcode').status, VideoJob.Status.FAILED)
+        self.assertEqual(video.status, Video.Status.FAILED)
+        self.assertEqual(scheduler.stats()['failed'], 1)
+
+    def test_recovers_jobs_with_expired_lease(self):
+        """
+        Ensure that jobs of a dead worker are requeued, or failed when out of attempts.
+        """
+
+        video = self.upload_video()
+        expired = timezone.now() - timedelta(seconds=1)
+        VideoJob.objects.filter(job_type='probe').update(
+            status='running', attempts=1, leased_until=expired, worker='dead')
+        VideoJob.objects.filter(job_type='transcode').update(
+            status='running', attempts=3, leased_until=expired, worker='dead')
+
+        self.assertEqual(recover_expired_leases(), 2)
+
+        self.assertEqual(VideoJob.objects.get(job_type='probe').status, VideoJob.Status.QUEUED)
+        self.assertEqual(VideoJob.objects.get(job_type='transcode').status, VideoJob.Status.FAILED)
+        video.refresh_from_db()
+        self.assertEqual(video.status, Video.Status.FAILED)
+
+    def test_ignores_result_of_superseded_claim(self):
+        """
+        Ensure that a worker whose lease expired cannot complete a job claimed again since.
+        """
+
+        self.upload_video()
+        stale = claim_job('first', ['probe'])
+        VideoJob.objects.filter(pk=stale.pk).update(
+            leased_until=timezone.now() - timedelta(seconds=1))
+        recover_expired_leases()
+        current = claim_job('second', ['probe'])
+
+        self.assertFalse(complete_job(stale, {'codec': 'stale'}))
+        self.assertTrue(complete_job(current, {'codec': 'fresh'}))
+
+    def test_queue_stats(self):
+        """
+        Ensure that queue depth is reported by type and lane.
+        """
+
+        self.upload_video()
+        claim_job('worker', ['probe'])
+
+        stats = queue_stats()
+
+        self.assertEqual(stats['queued'], {'thumbnail': 1, 'transcode': 1})
+        self.assertEqual(stats['queued_by_priority'], {'high': 1, 'normal': 1})
+        self.assertEqual(stats['running'], {'probe': 1})
+
+    def test_run_video_jobs_stats(self):
+        """
+        Ensure that the management command prints the queue stats.
+        """
+
+        self.upload_video()
+        out = io.StringIO()
+
+        call_command('run_video_jobs', '--stats', stdout=out)
+
+        self.assertEqual(json.loads(out.getvalue())['queued']['transcode'], 1)
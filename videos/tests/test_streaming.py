@@ -0,0 +1,112 @@
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+from django.utils.http import http_date
+
+from videos.streaming import FileRange, MultipartRanges, if_range_matches, parse_range_header
+
+
+class ParseRangeHeaderTest(SimpleTestCase):
+    """
+    Test module for the parse_range_header function.
+    """
+
+    def test_parses_ranges(self):
+        """
+        Ensure that closed, open-ended and suffix ranges are resolved against the size.
+        """
+
+        self.assertEqual(parse_range_header('bytes=0-99', 1000), [(0, 99)])
+        self.assertEqual(parse_range_header('bytes=900-', 1000), [(900, 999)])
+        self.assertEqual(parse_range_header('bytes=-100', 1000), [(900, 999)])
+        self.assertEqual(parse_range_header('bytes=-5000', 1000), [(0, 999)])
+        self.assertEqual(parse_range_header('bytes=990-5000', 1000), [(990, 999)])
+
+    def test_coalesces_overlapping_ranges(self):
+        """
+        Ensure that ranges are sorted and overlapping or adjacent ones merged.
+        """
+
+        self.assertEqual(parse_range_header('bytes=500-599, 0-9, 10-19, 550-650', 1000),
+                         [(0, 19), (500, 650)])
+
+    def test_unsatisfiable_ranges(self):
+        """
+        Ensure that ranges past the end of the file are dropped.
+        """
+
+        self.assertEqual(parse_range_header('bytes=1000-1100', 1000), [])
+        self.assertEqual(parse_range_header('bytes=-0', 1000), [])
+        self.assertEqual(parse_range_header('bytes=0-0', 0), [])
+        self.assertEqual(parse_range_header('bytes=0-9, 2000-', 1000), [(0, 9)])
+
+    def test_ignores_malformed_headers(self):
+        """
+        Ensure that missing, malformed or non-byte ranges are ignored.
+        """
+
+        for header in (None, '', 'bytes=', 'bytes=-', 'bytes=a-b', 'bytes=9-1',
+                       'items=0-1', 'bytes 0-1', 'bytes=0-1,'):
+            self.assertIsNone(parse_range_header(header, 1000), header)
+
+
+class IfRangeMatchesTest(SimpleTestCase):
+    """
+    Test module for the if_range_matches function.
+    """
+
+    def test_if_range(self):
+        """
+        Ensure that only the current strong ETag or exact date honour the range.
+        """
+
+        etag, last_modified = '"abc"', http_date(1700000000)
+
+        self.assertTrue(if_range_matches(None, etag, last_modified))
+        self.assertTrue(if_range_matches('"abc"', etag, last_modified))
+        self.assertTrue(if_range_matches(last_modified, etag, last_modified))
+        self.assertFalse(if_range_matches('"old"', etag, last_modified))
+        self.assertFalse(if_range_matches('W/"abc"', etag, last_modified))
+        self.assertFalse(if_range_matches(http_date(1600000000), etag, last_modified))
+        self.assertFalse(if_range_matches('yesterday', etag, last_modified))
+
+
+class RangeBodiesTest(SimpleTestCase):
+    """
+    Test module for the FileRange and MultipartRanges classes.
+    """
+
+    def setUp(self):
+        self.content = os.urandom(10000)
+        self.file = tempfile.TemporaryFile()
+        self.file.write(self.content)
+
+    def tearDown(self):
+        self.file.close()
+
+    def test_file_range_stops_at_end_of_range(self):
+        """
+        Ensure that a FileRange reads exactly its range and reports the absolute offset.
+        """
+
+        file_range = FileRange(self.file, 100, 2099)
+
+        self.assertEqual(file_range.tell(), 100)
+        content = b''.join(iter(lambda: file_range.read(768), b''))
+        self.assertEqual(content, self.content[100:2100])
+
+    def test_multipart_body(self):
+        """
+        Ensure that the multipart body carries each range and matches its announced length.
+        """
+
+        body = MultipartRanges(self.file, [(0, 9), (5000, 9999)], 10000, 'video/mp4', 'XYZ', 1000)
+
+        content = b''.join(body)
+
+        self.assertEqual(len(content), body.length)
+        self.assertTrue(content.startswith(b'--XYZ\r\nContent-Type: video/mp4\r\n'
+                                           b'Content-Range: bytes 0-9/10000\r\n\r\n'
+                                           + self.content[:10] + b'\r\n--XYZ\r\n'))
+        self.assertTrue(content.endswith(self.content[5000:] + b'\r\n--XYZ--\r\n'))
@@ -0,0 +1,124 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from users.follows import follow, unfollow
+from users.models.custom_user_models import CustomUser
+from videos.jobs import _update_video_status
+from videos.models.inbox_models import InboxEntry
+from videos.models.video_job_models import VideoJob
+from videos.models.video_models import Video
+from videos.timeline import fan_out, following_video_ids, timeline_page
+
+
+@override_settings(TIMELINE_FANOUT_MAX_FOLLOWERS=2, TIMELINE_FANOUT_BATCH=2,
+                   PAGINATION_PAGE_SIZE=3)
+class TimelineTest(TestCase):
+    """
+    Test module for the fan-out and reading of following timelines.
+    """
+
+    def setUp(self):
+        self.users = [
+            CustomUser.objects.create_user(username=f'user{i}', email=f'user{i}@example.com')
+            for i in range(5)
+        ]
+        self.reader = self.users[0]
+        self.now = timezone.now()
+
+    def post(self, owner, minutes_ago, status=Video.Status.READY):
+        video = Video.objects.create(owner=owner, title=f'{owner.username} {minutes_ago}',
+                                     content_type='video/mp4', size=1, status=status)
+        Video.objects.filter(pk=video.pk).update(
+            created_at=self.now - timedelta(minutes=minutes_ago))
+        return video
+
+    def follow(self, follower, followee):
+        with self.captureOnCommitCallbacks(execute=True):
+            follow(follower, followee)
+
+    def page(self, cursor=None):
+        params = {'cursor': cursor} if cursor else {}
+        return timeline_page(self.reader, Request(APIRequestFactory().get('/', params)))
+
+    def test_fan_out_writes_follower_inboxes(self):
+        """
+        Ensure that a ready video is written to every follower's inbox in batches, once.
+        """
+
+        creator = self.users[1]
+        for follower in self.users[2:4]:
+            self.follow(follower, creator)
+        video = self.post(creator, 0)
+
+        with self.assertNumQueries(3):
+            self.assertEqual(fan_out(video.pk), 2)
+        fan_out(video.pk)
+
+        self.assertEqual(sorted(InboxEntry.objects.values_list('user_id', flat=True)),
+                         [self.users[2].pk, self.users[3].pk])
+
+    def test_mega_creators_are_pulled(self):
+        """
+        Ensure that creators over the threshold are not fanned out but still read.
+        """
+
+        creator, regular = self.users[1], self.users[2]
+        for follower in (self.reader, self.users[3], self.users[4]):
+            self.follow(follower, creator)
+        self.follow(self.reader, regular)
+        pulled = self.post(creator, 5)
+        pushed = [self.post(regular, minutes) for minutes in (1, 10, 20)]
+        for video in pushed:
+            fan_out(video.pk)
+
+        self.assertEqual(fan_out(pulled.pk), 0)
+
+        first, cursor = self.page()
+        second, last = self.page(cursor)
+
+        self.assertEqual(first, [pushed[0], pulled, pushed[1]])
+        self.assertEqual(second, [pushed[2]])
+        self.assertIsNone(last)
+        self.assertCountEqual(following_video_ids(self.reader, 10),
+                              [video.pk for video in pushed + [pulled]])
+
+    def test_follow_backfills_and_unfollow_prunes(self):
+        """
+        Ensure that following copies the creator's recent videos and unfollowing removes them.
+        """
+
+        creator = self.users[1]
+        videos = [self.post(creator, minutes) for minutes in (1, 2)]
+        self.post(creator, 0, status=Video.Status.PROCESSING)
+
+        self.follow(self.reader, creator)
+
+        self.assertEqual(self.page()[0], videos)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            unfollow(self.reader, creator)
+
+        self.assertEqual(self.page(), ([], None))
+
+    def test_ready_video_schedules_fan_out(self):
+        """
+        Ensure that a video is fanned out once its last processing job succeeds.
+        """
+
+        video = self.post(self.users[1], 0, status=Video.Status.PROCESSING)
+        VideoJob.objects.create(video=video, job_type=VideoJob.JobType.PROBE,
+                                status=VideoJob.Status.SUCCEEDED)
+
+        with mock.patch('videos.timeline._executor') as executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                _update_video_status(video.pk)
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                _update_video_status(video.pk)
+
+        executor.get.return_value.submit.assert_called_once()
+        self.assertEqual(callbacks, [])
@@ -0,0 +1,148 @@
+from collections import Counter
+
+import numpy as np
+from django.test import TestCase, override_settings
+
+from utils.sketches import CountMinSketch, WindowedTopK, sketch_columns
+from users.models.custom_user_models import CustomUser
+from videos.counters import flush_counters, increment
+from videos.models.trending_models import TrendingSnapshot
+from videos.models.video_models import Video
+from videos.trending import (TrendingAggregator, extract_hashtags, get_trending_aggregator,
+                             record_post)
+
+
+HOUR = 60 * 60
+
+
+def counts(*values):
+    return np.array(values, dtype=np.int64)
+
+
+class SketchTest(TestCase):
+    """
+    Test module for the CountMinSketch and WindowedTopK classes.
+    """
+
+    def test_count_min_never_under_counts(self):
+        """
+        Ensure that estimates are at least the true counts, and exact without collisions.
+        """
+
+        sketch = CountMinSketch(width=16, depth=3)
+        keys = [f'key{i}' for i in range(100)]
+        sketch.add(sketch_columns(keys, 16, 3), np.arange(100, dtype=np.int64))
+
+        estimates = sketch.estimate(sketch_columns(keys, 16, 3))
+        wide = CountMinSketch(width=4096, depth=4)
+        wide.add(sketch_columns(['a', 'b'], 4096, 4), counts(5, 7))
+
+        self.assertTrue((estimates >= np.arange(100)).all())
+        self.assertEqual(wide.estimate(sketch_columns(['a', 'b', 'c'], 4096, 4)).tolist(),
+                         [5, 7, 0])
+
+    def test_window_slides_and_keeps_the_top(self):
+        """
+        Ensure that the top is ranked by the counts of the live buckets only.
+        """
+
+        window = WindowedTopK(2 * HOUR, HOUR, width=1024, depth=4, capacity=2)
+        window.add(['old', 'steady'], counts(50, 10), now=0)
+        window.add(['steady', 'new'], counts(10, 15), now=HOUR)
+        for minor in range(10):
+            window.add([f'minor{minor}'], counts(1), now=HOUR)
+
+        self.assertEqual(window.top(2, now=HOUR), [('old', 50), ('steady', 20)])
+        self.assertEqual(window.top(5, now=2 * HOUR), [('new', 15), ('steady', 10)])
+        self.assertEqual(window.top(5, now=4 * HOUR), [])
+
+    def test_merge_and_round_trip(self):
+        """
+        Ensure that merged windows add up and survive saving and loading.
+        """
+
+        first = WindowedTopK(HOUR, HOUR, width=1024, depth=4, capacity=10)
+        second = WindowedTopK(HOUR, HOUR, width=1024, depth=4, capacity=10)
+        first.add(['a', 'b'], counts(3, 1), now=0)
+        second.add(['b', 'c'], counts(4, 2), now=0)
+
+        first.merge(second)
+        loaded = WindowedTopK(HOUR, HOUR, width=1024, depth=4, capacity=10)
+        loaded.load_arrays(first.to_arrays())
+
+        self.assertEqual(loaded.top(3, now=0), [('b', 5), ('a', 3), ('c', 2)])
+
+
+@override_settings(TRENDING_SNAPSHOT_INTERVAL=3600, VIDEO_COUNTER_FLUSH_INTERVAL=0)
+class TrendingTest(TestCase):
+    """
+    Test module for the trending aggregator.
+    """
+
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+
+    def video(self, title, description='', sound=''):
+        return Video.objects.create(owner=self.owner, title=title, description=description,
+                                    sound=sound, content_type='video/mp4', size=1,
+                                    status=Video.Status.READY)
+
+    def test_extract_hashtags(self):
+        """
+        Ensure that hashtags are found once each, lowercased, and not inside words.
+        """
+
+        self.assertEqual(extract_hashtags('Best #Pasta ever #food', 'more #pasta, mail#me'),
+                         ['pasta', 'food'])
+
+    def test_posts_and_engagement_are_counted(self):
+        """
+        Ensure that ready videos and their flushed engagement count towards their topics.
+        """
+
+        cooking = self.video('Dinner #cooking', sound='Theme song')
+        dance = self.video('#dance #cooking')
+        record_post(cooking.pk)
+        record_post(dance.pk)
+        for _ in range(3):
+            increment(dance.pk, 'like_count')
+        increment(cooking.pk, 'like_count', -1)
+        flush_counters()
+
+        aggregator = get_trending_aggregator()
+        self.assertEqual(aggregator.top('hashtags', '1h', 5),
+                         [('cooking', 55), ('dance', 35)])
+        self.assertEqual(aggregator.top('sounds', '7d', 5), [('Theme song', 20)])
+
+    def test_workers_share_the_snapshot(self):
+        """
+        Ensure that syncing merges each worker's counts and a new worker starts from them.
+        """
+
+        first, second = TrendingAggregator(), TrendingAggregator()
+        first.record('hashtags', {'a': 2, 'b': 1})
+        second.record('hashtags', {'b': 3})
+
+        first.sync()
+        second.sync()
+        first.sync()
+        restarted = TrendingAggregator()
+
+        self.assertEqual(first.top('hashtags', '24h', 5), [('b', 4), ('a', 2)])
+        self.assertEqual(restarted.top('hashtags', '24h', 5), [('b', 4), ('a', 2)])
+        self.assertEqual(TrendingSnapshot.objects.count(), 1)
+
+    def test_engagement_is_synced_without_reads(self):
+        """
+        Ensure that a worker only recording engagement publishes it once a sync is due, and
+        buffers it until then.
+        """
+
+        dance = self.video('#dance')
+        worker = TrendingAggregator()
+
+        worker.record_videos({dance.pk: 5})
+        worker.record_videos({dance.pk: 3})
+
+        self.assertEqual(TrendingAggregator().top('hashtags', '1h', 5), [('dance', 5)])
+        self.assertEqual(sum(worker.engagement.values(), Counter()), Counter({dance.pk: 3}))
@@ -0,0 +1,86 @@
+import io
+import os
+import shutil
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.test import TestCase
+
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+from videos.uploads import (ContentRange, IncompleteChunk, create_partial, finalize_upload,
+                            open_partial, parse_content_range, partial_path, write_chunk)
+
+
+class ParseContentRangeTest(TestCase):
+    """
+    Test module for the parse_content_range function.
+    """
+
+    def test_parses_valid_range(self):
+        """
+        Ensure that a well-formed header is parsed into start, end and total.
+        """
+
+        content_range = parse_content_range('bytes 100-199/1000')
+
+        self.assertEqual(content_range, ContentRange(100, 199, 1000))
+        self.assertEqual(content_range.length, 100)
+
+    def test_rejects_invalid_ranges(self):
+        """
+        Ensure that malformed, inverted and out of bounds ranges are rejected.
+        """
+
+        for header in (None, '', 'bytes=0-1/2', 'bytes 5-4/10', 'bytes 0-10/10', 'bytes */10'):
+            self.assertIsNone(parse_content_range(header), header)
+
+
+class ChunkWritingTest(TestCase):
+    """
+    Test module for writing and finalizing chunked uploads.
+    """
+
+    def setUp(self):
+        owner = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.video = Video.objects.create(owner=owner, title='Video', content_type='video/mp4',
+                                          size=10)
+        create_partial(self.video)
+
+    def tearDown(self):
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+    def test_last_chunk_trims_stale_bytes(self):
+        """
+        Ensure that bytes left past the end by an abandoned attempt are removed.
+        """
+
+        with open(partial_path(self.video), 'wb') as partial:
+            partial.write(b'x' * 20)
+
+        with open_partial(self.video) as partial:
+            write_chunk(partial, ContentRange(0, 9, 10), io.BytesIO(b'0123456789'))
+
+        with open(partial_path(self.video), 'rb') as partial:
+            self.assertEqual(partial.read(), b'0123456789')
+
+    def test_short_body_raises(self):
+        """
+        Ensure that a body shorter than the range raises IncompleteChunk.
+        """
+
+        with open_partial(self.video) as partial, self.assertRaises(IncompleteChunk):
+            write_chunk(partial, ContentRange(0, 9, 10), io.BytesIO(b'01234'))
+
+    def test_finalize_is_idempotent(self):
+        """
+        Ensure that finalizing again after the file was moved only updates the row.
+        """
+
+        finalize_upload(self.video)
+        finalize_upload(self.video)
+
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.status, Video.Status.UPLOADED)
+        self.assertTrue(default_storage.exists(self.video.file.name))
+        self.assertFalse(os.path.exists(partial_path(self.video)))
@@ -0,0 +1,212 @@
+import heapq
+import logging
+from itertools import islice
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.dispatch import receiver
+from rest_framework.request import Request
+
+from utils.pagination import KeysetPagination, encode_cursor, parse_page_size
+from utils.workers import closes_connections, lazy_thread_pool
+from users.models.custom_user_models import CustomUser
+from users.models.follow_models import Follow
+from users.signals import user_followed, user_unfollowed
+from videos.models.inbox_models import InboxEntry
+from videos.models.video_models import Video
+
+
+logger = logging.getLogger(__name__)
+
+_executor = lazy_thread_pool('TIMELINE_FANOUT_WORKERS', 'timeline-fanout')
+
+
+def is_fanned_out(follower_count: int) -> bool:
+    """
+    Return whether a creator's videos are pushed to inboxes rather than pulled on read.
+
+    Args:
+        follower_count (int): The creator's follower count.
+
+    Returns:
+        bool: True unless the creator has more than TIMELINE_FANOUT_MAX_FOLLOWERS followers.
+    """
+    return follower_count <= settings.TIMELINE_FANOUT_MAX_FOLLOWERS
+
+
+def _inbox_entries(video: Video, user_ids) -> List[InboxEntry]:
+    return [InboxEntry(user_id=user_id, video_id=video.pk, creator_id=video.owner_id,
+                       created_at=video.created_at) for user_id in user_ids]
+
+
+def fan_out(video_id: int) -> int:
+    """
+    Write a ready video into the inbox of every follower of its creator.
+
+    Followers are streamed from the followers index and inserted TIMELINE_FANOUT_BATCH at a
+    time, so memory does not grow with the follower count. Entries that already exist are
+    skipped, which makes a retried fan-out harmless. Creators over the fan-out threshold
+    are skipped: their videos are pulled at read time.
+
+    Args:
+        video_id (int): The ID of the video.
+
+    Returns:
+        int: The number of inboxes written to.
+    """
+    video = (Video.objects.filter(pk=video_id, status=Video.Status.READY)
+             .select_related('owner')
+             .only('id', 'owner', 'created_at', 'owner__follower_count').first())
+    if video is None or not is_fanned_out(video.owner.follower_count):
+        return 0
+
+    batch_size = settings.TIMELINE_FANOUT_BATCH
+    followers = (Follow.objects.filter(followee_id=video.owner_id)
+                 .values_list('follower_id', flat=True).iterator(chunk_size=batch_size))
+    written = 0
+    while True:
+        batch = list(islice(followers, batch_size))
+        if not batch:
+            return written
+        InboxEntry.objects.bulk_create(_inbox_entries(video, batch), ignore_conflicts=True)
+        written += len(batch)
+
+
+@closes_connections
+def _fan_out_in_worker(video_id: int) -> None:
+    try:
+        fan_out(video_id)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception('Fan-out of video %s failed.', video_id)
+
+
+def schedule_fan_out(video_id: int) -> None:
+    """
+    Queue the fan-out of a video that just became ready, once the transaction commits.
+
+    Args:
+        video_id (int): The ID of the video.
+    """
+    transaction.on_commit(lambda: _executor.get().submit(_fan_out_in_worker, video_id))
+
+
+@receiver(user_followed, dispatch_uid='backfill_inbox')
+def backfill_inbox(follower_id: int, followee_id: int, **kwargs) -> None:
+    """
+    Copy the latest videos of a newly followed creator into the follower's inbox, so the
+    timeline does not wait for the creator's next post.
+    """
+    followee = CustomUser.objects.filter(pk=followee_id).only('follower_count').first()
+    if followee is None or not is_fanned_out(followee.follower_count):
+        return
+
+    videos = (Video.objects.filter(owner_id=followee_id, status=Video.Status.READY)
+              .order_by('-created_at', '-id').only('id', 'owner_id', 'created_at')
+              [:settings.TIMELINE_BACKFILL_SIZE])
+    InboxEntry.objects.bulk_create(
+        [entry for video in videos for entry in _inbox_entries(video, [follower_id])],
+        ignore_conflicts=True)
+
+
+@receiver(user_unfollowed, dispatch_uid='prune_inbox')
+def prune_inbox(follower_id: int, followee_id: int, **kwargs) -> None:
+    """
+    Remove an unfollowed creator's videos from the follower's inbox.
+    """
+    InboxEntry.objects.filter(user_id=follower_id, creator_id=followee_id).delete()
+
+
+def pulled_creators(user: CustomUser) -> List[int]:
+    """
+    Return the followed creators whose videos are pulled on read instead of fanned out.
+
+    Args:
+        user (CustomUser): The reader of the timeline.
+
+    Returns:
+        List[int]: The creators' IDs.
+    """
+    return list(Follow.objects
+                .filter(follower=user,
+                        followee__follower_count__gt=settings.TIMELINE_FANOUT_MAX_FOLLOWERS)
+                .values_list('followee_id', flat=True))
+
+
+def _ready_videos_of(creator_id: int) -> QuerySet:
+    return Video.objects.filter(owner_id=creator_id, status=Video.Status.READY)
+
+
+class InboxPagination(KeysetPagination):
+    """
+    Keyset pagination of inbox entries, whose (created_at, video_id) match the videos'.
+    """
+
+    ordering = ('-created_at', '-video_id')
+
+
+def timeline_page(user: CustomUser, request: Request) -> Tuple[List[Video], Optional[str]]:
+    """
+    Return a page of the user's following timeline, newest first.
+
+    The page is merged from the user's inbox and the videos pulled from each followed
+    creator over the fan-out threshold. Every source is read with the same (created_at, id)
+    cursor, so each costs one keyset range scan.
+
+    Args:
+        user (CustomUser): The reader.
+        request (Request): The request, with optional 'cursor' and 'limit' parameters.
+
+    Returns:
+        Tuple[List[Video], Optional[str]]: The videos and the cursor of the next page.
+
+    Raises:
+        ValidationError: If the cursor or the limit is invalid.
+    """
+    limit = parse_page_size(request, settings.PAGINATION_PAGE_SIZE,
+                            settings.PAGINATION_MAX_PAGE_SIZE)
+    inbox = InboxPagination()
+    entries = inbox.paginate_queryset(
+        InboxEntry.objects.filter(user=user).select_related('video'), request)
+    sources = [[entry.video for entry in entries]]
+    more = inbox.next_cursor is not None
+
+    # One range scan of the owner index per pulled creator. Few creators are over the
+    # threshold, whereas filtering all recent videos by owner scans everyone's uploads.
+    for creator_id in pulled_creators(user):
+        pulled = KeysetPagination()
+        sources.append(pulled.paginate_queryset(_ready_videos_of(creator_id), request))
+        more = more or pulled.next_cursor is not None
+
+    # A creator who crossed the threshold may have videos in both sources.
+    videos, seen = [], set()
+    for video in heapq.merge(*sources, key=lambda video: (video.created_at, video.pk),
+                             reverse=True):
+        if video.pk not in seen:
+            seen.add(video.pk)
+            videos.append(video)
+
+    more = more or len(videos) > limit
+    videos = videos[:limit]
+    return videos, encode_cursor([videos[-1].created_at, videos[-1].pk]) if more else None
+
+
+def following_video_ids(user: CustomUser, limit: int) -> List[int]:
+    """
+    Return the ids of the newest videos in the user's following timeline.
+
+    Args:
+        user (CustomUser): The reader.
+        limit (int): The number of ids taken from each source.
+
+    Returns:
+        List[int]: Up to limit ids from the inbox and from each pulled creator, unordered.
+    """
+    inbox = (InboxEntry.objects.filter(user=user).order_by('-created_at', '-video_id')
+             .values_list('video_id', flat=True)[:limit])
+    video_ids = list(inbox)
+    for creator_id in pulled_creators(user):
+        video_ids += _ready_videos_of(creator_id).order_by('-created_at', '-id').values_list(
+            'id', flat=True)[:limit]
+    return video_ids
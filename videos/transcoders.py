@@ -0,0 +1,122 @@
+import json
+import os
+import subprocess
+from typing import Any, Dict
+
+from django.utils.module_loading import import_string
+from PIL import Image
+
+
+class Transcoder:
+    """
+    Interface of the media tools used by the video jobs.
+
+    Implementations run inside job worker processes and only deal with local paths; they
+    never touch the database. Output paths are chosen by the caller.
+
+    Methods:
+    - probe(source) -> Dict[str, Any]: Return the container and stream metadata.
+    - transcode(source, destination, height) -> None: Write a rendition of the given height.
+    - thumbnail(source, destination) -> None: Write a still image from the video.
+    """
+
+    def probe(self, source: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def transcode(self, source: str, destination: str, height: int) -> None:
+        raise NotImplementedError
+
+    def thumbnail(self, source: str, destination: str) -> None:
+        raise NotImplementedError
+
+
+class FFmpegTranscoder(Transcoder):
+    """
+    Transcoder backed by the ffmpeg and ffprobe binaries.
+    """
+
+    timeout = 60 * 60
+
+    def probe(self, source: str) -> Dict[str, Any]:
+        output = subprocess.run(
+            ['ffprobe', '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams',
+             source],
+            check=True, capture_output=True, timeout=self.timeout,
+        ).stdout
+        probed = json.loads(output)
+        video = next((stream for stream in probed.get('streams', [])
+                      if stream.get('codec_type') == 'video'), {})
+        return {
+            'duration': float(probed.get('format', {}).get('duration', 0)),
+            'width': video.get('width'),
+            'height': video.get('height'),
+            'codec': video.get('codec_name'),
+        }
+
+    def transcode(self, source: str, destination: str, height: int) -> None:
+        subprocess.run(
+            ['ffmpeg', '-v', 'error', '-y', '-i', source, '-vf', f'scale=-2:{height}',
+             '-c:v', 'libx264', '-preset', 'veryfast', '-c:a', 'aac', '-movflags', '+faststart',
+             destination],
+            check=True, capture_output=True, timeout=self.timeout,
+        )
+
+    def thumbnail(self, source: str, destination: str) -> None:
+        subprocess.run(
+            ['ffmpeg', '-v', 'error', '-y', '-ss', '1', '-i', source, '-frames:v', '1',
+             destination],
+            check=True, capture_output=True, timeout=self.timeout,
+        )
+
+
+class FakeTranscoder(Transcoder):
+    """
+    In-process transcoder for tests and local development without ffmpeg.
+
+    Renditions are small placeholder files and thumbnails are solid-colour images, so the
+    whole pipeline can run without external binaries.
+    """
+
+    def probe(self, source: str) -> Dict[str, Any]:
+        size = os.path.getsize(source)
+        return {'duration': size / 1_000_000, 'width': 1920, 'height': 1080, 'codec': 'fake'}
+
+    def transcode(self, source: str, destination: str, height: int) -> None:
+        with open(destination, 'wb') as rendition:
+            rendition.write(f'{os.path.basename(source)} at {height}p'.encode())
+
+    def thumbnail(self, source: str, destination: str) -> None:
+        Image.new('RGB', (320, 180), 'black').save(destination)
+
+
+def run_job(transcoder_path: str, job_type: str, source: str, outputs: Dict[str, str],
+            renditions: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Execute a video job. Runs in a job worker process.
+
+    Kept free of model imports so spawned worker processes can load it without setting up
+    Django; everything it needs is passed in.
+
+    Args:
+        transcoder_path (str): Dotted path of the Transcoder class.
+        job_type (str): The VideoJob.JobType to run.
+        source (str): Path of the uploaded video.
+        outputs (Dict[str, str]): Paths to write, keyed by output name.
+        renditions (Dict[str, int]): Rendition heights, keyed by output name.
+
+    Returns:
+        Dict[str, Any]: The probe metadata, or an empty dict for jobs that write files.
+    """
+    transcoder = import_string(transcoder_path)()
+
+    for path in outputs.values():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    if job_type == 'probe':
+        return transcoder.probe(source)
+    if job_type == 'transcode':
+        for name, path in outputs.items():
+            transcoder.transcode(source, path, renditions[name])
+    elif job_type == 'thumbnail':
+        transcoder.thumbnail(source, outputs['thumbnail'])
+    return {}
@@ -0,0 +1,342 @@
+import atexit
+import io
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.dispatch import receiver
+
+from utils.lazy import LazySingleton, maintain
+from utils.sketches import WindowedTopK, sketch_columns
+from videos.counters import counters_flushed
+from videos.models.trending_models import TrendingSnapshot
+from videos.models.video_models import Video
+
+
+logger = logging.getLogger(__name__)
+
+KINDS = ('hashtags', 'sounds')
+
+HASHTAG_PATTERN = re.compile(r'(?<!\w)#(\w{1,100})')
+
+# The WindowedTopK.to_arrays fields saved per window in a snapshot.
+SNAPSHOT_FIELDS = ('buckets', 'tables', 'candidates', 'candidate_buckets')
+
+
+def extract_hashtags(*texts: str) -> List[str]:
+    """
+    Return the distinct hashtags of caption texts, lowercased, without the '#'.
+
+    Args:
+        *texts (str): The texts, such as a video's title and description.
+
+    Returns:
+        List[str]: The hashtags in order of first appearance.
+    """
+    return list(dict.fromkeys(tag.casefold() for text in texts
+                              for tag in HASHTAG_PATTERN.findall(text)))
+
+
+def video_topics(title: str, description: str, sound: str) -> Dict[str, List[str]]:
+    """
+    Return the topics a video counts towards, per kind.
+    """
+    return {'hashtags': extract_hashtags(title, description),
+            'sounds': [sound.strip()] if sound.strip() else []}
+
+
+def _windows() -> Dict[str, WindowedTopK]:
+    return {name: WindowedTopK(window, bucket, settings.TRENDING_SKETCH_WIDTH,
+                               settings.TRENDING_SKETCH_DEPTH, settings.TRENDING_CANDIDATES)
+            for name, (window, bucket) in settings.TRENDING_WINDOWS.items()}
+
+
+class TrendingAggregator:
+    """
+    Streaming top-K of hashtags and sounds over the TRENDING_WINDOWS sliding windows.
+
+    Events are counted into windowed count-min sketches (utils.sketches), so memory and the
+    cost of an event do not depend on how many distinct topics exist, and the trends are
+    read from memory. Every event is counted twice: into `shared`, which the trends are
+    read from, and into `pending`, the delta since the last sync. Every
+    TRENDING_SNAPSHOT_INTERVAL seconds, a sync adds `pending` to the kind's snapshot row
+    under a row lock and loads the result back as `shared`, so each worker also serves
+    what the others counted, and a restart starts from the last snapshot. Weighted videos,
+    such as a counter flush's engagement, are buffered per minute and their topics are
+    looked up in one query when the trends are next read or synced. Recording checks
+    whether a sync is due, so a worker that never serves the trends still publishes what
+    it counted, and the buffer is drained at least every interval.
+
+    Methods:
+    - record(kind, weights, now): Count weighted topics of one kind.
+    - record_videos(weights, now): Count weighted videos towards their topics, later.
+    - top(kind, window, limit, now) -> List[Tuple[str, int]]: The trending topics.
+    - sync(): Merge the pending counts into the snapshots and reload them.
+    - close(): Sync what is pending.
+    """
+
+    def __init__(self) -> None:
+        self.shared = {kind: _windows() for kind in KINDS}
+        self.pending = {kind: _windows() for kind in KINDS}
+        self.engagement: Dict[int, Counter] = {}
+        self.synced_at = -float('inf')
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def record(self, kind: str, weights: Dict[str, int], now: Optional[float] = None) -> None:
+        """
+        Count weighted topics of one kind.
+
+        Args:
+            kind (str): One of KINDS.
+            weights (Dict[str, int]): The positive weight of each topic.
+            now (Optional[float]): The Unix time of the events, the current time by default.
+        """
+        self._count(kind, weights, time.time() if now is None else now)
+        self._maybe_sync()
+
+    def record_videos(self, weights: Dict[int, int], now: Optional[float] = None) -> None:
+        """
+        Count weighted videos towards their hashtags and sound, once their topics are read.
+
+        Args:
+            weights (Dict[int, int]): The positive weight of each video ID.
+            now (Optional[float]): The Unix time of the events, the current time by default.
+        """
+        if not weights:
+            return
+        minute = int((time.time() if now is None else now) // 60) * 60
+        with self._lock:
+            self.engagement.setdefault(minute, Counter()).update(weights)
+        self._maybe_sync()
+
+    def top(self, kind: str, window: str, limit: int,
+            now: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        Return the topics with the most weight in a window ending now.
+
+        Args:
+            kind (str): One of KINDS.
+            window (str): A name of TRENDING_WINDOWS.
+            limit (int): The number of topics.
+            now (Optional[float]): The end of the window, the current time by default.
+
+        Returns:
+            List[Tuple[str, int]]: (topic, estimated weight) pairs, heaviest first.
+        """
+        self._count_videos()
+        self._maybe_sync()
+        with self._lock:
+            return self.shared[kind][window].top(limit, time.time() if now is None else now)
+
+    def sync(self) -> None:
+        """
+        Add the pending counts to the snapshots and replace the shared counts with them.
+        """
+        with self._sync_lock:
+            self._sync()
+
+    def close(self) -> None:
+        """
+        Save the pending counts, as the process exits.
+        """
+        if self.engagement or not all(window.empty() for windows in self.pending.values()
+                                      for window in windows.values()):
+            self._maybe_sync(force=True)
+
+    def _maybe_sync(self, force: bool = False) -> None:
+        if not force and self.synced_at + settings.TRENDING_SNAPSHOT_INTERVAL > time.monotonic():
+            return
+        # One thread syncs; the others keep counting and reading meanwhile.
+        maintain(self._sync_lock, lambda: True, self._try_sync)
+
+    def _try_sync(self) -> None:
+        try:
+            self._sync()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Syncing the trending snapshots failed.')
+            self.synced_at = time.monotonic()
+
+    def _count(self, kind: str, weights: Dict[str, int], now: float) -> None:
+        if not weights:
+            return
+        keys = list(weights)
+        counts = np.fromiter(weights.values(), dtype=np.int64, count=len(keys))
+        columns = sketch_columns(keys, settings.TRENDING_SKETCH_WIDTH,
+                                 settings.TRENDING_SKETCH_DEPTH)
+        with self._lock:
+            for windows in (self.shared[kind], self.pending[kind]):
+                for window in windows.values():
+                    window.add(keys, counts, now, columns)
+
+    def _count_videos(self) -> None:
+        with self._lock:
+            engagement, self.engagement = self.engagement, {}
+        if not engagement:
+            return
+        video_ids = set().union(*engagement.values())
+        captions = {video_id: (title, description, sound) for video_id, title, description, sound
+                    in Video.objects.filter(pk__in=video_ids).values_list(
+                        'id', 'title', 'description', 'sound')}
+        for minute, weights in sorted(engagement.items()):
+            topic_weights = _topic_weights((*captions[video_id], weight)
+                                           for video_id, weight in weights.items()
+                                           if video_id in captions)
+            for kind in KINDS:
+                self._count(kind, topic_weights[kind], minute)
+
+    def _sync(self) -> None:
+        self._count_videos()
+        with self._lock:
+            pending, self.pending = self.pending, {kind: _windows() for kind in KINDS}
+
+        shared = {}
+        for position, kind in enumerate(KINDS):
+            try:
+                shared[kind] = self._merge_snapshot(kind, pending[kind])
+            except Exception:
+                # Keep the counts that were not saved for the next sync.
+                with self._lock:
+                    for unsaved in KINDS[position:]:
+                        for name, window in pending[unsaved].items():
+                            self.pending[unsaved][name].merge(window)
+                raise
+
+        with self._lock:
+            # Add what was counted during the sync to the loaded snapshot.
+            for kind in KINDS:
+                for name, window in self.pending[kind].items():
+                    shared[kind][name].merge(window)
+            self.shared = shared
+        self.synced_at = time.monotonic()
+
+    @staticmethod
+    def _merge_snapshot(kind: str, pending: Dict[str, WindowedTopK]) -> Dict[str, WindowedTopK]:
+        windows = _windows()
+        if all(window.empty() for window in pending.values()):
+            snapshot = TrendingSnapshot.objects.filter(kind=kind).first()
+            if snapshot is not None:
+                _load(windows, snapshot.state)
+            return windows
+
+        with transaction.atomic():
+            snapshot, _ = TrendingSnapshot.objects.select_for_update().get_or_create(
+                kind=kind, defaults={'state': b''})
+            _load(windows, snapshot.state)
+            for name, window in pending.items():
+                windows[name].merge(window)
+            snapshot.state = _dump(windows)
+            snapshot.save(update_fields=['state', 'updated_at'])
+        return windows
+
+
+def _dump(windows: Dict[str, WindowedTopK]) -> bytes:
+    arrays = {f'{name}.{field}': array for name, window in windows.items()
+              for field, array in window.to_arrays().items()}
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _load(windows: Dict[str, WindowedTopK], state: bytes) -> None:
+    if not state:
+        return
+    with np.load(io.BytesIO(bytes(state)), allow_pickle=False) as arrays:
+        for name, window in windows.items():
+            fields = {field: arrays[f'{name}.{field}'] for field in SNAPSHOT_FIELDS
+                      if f'{name}.{field}' in arrays}
+            # Windows added to TRENDING_WINDOWS, or resized sketches, start empty.
+            if (len(fields) == len(SNAPSHOT_FIELDS)
+                    and fields['tables'].shape[1:] == (window.depth, window.width)):
+                window.load_arrays(fields)
+
+
+def _create_aggregator() -> TrendingAggregator:
+    aggregator = TrendingAggregator()
+    atexit.register(aggregator.close)
+    return aggregator
+
+
+_aggregator = LazySingleton(_create_aggregator, 'TRENDING_',
+                            on_reset=lambda aggregator: atexit.unregister(aggregator.close))
+
+
+def get_trending_aggregator() -> TrendingAggregator:
+    """
+    Return the process-wide trending aggregator, loading the snapshots on first use.
+
+    Returns:
+        TrendingAggregator: The shared instance.
+    """
+    return _aggregator.get()
+
+
+def record_topics(videos: Iterable[Tuple[str, str, str, int]],
+                  now: Optional[float] = None) -> None:
+    """
+    Count videos' weights towards their hashtags and sound.
+
+    Args:
+        videos (Iterable[Tuple[str, str, str, int]]): (title, description, sound, weight)
+        of each video.
+        now (Optional[float]): The Unix time of the events, the current time by default.
+    """
+    weights = _topic_weights(videos)
+    aggregator = get_trending_aggregator()
+    for kind in KINDS:
+        aggregator.record(kind, weights[kind], now)
+
+
+def _topic_weights(videos: Iterable[Tuple[str, str, str, int]]) -> Dict[str, Counter]:
+    weights = {kind: Counter() for kind in KINDS}
+    for title, description, sound, weight in videos:
+        if weight <= 0:
+            continue
+        for kind, topics in video_topics(title, description, sound).items():
+            for topic in topics:
+                weights[kind][topic] += weight
+    return weights
+
+
+def record_post(video_id: int) -> None:
+    """
+    Count a video that just became ready towards its hashtags and sound.
+
+    Args:
+        video_id (int): The ID of the video.
+    """
+    weight = settings.TRENDING_EVENT_WEIGHTS['post']
+    record_topics((title, description, sound, weight) for title, description, sound
+                  in Video.objects.filter(pk=video_id).values_list('title', 'description',
+                                                                   'sound'))
+
+
+def schedule_post(video_id: int) -> None:
+    """
+    Count a video that just became ready, once the transaction commits.
+
+    Args:
+        video_id (int): The ID of the video.
+    """
+    transaction.on_commit(lambda: record_post(video_id))
+
+
+@receiver(counters_flushed, dispatch_uid='record_engagement')
+def record_engagement(deltas: Dict[int, Dict[str, int]], **kwargs) -> None:
+    """
+    Count the views, likes and shares written by a counter flush towards the videos'
+    hashtags and sounds. Decrements, such as unlikes, are not counted. The videos' topics
+    are read when the trends are, or at the next sync, which runs on the flushing thread.
+    """
+    event_weights = settings.TRENDING_EVENT_WEIGHTS
+    weights = {video_id: sum(event_weights.get(field, 0) * max(amount, 0)
+                             for field, amount in fields.items())
+               for video_id, fields in deltas.items()}
+    get_trending_aggregator().record_videos(
+        {video_id: weight for video_id, weight in weights.items() if weight > 0})
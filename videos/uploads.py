@@ -0,0 +1,218 @@
+import fcntl
+import hashlib
+import os
+import re
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from videos.jobs import enqueue_processing
+from videos.models.video_models import Video
+
+
+_CONTENT_RANGE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+class UploadLocked(Exception):
+    """
+    Raised when another request is already writing a chunk of the same upload.
+    """
+
+
+class IncompleteChunk(Exception):
+    """
+    Raised when the request body ends before the length announced in Content-Range.
+    """
+
+
+class ContentRange(NamedTuple):
+    """
+    The inclusive byte range a chunk covers in an upload of total bytes.
+    """
+
+    start: int
+    end: int
+    total: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+
+def parse_content_range(header: Optional[str]) -> Optional[ContentRange]:
+    """
+    Parse a `Content-Range: bytes <start>-<end>/<total>` request header.
+
+    Args:
+        header (Optional[str]): The raw header value.
+
+    Returns:
+        Optional[ContentRange]: The parsed range, or None if the header is missing or invalid.
+    """
+    match = _CONTENT_RANGE.match(header or '')
+    if match is None:
+        return None
+
+    content_range = ContentRange(*map(int, match.groups()))
+    if content_range.start > content_range.end or content_range.end >= content_range.total:
+        return None
+    return content_range
+
+
+def partial_path(video: Video) -> str:
+    """
+    Return the local path of the file chunks of an unfinished upload are written to.
+
+    Args:
+        video (Video): The video being uploaded.
+
+    Returns:
+        str: The absolute path of the partial file.
+    """
+    return default_storage.path(f'videos/partial/{video.pk}.part')
+
+
+def original_name(video: Video) -> str:
+    """
+    Return the storage name of a finished upload.
+
+    Args:
+        video (Video): The uploaded video.
+
+    Returns:
+        str: The name relative to the storage root.
+    """
+    extension = settings.VIDEO_UPLOAD_CONTENT_TYPES[video.content_type]
+    return f'videos/{video.pk}/original.{extension}'
+
+
+def create_partial(video: Video) -> None:
+    """
+    Create the empty partial file chunks of a new upload are written to.
+
+    Args:
+        video (Video): The video being uploaded.
+    """
+    path = partial_path(video)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'xb'):
+        pass
+
+
+@contextmanager
+def open_partial(video: Video) -> Iterator[BinaryIO]:
+    """
+    Open the partial file of an upload for writing, holding an exclusive lock on it.
+
+    The lock serializes chunk writes to one upload across threads and worker processes on
+    the same host without keeping a database transaction open while the body streams in.
+
+    Args:
+        video (Video): The video being uploaded.
+
+    Yields:
+        BinaryIO: The partial file, opened for reading and writing.
+
+    Raises:
+        UploadLocked: If another request holds the lock.
+        FileNotFoundError: If the upload was already moved into place or discarded.
+    """
+    with open(partial_path(video), 'r+b') as partial:
+        try:
+            fcntl.flock(partial.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            raise UploadLocked() from exc
+
+        try:
+            yield partial
+        finally:
+            fcntl.flock(partial.fileno(), fcntl.LOCK_UN)
+
+
+def write_chunk(partial: BinaryIO, content_range: ContentRange,
+                stream: Optional[BinaryIO]) -> str:
+    """
+    Stream a chunk from the request body into the partial file, hashing it on the way.
+
+    The body is copied in blocks of VIDEO_UPLOAD_BLOCK_SIZE, so memory use does not depend
+    on the chunk or video size. The data is flushed to disk before returning, so callers can
+    commit the new offset once the checksum matches. Writing the last chunk also trims any
+    bytes past the end left by an earlier, abandoned attempt.
+
+    Args:
+        partial (BinaryIO): The partial file, as opened by open_partial.
+        content_range (ContentRange): Where the chunk goes.
+        stream (Optional[BinaryIO]): The request body.
+
+    Returns:
+        str: The hex SHA-256 digest of the bytes written.
+
+    Raises:
+        IncompleteChunk: If the stream ends before the whole chunk was read.
+    """
+    digest = hashlib.sha256()
+    block_size = settings.VIDEO_UPLOAD_BLOCK_SIZE
+    remaining = content_range.length
+
+    partial.seek(content_range.start)
+    while remaining:
+        block = stream.read(min(block_size, remaining)) if stream is not None else b''
+        if not block:
+            raise IncompleteChunk()
+        partial.write(block)
+        digest.update(block)
+        remaining -= len(block)
+
+    if content_range.end + 1 == content_range.total:
+        partial.truncate(content_range.total)
+
+    partial.flush()
+    os.fsync(partial.fileno())
+    return digest.hexdigest()
+
+
+def finalize_upload(video: Video) -> None:
+    """
+    Move a complete partial file into place, mark the video as uploaded and queue its
+    processing jobs.
+
+    The file is renamed rather than copied, so finishing an upload does not re-read it.
+    Safe to call again if a previous attempt stopped after the rename; the jobs are only
+    queued by the call that changes the status.
+
+    Args:
+        video (Video): The video whose upload_offset has reached its size.
+    """
+    name = original_name(video)
+    destination = default_storage.path(name)
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+    try:
+        os.replace(partial_path(video), destination)
+    except FileNotFoundError:
+        # Already moved by a previous or concurrent attempt.
+        pass
+
+    with transaction.atomic():
+        uploaded = Video.objects.filter(pk=video.pk, status=Video.Status.UPLOADING).update(
+            file=name, status=Video.Status.UPLOADED)
+        video.file.name = name
+        video.status = Video.Status.UPLOADED
+        if uploaded:
+            enqueue_processing(video)
+
+
+def discard_upload(video: Video) -> None:
+    """
+    Delete the partial file of an abandoned upload.
+
+    Args:
+        video (Video): The video being uploaded.
+    """
+    try:
+        os.remove(partial_path(video))
+    except FileNotFoundError:
+        pass
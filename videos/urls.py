@@ -0,0 +1,34 @@
+from django.urls import path
+from videos.views.video_upload_view import VideoUploadAPIView, VideoUploadCreateAPIView
+from videos.views.video_stream_view import VideoStreamAPIView
+from videos.views.video_feed_view import VideoFeedAPIView
+from videos.views.video_search_view import VideoSearchAPIView
+from videos.views.video_trending_view import VideoTrendingAPIView
+from videos.views.video_timeline_view import VideoTimelineAPIView
+from videos.views.video_list_view import UserVideoListAPIView, VideoListAPIView
+from videos.views.video_comment_view import (CommentReplyListAPIView, VideoCommentAPIView,
+                                             VideoCommentListAPIView)
+from videos.views.video_engagement_view import (VideoLikeAPIView, VideoShareAPIView,
+                                                VideoViewCountAPIView)
+
+
+urlpatterns = [
+    path('videos/uploads/', VideoUploadCreateAPIView.as_view(), name='video_upload_create'),
+    path('videos/uploads/<int:video_id>/', VideoUploadAPIView.as_view(), name='video_upload'),
+    path('videos/', VideoListAPIView.as_view(), name='video_list'),
+    path('videos/feed/', VideoFeedAPIView.as_view(), name='video_feed'),
+    path('videos/following/', VideoTimelineAPIView.as_view(), name='video_timeline'),
+    path('videos/search/', VideoSearchAPIView.as_view(), name='video_search'),
+    path('videos/trending/<str:kind>/', VideoTrendingAPIView.as_view(), name='video_trending'),
+    path('videos/<int:video_id>/stream/', VideoStreamAPIView.as_view(), name='video_stream'),
+    path('videos/<int:video_id>/view/', VideoViewCountAPIView.as_view(), name='video_view'),
+    path('videos/<int:video_id>/like/', VideoLikeAPIView.as_view(), name='video_like'),
+    path('videos/<int:video_id>/share/', VideoShareAPIView.as_view(), name='video_share'),
+    path('videos/<int:video_id>/comments/', VideoCommentListAPIView.as_view(),
+         name='video_comments'),
+    path('videos/<int:video_id>/comments/<int:comment_id>/', VideoCommentAPIView.as_view(),
+         name='video_comment'),
+    path('videos/<int:video_id>/comments/<int:comment_id>/replies/',
+         CommentReplyListAPIView.as_view(), name='comment_replies'),
+    path('users/<int:userid>/videos/', UserVideoListAPIView.as_view(), name='user_video_list'),
+]
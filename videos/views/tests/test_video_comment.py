@@ -0,0 +1,154 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from videos.models.comment_models import Comment
+from videos.models.video_models import Video
+
+
+class VideoCommentAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the VideoCommentListAPIView, CommentReplyListAPIView and
+    VideoCommentAPIView classes.
+    """
+
+    # A reply loads its parent, and the parent's own parent when replying to a reply, then
+    # inserts and bumps the reply count; deleting also loads the replies it cascades to.
+    query_budgets = {'GET video_comments': 3, 'GET comment_replies': 3, 'video_comments': 2,
+                     'comment_replies': 4, 'video_comment': 4}
+
+    def setUp(self):
+        self.users = [
+            CustomUser.objects.create_user(username=f'testuser{i}', email=f'test{i}@example.com')
+            for i in range(3)
+        ]
+        self.video = Video.objects.create(owner=self.users[0], title='Video',
+                                          content_type='video/mp4', size=1,
+                                          status=Video.Status.READY)
+        self.client.force_authenticate(self.users[0])
+
+    def comments_url(self, video=None):
+        return reverse('video_comments', kwargs={'video_id': (video or self.video).pk})
+
+    def comment_url(self, name, comment):
+        """
+        Return the URL of a comment view for a comment of self.video.
+        """
+        return reverse(name, kwargs={'video_id': self.video.pk, 'comment_id': comment.pk})
+
+    def comment(self, text, author=None, parent=None):
+        """
+        Post a comment, or a reply to parent, through the API and return it.
+        """
+        self.client.force_authenticate(author or self.users[0])
+        url = (self.comment_url('comment_replies', parent) if parent
+               else self.comments_url())
+        response = self.client.post(url, {'text': text})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Comment.objects.get(pk=response.data['id'])
+
+    def texts(self, url, **params):
+        """
+        Return the texts of every page of a comment list, following the cursors.
+        """
+        texts, cursor = [], None
+        while True:
+            query = dict(params, **({'cursor': cursor} if cursor else {}))
+            response = self.client.get(url, query)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            texts += [comment['text'] for comment in response.data['results']]
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                return texts
+
+    def test_threads_and_reply_counts(self):
+        """
+        Ensure that comments list newest first, replies oldest first with replies to
+        replies in the same thread, and that reply counts follow creations and deletions.
+        """
+
+        first = self.comment('first')
+        second = self.comment('second', author=self.users[1])
+        reply = self.comment('reply', author=self.users[1], parent=first)
+        self.comment('reply to reply', author=self.users[2], parent=reply)
+
+        self.client.force_authenticate(None)
+        top_level = self.client.get(self.comments_url())
+
+        self.assertEqual([(comment['text'], comment['reply_count'])
+                          for comment in top_level.data['results']],
+                         [('second', 0), ('first', 2)])
+        self.assertEqual(top_level.data['results'][0]['author'],
+                         {'id': self.users[1].pk, 'username': 'testuser1',
+                          'profile_picture': None, 'profile_picture_variants': {}})
+        self.assertEqual(self.texts(self.comment_url('comment_replies', first), limit=1),
+                         ['reply', 'reply to reply'])
+        self.assertEqual(self.texts(self.comment_url('comment_replies', second)), [])
+
+        self.client.force_authenticate(self.users[1])
+        deleted = self.client.delete(self.comment_url('video_comment', reply))
+
+        self.assertEqual(deleted.status_code, status.HTTP_204_NO_CONTENT)
+        first.refresh_from_db()
+        self.assertEqual(first.reply_count, 1)
+
+    def test_page_query_count_is_constant(self):
+        """
+        Ensure that a page costs the same queries however many comments and authors it has.
+        """
+
+        def count_queries(url):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {'limit': 50})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries), len(response.data['results'])
+
+        root = Comment.objects.create(video=self.video, author=self.users[0], text='root')
+        Comment.objects.create(video=self.video, author=self.users[0], text='re', parent=root)
+        small = count_queries(self.comments_url())
+        small_replies = count_queries(self.comment_url('comment_replies', root))
+
+        authors = CustomUser.objects.bulk_create([
+            CustomUser(username=f'author{i}', email=f'author{i}@example.com') for i in range(30)
+        ])
+        Comment.objects.bulk_create(
+            [Comment(video=self.video, author=author, text='hi') for author in authors]
+            + [Comment(video=self.video, author=author, text='re', parent=root)
+               for author in authors])
+
+        self.assertEqual(count_queries(self.comments_url()), (small[0], 31))
+        self.assertEqual(count_queries(self.comment_url('comment_replies', root)),
+                         (small_replies[0], 31))
+        self.assertEqual(small[0], 3)
+
+    def test_errors(self):
+        """
+        Ensure that anonymous users cannot comment, only authors delete, unknown videos and
+        comments return 404, and empty texts are rejected.
+        """
+
+        comment = self.comment('mine')
+        processing = Video.objects.create(owner=self.users[0], title='Processing',
+                                          content_type='video/mp4', size=1,
+                                          status=Video.Status.PROCESSING)
+
+        empty = self.client.post(self.comments_url(), {'text': ''})
+        hidden = self.client.get(self.comments_url(processing))
+        unknown = self.client.post(reverse('comment_replies',
+                                           kwargs={'video_id': self.video.pk, 'comment_id': 999}),
+                                   {'text': 'hi'})
+        self.client.force_authenticate(self.users[1])
+        not_author = self.client.delete(self.comment_url('video_comment', comment))
+        self.client.force_authenticate(None)
+        anonymous = self.client.post(self.comments_url(), {'text': 'hi'})
+
+        self.assertEqual(empty.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(hidden.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(unknown.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(not_author.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(anonymous.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertTrue(Comment.objects.filter(pk=comment.pk).exists())
@@ -0,0 +1,95 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from videos.counters import flush_counters, get_counter_backend
+from videos.models.video_models import Video
+from videos.models.video_like_models import VideoLike
+
+
+@override_settings(VIDEO_COUNTER_FLUSH_INTERVAL=0)
+class VideoEngagementAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the VideoViewCountAPIView, VideoShareAPIView and VideoLikeAPIView classes.
+    """
+
+    query_budgets = {'POST video_like': 3, 'video_like': 2, 'video_view': 1, 'video_share': 1}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.video = Video.objects.create(owner=self.user, title='Video', content_type='video/mp4',
+                                          size=1, status=Video.Status.READY, view_count=7)
+        get_counter_backend().clear()
+
+    def test_views_are_counted_behind(self):
+        """
+        Ensure that views are returned at once but written to the row only on flush.
+        """
+
+        url = reverse('video_view', kwargs={'video_id': self.video.pk})
+
+        self.client.post(url)
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['view_count'], 9)
+        self.assertEqual(Video.objects.get(pk=self.video.pk).view_count, 7)
+
+        flush_counters()
+
+        self.assertEqual(Video.objects.get(pk=self.video.pk).view_count, 9)
+        listed = self.client.get(reverse('video_list'))
+        self.assertEqual(listed.data['results'][0]['view_count'], 9)
+
+    def test_share(self):
+        """
+        Ensure that shares are counted.
+        """
+
+        response = self.client.post(reverse('video_share', kwargs={'video_id': self.video.pk}))
+
+        self.assertEqual(response.data['share_count'], 1)
+
+    def test_like_is_idempotent(self):
+        """
+        Ensure that a user's like counts once and unliking takes it back.
+        """
+
+        url = reverse('video_like', kwargs={'video_id': self.video.pk})
+        self.client.force_authenticate(self.user)
+
+        created = self.client.post(url)
+        repeated = self.client.post(url)
+
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(repeated.status_code, status.HTTP_200_OK)
+        self.assertEqual(repeated.data['like_count'], 1)
+
+        self.client.delete(url)
+        removed = self.client.delete(url)
+
+        self.assertEqual(removed.data['like_count'], 0)
+        self.assertFalse(VideoLike.objects.exists())
+
+    def test_like_requires_authentication(self):
+        """
+        Ensure that anonymous users cannot like videos.
+        """
+
+        response = self.client.post(reverse('video_like', kwargs={'video_id': self.video.pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_video_not_ready(self):
+        """
+        Ensure that events on videos that are not ready or do not exist return 404.
+        """
+
+        Video.objects.filter(pk=self.video.pk).update(status=Video.Status.PROCESSING)
+
+        for video_id in (self.video.pk, 999):
+            response = self.client.post(reverse('video_view', kwargs={'video_id': video_id}))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
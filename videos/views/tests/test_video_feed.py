@@ -0,0 +1,110 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.pagination import encode_cursor
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from videos.feed import feed_cache
+from videos.models.video_models import Video
+
+
+@override_settings(FEED_FEATURES_TTL=0, FEED_PAGE_SIZE=2)
+class VideoFeedAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the VideoFeedAPIView class.
+    """
+
+    # One query per candidate source (recent, inbox, followed creators) and one for the page.
+    query_budgets = {'video_feed': 4}
+
+    def setUp(self):
+        self.viewer = CustomUser.objects.create_user(username='viewer', email='viewer@example.com')
+        self.creator = CustomUser.objects.create_user(username='creator',
+                                                      email='creator@example.com')
+        self.videos = [
+            Video.objects.create(owner=self.creator, title=f'Video {likes}',
+                                 content_type='video/mp4', size=1, status=Video.Status.READY,
+                                 view_count=100, like_count=likes)
+            for likes in (10, 50, 30)
+        ]
+        self.client.force_authenticate(self.viewer)
+        self.url = reverse('video_feed')
+
+    def test_feed_pages(self):
+        """
+        Ensure that the feed is returned best first, page by page.
+        """
+
+        first = self.client.get(self.url)
+        second = self.client.get(self.url, {'cursor': first.data['next_cursor']})
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual([video['title'] for video in first.data['results']],
+                         ['Video 50', 'Video 30'])
+        self.assertEqual([video['title'] for video in second.data['results']], ['Video 10'])
+        self.assertIsNone(second.data['next_cursor'])
+
+    def test_scrolling_does_not_rescore(self):
+        """
+        Ensure that later pages come from the cached ranking until the feed is reopened.
+        """
+
+        first = self.client.get(self.url, {'limit': 1})
+        Video.objects.filter(pk=self.videos[0].pk).update(like_count=90)
+
+        scrolled = self.client.get(self.url, {'cursor': first.data['next_cursor'], 'limit': 1})
+        reopened = self.client.get(self.url, {'limit': 1})
+
+        self.assertEqual(scrolled.data['results'][0]['title'], 'Video 30')
+        self.assertEqual(reopened.data['results'][0]['title'], 'Video 10')
+
+    def test_own_and_unready_videos_are_excluded(self):
+        """
+        Ensure that the viewer's own videos and unprocessed videos are not in the feed.
+        """
+
+        Video.objects.create(owner=self.viewer, title='Mine', content_type='video/mp4', size=1,
+                             status=Video.Status.READY, like_count=99)
+        Video.objects.filter(pk=self.videos[1].pk).update(status=Video.Status.PROCESSING)
+
+        response = self.client.get(self.url, {'limit': 10})
+
+        self.assertEqual([video['title'] for video in response.data['results']],
+                         ['Video 30', 'Video 10'])
+
+    def test_anonymous_feed(self):
+        """
+        Ensure that anonymous users get a feed too.
+        """
+
+        self.client.force_authenticate(None)
+
+        response = self.client.get(self.url, {'limit': 10})
+
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_invalid_parameters(self):
+        """
+        Ensure that invalid cursors and limits are rejected.
+        """
+
+        for params in ({'cursor': 'abc'}, {'cursor': '-1'}, {'limit': '0'}, {'limit': '51'},
+                       {'cursor': encode_cursor([10 ** 400, 1])},
+                       {'cursor': encode_cursor([1.0, float('inf')])}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_cursor_survives_expired_ranking(self):
+        """
+        Ensure that a cursor resumes at the same score after the cached ranking is gone.
+        """
+
+        with self.settings(FEED_FEATURES_TTL=60):
+            first = self.client.get(self.url, {'limit': 1})
+            feed_cache.clear()
+
+            second = self.client.get(self.url, {'cursor': first.data['next_cursor'], 'limit': 1})
+
+        self.assertEqual(second.data['results'][0]['title'], 'Video 30')
@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+
+
+class VideoListAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the VideoListAPIView and UserVideoListAPIView classes.
+    """
+
+    query_budgets = {'video_list': 1, 'user_video_list': 2}
+
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(username='owner', email='owner@example.com')
+        self.other = CustomUser.objects.create_user(username='other', email='other@example.com')
+        now = timezone.now()
+        # Videos 1 and 2 share a timestamp, so their order comes from the id.
+        for index, minutes in enumerate([0, 10, 10, 30, 40]):
+            video = Video.objects.create(owner=self.owner, title=f'Video {index}',
+                                         content_type='video/mp4', size=1,
+                                         status=Video.Status.READY)
+            Video.objects.filter(pk=video.pk).update(created_at=now - timedelta(minutes=minutes))
+        Video.objects.create(owner=self.owner, title='Processing', content_type='video/mp4',
+                             size=1, status=Video.Status.PROCESSING)
+        Video.objects.create(owner=self.other, title='Other', content_type='video/mp4', size=1,
+                             status=Video.Status.READY)
+
+    def titles(self, url, **params):
+        """
+        Walk every page of a listing and return the titles in order and the page count.
+        """
+        titles, cursor, pages = [], None, 0
+        while True:
+            query = dict(params, **({'cursor': cursor} if cursor else {}))
+            response = self.client.get(url, query)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [video['title'] for video in response.data['results']]
+            cursor, pages = response.data['next_cursor'], pages + 1
+            if cursor is None:
+                return titles, pages
+
+    def test_list_videos_pages(self):
+        """
+        Ensure that walking the cursors lists every ready video once, newest first.
+        """
+
+        Video.objects.filter(title='Other').update(created_at=timezone.now() + timedelta(hours=1))
+
+        titles, pages = self.titles(reverse('video_list'), limit=2)
+
+        self.assertEqual(titles, ['Other', 'Video 0', 'Video 2', 'Video 1', 'Video 3', 'Video 4'])
+        self.assertEqual(pages, 3)
+
+    def test_new_videos_do_not_shift_pages(self):
+        """
+        Ensure that a video published while a client scrolls does not repeat items.
+        """
+
+        first = self.client.get(reverse('video_list'), {'limit': 3})
+        Video.objects.create(owner=self.other, title='New', content_type='video/mp4', size=1,
+                             status=Video.Status.READY)
+
+        second = self.client.get(reverse('video_list'),
+                                 {'limit': 3, 'cursor': first.data['next_cursor']})
+
+        seen = [video['title'] for video in first.data['results'] + second.data['results']]
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertNotIn('New', seen)
+
+    def test_user_videos(self):
+        """
+        Ensure that a user's videos are listed, including unprocessed ones for the owner only.
+        """
+
+        url = reverse('user_video_list', kwargs={'userid': self.owner.pk})
+
+        public, _ = self.titles(url)
+        self.client.force_authenticate(self.owner)
+        own, _ = self.titles(url)
+
+        self.assertEqual(len(public), 5)
+        self.assertNotIn('Other', public)
+        self.assertEqual(own[0], 'Processing')
+        self.assertEqual(len(own), 6)
+
+    def test_user_not_found(self):
+        """
+        Ensure that listing the videos of an unknown user returns 404.
+        """
+
+        response = self.client.get(reverse('user_video_list', kwargs={'userid': 999}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_cursor_and_limit(self):
+        """
+        Ensure that tampered cursors and out of range limits are rejected.
+        """
+
+        for params in ({'cursor': 'not-a-cursor'}, {'cursor': 'WzFd'}, {'cursor': 'WyJ4IiwxXQ'},
+                       {'cursor': 'W251bGwsMV0'}, {'limit': '0'}, {'limit': '101'},
+                       {'cursor': 'WyIyMDI0LTAxLTAxVDAwOjAwOjAwWiIsMWU5OTld'},
+                       {'cursor': 'WyIyMDI0LTAxLTAxVDAwOjAwOjAwWiIsSW5maW5pdHld'}):
+            response = self.client.get(reverse('video_list'), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn('error', response.data)
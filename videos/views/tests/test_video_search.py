@@ -0,0 +1,47 @@
+import unittest
+
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+
+
+class VideoSearchAPIViewTest(APITestCase):
+    """
+    Test module for the VideoSearchAPIView class.
+    """
+
+    def setUp(self):
+        owner = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        for title, description, video_status in (
+                ('Dinner in ten minutes', 'Quick pasta', Video.Status.READY),
+                ('Morning run', 'Dinner after a long run', Video.Status.READY),
+                ('Dinner party', 'Not processed yet', Video.Status.PROCESSING)):
+            Video.objects.create(owner=owner, title=title, description=description,
+                                 content_type='video/mp4', size=1, status=video_status)
+
+    def test_missing_query(self):
+        """
+        Ensure that searching without a query returns 400.
+        """
+
+        response = self.client.get(reverse('video_search'))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'Full-text search needs PostgreSQL.')
+    def test_search_ready_videos_by_caption(self):
+        """
+        Ensure that ready videos are matched by title and description, titles first.
+        """
+
+        response = self.client.get(reverse('video_search'), {'q': 'dinner'})
+        phrase = self.client.get(reverse('video_search'), {'q': '"long run" -pasta'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([video['title'] for video in response.data['results']],
+                         ['Dinner in ten minutes', 'Morning run'])
+        self.assertEqual([video['title'] for video in phrase.data['results']], ['Morning run'])
@@ -0,0 +1,178 @@
+import os
+import shutil
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+
+
+class VideoStreamAPIViewTest(APITestCase):
+    """
+    Test module for the VideoStreamAPIView class.
+    """
+
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(username='testuser', email='test@example.com')
+        self.content = os.urandom(5000)
+        self.video = Video.objects.create(owner=self.owner, title='Video',
+                                          content_type='video/mp4', size=len(self.content),
+                                          upload_offset=len(self.content),
+                                          status=Video.Status.READY)
+        self.video.file.name = default_storage.save('videos/1/original.mp4',
+                                                     ContentFile(self.content))
+        rendition = default_storage.save('videos/1/360p.mp4', ContentFile(b'360p rendition'))
+        self.video.renditions = {'360p': rendition}
+        self.video.save()
+        self.url = reverse('video_stream', kwargs={'video_id': self.video.pk})
+
+    def tearDown(self):
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+    def test_stream_whole_video(self):
+        """
+        Ensure that a request without Range gets the whole file with cache validators.
+        """
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertEqual(response['Content-Length'], '5000')
+        self.assertEqual(response['Content-Type'], 'video/mp4')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+        self.assertIn('public', response['Cache-Control'])
+
+    def test_stream_single_range(self):
+        """
+        Ensure that a single range gets a 206 with exactly the requested bytes.
+        """
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=1000-1999')
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b''.join(response.streaming_content), self.content[1000:2000])
+        self.assertEqual(response['Content-Length'], '1000')
+        self.assertEqual(response['Content-Range'], 'bytes 1000-1999/5000')
+
+    def test_stream_multiple_ranges(self):
+        """
+        Ensure that several ranges get a multipart/byteranges body.
+        """
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-99,-100')
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertTrue(response['Content-Type'].startswith('multipart/byteranges; boundary='))
+        body = b''.join(response.streaming_content)
+        self.assertEqual(len(body), int(response['Content-Length']))
+        self.assertIn(b'Content-Range: bytes 0-99/5000\r\n\r\n' + self.content[:100], body)
+        self.assertIn(b'Content-Range: bytes 4900-4999/5000\r\n\r\n' + self.content[4900:], body)
+
+    @override_settings(VIDEO_STREAM_MAX_RANGES=2)
+    def test_too_many_ranges_get_whole_video(self):
+        """
+        Ensure that a request with more ranges than allowed gets the whole file.
+        """
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-0,10-10,20-20')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    def test_unsatisfiable_range(self):
+        """
+        Ensure that a range past the end of the file gets a 416 with the file size.
+        """
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=5000-')
+
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response['Content-Range'], 'bytes */5000')
+
+    def test_malformed_range_is_ignored(self):
+        """
+        Ensure that a malformed Range header is ignored.
+        """
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=oops')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    def test_if_range(self):
+        """
+        Ensure that a range is only honoured while If-Range matches the current file.
+        """
+
+        first = self.client.get(self.url)
+        b''.join(first.streaming_content)
+
+        current = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=first['ETag'])
+        stale = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+
+        self.assertEqual(b''.join(current.streaming_content), self.content[:10])
+        self.assertEqual(stale.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(stale.streaming_content), self.content)
+
+    def test_not_modified(self):
+        """
+        Ensure that revalidating with the ETag or the date gets a 304.
+        """
+
+        first = self.client.get(self.url)
+        b''.join(first.streaming_content)
+
+        by_etag = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        by_date = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+        self.assertEqual(by_etag.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(by_date.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(by_etag['ETag'], first['ETag'])
+
+    def test_stream_rendition(self):
+        """
+        Ensure that a rendition can be selected, and unknown ones are reported.
+        """
+
+        response = self.client.get(self.url, {'rendition': '360p'})
+        missing = self.client.get(self.url, {'rendition': '4k'})
+
+        self.assertEqual(b''.join(response.streaming_content), b'360p rendition')
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unprocessed_video_is_only_visible_to_owner(self):
+        """
+        Ensure that a video still being processed can only be played by its owner.
+        """
+
+        Video.objects.filter(pk=self.video.pk).update(status=Video.Status.PROCESSING)
+
+        anonymous = self.client.get(self.url)
+        self.client.force_authenticate(self.owner)
+        owner = self.client.get(self.url)
+
+        self.assertEqual(anonymous.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(owner.status_code, status.HTTP_200_OK)
+        self.assertEqual(owner['Cache-Control'], 'private, no-cache')
+        b''.join(owner.streaming_content)
+
+    @override_settings(VIDEO_STREAM_ACCEL_REDIRECT='/protected-media/')
+    def test_accel_redirect(self):
+        """
+        Ensure that the transfer is delegated to nginx when configured.
+        """
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/videos/1/original.mp4')
+        self.assertEqual(response.content, b'')
@@ -0,0 +1,49 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.follows import follow
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+
+
+class VideoTimelineAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the VideoTimelineAPIView class.
+    """
+
+    query_budgets = {'video_timeline': 2}
+
+    def setUp(self):
+        self.reader = CustomUser.objects.create_user(username='reader', email='reader@example.com')
+        self.creator = CustomUser.objects.create_user(username='creator',
+                                                      email='creator@example.com')
+        self.video = Video.objects.create(owner=self.creator, title='Followed',
+                                          content_type='video/mp4', size=1,
+                                          status=Video.Status.READY)
+        self.url = reverse('video_timeline')
+
+    def test_timeline(self):
+        """
+        Ensure that the videos of followed creators are listed.
+        """
+
+        with self.captureOnCommitCallbacks(execute=True):
+            follow(self.reader, self.creator)
+        self.client.force_authenticate(self.reader)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([video['title'] for video in response.data['results']], ['Followed'])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_timeline_requires_authentication(self):
+        """
+        Ensure that anonymous users have no timeline.
+        """
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,42 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from videos.trending import get_trending_aggregator
+
+
+@override_settings(TRENDING_SNAPSHOT_INTERVAL=3600)
+class VideoTrendingAPIViewTest(APITestCase):
+    """
+    Test module for the VideoTrendingAPIView class.
+    """
+
+    def test_trending_hashtags(self):
+        """
+        Ensure that the top hashtags of the window are returned, heaviest first.
+        """
+
+        get_trending_aggregator().record('hashtags', {'food': 3, 'dance': 5, 'cats': 1})
+
+        response = self.client.get(reverse('video_trending', kwargs={'kind': 'hashtags'}),
+                                   {'window': '1h', 'limit': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'kind': 'hashtags',
+            'window': '1h',
+            'results': [{'name': 'dance', 'score': 5}, {'name': 'food', 'score': 3}],
+        })
+
+    def test_unknown_kind_or_window(self):
+        """
+        Ensure that an unknown kind returns 404 and an unknown window 400.
+        """
+
+        kind = self.client.get(reverse('video_trending', kwargs={'kind': 'songs'}))
+        window = self.client.get(reverse('video_trending', kwargs={'kind': 'sounds'}),
+                                 {'window': '2h'})
+
+        self.assertEqual(kind.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(window.status_code, status.HTTP_400_BAD_REQUEST)
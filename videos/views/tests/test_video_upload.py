@@ -0,0 +1,222 @@
+import hashlib
+import os
+import shutil
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.query_budget import QueryBudgetMixin
+from users.models.custom_user_models import CustomUser
+from videos.models.video_models import Video
+from videos.uploads import open_partial, partial_path
+
+
+class VideoUploadAPIViewTest(QueryBudgetMixin, APITestCase):
+    """
+    Test module for the VideoUploadCreateAPIView and VideoUploadAPIView classes.
+    """
+
+    # The last chunk also moves the video to processing and queues its job; deleting is one
+    # query per table the video cascades to.
+    query_budgets = {'video_upload_create': 1, 'GET video_upload': 1, 'PUT video_upload': 5,
+                     'DELETE video_upload': 6}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='testuser', email='test@example.com', password='testpassword123')
+        self.client.force_authenticate(self.user)
+        self.content = os.urandom(2500)
+
+    def tearDown(self):
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+    def start_upload(self, size=None):
+        """
+        Start an upload of self.content, or of size bytes, and return the response.
+        """
+        response = self.client.post(reverse('video_upload_create'), {
+            'title': 'My video',
+            'content_type': 'video/mp4',
+            'size': len(self.content) if size is None else size,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response
+
+    def put_chunk(self, url, start, end, checksum=None, body=None):
+        chunk = self.content[start:end + 1] if body is None else body
+        return self.client.put(
+            url, data=chunk, content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{len(self.content)}',
+            HTTP_X_CHUNK_CHECKSUM=checksum or hashlib.sha256(chunk).hexdigest(),
+        )
+
+    def test_start_upload(self):
+        """
+        Ensure that starting an upload creates a video owned by the user at offset 0.
+        """
+
+        response = self.start_upload()
+
+        self.assertEqual(response.data['status'], Video.Status.UPLOADING)
+        self.assertEqual(response['Upload-Offset'], '0')
+        self.assertEqual(response['Location'],
+                         reverse('video_upload', kwargs={'video_id': response.data['id']}))
+        self.assertEqual(Video.objects.get().owner, self.user)
+
+    def test_start_upload_rejects_unsupported_type_and_size(self):
+        """
+        Ensure that uploads with an unknown content type or oversized file are rejected.
+        """
+
+        response = self.client.post(reverse('video_upload_create'), {
+            'title': 'My video', 'content_type': 'video/x-flv',
+            'size': settings.VIDEO_UPLOAD_MAX_SIZE + 1,
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('content_type', response.data)
+        self.assertIn('size', response.data)
+
+    def test_start_upload_requires_authentication(self):
+        """
+        Ensure that anonymous users cannot start uploads.
+        """
+
+        self.client.force_authenticate(None)
+
+        response = self.client.post(reverse('video_upload_create'), {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(VIDEO_UPLOAD_BLOCK_SIZE=256)
+    def test_upload_in_chunks(self):
+        """
+        Ensure that chunks are assembled in place and the file is moved into storage.
+        """
+
+        url = self.start_upload()['Location']
+
+        first = self.put_chunk(url, 0, 999)
+        second = self.put_chunk(url, 1000, 2499)
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first['Upload-Offset'], '1000')
+        self.assertEqual(second.data['status'], Video.Status.UPLOADED)
+
+        video = Video.objects.get()
+        self.assertEqual(video.upload_offset, len(self.content))
+        with default_storage.open(video.file.name) as stored:
+            self.assertEqual(stored.read(), self.content)
+        self.assertFalse(os.path.exists(partial_path(video)))
+
+    def test_resume_from_committed_offset(self):
+        """
+        Ensure that a chunk not starting at the committed offset is rejected with the offset.
+        """
+
+        url = self.start_upload()['Location']
+        self.put_chunk(url, 0, 999)
+
+        response = self.put_chunk(url, 500, 1499)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['upload_offset'], 1000)
+        self.assertEqual(self.client.get(url)['Upload-Offset'], '1000')
+
+    def test_checksum_mismatch_does_not_advance_offset(self):
+        """
+        Ensure that a corrupted chunk is rejected and can be sent again.
+        """
+
+        url = self.start_upload()['Location']
+
+        response = self.put_chunk(url, 0, 999, checksum='0' * 64)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Video.objects.get().upload_offset, 0)
+        self.assertEqual(self.put_chunk(url, 0, 999).status_code, status.HTTP_200_OK)
+
+    def test_rejects_invalid_chunk_headers(self):
+        """
+        Ensure that chunks with a bad Content-Range or no checksum are rejected.
+        """
+
+        url = self.start_upload()['Location']
+        chunk = self.content[:100]
+
+        wrong_total = self.client.put(url, data=chunk, content_type='application/octet-stream',
+                                      HTTP_CONTENT_RANGE='bytes 0-99/100',
+                                      HTTP_X_CHUNK_CHECKSUM=hashlib.sha256(chunk).hexdigest())
+        no_checksum = self.client.put(url, data=chunk, content_type='application/octet-stream',
+                                      HTTP_CONTENT_RANGE=f'bytes 0-99/{len(self.content)}')
+        short_body = self.put_chunk(url, 0, 199, body=chunk)
+
+        self.assertEqual(wrong_total.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(no_checksum.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(short_body.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(VIDEO_UPLOAD_MAX_CHUNK_SIZE=500)
+    def test_rejects_oversized_chunk(self):
+        """
+        Ensure that chunks above VIDEO_UPLOAD_MAX_CHUNK_SIZE are rejected.
+        """
+
+        url = self.start_upload()['Location']
+
+        response = self.put_chunk(url, 0, 999)
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    def test_concurrent_chunk_is_rejected(self):
+        """
+        Ensure that a chunk is refused while another request holds the upload.
+        """
+
+        url = self.start_upload()['Location']
+
+        with open_partial(Video.objects.get()):
+            response = self.put_chunk(url, 0, 999)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_other_users_cannot_access_upload(self):
+        """
+        Ensure that an upload is only visible to its owner.
+        """
+
+        url = self.start_upload()['Location']
+        other = CustomUser.objects.create_user(username='other', email='other@example.com')
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.put_chunk(url, 0, 999).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_abandon_upload(self):
+        """
+        Ensure that deleting an unfinished upload removes the video and its partial file.
+        """
+
+        url = self.start_upload()['Location']
+        self.put_chunk(url, 0, 999)
+        path = partial_path(Video.objects.get())
+
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Video.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+    def test_finished_upload_cannot_be_written_or_abandoned(self):
+        """
+        Ensure that a finished upload rejects further chunks and deletion.
+        """
+
+        url = self.start_upload()['Location']
+        self.put_chunk(url, 0, 2499)
+
+        self.assertEqual(self.put_chunk(url, 0, 999).status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_409_CONFLICT)
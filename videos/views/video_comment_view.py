@@ -0,0 +1,198 @@
+from typing import Optional
+
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+from utils.pagination import KeysetPagination
+from videos.comments import add_comment, delete_comment, with_authors
+from videos.models.comment_models import Comment
+from videos.models.video_models import Video
+from videos.serializers import CommentSerializer
+from videos.constants import (VIDEO_NOT_FOUND_MESSAGE, COMMENT_NOT_FOUND_MESSAGE,
+                              COMMENT_NOT_AUTHOR_ERROR)
+
+
+class ReplyPagination(KeysetPagination):
+    """
+    Keyset pagination of a comment's replies, oldest first, so a thread reads in order.
+    """
+
+    ordering = ('created_at', 'id')
+
+
+def _ready_video(video_id: int) -> Optional[Video]:
+    return Video.objects.filter(pk=video_id, status=Video.Status.READY).only('id').first()
+
+
+def _comment_of(video_id: int, comment_id: int) -> Optional[Comment]:
+    return (Comment.objects.filter(pk=comment_id, video_id=video_id,
+                                   video__status=Video.Status.READY)
+            .select_related('video').first())
+
+
+def _not_found(message: str) -> Response:
+    return Response({'error': message}, status=status.HTTP_404_NOT_FOUND)
+
+
+def _page(request: HttpRequest, view: APIView, comments: QuerySet,
+          paginator: KeysetPagination) -> Response:
+    page = paginator.paginate_queryset(with_authors(comments), request, view=view)
+    return paginator.get_paginated_response(CommentSerializer(page, many=True).data)
+
+
+def _create(request: HttpRequest, video: Video, parent: Optional[Comment] = None) -> Response:
+    serializer = CommentSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    comment = add_comment(video, request.user, serializer.validated_data['text'], parent)
+    return Response(CommentSerializer(comment).data, status=status.HTTP_201_CREATED)
+
+
+class VideoCommentListAPIView(APIView):
+    """
+    API view for the top-level comments of a ready video.
+
+    Pages are fetched by keyset on (created_at, id), newest first, and the authors of a page
+    are loaded by one prefetch (videos.comments.with_authors), so a page costs the same
+    number of queries whatever its size. Replies are loaded separately, a page at a time,
+    from CommentReplyListAPIView; each comment carries its reply_count.
+
+    Methods:
+    - get: Retrieve a page of comments.
+    - post: Comment on the video.
+    """
+
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def get(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Retrieve a page of a video's top-level comments.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'cursor' and
+            'limit' query parameters.
+            video_id (int): The ID of the video.
+
+        Returns:
+            Response: The comments under 'results' and the cursor of the next page under
+            'next_cursor', a 400 response for an invalid cursor or limit, or a 404 response
+            if the video is not found or not ready.
+        """
+        if _ready_video(video_id) is None:
+            return _not_found(VIDEO_NOT_FOUND_MESSAGE)
+
+        comments = Comment.objects.filter(video_id=video_id, parent__isnull=True)
+        return _page(request, self, comments, KeysetPagination())
+
+    def post(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Comment on a video.
+
+        Args:
+            request (HttpRequest): The HTTP request object with the text.
+            video_id (int): The ID of the video.
+
+        Returns:
+            Response: The new comment, the validation errors, or a 404 response if the
+            video is not found or not ready.
+        """
+        video = _ready_video(video_id)
+        if video is None:
+            return _not_found(VIDEO_NOT_FOUND_MESSAGE)
+
+        return _create(request, video)
+
+
+class CommentReplyListAPIView(APIView):
+    """
+    API view for the replies to a comment.
+
+    Pages are fetched by keyset on (created_at, id), oldest first, with the authors
+    prefetched as for the top-level comments.
+
+    Methods:
+    - get: Retrieve a page of replies.
+    - post: Reply to the comment.
+    """
+
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def get(self, request: HttpRequest, video_id: int, comment_id: int) -> Response:
+        """
+        Retrieve a page of a comment's replies.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'cursor' and
+            'limit' query parameters.
+            video_id (int): The ID of the video.
+            comment_id (int): The ID of the comment.
+
+        Returns:
+            Response: The replies under 'results' and the cursor of the next page under
+            'next_cursor', a 400 response for an invalid cursor or limit, or a 404 response
+            if the comment is not found on the video.
+        """
+        if not Comment.objects.filter(pk=comment_id, video_id=video_id,
+                                      video__status=Video.Status.READY).exists():
+            return _not_found(COMMENT_NOT_FOUND_MESSAGE)
+
+        return _page(request, self, Comment.objects.filter(parent_id=comment_id),
+                     ReplyPagination())
+
+    def post(self, request: HttpRequest, video_id: int, comment_id: int) -> Response:
+        """
+        Reply to a comment. Replies to a reply join the thread of its top-level comment.
+
+        Args:
+            request (HttpRequest): The HTTP request object with the text.
+            video_id (int): The ID of the video.
+            comment_id (int): The ID of the comment replied to.
+
+        Returns:
+            Response: The new reply, the validation errors, or a 404 response if the
+            comment is not found on the video.
+        """
+        parent = _comment_of(video_id, comment_id)
+        if parent is None:
+            return _not_found(COMMENT_NOT_FOUND_MESSAGE)
+
+        return _create(request, parent.video, parent)
+
+
+class VideoCommentAPIView(APIView):
+    """
+    API view for deleting one's own comment.
+
+    Methods:
+    - delete: Delete the comment and its replies.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def delete(self, request: HttpRequest, video_id: int, comment_id: int) -> Response:
+        """
+        Delete a comment with its replies.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            video_id (int): The ID of the video.
+            comment_id (int): The ID of the comment.
+
+        Returns:
+            Response: An empty 204 response, a 403 response if the requesting user is not
+            the author, or a 404 response if the comment is not found on the video.
+        """
+        comment = _comment_of(video_id, comment_id)
+        if comment is None:
+            return _not_found(COMMENT_NOT_FOUND_MESSAGE)
+        if comment.author_id != request.user.pk:
+            return Response({'error': COMMENT_NOT_AUTHOR_ERROR}, status=status.HTTP_403_FORBIDDEN)
+
+        delete_comment(comment)
+        return Response(status=status.HTTP_204_NO_CONTENT)
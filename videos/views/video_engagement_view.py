@@ -0,0 +1,130 @@
+from typing import Optional
+
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny, IsAuthenticated
+
+from django.http import HttpRequest
+
+from videos.counters import COUNTER_FIELDS, increment, with_pending_counts
+from videos.models.video_models import Video
+from videos.models.video_like_models import VideoLike
+from videos.constants import VIDEO_NOT_FOUND_MESSAGE
+
+
+def _ready_video(video_id: int) -> Optional[Video]:
+    return (Video.objects.filter(pk=video_id, status=Video.Status.READY)
+            .only('id', *COUNTER_FIELDS).first())
+
+
+def _counts(video: Video, status_code: int = status.HTTP_200_OK) -> Response:
+    with_pending_counts([video])
+    return Response({field: getattr(video, field) for field in COUNTER_FIELDS},
+                    status=status_code)
+
+
+class VideoCounterAPIView(APIView):
+    """
+    Base API view counting one event, such as a view or a share, on a ready video.
+
+    The event only adds to the pending delta of the counter (videos.counters); the row is
+    updated by the next flush, so popular videos do not serialize requests on a row lock.
+
+    Methods:
+    - post: Count one event.
+    """
+
+    permission_classes = [AllowAny]
+    field = ''
+
+    def post(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Count one event on a video.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            video_id (int): The ID of the video.
+
+        Returns:
+            Response: The counters of the video including the unflushed deltas, or a 404
+            response if the video is not found or not ready.
+        """
+        video = _ready_video(video_id)
+        if video is None:
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        increment(video.pk, self.field)
+        return _counts(video)
+
+
+class VideoViewCountAPIView(VideoCounterAPIView):
+    """
+    API view counting a play of a video.
+    """
+
+    field = 'view_count'
+
+
+class VideoShareAPIView(VideoCounterAPIView):
+    """
+    API view counting a share of a video.
+    """
+
+    field = 'share_count'
+
+
+class VideoLikeAPIView(APIView):
+    """
+    API view for liking and unliking a video.
+
+    A VideoLike row keeps each user's like idempotent; only an actual change counts
+    towards the write-behind like counter.
+
+    Methods:
+    - post: Like the video.
+    - delete: Remove the like.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Like a video.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            video_id (int): The ID of the video.
+
+        Returns:
+            Response: The counters of the video, with status 201 if the like is new and 200
+            if the user already liked it, or a 404 response if the video is not found.
+        """
+        video = _ready_video(video_id)
+        if video is None:
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        _, created = VideoLike.objects.get_or_create(user=request.user, video=video)
+        if created:
+            increment(video.pk, 'like_count')
+        return _counts(video, status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+    def delete(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Remove the like of a video.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            video_id (int): The ID of the video.
+
+        Returns:
+            Response: The counters of the video, or a 404 response if the video is not found.
+        """
+        video = _ready_video(video_id)
+        if video is None:
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        deleted, _ = VideoLike.objects.filter(user=request.user, video=video).delete()
+        if deleted:
+            increment(video.pk, 'like_count', -1)
+        return _counts(video)
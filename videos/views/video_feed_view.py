@@ -0,0 +1,66 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from utils.pagination import INVALID_CURSOR_ERROR, decode_cursor, encode_cursor, parse_page_size
+from videos.counters import with_pending_counts
+from videos.feed import get_feed, position_after
+from videos.models.video_models import Video
+from videos.serializers import VideoListSerializer
+
+
+class VideoFeedAPIView(APIView):
+    """
+    API view for the ranked For-You feed.
+
+    The first page (no cursor) ranks the feed anew and caches the ranked ids for the user;
+    the following pages are slices of that cached list, so scrolling never rescores. The
+    opaque cursor holds the (score, id) of the last video served, so if the cached list
+    expired the new ranking is entered at the same score instead of at a stale offset.
+
+    Methods:
+    - get: Retrieve a page of the feed.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Retrieve a page of the feed.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'cursor' (from
+            the previous page) and 'limit' query parameters.
+
+        Returns:
+            Response: The videos under 'results' and the cursor of the next page under
+            'next_cursor' (None at the end), or a 400 response for an invalid cursor or limit.
+        """
+        limit = parse_page_size(request, settings.FEED_PAGE_SIZE, settings.FEED_MAX_PAGE_SIZE)
+        cursor = request.query_params.get('cursor')
+        ranked = get_feed(request.user, refresh=cursor is None)
+
+        start = 0
+        if cursor is not None:
+            try:
+                score, video_id = decode_cursor(cursor, 2)
+                start = position_after(ranked, float(score), int(video_id))
+            except (ValueError, TypeError, OverflowError):
+                return Response({'error': INVALID_CURSOR_ERROR},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+        page = ranked[start:start + limit]
+        page_ids = [video_id for video_id, _ in page]
+        videos = Video.objects.filter(status=Video.Status.READY).in_bulk(page_ids)
+        videos = with_pending_counts([videos[pk] for pk in page_ids if pk in videos])
+        results = VideoListSerializer(videos, many=True, context={'request': request}).data
+
+        more = start + limit < len(ranked)
+        return Response({
+            'results': results,
+            'next_cursor': encode_cursor([page[-1][1], page[-1][0]]) if more else None,
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,84 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from django.http import HttpRequest
+
+from utils.pagination import KeysetPagination
+from users.models.custom_user_models import CustomUser
+from users.constants import USER_NOT_FOUND_MESSAGE
+from videos.counters import with_pending_counts
+from videos.models.video_models import Video
+from videos.serializers import VideoListSerializer
+
+
+def _paginated(request: HttpRequest, view: APIView, queryset) -> Response:
+    paginator = KeysetPagination()
+    page = with_pending_counts(paginator.paginate_queryset(queryset, request, view=view))
+    return paginator.get_paginated_response(
+        VideoListSerializer(page, many=True, context={'request': request}).data)
+
+
+class VideoListAPIView(APIView):
+    """
+    API view for listing every ready video, newest first.
+
+    Pages are fetched by keyset on (created_at, id) (utils.pagination.KeysetPagination),
+    so deep pages cost the same as the first one.
+
+    Methods:
+    - get: Retrieve a page of videos.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Retrieve a page of ready videos.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'cursor' and
+            'limit' query parameters.
+
+        Returns:
+            Response: The videos under 'results' and the cursor of the next page under
+            'next_cursor', or a 400 response for an invalid cursor or limit.
+        """
+        return _paginated(request, self, Video.objects.filter(status=Video.Status.READY))
+
+
+class UserVideoListAPIView(APIView):
+    """
+    API view for listing the videos of a user, newest first.
+
+    Other users see the ready videos only; the owner also sees the ones still uploading or
+    being processed.
+
+    Methods:
+    - get: Retrieve a page of the user's videos.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest, userid: int) -> Response:
+        """
+        Retrieve a page of a user's videos.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'cursor' and
+            'limit' query parameters.
+            userid (int): The ID of the user.
+
+        Returns:
+            Response: The videos under 'results' and the cursor of the next page under
+            'next_cursor', a 400 response for an invalid cursor or limit, or a 404 response
+            if the user does not exist.
+        """
+        if not CustomUser.objects.filter(pk=userid).exists():
+            return Response({'error': USER_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        videos = Video.objects.filter(owner_id=userid)
+        if request.user.pk != userid:
+            videos = videos.filter(status=Video.Status.READY)
+        return _paginated(request, self, videos)
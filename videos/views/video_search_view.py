@@ -0,0 +1,47 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from django.http import HttpRequest
+
+from utils.search import SearchPagination, parse_search_query, ranked_search
+from videos.counters import with_pending_counts
+from videos.models.video_models import VIDEO_SEARCH_VECTOR, Video
+from videos.serializers import VideoListSerializer
+
+
+class VideoSearchAPIView(APIView):
+    """
+    API view for searching ready videos by caption.
+
+    Words are matched against the title and description through a GIN index, titles
+    weighing more than descriptions. Results are ordered by relevance and paginated by
+    keyset on (rank, id).
+
+    Methods:
+    - get: Retrieve a page of matching videos.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Search videos.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with the search text in 'q' and
+            optional 'cursor' and 'limit' query parameters.
+
+        Returns:
+            Response: The videos under 'results', most relevant first, and the cursor of
+            the next page under 'next_cursor', or a 400 response for an invalid query,
+            cursor or limit.
+        """
+        text = parse_search_query(request)
+        videos = ranked_search(Video.objects.filter(status=Video.Status.READY),
+                               VIDEO_SEARCH_VECTOR, text)
+
+        paginator = SearchPagination()
+        page = with_pending_counts(paginator.paginate_queryset(videos, request, view=self))
+        return paginator.get_paginated_response(
+            VideoListSerializer(page, many=True, context={'request': request}).data)
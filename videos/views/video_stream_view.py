@@ -0,0 +1,142 @@
+import os
+import secrets
+from typing import Optional, Tuple
+
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+
+from videos.models.video_models import Video
+from videos.streaming import (FileRange, MultipartRanges, file_validators, if_range_matches,
+                              parse_range_header)
+from videos.constants import (VIDEO_NOT_FOUND_MESSAGE, RENDITION_NOT_FOUND_MESSAGE,
+                              RANGE_NOT_SATISFIABLE_ERROR)
+
+
+class VideoStreamAPIView(APIView):
+    """
+    API view for playing a video with HTTP range requests.
+
+    Ready videos are public; their owner can also play the original while it is still
+    being processed. `?rendition=<name>` selects a transcoded rendition instead of the
+    original. The file is never read into Python: the whole file or a single range is
+    passed to the WSGI server's sendfile path, several ranges are sliced from a memory map,
+    and with VIDEO_STREAM_ACCEL_REDIRECT set nginx serves the file itself. Strong ETags and
+    Last-Modified dates let players revalidate with 304s and resume with If-Range.
+
+    Methods:
+    - get: Stream the whole video (200), one or more byte ranges (206), or nothing (304/416).
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest, video_id: int) -> HttpResponse:
+        """
+        Handle HTTP GET (and HEAD) requests to stream a video.
+
+        Args:
+            request (HttpRequest): The HTTP request object, optionally with Range, If-Range,
+            If-None-Match and If-Modified-Since headers.
+            video_id (int): The ID of the video.
+
+        Returns:
+            HttpResponse: The requested bytes, a 304 if the client's copy is current, a 416
+            if no range overlaps the file, or a 404 if the video or rendition is not found.
+        """
+        video = Video.objects.filter(pk=video_id).first()
+        if video is None or not video.file or not self._can_play(request, video):
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        name, content_type, error = self._select_file(request, video)
+        if error is not None:
+            return error
+
+        # Closed here on every path that does not hand it over to the response.
+        try:
+            file = open(default_storage.path(name), 'rb')  # pylint: disable=consider-using-with
+        except FileNotFoundError:
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        stat = os.fstat(file.fileno())
+        etag, last_modified = file_validators(stat)
+        headers = {
+            'Accept-Ranges': 'bytes',
+            'ETag': etag,
+            'Last-Modified': last_modified,
+            'Cache-Control': (f'public, max-age={settings.VIDEO_STREAM_MAX_AGE}'
+                              if video.status == Video.Status.READY else 'private, no-cache'),
+        }
+
+        response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+        if response is not None:
+            file.close()
+        elif settings.VIDEO_STREAM_ACCEL_REDIRECT:
+            file.close()
+            response = HttpResponse(content_type=content_type)
+            response['X-Accel-Redirect'] = settings.VIDEO_STREAM_ACCEL_REDIRECT + name
+        else:
+            response = self._file_response(request, file, stat, content_type)
+
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    @staticmethod
+    def _can_play(request: HttpRequest, video: Video) -> bool:
+        return video.status == Video.Status.READY or video.owner_id == request.user.pk
+
+    @staticmethod
+    def _select_file(request: HttpRequest,
+                     video: Video) -> Tuple[Optional[str], Optional[str], Optional[Response]]:
+        rendition = request.query_params.get('rendition')
+        if rendition is None:
+            return video.file.name, video.content_type, None
+
+        if rendition not in video.renditions:
+            available = ', '.join(sorted(video.renditions)) or '-'
+            return None, None, Response({'error': RENDITION_NOT_FOUND_MESSAGE % available},
+                                        status=status.HTTP_404_NOT_FOUND)
+        return video.renditions[rendition], 'video/mp4', None
+
+    @staticmethod
+    def _file_response(request: HttpRequest, file, stat: os.stat_result,
+                       content_type: str) -> HttpResponse:
+        size = stat.st_size
+        etag, last_modified = file_validators(stat)
+        ranges = None
+        if if_range_matches(request.headers.get('If-Range'), etag, last_modified):
+            ranges = parse_range_header(request.headers.get('Range'), size)
+        if ranges is not None and len(ranges) > settings.VIDEO_STREAM_MAX_RANGES:
+            ranges = None
+
+        if ranges is None:
+            response = FileResponse(file, content_type=content_type)
+        elif not ranges:
+            file.close()
+            return Response({'error': RANGE_NOT_SATISFIABLE_ERROR},
+                            status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                            headers={'Content-Range': f'bytes */{size}'})
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            response = FileResponse(FileRange(file, start, end), content_type=content_type,
+                                    status=status.HTTP_206_PARTIAL_CONTENT)
+            response['Content-Length'] = end - start + 1
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        else:
+            boundary = secrets.token_hex(16)
+            body = MultipartRanges(file, ranges, size, content_type, boundary,
+                                   settings.VIDEO_STREAM_BLOCK_SIZE)
+            response = StreamingHttpResponse(
+                body, status=status.HTTP_206_PARTIAL_CONTENT,
+                content_type=f'multipart/byteranges; boundary={boundary}')
+            response['Content-Length'] = body.length
+            return response
+
+        response.block_size = settings.VIDEO_STREAM_BLOCK_SIZE
+        return response
@@ -0,0 +1,42 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+
+from django.http import HttpRequest
+
+from videos.counters import with_pending_counts
+from videos.serializers import VideoListSerializer
+from videos.timeline import timeline_page
+
+
+class VideoTimelineAPIView(APIView):
+    """
+    API view for the timeline of videos from the creators the user follows, newest first.
+
+    The timeline is read from the user's materialized inbox, merged with the videos of
+    followed creators too popular to fan out (videos.timeline).
+
+    Methods:
+    - get: Retrieve a page of the timeline.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Retrieve a page of the following timeline.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'cursor' and
+            'limit' query parameters.
+
+        Returns:
+            Response: The videos under 'results' and the cursor of the next page under
+            'next_cursor', or a 400 response for an invalid cursor or limit.
+        """
+        videos, next_cursor = timeline_page(request.user, request)
+        results = VideoListSerializer(with_pending_counts(videos), many=True,
+                                      context={'request': request}).data
+        return Response({'results': results, 'next_cursor': next_cursor},
+                        status=status.HTTP_200_OK)
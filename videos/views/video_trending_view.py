@@ -0,0 +1,58 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from utils.pagination import parse_page_size
+from videos.constants import INVALID_TRENDING_KIND_ERROR, INVALID_TRENDING_WINDOW_ERROR
+from videos.trending import KINDS, get_trending_aggregator
+
+
+class VideoTrendingAPIView(APIView):
+    """
+    API view for the trending hashtags or sounds.
+
+    Served from the in-process sketches of the trending aggregator (videos.trending). A
+    request only queries the database to look up the topics of engagement buffered since
+    the last read, and, every TRENDING_SNAPSHOT_INTERVAL seconds, to sync the snapshots.
+
+    Methods:
+    - get: Retrieve the top topics of a window.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request: HttpRequest, kind: str) -> Response:
+        """
+        Retrieve the trending topics of a kind.
+
+        Args:
+            request (HttpRequest): The HTTP request object, with optional 'window' (a key
+            of TRENDING_WINDOWS, '24h' by default) and 'limit' query parameters.
+            kind (str): 'hashtags' or 'sounds'.
+
+        Returns:
+            Response: The topics under 'results', each with its estimated weighted event
+            count as 'score', heaviest first, a 400 response for an unknown window or an
+            invalid limit, or a 404 response for an unknown kind.
+        """
+        if kind not in KINDS:
+            return Response({'error': INVALID_TRENDING_KIND_ERROR % ', '.join(KINDS)},
+                            status=status.HTTP_404_NOT_FOUND)
+
+        window = request.query_params.get('window', '24h')
+        if window not in settings.TRENDING_WINDOWS:
+            return Response(
+                {'error': INVALID_TRENDING_WINDOW_ERROR % ', '.join(settings.TRENDING_WINDOWS)},
+                status=status.HTTP_400_BAD_REQUEST)
+        limit = parse_page_size(request, settings.TRENDING_LIMIT, settings.TRENDING_MAX_LIMIT)
+
+        topics = get_trending_aggregator().top(kind, window, limit)
+        return Response({
+            'kind': kind,
+            'window': window,
+            'results': [{'name': name, 'score': score} for name, score in topics],
+        }, status=status.HTTP_200_OK)
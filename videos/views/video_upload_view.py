@@ -0,0 +1,219 @@
+from typing import Optional, Tuple
+
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.urls import reverse
+
+from videos.models.video_models import Video
+from videos.serializers import VideoSerializer
+from videos.uploads import (ContentRange, IncompleteChunk, UploadLocked, create_partial,
+                            discard_upload, finalize_upload, open_partial, parse_content_range,
+                            write_chunk)
+from videos.constants import (VIDEO_NOT_FOUND_MESSAGE, INVALID_CONTENT_RANGE_ERROR,
+                              MISSING_CHECKSUM_ERROR, CHECKSUM_MISMATCH_ERROR,
+                              CHUNK_TOO_LARGE_ERROR, CONTENT_LENGTH_MISMATCH_ERROR,
+                              INCOMPLETE_CHUNK_ERROR, UPLOAD_OFFSET_MISMATCH_ERROR,
+                              UPLOAD_IN_PROGRESS_ERROR, UPLOAD_NOT_IN_PROGRESS_ERROR)
+
+
+def _upload_response(video: Video, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(VideoSerializer(video).data, status=status_code,
+                    headers={'Upload-Offset': str(video.upload_offset)})
+
+
+class VideoUploadCreateAPIView(APIView):
+    """
+    API view for starting a chunked video upload.
+
+    Methods:
+    - post: Create a video in the 'uploading' state from its metadata and declared size.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: HttpRequest) -> Response:
+        """
+        Handle HTTP POST request to start an upload.
+
+        Args:
+            request (HttpRequest): The HTTP request object with title, description,
+            content_type and size.
+
+        Returns:
+            Response: The new video with its upload URL in the Location header, or the
+            validation errors.
+        """
+        serializer = VideoSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        video = serializer.save(owner=request.user)
+        create_partial(video)
+
+        response = _upload_response(video, status.HTTP_201_CREATED)
+        response['Location'] = reverse('video_upload', kwargs={'video_id': video.pk})
+        return response
+
+
+class VideoUploadAPIView(APIView):
+    """
+    API view for the chunks of a resumable video upload.
+
+    Each PUT carries one chunk as a raw body with `Content-Range: bytes <start>-<end>/<size>`
+    and `X-Chunk-Checksum: <hex sha256>`. The chunk is streamed to disk at its offset, and
+    upload_offset only advances once the data is flushed and its checksum verified. A client
+    that lost its connection asks for the offset with GET and resumes from there. The
+    request body is never parsed by DRF, so memory use is independent of the chunk size.
+
+    Methods:
+    - get: Retrieve the upload state, including the committed offset.
+    - put: Write the next chunk of the upload.
+    - delete: Abandon an unfinished upload.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Retrieve the state of an upload.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            video_id (int): The ID of the video being uploaded.
+
+        Returns:
+            Response: The video with an Upload-Offset header, or 404 if the requesting user
+            does not own it.
+        """
+        video = self._get_video(request, video_id)
+        if video is None:
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        return _upload_response(video)
+
+    def put(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Write one chunk of an upload.
+
+        Args:
+            request (HttpRequest): The HTTP request object with the chunk as its body.
+            video_id (int): The ID of the video being uploaded.
+
+        Returns:
+            Response: The video with the new Upload-Offset. 409 responses carry the current
+            offset when the chunk does not start there.
+        """
+        video = self._get_video(request, video_id)
+        if video is None:
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        if video.status != Video.Status.UPLOADING:
+            return self._conflict(video, UPLOAD_NOT_IN_PROGRESS_ERROR)
+
+        if video.upload_offset == video.size:
+            # Every byte is committed but a previous request stopped before moving the file.
+            finalize_upload(video)
+            return _upload_response(video)
+
+        content_range, error = self._parse_chunk_headers(request, video)
+        if error is None:
+            error = self._write_chunk(request, video, content_range)
+        if error is not None:
+            return error
+
+        return _upload_response(video)
+
+    def delete(self, request: HttpRequest, video_id: int) -> Response:
+        """
+        Abandon an unfinished upload and delete its partial file.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            video_id (int): The ID of the video being uploaded.
+
+        Returns:
+            Response: 204 on success, 404 if not found or 409 if the upload already finished.
+        """
+        video = self._get_video(request, video_id)
+        if video is None:
+            return Response({'error': VIDEO_NOT_FOUND_MESSAGE}, status=status.HTTP_404_NOT_FOUND)
+
+        if video.status != Video.Status.UPLOADING:
+            return self._conflict(video, UPLOAD_NOT_IN_PROGRESS_ERROR)
+
+        discard_upload(video)
+        video.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @staticmethod
+    def _get_video(request: HttpRequest, video_id: int) -> Optional[Video]:
+        return Video.objects.filter(pk=video_id, owner=request.user).first()
+
+    @staticmethod
+    def _conflict(video: Video, error: str) -> Response:
+        return Response({'error': error, 'upload_offset': video.upload_offset,
+                         'status': video.status},
+                        status=status.HTTP_409_CONFLICT,
+                        headers={'Upload-Offset': str(video.upload_offset)})
+
+    @classmethod
+    def _write_chunk(cls, request: HttpRequest, video: Video,
+                     content_range: ContentRange) -> Optional[Response]:
+        try:
+            with open_partial(video) as partial:
+                video.refresh_from_db(fields=['upload_offset'])
+                if content_range.start != video.upload_offset:
+                    return cls._conflict(video, UPLOAD_OFFSET_MISMATCH_ERROR)
+
+                try:
+                    digest = write_chunk(partial, content_range, request.stream)
+                except IncompleteChunk:
+                    return Response({'error': INCOMPLETE_CHUNK_ERROR},
+                                    status=status.HTTP_400_BAD_REQUEST)
+
+                if digest != request.headers['X-Chunk-Checksum'].lower():
+                    return Response({'error': CHECKSUM_MISMATCH_ERROR},
+                                    status=status.HTTP_400_BAD_REQUEST)
+
+                video.upload_offset = content_range.end + 1
+                Video.objects.filter(pk=video.pk, upload_offset=content_range.start).update(
+                    upload_offset=video.upload_offset)
+
+                if video.upload_offset == video.size:
+                    finalize_upload(video)
+        except UploadLocked:
+            return cls._conflict(video, UPLOAD_IN_PROGRESS_ERROR)
+        except FileNotFoundError:
+            # Finished or abandoned by a concurrent request.
+            video.refresh_from_db()
+            return cls._conflict(video, UPLOAD_NOT_IN_PROGRESS_ERROR)
+        return None
+
+    @staticmethod
+    def _parse_chunk_headers(request: HttpRequest,
+                             video: Video) -> Tuple[Optional[ContentRange], Optional[Response]]:
+        content_range = parse_content_range(request.headers.get('Content-Range'))
+        if content_range is None or content_range.total != video.size:
+            return None, Response({'error': INVALID_CONTENT_RANGE_ERROR},
+                                  status=status.HTTP_400_BAD_REQUEST)
+
+        if content_range.length > settings.VIDEO_UPLOAD_MAX_CHUNK_SIZE:
+            return None, Response(
+                {'error': CHUNK_TOO_LARGE_ERROR % settings.VIDEO_UPLOAD_MAX_CHUNK_SIZE},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        if request.META.get('CONTENT_LENGTH') != str(content_range.length):
+            return None, Response({'error': CONTENT_LENGTH_MISMATCH_ERROR},
+                                  status=status.HTTP_400_BAD_REQUEST)
+
+        if 'X-Chunk-Checksum' not in request.headers:
+            return None, Response({'error': MISSING_CHECKSUM_ERROR},
+                                  status=status.HTTP_400_BAD_REQUEST)
+
+        return content_range, None